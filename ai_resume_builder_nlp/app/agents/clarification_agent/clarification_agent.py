@@ -2,7 +2,8 @@ import sys
 from os.path import dirname, join, abspath
 sys.path.append(abspath(join(dirname(__file__), "..", "..")))
 from utils.file_loader import load_instructions_file
-from google.adk.agents import Agent
+from utils.lazy import lazy_attributes
+from app.services.knowledge_base import get_knowledge_base
 
 def clarification_questions(state : dict) -> dict:
     if state.get("test_mode"):
@@ -79,6 +80,11 @@ def clarification_questions(state : dict) -> dict:
             keywords = section_keywords[field]
             if any(kw in raw_text for kw in keywords):
                 is_missing = False  # Content exists in prompt, don't ask
+
+        # Skills named without any keyword ("Python, Kubernetes"); not aliases, typos
+        # or "Go"/"R", which can be plain words ("graph node", "reacts", "ready to go")
+        if is_missing and field == "skills" and get_knowledge_base().skill_index.find_unambiguous(raw_text):
+            is_missing = False
             
         if is_missing and field not in missing_fields:
             missing_fields.append(field)
@@ -95,8 +101,13 @@ def clarification_questions(state : dict) -> dict:
         "questions" : questions
     }
 
-clarification_agent = Agent(
-    name="clarification_agent",
-    description=load_instructions_file("agents/clarification_agent/descriptions.txt"),
-    tools=[clarification_questions]
-)
\ No newline at end of file
+def _build_clarification_agent():
+    from google.adk.agents import Agent
+    return Agent(
+        name="clarification_agent",
+        description=load_instructions_file("agents/clarification_agent/descriptions.txt"),
+        tools=[clarification_questions]
+    )
+
+
+__getattr__ = lazy_attributes(globals(), clarification_agent=_build_clarification_agent)
@@ -1,87 +1,198 @@
 import sys
 import json
+import time
+import asyncio
+from contextlib import aclosing
 from os.path import dirname, join, abspath
 sys.path.append(abspath(join(dirname(__file__), "..", "..")))
 from utils.file_loader import load_instructions_file
+from utils.lazy import lazy_attributes
 from nlp.enhancers.text_enhancer import enhance_resume_content
-from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
-import litellm
+from nlp.enhancers.section_splitter import split_resume_sections, merge_section, parse_section_id, fill_missing
+from app.services.llm_client import get_llm_client, run_sync, LLMError
+from app.nlp.enhancers import quality_scorer
+from app.utils.metrics import get_metrics
+from app.utils.json_utils import IncrementalJSONParser
+from app.utils.cancellation import current_token, OperationCancelled, LLM_SECTIONS_CANCELLED
 import os
 
-# Configure LiteLLM for Vercel AI Gateway
+# Configure LiteLLM (ADK agent) and LLMClient for Vercel AI Gateway
 os.environ.setdefault("OPENAI_API_BASE", "https://ai-gateway.vercel.sh/v1")
 api_key = os.getenv("AI_GATEWAY_API_KEY")
 if api_key:
     os.environ.setdefault("OPENAI_API_KEY", api_key)
 
+# All section calls share one deadline, so latency is bounded by the slowest section
+SECTION_TIMEOUT_SECONDS = float(os.getenv("LLM_SECTION_TIMEOUT_SECONDS", "20"))
+SECTION_MAX_TOKENS = int(os.getenv("LLM_SECTION_MAX_TOKENS", "1024"))
 
-def enhance_with_devstral(pre_enhanced_content: dict) -> dict:
+
+def build_section_prompt(sid: str, content) -> str:
+    key = parse_section_id(sid)[0]
+    return f"""You are enhancing one section of a resume for clarity and impact.
+
+Rules:
+- Do NOT invent new skills, companies, roles, or metrics
+- Do NOT remove existing information  
+- Only improve wording, clarity, and professional impact
+- Use existing metrics if present, do not create new ones
+- Keep the same JSON structure, keys and number of items
+- Return valid JSON only
+
+Here is the "{key}" section to enhance:
+{json.dumps({key: content}, indent=2)}
+
+Return ONLY the enhanced JSON object with the single key "{key}", no explanations."""
+
+
+async def enhance_section(sid: str, content, deadline: float):
+    """
+    Enhance one section with Devstral, streaming the response.
+
+    The section is taken as soon as the JSON object holding it closes,
+    ignoring any text after it. If the output is cut short (max_tokens, deadline, dropped
+    stream), the complete part of the section is kept and the rest filled in
+    from the rule-based `content`. Raises LLMError or ValueError if nothing
+    usable arrived.
+    """
+    key = parse_section_id(sid)[0]
+    parser = IncrementalJSONParser()
+    try:
+        async with aclosing(get_llm_client().astream(
+            [{"role": "user", "content": build_section_prompt(sid, content)}],
+            temperature=0.25,
+            max_tokens=SECTION_MAX_TOKENS,
+            deadline=deadline,
+        )) as stream:
+            async for delta in stream:
+                for member_key, value in parser.feed(delta):
+                    if member_key == key:
+                        return value
+    except LLMError:
+        if not parser.buffer:
+            raise
+        # Cut off mid-stream: fall through and keep what arrived
+
+    # A "{" in prose before the object only shows once the stream has ended
+    for member_key, value in parser.finish():
+        if member_key == key:
+            return value
+    partial = parser.partial()
+    if not partial or key not in partial:
+        raise ValueError(f"response has no complete '{key}' value")
+    return fill_missing(content, partial[key])
+
+
+async def enhance_with_devstral_async(pre_enhanced_content: dict) -> dict:
     """
     Use Devstral 2 (via Vercel AI Gateway) to further enhance the resume content.
     Takes the pre-enhanced content and polishes it for clarity and impact.
+
+    The rule-based version of the resume is split into sections (summary, each
+    experience entry, projects, ...) which are enhanced as concurrent calls
+    sharing one deadline. Results are merged as they arrive; a section that
+    times out, fails or comes back with a different shape keeps its
+    rule-based text. Sections the local quality scorer already rates as
+    strong are not sent at all. If every call fails, pre_enhanced_content is
+    returned unchanged.
+
+    The request's CancellationToken (if any) bounds the shared deadline, and
+    cancelling it cancels the in-flight calls and raises OperationCancelled.
     """
+    token = current_token()
+    if token:
+        token.raise_if_cancelled()
+
     # Get the final_resume from the pre-enhanced content
     resume = pre_enhanced_content.get("final_resume") or pre_enhanced_content
     
     if not resume or not isinstance(resume, dict):
         return pre_enhanced_content
-    
-    # Prepare prompt for Devstral
-    prompt = f"""You are enhancing a resume for clarity and impact.
 
-Rules:
-- Do NOT invent new skills, companies, roles, or metrics
-- Do NOT remove existing information  
-- Only improve wording, clarity, and professional impact
-- Use existing metrics if present, do not create new ones
-- Keep the same JSON structure
-- Return valid JSON only
+    # Rule-based version is both the LLM input and the per-section fallback
+    merged = enhance_resume_content(resume)
+    sections = split_resume_sections(merged)
+    if not sections:
+        return pre_enhanced_content
 
-Here is the resume to enhance:
-{json.dumps(resume, indent=2)}
+    # Only weak sections go to the LLM; strong ones keep their rule-based text
+    metrics = get_metrics()
+    to_send, skipped = [], []
+    for sid, content in sections:
+        tokens = quality_scorer.estimate_tokens(build_section_prompt(sid, content)) + \
+            quality_scorer.estimate_tokens(json.dumps(content))
+        if quality_scorer.needs_llm(parse_section_id(sid)[0], content):
+            to_send.append((sid, content))
+            metrics.inc(quality_scorer.SECTIONS_SENT)
+            metrics.inc(quality_scorer.TOKENS_SENT, tokens)
+        else:
+            skipped.append(sid)
+            metrics.inc(quality_scorer.SECTIONS_SKIPPED)
+            metrics.inc(quality_scorer.TOKENS_SKIPPED, tokens)
 
-Return ONLY the enhanced JSON, no explanations."""
+    deadline = time.monotonic() + SECTION_TIMEOUT_SECONDS
+    if token:
+        deadline = token.limit(deadline)
 
+    async def run_section(sid, content):
+        try:
+            return sid, await enhance_section(sid, content, deadline), None
+        except (LLMError, ValueError) as e:
+            return sid, None, e
+        except asyncio.CancelledError:
+            if token and token.cancelled:
+                return sid, None, OperationCancelled(token.reason)
+            raise
+
+    tasks = [asyncio.create_task(run_section(sid, content)) for sid, content in to_send]
+    unregister = token.on_cancel(lambda: [task.cancel() for task in tasks]) if token else None
+    enhanced = set()
+    cancelled = 0
     try:
-        # Get API key from environment
-        gateway_key = os.getenv("AI_GATEWAY_API_KEY") or os.getenv("OPENAI_API_KEY")
-        if not gateway_key:
-            print("Devstral enhancement skipped: AI_GATEWAY_API_KEY not set")
-            return pre_enhanced_content
-        
-        # Use LiteLLM to call Devstral 2 via Vercel AI Gateway
-        response = litellm.completion(
-            model="openai/mistral/devstral-2",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.25,
-            max_tokens=4096,  # Ensure complete resume output
-            api_base=os.environ.get("OPENAI_API_BASE", "https://ai-gateway.vercel.sh/v1"),
-            api_key=gateway_key
-        )
-        
-        # Parse the response
-        response_text = response.choices[0].message.content.strip()
-        
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        
-        enhanced_resume = json.loads(response_text.strip())
-        print("Devstral enhancement successful!")
-        return {"final_resume": enhanced_resume, "devstral_enhanced": True}
-        
-    except Exception as e:
-        # If Devstral fails, return the pre-enhanced content
-        print(f"Devstral enhancement failed: {e}")
+        for next_done in asyncio.as_completed(tasks):
+            sid, content, error = await next_done
+            if isinstance(error, OperationCancelled):
+                cancelled += 1
+            elif error is not None:
+                print(f"Devstral enhancement kept rule-based '{sid}': {error}")
+            elif merge_section(merged, sid, content):
+                enhanced.add(sid)
+            else:
+                print(f"Devstral enhancement kept rule-based '{sid}': structure changed")
+    finally:
+        cancelled += sum(1 for task in tasks if not task.done())
+        for task in tasks:
+            task.cancel()
+        if unregister:
+            unregister()
+        if cancelled:
+            metrics.inc(LLM_SECTIONS_CANCELLED, cancelled)
+
+    if token:
+        token.raise_if_cancelled()
+    if to_send and not enhanced:
+        print("Devstral enhancement skipped: no section enhanced")
         return pre_enhanced_content
 
+    print(f"Devstral enhancement successful for {len(enhanced)}/{len(to_send)} sections "
+          f"({len(skipped)} already strong)")
+    return {
+        "final_resume": merged,
+        "devstral_enhanced": bool(enhanced),
+        "enhancement_sections": {
+            "llm": [sid for sid, _ in to_send if sid in enhanced],
+            "rule_based": [sid for sid, _ in to_send if sid not in enhanced],
+            "skipped": skipped,
+        },
+    }
 
-def enhance_resume(state: dict) -> dict:
+
+def enhance_with_devstral(pre_enhanced_content: dict) -> dict:
+    """Synchronous wrapper for callers outside an event loop (ADK tools, scripts)."""
+    return run_sync(enhance_with_devstral_async(pre_enhanced_content))
+
+
+async def enhance_resume_async(state: dict) -> dict:
     """
     Full enhancement pipeline:
     1. Manual enhancement (weak verbs → strong verbs)
@@ -96,31 +207,43 @@ def enhance_resume(state: dict) -> dict:
         return {"pre_enhanced_content": pre_enhanced}
     
     # Call Devstral for further enhancement
-    devstral_result = enhance_with_devstral(state)
+    devstral_result = await enhance_with_devstral_async(state)
     
     # Merge results
     result = {
         "pre_enhanced_content": pre_enhanced,
     }
     
-    # If Devstral enhanced successfully, update final_resume
-    if devstral_result.get("devstral_enhanced"):
+    # If Devstral enhanced successfully (or every section was already strong), update final_resume
+    if "enhancement_sections" in devstral_result:
         result["final_resume"] = devstral_result["final_resume"]
+        result["enhancement_sections"] = devstral_result["enhancement_sections"]
     
     return result
 
 
-# Legacy function for backward compatibility with pipeline_runner
-def pre_enhance(state: dict) -> dict:
-    """Legacy function - now calls the full enhancement pipeline."""
-    return enhance_resume(state)
+def enhance_resume(state: dict) -> dict:
+    """Synchronous wrapper around enhance_resume_async."""
+    return run_sync(enhance_resume_async(state))
+
+
+# Legacy tool name kept for the ADK agent
+async def pre_enhance(state: dict) -> dict:
+    """Legacy function - now calls the full enhancement pipeline (async so ADK awaits it)."""
+    return await enhance_resume_async(state)
+
+
+# LlmAgent for root coordinator compatibility - using Devstral 2 via LiteLLM (built on first access)
+def _build_enhancement_agent():
+    from google.adk.agents import LlmAgent
+    from google.adk.models.lite_llm import LiteLlm
+    return LlmAgent(
+        name="enhancement_agent", 
+        model=LiteLlm(model="openai/mistral/devstral-2"),
+        instruction=load_instructions_file("agents/enhancer_agent/instructions.txt"),
+        description=load_instructions_file("agents/enhancer_agent/description.txt"),
+        tools=[pre_enhance] 
+    )
 
 
-# LlmAgent for root coordinator compatibility - using Devstral 2 via LiteLLM
-enhancement_agent = LlmAgent(
-    name="enhancement_agent", 
-    model=LiteLlm(model="openai/mistral/devstral-2"),
-    instruction=load_instructions_file("agents/enhancer_agent/instructions.txt"),
-    description=load_instructions_file("agents/enhancer_agent/description.txt"),
-    tools=[pre_enhance] 
-)
+__getattr__ = lazy_attributes(globals(), enhancement_agent=_build_enhancement_agent)
@@ -2,7 +2,7 @@ import sys
 from os.path import join, dirname, abspath
 sys.path.append(abspath(join(dirname(__file__),"..","..")))
 from utils.file_loader import load_instructions_file
-from google.adk.agents import Agent 
+from utils.lazy import lazy_attributes
 from utils.schema_normalizer import normalize_resume_schema
 
 def formatting_passthrough(state: dict) -> dict:
@@ -91,8 +91,13 @@ def formatting_passthrough(state: dict) -> dict:
     return normalized
 
 
-formatting_agent = Agent(
-    name="formatting_agent",
-    description=load_instructions_file("agents/formatting_agent/descriptions.txt"),
-     tools=[formatting_passthrough]
-)
\ No newline at end of file
+def _build_formatting_agent():
+    from google.adk.agents import Agent
+    return Agent(
+        name="formatting_agent",
+        description=load_instructions_file("agents/formatting_agent/descriptions.txt"),
+         tools=[formatting_passthrough]
+    )
+
+
+__getattr__ = lazy_attributes(globals(), formatting_agent=_build_formatting_agent)
@@ -2,9 +2,9 @@ import sys
 from os.path import abspath, join, dirname
 
 sys.path.append(abspath(join(dirname(__file__), "..", "..")))
-from google.adk.agents import Agent
 from nlp.generators.content_generator import generate_resume_structure
 from utils.file_loader import load_instructions_file
+from utils.lazy import lazy_attributes
 from utils.schema_normalizer import normalize_resume_schema
 
 def generate_resume(state: dict) -> dict:
@@ -24,8 +24,13 @@ def generate_resume(state: dict) -> dict:
     
     
 
-generation_agent = Agent(
-    name='generation_agent',
-    description=load_instructions_file("agents/generation_agent/description.txt"),
-    tools=[generate_resume],
-)
\ No newline at end of file
+def _build_generation_agent():
+    from google.adk.agents import Agent
+    return Agent(
+        name='generation_agent',
+        description=load_instructions_file("agents/generation_agent/description.txt"),
+        tools=[generate_resume],
+    )
+
+
+__getattr__ = lazy_attributes(globals(), generation_agent=_build_generation_agent)
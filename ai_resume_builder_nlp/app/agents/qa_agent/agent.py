@@ -2,11 +2,19 @@ import sys
 from os.path import dirname, join, abspath
 sys.path.append(abspath(join(dirname(__file__),"..","..")))
 from utils.file_loader import load_instructions_file
-from google.adk.agents import Agent 
+from utils.lazy import lazy_attributes
 
 MIN_SKILLS = 3
 MIN_EXP_ITEMS= 1 
 
+REQUIRED_SECTIONS = [
+    "profile",
+    "summary",
+    "experience",
+    "education",
+    "skills"
+]
+
 def qa_passthrough(state: dict) -> dict:
     issues = []
 
@@ -19,15 +27,7 @@ def qa_passthrough(state: dict) -> dict:
         }
 
     # ---- REQUIRED SECTIONS ----
-    required_sections = [
-        "profile",
-        "summary",
-        "experience",
-        "education",
-        "skills"
-    ]
-
-    for section in required_sections:
+    for section in REQUIRED_SECTIONS:
         value = resume.get(section)
         if not value or (isinstance(value, list) and len(value) == 0):
             issues.append(f"missing or empty section: {section}")
@@ -79,8 +79,13 @@ def qa_passthrough(state: dict) -> dict:
     }
 
 
-qa_agent = Agent(
-    name="qa_agent",
-    description=load_instructions_file("agents/qa_agent/description.txt"),
-    tools=[qa_passthrough]
-)
\ No newline at end of file
+def _build_qa_agent():
+    from google.adk.agents import Agent
+    return Agent(
+        name="qa_agent",
+        description=load_instructions_file("agents/qa_agent/description.txt"),
+        tools=[qa_passthrough]
+    )
+
+
+__getattr__ = lazy_attributes(globals(), qa_agent=_build_qa_agent)
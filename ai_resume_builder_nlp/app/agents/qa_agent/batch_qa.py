@@ -0,0 +1,142 @@
+"""
+Batch QA - columnar version of qa_passthrough for bulk imports and re-scoring.
+
+Runs the same quality gates as qa_agent.qa_passthrough over many normalized
+resumes at once. Each resume is visited once to fill NumPy arrays (section
+presence, skill counts, experience sanity), and the "measurable impact" check
+runs a single regex pass over every achievement joined into one buffer.
+"""
+import re
+from typing import Any, Dict, List
+
+import numpy as np
+
+from app.agents.qa_agent.agent import MIN_SKILLS, REQUIRED_SECTIONS
+
+# Column order of the score matrix. Matches the order qa_passthrough reports issues in.
+CHECKS = [f"section:{section}" for section in REQUIRED_SECTIONS] + [
+    "experience_role_company",
+    "min_skills",
+    "measurable_impact",
+]
+
+ISSUE_MESSAGES = [f"missing or empty section: {section}" for section in REQUIRED_SECTIONS] + [
+    "experience entries missing role/company",
+    "too few skills listed",
+    "no measurable impact found",
+]
+
+# Achievements are joined with NUL, so a match that starts at a digit and runs
+# to the next separator consumes the rest of that achievement: at most one
+# match per achievement, however many digits it contains.
+_SEPARATOR = "\x00"
+_DIGIT_REGEX = re.compile(r"\d[^\x00]*")
+
+
+def qa_batch(resumes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run the QA gates over a batch of normalized resumes.
+
+    Args:
+        resumes: List of `final_resume` dicts (as produced by generation/formatting)
+
+    Returns:
+        Dict with:
+            checks:    column names of the score matrix
+            matrix:    (N, len(checks)) bool array, True where a check passed
+            scores:    (N,) float array, fraction of checks passed
+            qa_passed: (N,) bool array
+            issues:    per-resume issue lists, identical to qa_passthrough
+    """
+    n = len(resumes)
+    n_sections = len(REQUIRED_SECTIONS)
+
+    present = np.zeros((n, n_sections), dtype=bool)
+    missing_resume = np.zeros(n, dtype=bool)
+    exp_checked = np.zeros(n, dtype=bool)
+    exp_valid = np.zeros(n, dtype=bool)
+    skill_count = np.full(n, -1, dtype=np.int32)
+    metrics_listed = np.zeros(n, dtype=bool)
+
+    ach_texts: List[str] = []
+    ach_owner: List[int] = []
+
+    # ---- GATHER COLUMNS (single pass over the dicts) ----
+    for row, resume in enumerate(resumes):
+        if not resume:
+            missing_resume[row] = True
+            continue
+
+        for col, section in enumerate(REQUIRED_SECTIONS):
+            if resume.get(section):
+                present[row, col] = True
+
+        experience = resume.get("experience", [])
+        if experience and isinstance(experience, list):
+            exp_checked[row] = True
+            exp_valid[row] = any(
+                exp.get("role") and exp.get("company")
+                for exp in experience
+                if isinstance(exp, dict)
+            )
+
+        skills = resume.get("skills", [])
+        if isinstance(skills, list):
+            skill_count[row] = len(skills)
+
+        if resume.get("metrics"):
+            metrics_listed[row] = True
+        elif isinstance(experience, list):
+            for exp in experience:
+                if not isinstance(exp, dict):
+                    continue
+                achievements = exp.get("achievements", [])
+                if not isinstance(achievements, list):
+                    continue
+                for ach in achievements:
+                    if isinstance(ach, str):
+                        ach_texts.append(ach)
+                        ach_owner.append(row)
+
+    # ---- METRICS: one regex pass over all achievements ----
+    has_digit = np.zeros(n, dtype=bool)
+    if ach_texts:
+        blob = _SEPARATOR.join(ach_texts)
+        lengths = np.fromiter((len(t) + 1 for t in ach_texts), dtype=np.int64, count=len(ach_texts))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        positions = np.fromiter(
+            (m.start() for m in _DIGIT_REGEX.finditer(blob)), dtype=np.int64
+        )
+        if positions.size:
+            text_idx = np.searchsorted(starts, positions, side="right") - 1
+            owners = np.asarray(ach_owner, dtype=np.int64)
+            has_digit[owners[text_idx]] = True
+
+    # ---- SCORE MATRIX ----
+    matrix = np.empty((n, len(CHECKS)), dtype=bool)
+    matrix[:, :n_sections] = present
+    matrix[:, n_sections] = ~exp_checked | exp_valid
+    matrix[:, n_sections + 1] = skill_count >= MIN_SKILLS
+    matrix[:, n_sections + 2] = metrics_listed | has_digit
+    matrix[missing_resume] = False
+
+    qa_passed = matrix.all(axis=1)
+    scores = matrix.mean(axis=1) if n else np.zeros(0)
+
+    # ---- ISSUE LISTS (only failing cells are visited) ----
+    issues: List[List[str]] = [[] for _ in range(n)]
+    failing = ~matrix
+    failing[missing_resume] = False
+    for col, message in enumerate(ISSUE_MESSAGES):
+        for row in np.flatnonzero(failing[:, col]):
+            issues[row].append(message)
+    for row in np.flatnonzero(missing_resume):
+        issues[row] = ["final_resume missing"]
+
+    return {
+        "checks": CHECKS,
+        "matrix": matrix,
+        "scores": scores,
+        "qa_passed": qa_passed,
+        "issues": issues,
+    }
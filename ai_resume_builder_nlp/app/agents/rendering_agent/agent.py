@@ -0,0 +1,51 @@
+import sys
+import logging
+from os.path import join, dirname, abspath
+sys.path.append(abspath(join(dirname(__file__),"..","..")))
+from utils.file_loader import load_instructions_file
+from utils.lazy import lazy_attributes
+from app.services.output_store import get_output_store
+from app.services.renderer import RENDER_DEFAULT_THEME, UnknownTheme, get_renderer, resume_from_state
+from app.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def render_passthrough(state: dict) -> dict:
+    """
+    Render the formatted resume (the sections formatting_passthrough put in
+    state) to HTML with state["theme"], and keep it in the output store
+    (artifact: its hash). The API rejects unknown themes up front; a caller
+    of the pipeline that passes one gets the default theme, counted as
+    render.theme_fallbacks.
+    """
+    renderer = get_renderer()
+    try:
+        theme = renderer.resolve_theme(state.get("theme"))
+    except UnknownTheme as e:
+        logger.warning(f"{e}; rendering with {RENDER_DEFAULT_THEME!r}")
+        get_metrics().inc("render.theme_fallbacks")
+        theme = RENDER_DEFAULT_THEME
+
+    html, digest = renderer.render_html(resume_from_state(state), theme)
+    stored = get_output_store().put(html.encode("utf-8"), ".html")
+    return {
+        "rendered_resume": {
+            "theme": theme,
+            "content_hash": digest,
+            "artifact": stored["hash"],
+            "html": html,
+        }
+    }
+
+
+def _build_rendering_agent():
+    from google.adk.agents import Agent
+    return Agent(
+        name="rendering_agent",
+        description=load_instructions_file("agents/rendering_agent/descriptions.txt"),
+        tools=[render_passthrough]
+    )
+
+
+__getattr__ = lazy_attributes(globals(), rendering_agent=_build_rendering_agent)
@@ -1,27 +1,41 @@
 import sys
 from os.path import dirname,join,abspath
-from google.adk.agents import SequentialAgent
 sys.path.append(abspath(join(dirname(__file__),"..","..")))
 
 from utils.file_loader import load_instructions_file
+from utils.lazy import lazy_attributes
 
-# Import sub-agents
-from agents.understanding_agent.agent import understanding_agent
-from agents.clarification_agent.clarification_agent import clarification_agent
-from agents.generation_agent.agent import generation_agent
-from agents.enhancer_agent.agent import enhancement_agent
-from agents.qa_agent.agent import qa_agent
-from agents.formatting_agent.agent import formatting_agent
 
-root_coordinator_agent = SequentialAgent(
-    name='root_coordinator_agent',
-    sub_agents=[
-        understanding_agent,
-        clarification_agent,
-        generation_agent,
-        enhancement_agent,
-        qa_agent,
-        formatting_agent
-    ],
-    description=load_instructions_file("agents/root_coordinator/descriptions.txt")
-)
\ No newline at end of file
+# The ADK tree is only needed by ADK runners; ResumePipeline calls the tool
+# functions directly. Building it on first access keeps google-adk and
+# litellm out of the API's import path.
+def _build_root_coordinator_agent():
+    from google.adk.agents import SequentialAgent
+
+    # Import sub-agents
+    from agents.understanding_agent.agent import understanding_agent
+    from agents.clarification_agent.clarification_agent import clarification_agent
+    from agents.generation_agent.agent import generation_agent
+    from agents.enhancer_agent.agent import enhancement_agent
+    from agents.scoring_agent.agent import scoring_agent
+    from agents.qa_agent.agent import qa_agent
+    from agents.formatting_agent.agent import formatting_agent
+    from agents.rendering_agent.agent import rendering_agent
+
+    return SequentialAgent(
+        name='root_coordinator_agent',
+        sub_agents=[
+            understanding_agent,
+            clarification_agent,
+            generation_agent,
+            enhancement_agent,
+            scoring_agent,
+            qa_agent,
+            formatting_agent,
+            rendering_agent
+        ],
+        description=load_instructions_file("agents/root_coordinator/descriptions.txt")
+    )
+
+
+__getattr__ = lazy_attributes(globals(), root_coordinator_agent=_build_root_coordinator_agent)
@@ -0,0 +1,30 @@
+import sys
+from os.path import dirname, join, abspath
+sys.path.append(abspath(join(dirname(__file__),"..","..")))
+from utils.file_loader import load_instructions_file
+from utils.lazy import lazy_attributes
+from app.nlp.validators.resume_scorer import score_resume
+
+def score_passthrough(state: dict) -> dict:
+    resume = state.get("final_resume") or {}
+
+    # Prefer the role detected during understanding, then the profile role
+    entities = state.get("entities") or {}
+    profile = resume.get("profile") if isinstance(resume.get("profile"), dict) else {}
+    role = entities.get("role") or profile.get("role")
+
+    return {
+        "validation": score_resume(resume, role=role)
+    }
+
+
+def _build_scoring_agent():
+    from google.adk.agents import Agent
+    return Agent(
+        name="scoring_agent",
+        description=load_instructions_file("agents/scoring_agent/description.txt"),
+        tools=[score_passthrough]
+    )
+
+
+__getattr__ = lazy_attributes(globals(), scoring_agent=_build_scoring_agent)
@@ -1,23 +1,72 @@
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from os.path import dirname, join, abspath
 sys.path.append(abspath(join(dirname(__file__),"..","..")))
 from utils.file_loader import load_instructions_file
-from google.adk.agents import Agent
+from utils.lazy import lazy_attributes
 from app.nlp.extractors.entity_extractor import extract_entities
 from app.nlp.extractors.skill_matcher import extract_skills
 from app.nlp.extractors.pattern_matcher import extract_metrics
 from app.nlp.validators.completeness_checker import check_completeness
 from app.nlp.extractors.section_extractor import extract_sections
 
-def understand_text(text: str) -> dict:
-    entities = extract_entities(text)
-    sections = extract_sections(text)  # NEW: Parse section content from raw_text
+# Run the independent extractors concurrently for inputs at least this long.
+# Off by default: the extractors are pure-Python regex work that holds the GIL,
+# see benchmarks/bench_understanding.py for when it pays off.
+PARALLEL_EXTRACTION = os.getenv("PARALLEL_EXTRACTION", "false").lower() == "true"
+PARALLEL_MIN_CHARS = int(os.getenv("PARALLEL_MIN_CHARS", "20000"))
+
+# Independent extractors: each reads the whole text and shares no state
+EXTRACTORS = [
+    ("entities", extract_entities),
+    ("sections", extract_sections),
+    ("extracted_skills", extract_skills),
+    ("extracted_metrics", extract_metrics),
+]
+
+_extractor_pool = None
+_extractor_pool_lock = threading.Lock()
+
+
+def get_extractor_pool() -> ThreadPoolExecutor:
+    """
+    Get the pool the parallel extractors run on.
+    Not the shared thread pool: understand_text may itself run on one of its
+    threads and waits for the extractors, which must never queue behind it.
+    """
+    global _extractor_pool
+    with _extractor_pool_lock:
+        if _extractor_pool is None:
+            _extractor_pool = ThreadPoolExecutor(max_workers=len(EXTRACTORS), thread_name_prefix="resume-extractor")
+    return _extractor_pool
+
+
+def run_extractors(text: str, parallel: bool) -> dict:
+    """Run EXTRACTORS on text, on the extractor pool if parallel. Keyed by name."""
+    if not parallel:
+        return {name: func(text) for name, func in EXTRACTORS}
+
+    pool = get_extractor_pool()
+    futures = [(name, pool.submit(func, text)) for name, func in EXTRACTORS]
+    # Collect in declaration order so the merge is the same whatever finishes first
+    return {name: future.result() for name, future in futures}
+
+
+def understand_text(text: str, parallel: bool = None) -> dict:
+    if parallel is None:
+        parallel = PARALLEL_EXTRACTION and len(text or "") >= PARALLEL_MIN_CHARS
+
+    extracted = run_extractors(text, parallel)
+    entities = extracted["entities"]
+    sections = extracted["sections"]  # NEW: Parse section content from raw_text
     
     result = {
         "raw_text": text,
         "entities": entities,
-        "extracted_skills": extract_skills(text),
-        "extracted_metrics": extract_metrics(text),
+        "extracted_skills": extracted["extracted_skills"],
+        "extracted_metrics": extracted["extracted_metrics"],
         "missing_fields": check_completeness(entities),
     }
     
@@ -27,8 +76,13 @@ def understand_text(text: str) -> dict:
     return result
 
 
-understanding_agent = Agent(
-    name='understanding_agent',
-    description=load_instructions_file("agents/understanding_agent/descriptions.txt"),
-    tools=[understand_text]
-)
\ No newline at end of file
+def _build_understanding_agent():
+    from google.adk.agents import Agent
+    return Agent(
+        name='understanding_agent',
+        description=load_instructions_file("agents/understanding_agent/descriptions.txt"),
+        tools=[understand_text]
+    )
+
+
+__getattr__ = lazy_attributes(globals(), understanding_agent=_build_understanding_agent)
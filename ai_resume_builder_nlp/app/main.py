@@ -1,16 +1,35 @@
 from dotenv import load_dotenv
 load_dotenv()  # Load .env file BEFORE any other imports that might need API keys
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional
+import asyncio
+from datetime import datetime, timezone
 import logging
 import json
-from app.agents.root_coordinator.agent import root_coordinator_agent
+import hmac
+import re
+import mimetypes
+from contextlib import asynccontextmanager
 from app.pipeline_runner import pipeline
+from app.utils.metrics import get_metrics
+from app.nlp.enhancers.quality_scorer import llm_savings
+from app.services.admission import AdmissionRejected, get_admission_controller
+from app.services.candidate_ranker import get_candidate_ranker
+from app.services.document_reader import DocumentRejected, read_upload
+from app.services.job_matcher import get_job_matcher
+from app.services.llm_client import close_llm_client
+from app.services.output_store import OUTPUT_EXPORT_TOKEN, get_output_store
+from app.services.renderer import UnknownTheme, get_renderer, pdf_available, resume_from_state
+from app.services.result_cache import get_result_cache, request_key
+from app.services.resume_repository import get_resume_repository
+from app.services.scheduler import get_scheduler
+from app.services.search_index import InvalidSearch, get_search_index
+from app.utils.cancellation import CancellationToken, OperationCancelled, reclaimed_work
+from app.utils.executors import get_thread_pool
 
 
 # ------------------------------------------------------------------
@@ -34,6 +53,67 @@ def sanitize_result(data: Dict[str, Any]) -> Dict[str, Any]:
                 clean[key] = str(value)
         return clean
 
+
+# How often a running request checks whether its client is still connected
+DISCONNECT_POLL_SECONDS = 0.5
+
+
+async def run_until_disconnected(http_request: Request, token: CancellationToken, work) -> Dict[str, Any]:
+    """
+    Await `work`, cancelling it (and `token`) if the client disconnects first,
+    so an abandoned request stops using CPU and LLM tokens.
+    """
+    task = asyncio.ensure_future(work)
+
+    async def watch():
+        while not task.done():
+            await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+            if await http_request.is_disconnected():
+                token.cancel("client_disconnected")
+                task.cancel()
+                return
+
+    watcher = asyncio.create_task(watch())
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if token.reason != "client_disconnected":
+            raise
+        # Nobody is listening; this only ends the handler
+        return {"success": False, "status": "cancelled", "data": None, "error": "client disconnected"}
+    finally:
+        watcher.cancel()
+
+
+async def previous_response(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Response already produced for this request key: from the result cache,
+    else from the resume repository (read on the thread pool).
+    """
+    cache = get_result_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    loop = asyncio.get_running_loop()
+    stored = await loop.run_in_executor(get_thread_pool(), get_resume_repository().reusable_response, key)
+    if stored is not None:
+        cache.put(key, stored)
+    return stored
+
+
+def remember_response(key: str, response: Dict[str, Any]) -> None:
+    """Cache a reusable response; persist it as well when it holds a generated resume."""
+    if response["status"] == "success":
+        response["resumeHash"] = key
+        get_resume_repository().save(key, resume_from_state(response["data"]), response)
+    if response["status"] in ("success", "needs_clarification"):
+        get_result_cache().put(key, response)
+
+
+def client_id(request: Request) -> str:
+    """Rate-limit key: the peer address (run uvicorn with --proxy-headers behind a proxy)."""
+    return request.client.host if request.client else "unknown"
+
 # ------------------------------------------------------------------
 # LOGGING
 # ------------------------------------------------------------------
@@ -46,12 +126,20 @@ logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------
 # FASTAPI APP
 # ------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Close the gateway connections while their event loop is still running
+    await close_llm_client()
+
+
 app = FastAPI(
     title="AI Resume Engine API",
     description="AI-powered resume generation system",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # ------------------------------------------------------------------
@@ -77,6 +165,48 @@ class ResumeRequest(BaseModel):
     prompt: str = Field(...,) #min_length=10
     answers: Optional[Dict[str, Any]] = None
     test_mode : Optional[bool] = False
+    theme: Optional[str] = None
+
+
+class BatchResumeRequest(BaseModel):
+    items: List[ResumeRequest] = Field(..., max_length=100)
+    priority: str = Field("batch", pattern="^(batch|background)$")
+    deadline_seconds: Optional[float] = Field(None, gt=0)
+
+
+class RenderRequest(BaseModel):
+    resume: Dict[str, Any]
+    theme: Optional[str] = None
+    format: str = Field("html", pattern="^(html|pdf)$")
+
+
+class MatchRequest(BaseModel):
+    job_description: str = Field(..., min_length=1)
+    resume: Optional[Dict[str, Any]] = None  # formatted resume (generate-resume "data")
+    resume_id: Optional[int] = None  # or a stored resume
+
+
+class SearchRequest(BaseModel):
+    query: Optional[str] = None  # FTS5 syntax: kubernetes AND "payments platform"
+    skills: List[str] = []  # all required
+    industries: List[str] = []  # any of
+    roles: List[str] = []  # any of
+    locations: List[str] = []  # any of
+    min_years: int = Field(0, ge=0)
+    max_years: Optional[int] = Field(None, ge=0)
+    limit: int = Field(20, ge=1, le=200)
+
+
+class RankRequest(BaseModel):
+    job_description: str = Field(..., min_length=1)
+    k: int = Field(20, ge=1, le=500)
+    # Optional filters, as in SearchRequest
+    skills: List[str] = []
+    industries: List[str] = []
+    roles: List[str] = []
+    locations: List[str] = []
+    min_years: int = Field(0, ge=0)
+    max_years: Optional[int] = Field(None, ge=0)
 
 
 class ResumeResponse(BaseModel):
@@ -115,12 +245,393 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def metrics():
+    snapshot = get_metrics().snapshot()
+    return {
+        **snapshot,
+        "llmSavings": llm_savings(snapshot["counters"]),
+        "cancellationSavings": reclaimed_work(snapshot),
+    }
+
+
 # ------------------------------------------------------------------
 # MAIN API - RESUME GENERATION
 # ------------------------------------------------------------------
 
+def unknown_theme(*themes: Optional[str]) -> Optional[JSONResponse]:
+    """422 for the first of themes that has no template (as /api/render-resume answers), else None."""
+    try:
+        for theme in themes:
+            get_renderer().resolve_theme(theme)
+    except UnknownTheme as e:
+        return JSONResponse(
+            status_code=422,
+            content={"success": False, "status": "unknown_theme", "data": None, "error": str(e)},
+        )
+    return None
+
+
 @app.post("/api/generate-resume")
-async def generate_resume(request: ResumeRequest):
+async def generate_resume(request: ResumeRequest, http_request: Request):
+    rejected = unknown_theme(request.theme)
+    if rejected is not None:
+        return rejected
+    key = request_key(request.prompt, request.answers, request.test_mode, request.theme)
+    cached = await previous_response(key)
+    if cached is not None:
+        return cached
+
+    try:
+        async with get_admission_controller().slot(client_id(http_request), fast_lane=bool(request.test_mode)):
+            token = CancellationToken()
+            response = await run_until_disconnected(http_request, token, run_generation(request, token=token))
+    except AdmissionRejected as e:
+        return JSONResponse(
+            status_code=e.status_code,
+            headers={"Retry-After": e.retry_after_header},
+            content={
+                "success": False,
+                "status": e.reason,
+                "data": None,
+                "error": "server busy, retry later" if e.status_code == 503 else "too many requests",
+            },
+        )
+
+    remember_response(key, response)
+    return response
+
+
+@app.post("/api/generate-resume/batch")
+async def generate_resume_batch(request: BatchResumeRequest, http_request: Request):
+    """
+    Bulk generation at batch/background priority. Items run concurrently but
+    the scheduler gives interactive requests precedence for every stage;
+    items still queued at the deadline come back with status "expired".
+    """
+    rejected = unknown_theme(*(item.theme for item in request.items))
+    if rejected is not None:
+        return rejected
+    # Shared by every item: a disconnect cancels the whole batch
+    token = CancellationToken()
+
+    async def run_item(item: ResumeRequest) -> Dict[str, Any]:
+        key = request_key(item.prompt, item.answers, item.test_mode, item.theme)
+        cached = await previous_response(key)
+        if cached is not None:
+            return cached
+        response = await run_generation(item, request.priority, request.deadline_seconds, token)
+        remember_response(key, response)
+        return response
+
+    try:
+        # One admission slot for the whole batch; the scheduler bounds its items
+        async with get_admission_controller().slot(client_id(http_request)):
+            results = await run_until_disconnected(
+                http_request, token, asyncio.gather(*(run_item(item) for item in request.items)),
+            )
+    except AdmissionRejected as e:
+        return JSONResponse(
+            status_code=e.status_code,
+            headers={"Retry-After": e.retry_after_header},
+            content={"success": False, "status": e.reason, "data": None, "error": "server busy, retry later"},
+        )
+
+    if isinstance(results, dict):  # client disconnected
+        return results
+    statuses = [r["status"] for r in results]
+    return {
+        "success": True,
+        "status": "success",
+        "data": {
+            "results": results,
+            "summary": {status: statuses.count(status) for status in sorted(set(statuses))},
+        },
+        "error": None,
+    }
+
+
+@app.post("/api/upload-resume")
+async def upload_resume(http_request: Request, test_mode: bool = False, theme: Optional[str] = None):
+    """
+    Generate a resume from an existing CV sent as the raw request body
+    (PDF, DOCX or plain text), e.g.
+    curl --data-binary @cv.pdf http://host/api/upload-resume
+
+    The body is streamed to a spooled temp file and its text extracted off
+    the event loop (see services.document_reader) before an admission slot
+    is taken, so a slow upload does not hold one. The response carries a
+    "document" summary including the extracted text, so a client answering
+    clarification questions can resend it to /api/generate-resume.
+    """
+    rejected = unknown_theme(theme)
+    if rejected is not None:
+        return rejected
+    declared = http_request.headers.get("content-length")
+
+    try:
+        document = await read_upload(
+            http_request.stream(), int(declared) if declared and declared.isdigit() else None,
+        )
+    except DocumentRejected as e:
+        return JSONResponse(
+            status_code=e.status_code,
+            content={"success": False, "status": e.reason, "data": None, "error": str(e)},
+        )
+
+    request = ResumeRequest(prompt=document["text"], test_mode=test_mode, theme=theme)
+    key = request_key(request.prompt, None, test_mode, theme)
+    response = await previous_response(key)
+    try:
+        if response is None:
+            async with get_admission_controller().slot(client_id(http_request), fast_lane=test_mode):
+                token = CancellationToken()
+                response = await run_until_disconnected(http_request, token, run_generation(request, token=token))
+            remember_response(key, response)
+    except AdmissionRejected as e:
+        return JSONResponse(
+            status_code=e.status_code,
+            headers={"Retry-After": e.retry_after_header},
+            content={"success": False, "status": e.reason, "data": None, "error": "server busy, retry later"},
+        )
+
+    return {
+        **response,
+        "document": {
+            "format": document["format"],
+            "bytes": document["bytes"],
+            "parts": document["parts"],
+            "truncated": document["truncated"],
+            "text": document["text"],
+        },
+    }
+
+
+@app.post("/api/render-resume")
+async def render_resume(request: RenderRequest):
+    """
+    Render a formatted resume (the "data" of a successful generate-resume
+    response) as HTML or PDF. The content hash is sent as the ETag.
+    """
+    renderer = get_renderer()
+    resume = resume_from_state(request.resume)
+    pdf_unavailable = JSONResponse(
+        status_code=501,
+        content={"success": False, "status": "pdf_unavailable", "data": None,
+                 "error": "PDF rendering needs WeasyPrint (and its Pango libraries) on the server"},
+    )
+    try:
+        if request.format == "pdf":
+            if not pdf_available():
+                return pdf_unavailable
+            pdf, digest = await renderer.render_pdf(resume, request.theme)
+            stored = get_output_store().put(pdf, ".pdf")
+            return Response(pdf, media_type="application/pdf", headers={
+                "ETag": f'"{digest}"', "Content-Location": f"/api/artifacts/{stored['hash']}",
+            })
+        html, digest = renderer.render_html(resume, request.theme)
+    except UnknownTheme:
+        return unknown_theme(request.theme)
+    except (ImportError, OSError) as e:
+        # WeasyPrint installed without its system libraries
+        logger.error(f"PDF rendering failed: {e}")
+        return pdf_unavailable
+    stored = get_output_store().put(html.encode("utf-8"), ".html")
+    return HTMLResponse(html, headers={
+        "ETag": f'"{digest}"', "Content-Location": f"/api/artifacts/{stored['hash']}",
+    })
+
+
+@app.post("/api/match-job")
+async def match_job(request: MatchRequest):
+    """
+    Compare a resume (inline, or stored by resume_id) with a job description:
+    TF-IDF cosine similarity over the skill/keyword vocabulary, keyword
+    coverage, and the posting's keywords and skills the resume lacks.
+    """
+    loop = asyncio.get_running_loop()
+    if request.resume is not None:
+        resume = resume_from_state(request.resume)
+    elif request.resume_id is not None:
+        record = await loop.run_in_executor(get_thread_pool(), get_resume_repository().get, request.resume_id)
+        if record is None:
+            raise HTTPException(status_code=404, detail="resume not found")
+        resume = record["resume"]
+    else:
+        return JSONResponse(
+            status_code=422,
+            content={"success": False, "status": "missing_resume", "data": None,
+                     "error": "send a resume or a resume_id"},
+        )
+
+    match = await loop.run_in_executor(get_thread_pool(), get_job_matcher().match, request.job_description, resume)
+    return {
+        "success": True,
+        "status": "success",
+        "data": {
+            "similarity": round(match["similarity"], 4),
+            "coverage": round(match["coverage"], 4),
+            "jobKeywords": match["job_keywords"],
+            "matchedKeywords": match["matched"],
+            "missingKeywords": match["missing"],
+            "missingSkills": match["missing_skills"],
+        },
+        "error": None,
+    }
+
+
+def stored_resume_response(record: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if record is None:
+        raise HTTPException(status_code=404, detail="resume not found")
+    return {
+        "success": True,
+        "status": "success",
+        "data": {
+            "id": record["id"],
+            "inputHash": record["input_hash"],
+            "createdAt": datetime.fromtimestamp(record["created_at"], timezone.utc).isoformat(),
+            "resume": record["resume"],
+        },
+        "error": None,
+    }
+
+
+@app.get("/api/resumes/by-hash/{input_hash}")
+async def get_resume_by_hash(input_hash: str):
+    """A generated resume by its input hash (the resumeHash of the generate response)."""
+    loop = asyncio.get_running_loop()
+    record = await loop.run_in_executor(get_thread_pool(), get_resume_repository().get_by_hash, input_hash)
+    return stored_resume_response(record)
+
+
+def search_index_query(request: SearchRequest) -> Dict[str, Any]:
+    """Thread pool body: open the index (catching up on first use) and query it."""
+    return get_search_index().search(
+        request.query, request.skills, request.industries, request.roles, request.locations,
+        min_years=request.min_years, max_years=request.max_years, limit=request.limit,
+    )
+
+
+@app.post("/api/resumes/search")
+async def search_resumes(request: SearchRequest):
+    """
+    Search generated resumes by text and facets, e.g. Kubernetes with 5+
+    years at a fintech: {"skills": ["Kubernetes"], "industries": ["fintech"], "min_years": 5}.
+    Ranked by text relevance when a query is given, else by years of experience.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        found = await loop.run_in_executor(get_thread_pool(), search_index_query, request)
+    except InvalidSearch as e:
+        return JSONResponse(
+            status_code=422,
+            content={"success": False, "status": "invalid_query", "data": None, "error": str(e)},
+        )
+    results = []
+    for hit in found["hits"]:
+        profile = hit["resume"].get("profile") or {}
+        results.append({
+            "id": hit["id"],
+            "inputHash": hit["input_hash"],
+            "score": hit["score"],
+            "name": profile.get("name"),
+            "role": profile.get("role"),
+            "years": profile.get("years"),
+            "location": profile.get("location"),
+            "skills": hit["resume"].get("skills", []),
+            "createdAt": datetime.fromtimestamp(hit["created_at"], timezone.utc).isoformat(),
+        })
+    return {"success": True, "status": "success", "data": {"total": found["total"], "results": results}, "error": None}
+
+
+def rank_candidates_query(request: RankRequest) -> Dict[str, Any]:
+    """Thread pool body: rank every stored resume, then explain the top k."""
+    ranked = get_candidate_ranker().rank(
+        request.job_description, request.k, request.skills, request.industries, request.roles,
+        request.locations, min_years=request.min_years, max_years=request.max_years,
+    )
+    matcher = get_job_matcher()
+    for hit in ranked["hits"]:
+        hit["match"] = matcher.match(request.job_description, hit["resume"])
+    return ranked
+
+
+@app.post("/api/rank-candidates")
+async def rank_candidates(request: RankRequest):
+    """
+    The k stored resumes that best match a job description (TF-IDF cosine
+    similarity, as /api/match-job), optionally only those passing the search
+    facets, e.g. {"job_description": "...", "locations": ["berlin"], "min_years": 3}.
+    """
+    loop = asyncio.get_running_loop()
+    ranked = await loop.run_in_executor(get_thread_pool(), rank_candidates_query, request)
+    results = []
+    for hit in ranked["hits"]:
+        profile = hit["resume"].get("profile") or {}
+        results.append({
+            "id": hit["id"],
+            "inputHash": hit["input_hash"],
+            "score": round(hit["score"], 4),
+            "name": profile.get("name"),
+            "role": profile.get("role"),
+            "years": profile.get("years"),
+            "location": profile.get("location"),
+            "coverage": round(hit["match"]["coverage"], 4),
+            "missingSkills": hit["match"]["missing_skills"],
+        })
+    return {"success": True, "status": "success", "data": {"considered": ranked["considered"], "results": results}, "error": None}
+
+
+@app.get("/api/resumes/{resume_id}")
+async def get_resume(resume_id: int):
+    """A generated resume by id; re-render it with /api/render-resume."""
+    loop = asyncio.get_running_loop()
+    record = await loop.run_in_executor(get_thread_pool(), get_resume_repository().get, resume_id)
+    return stored_resume_response(record)
+
+
+ARTIFACT_HASH = re.compile(r"^[0-9a-f]{64}$")
+
+
+@app.get("/api/artifacts/export")
+async def export_artifacts(http_request: Request, since: Optional[float] = None, gzip: bool = False):
+    """
+    Stream stored artifacts as a tar archive (gzipped if gzip=true), only
+    those written after `since` (Unix time) if given. Needs
+    "Authorization: Bearer <OUTPUT_EXPORT_TOKEN>"; disabled when that is unset.
+    """
+    if not OUTPUT_EXPORT_TOKEN:
+        raise HTTPException(status_code=404, detail="export is disabled")
+    supplied = http_request.headers.get("authorization", "")
+    if not hmac.compare_digest(supplied.encode(), f"Bearer {OUTPUT_EXPORT_TOKEN}".encode()):
+        raise HTTPException(status_code=401, detail="invalid export token")
+
+    filename = "artifacts.tar.gz" if gzip else "artifacts.tar"
+    return StreamingResponse(
+        get_output_store().export_tar(since, compress=gzip),
+        media_type="application/gzip" if gzip else "application/x-tar",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@app.get("/api/artifacts/{digest}")
+async def get_artifact(digest: str):
+    """A stored artifact by its content hash; immutable, so cacheable forever."""
+    found = None
+    if ARTIFACT_HASH.match(digest):
+        loop = asyncio.get_running_loop()
+        found = await loop.run_in_executor(get_thread_pool(), get_output_store().read, digest)
+    if found is None:
+        raise HTTPException(status_code=404, detail="artifact not found")
+    data, name = found
+    return Response(data, media_type=mimetypes.guess_type(name)[0] or "application/octet-stream", headers={
+        "ETag": f'"{digest}"', "Cache-Control": "public, max-age=31536000, immutable",
+    })
+
+
+async def run_generation(request: ResumeRequest, priority: str = "interactive",
+                         deadline_s: Optional[float] = None,
+                         token: Optional[CancellationToken] = None) -> Dict[str, Any]:
     try:
         # 1️⃣ Build initial state
         state = {
@@ -131,12 +642,15 @@ async def generate_resume(request: ResumeRequest):
         if getattr(request, "test_mode", False):
             state["test_mode"] = True
 
+        if request.theme:
+            state["theme"] = request.theme
+
         # 2️⃣ Merge answers BEFORE pipeline runs (CRITICAL)
         if request.answers:
             for key, value in request.answers.items():
                 state[key] = value
 
-        result = await pipeline.run_async(state)
+        result = await get_scheduler().run(pipeline, state, priority, deadline_s, token)
 
         # 4️⃣ Clarification stop
         if result.get("needs_more_information"):
@@ -160,7 +674,8 @@ async def generate_resume(request: ResumeRequest):
                 "success": False,
                 "status": "qa_failed",
                 "data": {
-                    "issues": result.get("issues", [])
+                    "issues": result.get("issues", []),
+                    "validation": result.get("validation"),
                 },
                 "error": "quality_assurance failed"
             }
@@ -173,6 +688,14 @@ async def generate_resume(request: ResumeRequest):
             "error": None
         }
 
+    except OperationCancelled as e:
+        return {
+            "success": False,
+            "status": "expired" if e.reason == "deadline" else "cancelled",
+            "data": None,
+            "error": str(e)
+        }
+
     except Exception as e:
         return {
             "success": False,
@@ -0,0 +1,115 @@
+"""
+Local quality scorer used to decide which resume sections are worth an LLM call.
+
+Each bullet scores 0-1 from three cheap signals:
+- opens with a verb from action_verbs.json          (0.40)
+- contains a metric (pattern_matcher.extract_metrics) (0.35)
+- length within BULLET_WORDS                        (0.25)
+
+A summary scores on length and on not containing weak phrasing. A section's
+score is its weakest text, so one weak bullet is enough to send the entry.
+Sections with no prose (education rows, award titles) score 1.0.
+"""
+import os
+import re
+from typing import Any, Dict, List, Tuple
+
+from app.nlp.extractors.pattern_matcher import extract_metrics
+from app.nlp.enhancers.text_enhancer import WEAK_TO_STRONG_VERBS
+from app.services.knowledge_base import get_knowledge_base
+
+QUALITY_THRESHOLD = float(os.getenv("LLM_QUALITY_THRESHOLD", "0.75"))
+
+BULLET_WEIGHTS = {"action_verb": 0.40, "metric": 0.35, "length": 0.25}
+BULLET_WORDS = (6, 30)
+SUMMARY_WORDS = (15, 80)
+
+BULLET_SPLIT_REGEX = re.compile(r"\n\s*[-•*]?\s*")
+WEAK_PHRASE_REGEX = re.compile(
+    r"\b(?:" + "|".join(re.escape(w) for w in WEAK_TO_STRONG_VERBS) + r")\b", re.IGNORECASE
+)
+
+# Metric names (see app/utils/metrics.py)
+SECTIONS_SENT = "enhancement.sections.llm"
+SECTIONS_SKIPPED = "enhancement.sections.skipped"
+TOKENS_SENT = "enhancement.tokens.llm_estimated"
+TOKENS_SKIPPED = "enhancement.tokens.skipped_estimated"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English/JSON)."""
+    return max(1, len(text) // 4)
+
+
+def _length_score(words: int, bounds: Tuple[int, int]) -> float:
+    low, high = bounds
+    return 1.0 if low <= words <= high else 0.0
+
+
+def score_bullet(text: str) -> float:
+    kb = get_knowledge_base()
+    score = 0.0
+    if kb.starts_with_action_verb(text):
+        score += BULLET_WEIGHTS["action_verb"]
+    if extract_metrics(text):
+        score += BULLET_WEIGHTS["metric"]
+    score += BULLET_WEIGHTS["length"] * _length_score(len(text.split()), BULLET_WORDS)
+    return round(score, 3)
+
+
+def score_summary(text: str) -> float:
+    score = 0.5 * _length_score(len(text.split()), SUMMARY_WORDS)
+    if not WEAK_PHRASE_REGEX.search(text):
+        score += 0.5
+    return score
+
+
+def section_texts(key: str, content: Any) -> List[Tuple[str, str]]:
+    """(kind, text) pairs of the prose in a section; kind is "summary" or "bullet"."""
+    if key == "summary":
+        return [("summary", content)] if isinstance(content, str) and content.strip() else []
+    texts = []
+    items = content if isinstance(content, list) else [content]
+    for item in items:
+        if isinstance(item, str):
+            # Plain strings are titles in awards/publications, prose elsewhere
+            if key not in ("awards", "publications"):
+                texts.append(item)
+        elif isinstance(item, dict):
+            for field in ("description", "summary"):
+                value = item.get(field)
+                if isinstance(value, str):
+                    texts.extend(BULLET_SPLIT_REGEX.split(value))
+            for field in ("achievements", "bullets"):
+                values = item.get(field)
+                if isinstance(values, list):
+                    texts.extend(v for v in values if isinstance(v, str))
+    return [("bullet", t.strip(" -•*\t")) for t in texts if t.strip(" -•*\t")]
+
+
+def score_section(key: str, content: Any) -> float:
+    """Weakest text score in the section (1.0 when there is no prose)."""
+    scores = [
+        score_summary(text) if kind == "summary" else score_bullet(text)
+        for kind, text in section_texts(key, content)
+    ]
+    return min(scores) if scores else 1.0
+
+
+def needs_llm(key: str, content: Any, threshold: float = None) -> bool:
+    return score_section(key, content) < (QUALITY_THRESHOLD if threshold is None else threshold)
+
+
+def llm_savings(counters: Dict[str, float]) -> Dict[str, Any]:
+    """Share of section calls and estimated tokens the quality gate avoided."""
+    sent, skipped = counters.get(SECTIONS_SENT, 0), counters.get(SECTIONS_SKIPPED, 0)
+    tokens_sent, tokens_skipped = counters.get(TOKENS_SENT, 0), counters.get(TOKENS_SKIPPED, 0)
+    return {
+        "callsSent": sent,
+        "callsSkipped": skipped,
+        "callsAvoidedRatio": round(skipped / (sent + skipped), 3) if sent + skipped else 0.0,
+        "tokensSentEstimated": tokens_sent,
+        "tokensSkippedEstimated": tokens_skipped,
+        "tokensAvoidedRatio": round(tokens_skipped / (tokens_sent + tokens_skipped), 3)
+        if tokens_sent + tokens_skipped else 0.0,
+    }
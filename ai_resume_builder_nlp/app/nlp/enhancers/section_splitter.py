@@ -0,0 +1,114 @@
+"""
+Split a resume into independently enhanceable sections and merge them back.
+
+Sections are identified by strings: "summary", "projects", or "experience[2]"
+for a single experience entry. Sections with no prose to polish (profile,
+skills, languages, ...) are never sent to the LLM.
+"""
+import re
+from typing import Any, List, Tuple
+
+# Sections worth sending to the LLM, in prompt order.
+# Experience is split per entry because it dominates resume length.
+ENHANCEABLE_SECTIONS = ["summary", "experience", "projects", "education", "volunteering", "awards", "publications"]
+PER_ENTRY_SECTIONS = {"experience"}
+
+_SECTION_ID = re.compile(r"^(\w+)(?:\[(\d+)\])?$")
+
+
+def section_id(key: str, index: int = None) -> str:
+    return key if index is None else f"{key}[{index}]"
+
+
+def parse_section_id(sid: str) -> Tuple[str, Any]:
+    match = _SECTION_ID.match(sid)
+    if not match:
+        raise ValueError(f"Invalid section id: {sid}")
+    key, index = match.groups()
+    return key, int(index) if index is not None else None
+
+
+def split_resume_sections(resume: dict) -> List[Tuple[str, Any]]:
+    """
+    Split a resume into (section_id, content) pairs worth enhancing.
+    Empty sections are skipped.
+    """
+    sections = []
+    for key in ENHANCEABLE_SECTIONS:
+        value = resume.get(key)
+        if not value:
+            continue
+        if key in PER_ENTRY_SECTIONS and isinstance(value, list):
+            for i, entry in enumerate(value):
+                if entry:
+                    sections.append((section_id(key, i), entry))
+        else:
+            sections.append((key, value))
+    return sections
+
+
+def get_section(resume: dict, sid: str) -> Any:
+    key, index = parse_section_id(sid)
+    value = resume.get(key)
+    if index is None:
+        return value
+    if isinstance(value, list) and index < len(value):
+        return value[index]
+    return None
+
+
+def is_compatible(original: Any, enhanced: Any) -> bool:
+    """
+    Accept an enhanced section only if it keeps the original's shape:
+    same type, same number of list items and no dropped dict keys.
+    The LLM is told not to remove information; this enforces it.
+    """
+    if isinstance(original, str):
+        # Blank fields may stay blank; filled ones may not be emptied
+        return isinstance(enhanced, str) and (bool(enhanced.strip()) or not original.strip())
+    if isinstance(original, (list, tuple)):
+        # JSON has no tuples, so they come back as lists
+        return (
+            isinstance(enhanced, list)
+            and len(enhanced) == len(original)
+            and all(is_compatible(o, e) for o, e in zip(original, enhanced))
+        )
+    if isinstance(original, dict):
+        return isinstance(enhanced, dict) and all(
+            k in enhanced and is_compatible(v, enhanced[k]) for k, v in original.items()
+        )
+    # Numbers, booleans, None: must come back unchanged
+    return original == enhanced
+
+
+def fill_missing(original: Any, partial: Any) -> Any:
+    """
+    Complete a section recovered from truncated LLM output: dict keys and
+    trailing list items the output never reached are taken from `original`.
+    """
+    if isinstance(original, dict) and isinstance(partial, dict):
+        filled = {k: fill_missing(v, partial[k]) if k in partial else v for k, v in original.items()}
+        filled.update((k, v) for k, v in partial.items() if k not in original)
+        return filled
+    if isinstance(original, (list, tuple)) and isinstance(partial, list):
+        head = [fill_missing(o, p) for o, p in zip(original, partial)]
+        return head + list(original[len(head):])
+    return partial
+
+
+def merge_section(resume: dict, sid: str, content: Any) -> bool:
+    """
+    Write one enhanced section into `resume` in place.
+
+    Returns:
+        True if merged, False if the content was rejected (shape changed)
+    """
+    original = get_section(resume, sid)
+    if original is None or not is_compatible(original, content):
+        return False
+    key, index = parse_section_id(sid)
+    if index is None:
+        resume[key] = content
+    else:
+        resume[key][index] = content
+    return True
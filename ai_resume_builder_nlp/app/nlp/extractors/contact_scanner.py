@@ -0,0 +1,199 @@
+"""
+Contact Scanner - linear-time scanners for phone, email, profile URLs and
+years of experience.
+
+These replace regexes whose optional groups and adjacent unbounded
+quantifiers backtrack on adversarial input (a pasted table of numbers, a long
+run of separators or of email-local characters could take seconds). Each
+scanner makes a single left-to-right pass, never revisits a character more
+than a constant number of times, and so runs in O(len(text)) whatever the
+input. benchmarks/bench_redos.py measures them against the old patterns.
+"""
+from typing import Dict, Optional
+
+MIN_PHONE_DIGITS = 7
+MAX_PHONE_DIGITS = 15  # E.164
+
+PHONE_SEPARATORS = "-. \t"
+EMAIL_LOCAL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-")
+EMAIL_DOMAIN_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-")
+URL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._~%/-:?=&#+")
+
+# Host -> profile key; a URL must have a path after the host
+PROFILE_HOSTS = {"linkedin.com/": "linkedin", "github.com/": "github"}
+# At most this many characters of scheme/subdomain before the host ("https://www.")
+MAX_URL_PREFIX = 16
+
+YEAR_UNITS = ("years", "year", "yrs", "yr")
+
+
+def _is_word(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _is_digit(char: str) -> bool:
+    return "0" <= char <= "9"
+
+
+def scan_phone(text: str) -> Optional[str]:
+    """
+    First phone number in text: a run of digit groups joined by single
+    separators ("-", ".", space) with an optional leading "+" and a
+    parenthesized area code, holding MIN_PHONE_DIGITS..MAX_PHONE_DIGITS digits.
+    A longer run (a number followed by years) is cut back to the last digit
+    group that still fits.
+    """
+    n = len(text)
+    i = 0
+    while i < n:
+        char = text[i]
+        if not (_is_digit(char) or (char in "+(" and i + 1 < n and _is_digit(text[i + 1]))):
+            i += 1
+            continue
+
+        start = i
+        digits = 0
+        last_digit_end = i
+        fit_end = 0  # end of the last digit group that leaves a valid count
+        open_paren = False
+        gap = 0  # consecutive separators since the last digit
+        j = i
+        while j < n:
+            char = text[j]
+            if _is_digit(char):
+                digits += 1
+                gap = 0
+                last_digit_end = j + 1
+                if MIN_PHONE_DIGITS <= digits <= MAX_PHONE_DIGITS and not (j + 1 < n and _is_digit(text[j + 1])):
+                    fit_end = j + 1
+            elif char == "+" and j == start:
+                pass
+            elif char == "(" and not open_paren and digits <= 3:
+                open_paren = True
+            elif char == ")" and open_paren:
+                open_paren = False
+            elif char in PHONE_SEPARATORS:
+                gap += 1
+                if gap > 1:
+                    break
+            else:
+                break
+            j += 1
+
+        if fit_end:
+            candidate = text[start:fit_end]
+            if candidate.startswith("(") and ")" not in candidate:
+                candidate = candidate[1:]
+            return candidate
+        i = max(j, i + 1)
+    return None
+
+
+def scan_email(text: str) -> Optional[str]:
+    """
+    First email address in text. Same matches as
+    \\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}\\b, found by expanding
+    around each "@"; "@" is in neither character set, so the expansions of
+    consecutive "@"s never overlap.
+    """
+    n = len(text)
+    at = text.find("@")
+    while at != -1:
+        # Local part: leftmost word boundary in the run of local characters
+        run_start = at
+        while run_start > 0 and text[run_start - 1] in EMAIL_LOCAL_CHARS:
+            run_start -= 1
+        start = None
+        for p in range(run_start, at):
+            if (p > 0 and _is_word(text[p - 1])) != _is_word(text[p]):
+                start = p
+                break
+
+        # Domain: longest prefix of the run ending in "." + 2 letters at a word boundary
+        end = at + 1
+        while end < n and text[end] in EMAIL_DOMAIN_CHARS:
+            end += 1
+        if start is not None:
+            k = end
+            while k > at + 1:
+                letters = 0
+                while k - letters - 1 > at and text[k - letters - 1].isascii() and text[k - letters - 1].isalpha():
+                    letters += 1
+                dot = k - letters - 1
+                boundary = k == n or not _is_word(text[k])
+                if letters >= 2 and boundary and text[dot] == "." and dot > at + 1:
+                    return text[start:k]
+                # The next candidate end is before this letter run
+                k = k - letters - 1 if letters else k - 1
+        at = text.find("@", end)
+    return None
+
+
+def scan_profile_urls(text: str) -> Dict[str, str]:
+    """LinkedIn and GitHub profile URLs in text, as written: {"linkedin": ..., "github": ...}."""
+    lowered = text.lower()
+    found = {}
+    for host, key in PROFILE_HOSTS.items():
+        at = lowered.find(host)
+        while at != -1:
+            # Optional subdomain ("www.", "uk.") and scheme before the host
+            start = at
+            if start > 1 and text[start - 1] == ".":
+                sub = start - 1
+                while sub > 0 and at - sub < MAX_URL_PREFIX and text[sub - 1].isalnum():
+                    sub -= 1
+                if sub < start - 1:
+                    start = sub
+            for scheme in ("https://", "http://"):
+                if lowered.startswith(scheme, start - len(scheme)) and start >= len(scheme):
+                    start -= len(scheme)
+                    break
+
+            if start > 0 and (_is_word(text[start - 1]) or text[start - 1] in "./"):
+                at = lowered.find(host, at + len(host))  # part of another word or URL
+                continue
+
+            end = at + len(host)
+            while end < len(text) and text[end] in URL_CHARS:
+                end += 1
+            url = text[start:end].rstrip(".,;:?#&/)")
+            if len(url) > at - start + len(host):
+                found[key] = url
+                break
+            # Nothing but punctuation after the host, so no other host occurs before end
+            at = lowered.find(host, end)
+    return found
+
+
+def scan_years_of_experience(text: str) -> Optional[int]:
+    """
+    First "<number> [+] years/yrs" in text, as \\b(\\d+)\\s*\\+?\\s*(years?|yrs?)\\b
+    (case-insensitive) would find it, in one pass over the digit runs.
+    """
+    n = len(text)
+    i = 0
+    while i < n:
+        if not text[i].isdecimal():
+            i += 1
+            continue
+        start = i
+        while i < n and text[i].isdecimal():
+            i += 1
+        if start > 0 and _is_word(text[start - 1]):
+            continue
+        j = i
+        while j < n and text[j].isspace():
+            j += 1
+        if j < n and text[j] == "+":
+            j += 1
+            while j < n and text[j].isspace():
+                j += 1
+        window = text[j:j + 5].lower()
+        for unit in YEAR_UNITS:
+            if window.startswith(unit):
+                after = j + len(unit)
+                if after == n or not _is_word(text[after]):
+                    return int(text[start:i])
+        # Skipped whitespace cannot start another number, so resume after it
+        i = max(i, j)
+    return None
@@ -2,6 +2,11 @@ import re
 import json 
 from pathlib import Path
 
+from app.services.knowledge_base import get_knowledge_base
+from app.nlp.extractors.contact_scanner import (
+    scan_email, scan_phone, scan_profile_urls, scan_years_of_experience,
+)
+
 #importing all the json files here
 
 ROLE_KEYWORDS= Path(__file__).resolve().parents[2]/'data'/'role_keywords.json'
@@ -21,22 +26,14 @@ for group in COMPANIES_JSON.values():
         for alias in company.get("aliases", []):
             COMPANIES.append(alias.lower())
 
-Email_Regex = re.compile(
-    r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"
-)
-
-Years_Regex = re.compile(
-    r"\b(\d+)\s*\+?\s*(years?|yrs?)\b",
-    re.IGNORECASE
-)
-
-Company_REGEX = re.compile(
-    r"\b(?:at|with|for)\s+([A-Z][A-Za-z0-9&.\- ]+)",
-)
-
-# Phone number patterns (international formats)
-Phone_Regex = re.compile(
-    r"(?:\+\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,5}[-.\s]?\d{3,5}[-.\s]?\d{0,5}"
+# Candidate company spans: up to 4 capitalized tokens after "at"/"with"/"for"/
+# "joined"/"@" or starting a line or a "|", ",", dash-separated header field.
+# Tokens are capped at 40 characters and line starts skip only spaces/tabs, so
+# a start never scans past its own span ("-A-A-A..." or blank lines stay linear).
+Company_Span_Regex = re.compile(
+    r"(?:\b(?:at|with|for|joined)\s+|@\s*|^[ \t]*|[|,\u2013\u2014-]\s*)"
+    r"([A-Z][\w&.'-]{0,39}(?:[ \t]+[A-Z&][\w&.'-]{0,39}){0,3})",
+    re.MULTILINE,
 )
 
 # Name extraction patterns
@@ -45,27 +42,24 @@ Name_Patterns = [
     re.compile(r"^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)(?:\.|,|\n)", re.MULTILINE),  # Name at start of line
 ]
 
-# Location patterns
+# Location patterns; spans are bounded so a long run of words is not rescanned from every "from"
 Location_Patterns = [
-    re.compile(r"(?:based in|located in|from|living in|residing in)\s+([A-Za-z][A-Za-z\s,]+?)(?:\.|,|\n|$)", re.IGNORECASE),
-    re.compile(r"location[:\s]+([A-Za-z][A-Za-z\s,]+?)(?:\.|,|\n|$)", re.IGNORECASE),
+    re.compile(r"(?:based in|located in|from|living in|residing in)\s+([A-Za-z][A-Za-z\s,]{1,80}?)(?:\.|,|\n|$)", re.IGNORECASE),
+    re.compile(r"location[:\s]+([A-Za-z][A-Za-z\s,]{1,80}?)(?:\.|,|\n|$)", re.IGNORECASE),
 ]
 
 def extract_email(text: str):
-    match = Email_Regex.search(text)
-    return match.group(0) if match else None
+    return scan_email(text)
 
 
 def extract_phone(text: str):
-    """Extract phone number from text."""
-    match = Phone_Regex.search(text)
-    if match:
-        phone = match.group(0).strip()
-        # Ensure it looks like a phone (at least 7 digits)
-        digits = re.sub(r'\D', '', phone)
-        if len(digits) >= 7:
-            return phone
-    return None
+    """Extract phone number from text (7-15 digits, see contact_scanner)."""
+    return scan_phone(text)
+
+
+def extract_profile_links(text: str) -> dict:
+    """LinkedIn / GitHub profile URLs, e.g. {"linkedin": "linkedin.com/in/jane"}."""
+    return scan_profile_urls(text)
 
 
 def extract_name(text: str):
@@ -93,10 +87,7 @@ def extract_location(text: str):
 
 
 def extract_years_of_experience(text:str):      
-    match = Years_Regex.search(text)
-    if not match:
-        return None
-    return int(match.group(1))
+    return scan_years_of_experience(text)
 
 DOMINANT_ROLE_SIGNALS = {
     "data_scientist": [
@@ -139,13 +130,30 @@ def extract_company(text : str):
     for company in COMPANIES:
         if f"{company}" in f"{text_lower}":
             return company.title()
+    return extract_company_fuzzy(text)
+
+def extract_company_fuzzy(text: str):
+    """
+    Typo-tolerant fallback ("Goolge", "Microsfot", "Infosys Ltd."): look up
+    candidate spans in the knowledge base's company index, longest first.
+    """
+    index = get_knowledge_base().company_index
+    for match in Company_Span_Regex.finditer(text):
+        tokens = match.group(1).split()
+        for n in range(len(tokens), 0, -1):
+            name = index.best(" ".join(tokens[:n]))
+            if name:
+                return name
     return None
 
 def extract_entities(text: str) -> dict:
+    links = extract_profile_links(text)
     return {
         "name": extract_name(text),
         "email": extract_email(text),
         "phone": extract_phone(text),
+        "linkedin": links.get("linkedin"),
+        "github": links.get("github"),
         "location": extract_location(text),
         "years": extract_years_of_experience(text),
         "role": extract_role(text),
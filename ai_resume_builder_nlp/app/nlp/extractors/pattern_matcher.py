@@ -1,7 +1,8 @@
 import re 
 
+# (?<!\d): only whole numbers start a match, so a long digit run is not rescanned from every digit
 METRIC_REGEX = re.compile(
-     r"(\d+%|\d+\s+(?:bugs?|features?|issues?|clients?|users?))",
+     r"(?<!\d)(\d+%|\d+\s+(?:bugs?|features?|issues?|clients?|users?))",
     re.IGNORECASE
 )   
 
@@ -54,6 +54,54 @@ DEGREE_REGEX = re.compile("|".join(DEGREE_PATTERNS), re.IGNORECASE)
 # Year extraction pattern
 YEAR_REGEX = re.compile(r'\b(19|20)\d{2}\b')
 
+# Longest free-text span (role, company, field of study, institution name) the
+# fallback patterns below capture. Unbounded lazy spans such as [A-Za-z\s&]+?
+# were rescanned from every possible start and went quadratic on long runs of
+# words; with a bound each start costs at most MAX_SPAN steps.
+MAX_SPAN = 80
+
+DEGREE_TYPES = r"(?:Bachelor'?s?|Master'?s?|Ph\.?D\.?|Doctor(?:ate)?|Associate'?s?|MBA|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|B\.?Tech\.?|M\.?Tech\.?)"
+
+# "Bachelor's degree in Information Technology" - stops at "from/at" or an institution name
+FULL_DEGREE_REGEX = re.compile(
+    rf"({DEGREE_TYPES}(?:\s+degree)?(?:\s+in\s+[A-Za-z\s&]{{1,{MAX_SPAN}}}?)?)"
+    r"(?:\s+(?:from|at)\s+|\s+[A-Z][a-z]{1,40}\s+(?:University|College|Institute)|$)",
+    re.IGNORECASE,
+)
+
+# "Degree in Field"
+SIMPLE_DEGREE_REGEX = re.compile(
+    rf"((?:Bachelor'?s?|Master'?s?|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|B\.?Tech\.?|M\.?Tech\.?)(?:'?s)?(?:\s+degree)?(?:\s+in\s+[A-Za-z\s&]{{1,{MAX_SPAN}}})?)",
+    re.IGNORECASE,
+)
+
+INSTITUTION_PATTERNS = [
+    re.compile(rf"(?:from|at|@)\s+([A-Z][A-Za-z\s&]{{1,{MAX_SPAN}}}(?:University|College|Institute|School|Academy))"),
+    re.compile(rf"([A-Z][A-Za-z\s&]{{1,{MAX_SPAN}}}(?:University|College|Institute|School|Academy))"),
+    re.compile(r"(?:from|at|@)\s+([A-Z][A-Za-z\s]+)\b"),
+]
+
+# "Role at Company (Date)"
+ROLE_AT_COMPANY_REGEX = re.compile(
+    rf"^([A-Za-z\s]{{1,{MAX_SPAN}}}?)\s+at\s+([A-Za-z0-9\s&.,]{{1,{MAX_SPAN}}}?)(?:\s*\(|\s*,|\s*-|\s*$)",
+    re.IGNORECASE,
+)
+
+# "Company - Role" or "Company | Role"
+COMPANY_ROLE_REGEX = re.compile(
+    rf"^([A-Za-z0-9\s&.,]{{1,{MAX_SPAN}}}?)\s*[-|]\s*([A-Za-z\s]{{1,{MAX_SPAN}}}?)(?:\s*\(|\s*,|\s*$)",
+    re.IGNORECASE,
+)
+
+ROLE_WORD_REGEX = re.compile(
+    r"(?:Engineer|Developer|Manager|Lead|Analyst|Designer|Architect|Director|Specialist|Consultant|Coordinator|Intern|Associate)\b",
+    re.IGNORECASE,
+)
+
+# Bullets and numbered items at the start of a line ([ \t]*, not \s*, so runs of
+# blank lines are not rescanned from every newline)
+LIST_ITEM_SPLIT_REGEX = re.compile(r"\n[ \t]*[-•*]\s*|\n[ \t]*\d+[.)]\s*")
+
 
 def normalize_header(header: str) -> str:
     """Map various header names to canonical section names."""
@@ -90,7 +138,7 @@ def normalize_header(header: str) -> str:
 def split_into_list_items(content: str) -> List[str]:
     """Split content by common list separators (bullets, dashes, newlines with content)."""
     # Split by common bullet patterns
-    items = re.split(r"\n\s*[-•*]\s*|\n\s*\d+[.)]\s*", content)
+    items = LIST_ITEM_SPLIT_REGEX.split(content)
     
     # Filter and clean
     result = []
@@ -108,24 +156,16 @@ def extract_degree(text: str) -> str:
     Tries to capture the full degree including field of study.
     """
     # First try to extract full degree with field of study
-    # Pattern: "Bachelor's degree in Information Technology" (stops before "from/at" or institution name)
-    full_degree_patterns = [
-        # "Bachelor's degree in Information Technology" - stops at "from/at" or end
-        r"((?:Bachelor'?s?|Master'?s?|Ph\.?D\.?|Doctor(?:ate)?|Associate'?s?|MBA|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|B\.?Tech\.?|M\.?Tech\.?)(?:\s+degree)?(?:\s+in\s+[A-Za-z\s&]+?)?)(?:\s+(?:from|at)\s+|\s+[A-Z][a-z]+\s+(?:University|College|Institute)|$)",
-    ]
-    
-    for pattern in full_degree_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            degree = match.group(1).strip()
-            # Clean up trailing prepositions/articles
-            degree = re.sub(r'\s+(from|at)\s*$', '', degree, flags=re.IGNORECASE)
-            if len(degree) > 3:
-                return degree
+    match = FULL_DEGREE_REGEX.search(text)
+    if match:
+        degree = match.group(1).strip()
+        # Clean up trailing prepositions/articles
+        degree = re.sub(r'\s+(from|at)\s*$', '', degree, flags=re.IGNORECASE)
+        if len(degree) > 3:
+            return degree
     
     # Try simpler pattern: "Degree in Field"
-    simple_pattern = r"((?:Bachelor'?s?|Master'?s?|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|B\.?Tech\.?|M\.?Tech\.?)(?:'?s)?(?:\s+degree)?(?:\s+in\s+[A-Za-z\s&]+)?)"
-    match = re.search(simple_pattern, text, re.IGNORECASE)
+    match = SIMPLE_DEGREE_REGEX.search(text)
     if match:
         degree = match.group(1).strip()
         # Stop at "from" or "at" or institution names
@@ -152,14 +192,8 @@ def extract_institution(text: str) -> str:
         return institution
     
     # Fallback: Look for common institution patterns
-    patterns = [
-        r"(?:from|at|@)\s+([A-Z][A-Za-z\s&]+(?:University|College|Institute|School|Academy))",
-        r"([A-Z][A-Za-z\s&]+(?:University|College|Institute|School|Academy))",
-        r"(?:from|at|@)\s+([A-Z][A-Za-z\s]+)\b",
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in INSTITUTION_PATTERNS:
+        match = pattern.search(text)
         if match:
             inst = match.group(1).strip()
             if len(inst) > 2:
@@ -168,6 +202,42 @@ def extract_institution(text: str) -> str:
     return ""
 
 
+def _is_title_char(char: str) -> bool:
+    return char.isspace() or ("a" <= char.lower() <= "z")
+
+
+def _word_boundary(text: str, i: int) -> bool:
+    before = i > 0 and (text[i - 1].isalnum() or text[i - 1] == "_")
+    after = i < len(text) and (text[i].isalnum() or text[i] == "_")
+    return before != after
+
+
+def extract_role_title(text: str) -> str:
+    """
+    Role title ending in a role word ("Senior Software Engineer"): what
+    \\b([A-Za-z\\s]{0,MAX_SPAN}(?:Engineer|...|Associate))\\b would match, found
+    from the role-word hits instead of trying the span at every word start.
+    """
+    for match in ROLE_WORD_REGEX.finditer(text):
+        # Leftmost word boundary within MAX_SPAN letters/spaces before the role word
+        start = match.start()
+        while start > 0 and match.start() - start < MAX_SPAN and _is_title_char(text[start - 1]):
+            start -= 1
+        while start <= match.start() and not _word_boundary(text, start):
+            start += 1
+        if start > match.start():
+            continue
+
+        # Greedy: extend to the last role word still within the span
+        end = match.end()
+        for later in ROLE_WORD_REGEX.finditer(text, match.end(), start + MAX_SPAN + len("Coordinator")):
+            if later.start() - start > MAX_SPAN or not all(_is_title_char(c) for c in text[end:later.start()]):
+                break
+            end = later.end()
+        return text[start:end]
+    return ""
+
+
 def extract_year(text: str) -> str:
     """Extract year from text."""
     match = YEAR_REGEX.search(text)
@@ -199,10 +269,7 @@ def parse_experience_entry(text: str) -> Dict[str, Any]:
     # Fallback: Extract role and company using patterns if not found via JSON
     if not entry["role"] or not entry["company"]:
         # Pattern: "Role at Company (Date)"
-        role_at_company = re.search(
-            r"^([A-Za-z\s]+?)\s+at\s+([A-Za-z0-9\s&.,]+?)(?:\s*\(|\s*,|\s*-|\s*$)",
-            text, re.IGNORECASE
-        )
+        role_at_company = ROLE_AT_COMPANY_REGEX.search(text)
         if role_at_company:
             if not entry["role"]:
                 entry["role"] = role_at_company.group(1).strip()
@@ -211,10 +278,7 @@ def parse_experience_entry(text: str) -> Dict[str, Any]:
         
         # Pattern: "Company - Role" or "Company | Role"
         if not entry["company"] or not entry["role"]:
-            company_role = re.search(
-                r"^([A-Za-z0-9\s&.,]+?)\s*[-|]\s*([A-Za-z\s]+?)(?:\s*\(|\s*,|\s*$)",
-                text, re.IGNORECASE
-            )
+            company_role = COMPANY_ROLE_REGEX.search(text)
             if company_role:
                 if not entry["company"]:
                     entry["company"] = company_role.group(1).strip()
@@ -223,14 +287,9 @@ def parse_experience_entry(text: str) -> Dict[str, Any]:
     
     # If still no role, try extracting common role titles
     if not entry["role"]:
-        patterns = [
-            r"\b([A-Za-z\s]*(?:Engineer|Developer|Manager|Lead|Analyst|Designer|Architect|Director|Specialist|Consultant|Coordinator|Intern|Associate))\b",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                entry["role"] = match.group(1).strip()
-                break
+        title = extract_role_title(text)
+        if title:
+            entry["role"] = title.strip()
     
     # Use JSON-backed metrics extractor for achievements
     metrics = extract_metrics(text)
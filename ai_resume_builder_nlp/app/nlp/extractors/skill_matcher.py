@@ -1,25 +1,23 @@
 import json 
 from pathlib import Path
 
+from app.services.knowledge_base import compile_term_regex, get_knowledge_base
+from app.services.skill_index import skill_terms
+
 SKILLS_PATH = Path(__file__).resolve().parents[2]/'data'/'skills.json'
 
 with open(SKILLS_PATH, "r", encoding="utf-8") as f:
     SKILLS_DATA = json.load(f)
 
+# lowercase spelling -> skills.json spelling, and a whole-token matcher over them
+# ("Java" is not found in "JavaScript", nor "R" in every word with an r)
+SKILL_SPELLINGS = {skill.lower(): skill for skill in skill_terms(SKILLS_DATA)}
+SKILL_REGEX = compile_term_regex(list(SKILL_SPELLINGS.values()))
+
 
 def extract_skills(text:str) -> list:
-    text_lower = text.lower()
-    found_skills = set()
+    found_skills = {SKILL_SPELLINGS[match.group()] for match in SKILL_REGEX.finditer(text.lower())}
 
-    for section in SKILLS_DATA.values():
-        if isinstance(section, dict):
-            for skill_list in section.values():
-                for skill in skill_list:
-                    if(skill.lower() in text_lower):
-                        found_skills.add(skill)
-        elif isinstance(section, list):
-            for skill in section:
-                if(skill.lower() in text.lower()):
-                    found_skills.add(skill)
+    # Aliases and misspellings ("k8s", "ReactJS", "Pyhton") -> canonical skill
+    found_skills.update(get_knowledge_base().skill_index.find(text))
     return sorted(found_skills)
-
@@ -24,6 +24,8 @@ def generate_resume_structure(extracted: dict) -> dict:
             "name": entities.get("name", ""),
             "email": entities.get("email", ""),
             "phone": entities.get("phone", ""),
+            "linkedin": entities.get("linkedin", ""),
+            "github": entities.get("github", ""),
             "location": entities.get("location", ""),
             "role": entities.get("role", ""),
             "company": entities.get("company", ""),
@@ -0,0 +1,207 @@
+"""
+Resume Scorer - quantitative ATS and completeness scores for a normalized resume.
+
+Scores come from three signals plus section completeness:
+- keyword coverage against role_keywords.json for the detected role
+- action-verb density (bullets opening with a verb from action_verbs.json)
+- metric density (bullets containing a number)
+
+All keyword sets and matchers are precompiled in the KnowledgeBase, so a
+score is a handful of regex scans over the resume text.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.knowledge_base import get_knowledge_base
+
+NUMBER_REGEX = re.compile(r"\d")
+BULLET_SPLIT_REGEX = re.compile(r"\n\s*[-•*]?\s*")
+
+# Weights for the completeness score (sum to 100)
+COMPLETENESS_WEIGHTS = {
+    "name": 10,
+    "email": 15,
+    "phone": 10,
+    "summary": 15,
+    "experience": 20,
+    "education": 15,
+    "skills": 15,
+}
+
+COMPLETENESS_ISSUES = {
+    "name": "Missing name",
+    "email": "Missing email address",
+    "phone": "Missing phone number",
+    "summary": "Missing professional summary",
+    "experience": "No work experience listed",
+    "education": "No education listed",
+    "skills": "No skills listed",
+}
+
+# Weights for the ATS score (sum to 1.0)
+ATS_WEIGHTS = {
+    "keywords": 0.4,
+    "action_verbs": 0.2,
+    "metrics": 0.2,
+    "completeness": 0.2,
+}
+
+
+def collect_bullets(resume: Dict[str, Any]) -> List[str]:
+    """Gather the sentence-level content (experience lines, bullets, project text) of a resume."""
+    bullets = []
+
+    experience = resume.get("experience", [])
+    if isinstance(experience, list):
+        for exp in experience:
+            if isinstance(exp, str):
+                bullets.extend(BULLET_SPLIT_REGEX.split(exp))
+                continue
+            if not isinstance(exp, dict):
+                continue
+            description = exp.get("description") or ""
+            if isinstance(description, str):
+                bullets.extend(BULLET_SPLIT_REGEX.split(description))
+            for key in ("bullets", "achievements"):
+                items = exp.get(key, [])
+                if not isinstance(items, list):
+                    continue
+                for item in items:
+                    # achievements are often metrics pulled out of the description
+                    if isinstance(item, str) and item not in description:
+                        bullets.append(item)
+
+    projects = resume.get("projects", [])
+    if isinstance(projects, list):
+        for proj in projects:
+            if isinstance(proj, str):
+                bullets.append(proj)
+            elif isinstance(proj, dict):
+                bullets.append(proj.get("description") or proj.get("summary") or "")
+
+    return [b.strip() for b in bullets if isinstance(b, str) and b.strip()]
+
+
+def resume_text(resume: Dict[str, Any], bullets: List[str]) -> str:
+    """Lowercased searchable text of a resume: summary, skills, roles and bullets."""
+    parts = [resume.get("summary") or ""]
+
+    skills = resume.get("skills", [])
+    if isinstance(skills, list):
+        parts.extend(s for s in skills if isinstance(s, str))
+
+    experience = resume.get("experience", [])
+    if isinstance(experience, list):
+        parts.extend(exp.get("role") or "" for exp in experience if isinstance(exp, dict))
+
+    parts.extend(bullets)
+    return "\n".join(p for p in parts if isinstance(p, str)).lower()
+
+
+def keyword_coverage(text: str, role: Optional[str]) -> Tuple[Optional[str], List[str], List[str]]:
+    """
+    Match role keywords in `text`. If `role` is unknown, the role with the best
+    coverage wins. Returns (role_key, matched, missing) with original spellings.
+    """
+    kb = get_knowledge_base()
+    role_key = kb.resolve_role(role)
+
+    if role_key is None:
+        best = 0.0
+        for candidate, regex in kb.role_keyword_regex.items():
+            found = set(regex.findall(text))
+            coverage = len(found) / max(len(kb.role_keywords[candidate]), 1)
+            if coverage > best:
+                best, role_key = coverage, candidate
+        if role_key is None:
+            return None, [], []
+
+    keywords = kb.role_keywords[role_key]
+    found = set(kb.role_keyword_regex[role_key].findall(text))
+    matched = [original for kw, original in keywords.items() if kw in found]
+    missing = [original for kw, original in keywords.items() if kw not in found]
+    return role_key, matched, missing
+
+
+def completeness(resume: Dict[str, Any]) -> Tuple[int, List[str]]:
+    """Weighted share of the core resume fields that are filled in."""
+    profile = resume.get("profile")
+    if not isinstance(profile, dict):
+        profile = {}
+
+    present = {
+        "name": profile.get("name") or resume.get("name"),
+        "email": profile.get("email") or resume.get("email"),
+        "phone": profile.get("phone") or resume.get("phone"),
+        "summary": resume.get("summary"),
+        "experience": resume.get("experience"),
+        "education": resume.get("education"),
+        "skills": resume.get("skills"),
+    }
+
+    score = 0
+    issues = []
+    for field, weight in COMPLETENESS_WEIGHTS.items():
+        if present[field]:
+            score += weight
+        else:
+            issues.append(COMPLETENESS_ISSUES[field])
+    return score, issues
+
+
+def score_resume(resume: Dict[str, Any], role: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Compute ATS and completeness scores for a normalized resume.
+
+    Args:
+        resume: final_resume dict
+        role: Detected role title (e.g. entities["role"]); detected from keywords if None
+
+    Returns:
+        Dict in the ValidationInfo shape (atsScore, completenessScore, issues)
+        plus the underlying signals.
+    """
+    if not isinstance(resume, dict):
+        resume = {}
+
+    kb = get_knowledge_base()
+    bullets = collect_bullets(resume)
+    text = resume_text(resume, bullets)
+
+    role_key, matched, missing = keyword_coverage(text, role)
+    coverage = len(matched) / max(len(matched) + len(missing), 1)
+
+    verb_density = (
+        sum(1 for b in bullets if kb.starts_with_action_verb(b)) / len(bullets) if bullets else 0.0
+    )
+    metric_density = (
+        sum(1 for b in bullets if NUMBER_REGEX.search(b)) / len(bullets) if bullets else 0.0
+    )
+
+    completeness_score, issues = completeness(resume)
+
+    ats_score = round(100 * (
+        ATS_WEIGHTS["keywords"] * coverage
+        + ATS_WEIGHTS["action_verbs"] * verb_density
+        + ATS_WEIGHTS["metrics"] * metric_density
+    ) + ATS_WEIGHTS["completeness"] * completeness_score)
+
+    if role_key and coverage < 0.3:
+        issues.append(f"Low keyword coverage for {role_key.replace('_', ' ')}")
+    if bullets and verb_density < 0.5:
+        issues.append("Few bullets start with a strong action verb")
+    if bullets and metric_density == 0:
+        issues.append("No quantified achievements")
+
+    return {
+        "atsScore": max(0, min(100, ats_score)),
+        "completenessScore": completeness_score,
+        "issues": issues,
+        "role": role_key,
+        "keywordCoverage": round(coverage, 3),
+        "matchedKeywords": matched,
+        "missingKeywords": missing,
+        "actionVerbDensity": round(verb_density, 3),
+        "metricDensity": round(metric_density, 3),
+    }
@@ -3,11 +3,32 @@ Custom Pipeline Runner for Non-LLM Agents
 This module provides a sequential executor that calls agent tool functions directly,
 respecting the user's design of having non-LLM agents with custom functions.
 """
+import os
+import time
+import asyncio
+import inspect
 import logging
-from typing import Dict, Any, List, Callable
+from contextlib import nullcontext
+from typing import Dict, Any, List, Callable, Optional
+
+from app.utils.executors import pack_call, call_in_process
+from app.utils.metrics import get_metrics
+from app.services.llm_client import run_sync
+from app.utils.cancellation import (
+    CancellationToken, OperationCancelled, current_token, use_token, STAGES_SKIPPED, STAGE_MS,
+)
 
 logger = logging.getLogger(__name__)
 
+# Run the CPU-heavy stages on the process pool when their payload is at least
+# PROCESS_OFFLOAD_MIN_BYTES (marshalled), so a large pasted CV does not hold
+# the GIL of the worker serving every other request. Off by default.
+PROCESS_OFFLOAD = os.getenv("PROCESS_OFFLOAD", "false").lower() == "true"
+PROCESS_OFFLOAD_MIN_BYTES = int(os.getenv("PROCESS_OFFLOAD_MIN_BYTES", "20000"))
+
+# Stages that may be offloaded: regex extraction and schema normalization
+OFFLOADABLE_STAGES = ("understanding", "generation")
+
 
 class ResumePipeline:
     """
@@ -20,30 +41,74 @@ class ResumePipeline:
         from app.agents.understanding_agent.agent import understand_text
         from app.agents.clarification_agent.clarification_agent import clarification_questions
         from app.agents.generation_agent.agent import generate_resume
-        from app.agents.enhancer_agent.agent import pre_enhance
+        from app.agents.enhancer_agent.agent import enhance_resume_async
+        from app.agents.scoring_agent.agent import score_passthrough
         from app.agents.qa_agent.agent import qa_passthrough
         from app.agents.formatting_agent.agent import formatting_passthrough
+        from app.agents.rendering_agent.agent import render_passthrough
         
         # Define pipeline stages with their functions and names
         self.stages: List[tuple[str, Callable]] = [
             ("understanding", understand_text),
             ("clarification", clarification_questions),
             ("generation", generate_resume),
-            ("enhancement", pre_enhance),
+            ("enhancement", enhance_resume_async),
+            ("scoring", score_passthrough),
             ("qa", qa_passthrough),
             ("formatting", formatting_passthrough),
+            ("rendering", render_passthrough),
         ]
     
     def run(self, initial_state: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Execute the pipeline synchronously.
+        Execute the pipeline synchronously (scripts, benchmarks, tests).
+        Must not be called from inside a running event loop; use run_async there.
+        """
+        return run_sync(self.run_async(initial_state))
+
+    async def run_async(self, initial_state: Dict[str, Any], gate: Optional[Callable] = None,
+                        token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """
+        Execute the pipeline.
+
+        Stages may be plain functions or coroutines; coroutine stages (the LLM
+        enhancement) are awaited so the event loop keeps serving other requests
+        while they wait on the gateway.
         
         Args:
             initial_state: Dict containing 'raw_text' and optionally 'answers'
+            gate: Optional callable(stage_name) returning an async context
+                manager held while the stage runs (see services.scheduler);
+                exceptions it raises abort the run
+            token: Optional CancellationToken (defaults to the current one);
+                it is current while stages run and checked before each stage
             
         Returns:
             Dict containing the final pipeline state with all accumulated results
+
+        Raises:
+            OperationCancelled if the token is cancelled or its deadline passes
         """
+        token = token or current_token()
+        progress = {"stage": 0}
+        try:
+            with use_token(token):
+                return await self._run_stages(initial_state, gate, token, progress)
+        except (OperationCancelled, asyncio.CancelledError) as e:
+            if isinstance(e, OperationCancelled):
+                reason = e.reason
+            else:
+                reason = token.reason if token and token.reason else "task_cancelled"
+            metrics = get_metrics()
+            metrics.inc(f"cancellation.requests.{reason}")
+            # The interrupted stage and everything after it
+            for stage_name, _ in self.stages[progress["stage"]:]:
+                metrics.inc(f"{STAGES_SKIPPED}.{stage_name}")
+            logger.info(f"Pipeline cancelled ({reason}) at stage {self.stages[progress['stage']][0]}")
+            raise
+
+    async def _run_stages(self, initial_state: Dict[str, Any], gate: Optional[Callable],
+                          token: Optional[CancellationToken], progress: Dict[str, int]) -> Dict[str, Any]:
         state = dict(initial_state)
         
         # Merge user answers into state immediately so they are available to agents
@@ -56,7 +121,8 @@ class ResumePipeline:
 
         logger.info("Starting resume pipeline execution")
         
-        for stage_name, stage_func in self.stages:
+        for position, (stage_name, stage_func) in enumerate(self.stages):
+            progress["stage"] = position
             # Smart stage skipping: skip if output already exists in state
             if stage_name == "understanding" and state.get("entities"):
                 logger.info("Skipping understanding: already has extracted data")
@@ -74,46 +140,70 @@ class ResumePipeline:
                     logger.info("Skipping clarification: all required fields present")
                     continue
             
+            if token:
+                token.raise_if_cancelled()
             logger.info(f"Executing stage: {stage_name}")
             
-            try:
-                # Call the stage function with appropriate input
-                if stage_name == "understanding":
-                    # Understanding stage takes raw text as input
-                    result = stage_func(state.get("raw_text", ""))
-                else:
-                    # Other stages take the accumulated state
-                    result = stage_func(state)
+            async with (gate(stage_name) if gate else nullcontext()):
+                try:
+                    started = time.perf_counter()
+                    # Call the stage function with appropriate input
+                    if stage_name == "understanding":
+                        # Understanding stage takes raw text as input
+                        args = (state.get("raw_text", ""),)
+                        kwargs = {"parallel": state.get("parallel_extraction")}
+                    else:
+                        # Other stages take the accumulated state
+                        args, kwargs = (state,), {}
+                    result = await self._call_stage(stage_name, stage_func, args, kwargs)
+                    if inspect.isawaitable(result):
+                        result = await result
                 
-                # Merge result into state
-                if isinstance(result, dict):
-                    state.update(result)
-                    logger.info(f"Stage {stage_name} completed. Keys added: {list(result.keys())}")
+                    get_metrics().observe(f"{STAGE_MS}.{stage_name}", (time.perf_counter() - started) * 1000)
+
+                    # Merge result into state
+                    if isinstance(result, dict):
+                        state.update(result)
+                        logger.info(f"Stage {stage_name} completed. Keys added: {list(result.keys())}")
                 
-                # Early exit conditions
-                if stage_name == "clarification" and state.get("needs_more_information"):
-                    logger.info("Pipeline paused: clarification needed")
-                    return state
+                    # Early exit conditions
+                    if stage_name == "clarification" and state.get("needs_more_information"):
+                        logger.info("Pipeline paused: clarification needed")
+                        return state
                     
-                if stage_name == "qa" and not state.get("qa_passed", True):
-                    logger.info("Pipeline stopped: QA failed")
-                    return state
+                    if stage_name == "qa" and not state.get("qa_passed", True):
+                        logger.info("Pipeline stopped: QA failed")
+                        return state
                     
-            except Exception as e:
-                logger.error(f"Error in stage {stage_name}: {e}", exc_info=True)
-                state["error"] = str(e)
-                state["failed_stage"] = stage_name
-                return state
+                except OperationCancelled:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error in stage {stage_name}: {e}", exc_info=True)
+                    state["error"] = str(e)
+                    state["failed_stage"] = stage_name
+                    return state
         
         logger.info("Pipeline execution completed successfully")
         return state
-    
-    async def run_async(self, initial_state: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Async wrapper for the pipeline (for FastAPI compatibility).
-        Currently runs synchronously but can be extended for async stages.
-        """
-        return self.run(initial_state)
+
+    async def _call_stage(self, stage_name: str, stage_func: Callable, args: tuple, kwargs: dict) -> Any:
+        """Call a stage inline, or on the process pool if offloading applies."""
+        if not PROCESS_OFFLOAD or stage_name not in OFFLOADABLE_STAGES:
+            return stage_func(*args, **kwargs)
+
+        if stage_name == "generation":
+            # Generation never reads raw_text; don't ship it across
+            args = ({k: v for k, v in args[0].items() if k != "raw_text"},)
+        payload = pack_call(args, kwargs)
+        if payload is None or len(payload) < PROCESS_OFFLOAD_MIN_BYTES:
+            return stage_func(*args, **kwargs)
+
+        metrics = get_metrics()
+        metrics.inc("pipeline.offloaded_stages")
+        metrics.observe("pipeline.offload_payload_bytes", len(payload))
+        logger.info(f"Offloading stage {stage_name} to the process pool ({len(payload)} bytes)")
+        # Understanding echoes raw_text back; the state already has it
+        return await call_in_process(stage_func, payload, omit_keys=("raw_text",))
 
 
 # Singleton instance
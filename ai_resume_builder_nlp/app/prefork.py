@@ -0,0 +1,155 @@
+"""
+Pre-fork production launcher.
+
+The parent process imports the app, loads the JSON data files and compiles
+the KnowledgeBase once, freezes the GC, binds the listening socket and then
+forks N uvicorn workers. Workers inherit the loaded data copy-on-write
+instead of re-parsing every file and rebuilding every matcher.
+
+gc.freeze() moves everything loaded so far into the permanent generation,
+so the workers' garbage collector never walks (and writes GC headers into)
+the shared pages. Refcount updates still dirty the pages of objects a
+worker actually touches, but the bulk of the data stays shared.
+
+Usage:
+    python -m app.prefork --workers 4 --port 8000
+    python -m app.prefork --app main:app --workers 4     # legacy root API
+    WEB_CONCURRENCY=4 python -m app.prefork
+
+POSIX only (os.fork). The parent supervises its workers: a worker that dies
+is replaced, SIGTERM/SIGINT stop all of them.
+"""
+import gc
+import os
+import sys
+import signal
+import logging
+import argparse
+import importlib
+
+import uvicorn
+from uvicorn.importer import import_from_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+
+
+def preload(app_path: str):
+    """
+    Import the app and build every read-only structure the workers share.
+
+    Returns:
+        The ASGI app object
+    """
+    from app.services.data_loader import get_data_loader
+    from app.services.knowledge_base import get_knowledge_base
+
+    get_data_loader()
+    get_knowledge_base()
+    # Extractors compile their JSON-derived regexes at import
+    importlib.import_module("app.pipeline_runner")
+    app = import_from_string(app_path)
+
+    gc.collect()
+    gc.freeze()
+    logger.info(f"✓ Preloaded {app_path} ({gc.get_freeze_count()} objects frozen)")
+    return app
+
+
+def stop_worker(signum, frame) -> None:
+    # Before uvicorn installs its handlers, and when it re-raises the signal
+    # after its graceful shutdown: exit through SystemExit, not the default
+    # action, so the exit hooks still run
+    raise SystemExit(0)
+
+
+def run_worker(config: uvicorn.Config, sock) -> None:
+    """
+    Child process body: serve on the inherited socket, then exit the
+    interpreter normally so atexit hooks run (queued resume and artifact
+    writes, search index and ranker snapshots). Never returns: SystemExit
+    unwinds the parent's frames the child was forked from, none of which
+    catch it.
+    """
+    signal.signal(signal.SIGINT, stop_worker)
+    signal.signal(signal.SIGTERM, stop_worker)
+    try:
+        uvicorn.Server(config).run(sockets=[sock])
+    except SystemExit:
+        pass
+    except BaseException:
+        logger.exception(f"Worker {os.getpid()} crashed")
+        sys.exit(1)
+    sys.exit(0)
+
+
+def serve(app_path: str, host: str, port: int, workers: int, preload_app: bool = True) -> None:
+    if preload_app:
+        app = preload(app_path)
+    else:
+        # Every worker imports and builds everything itself (for comparison)
+        app = app_path
+
+    config = uvicorn.Config(app, host=host, port=port, log_level="info")
+    sock = config.bind_socket()
+    sock.set_inheritable(True)
+
+    children = {}
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            run_worker(config, sock)
+        children[pid] = True
+        logger.info(f"Started worker {pid}")
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        spawn()
+    logger.info(f"✓ Serving {app_path} on http://{host}:{port} with {workers} workers (parent {os.getpid()})")
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        children.pop(pid, None)
+        if not stopping:
+            logger.warning(f"Worker {pid} exited with status {status}; restarting")
+            spawn()
+
+    sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-fork launcher for the resume API")
+    parser.add_argument("--app", default="app.main:app", help="ASGI app import string")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--no-preload", action="store_true", help="let each worker load everything itself")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    if not hasattr(os, "fork"):
+        sys.exit("app.prefork needs os.fork (Linux/macOS); use uvicorn directly on this platform")
+    serve(args.app, args.host, args.port, max(1, args.workers), preload_app=not args.no_preload)
+
+
+if __name__ == "__main__":
+    main()
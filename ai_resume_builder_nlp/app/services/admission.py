@@ -0,0 +1,223 @@
+"""
+Admission control for the resume pipeline.
+
+Requests go through one of two lanes:
+
+- the pipeline lane: at most ADMISSION_MAX_CONCURRENCY run at once; up to
+  ADMISSION_MAX_QUEUE more wait in FIFO order for ADMISSION_QUEUE_TIMEOUT_SECONDS.
+  Each client (by peer address) is also rate limited by a token bucket.
+  A request that cannot get in is rejected straight away with 429 (rate
+  limited) or 503 (queue full / waited too long) and a Retry-After hint,
+  instead of piling more work onto an overloaded worker.
+- the fast lane: cheap requests (test_mode, which skips the LLM) start
+  immediately without queueing, up to ADMISSION_MAX_FAST_LANE at once;
+  beyond that they queue in the pipeline lane. They are still rate limited,
+  since test_mode is chosen by the client.
+
+Repeats answered from the result cache do not go through admission at all.
+
+Queue wait is exported as the "admission.queue_wait_ms" observation.
+State is per process; with several workers each admits independently.
+"""
+import os
+import math
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Callable, Deque, Dict, Optional
+
+from app.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+ADMISSION_MAX_CONCURRENCY = int(os.getenv("ADMISSION_MAX_CONCURRENCY", "16"))
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "64"))
+ADMISSION_QUEUE_TIMEOUT_SECONDS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS", "10"))
+ADMISSION_RATE_PER_CLIENT = float(os.getenv("ADMISSION_RATE_PER_CLIENT", "2"))  # requests/s
+ADMISSION_BURST_PER_CLIENT = float(os.getenv("ADMISSION_BURST_PER_CLIENT", "10"))
+ADMISSION_MAX_FAST_LANE = int(os.getenv("ADMISSION_MAX_FAST_LANE", "4"))
+
+# Idle buckets are pruned once this many clients are tracked
+MAX_TRACKED_CLIENTS = 10000
+
+QUEUE_WAIT_MS = "admission.queue_wait_ms"
+
+
+class AdmissionRejected(Exception):
+    """The request was not admitted; answer with status_code and Retry-After."""
+
+    def __init__(self, status_code: int, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens/s, holding at most `burst`."""
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Take one token. Returns 0 on success, else seconds until one is available."""
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate if self.rate > 0 else float("inf")
+
+    def is_full(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.burst
+
+
+class AdmissionController:
+    """Bounded FIFO queue plus per-client rate limiting in front of the pipeline"""
+
+    def __init__(
+        self,
+        max_concurrency: int = ADMISSION_MAX_CONCURRENCY,
+        max_queue: int = ADMISSION_MAX_QUEUE,
+        queue_timeout_s: float = ADMISSION_QUEUE_TIMEOUT_SECONDS,
+        rate_per_client: float = ADMISSION_RATE_PER_CLIENT,
+        burst_per_client: float = ADMISSION_BURST_PER_CLIENT,
+        max_fast_lane: int = ADMISSION_MAX_FAST_LANE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout_s = queue_timeout_s
+        self.rate_per_client = rate_per_client
+        self.burst_per_client = burst_per_client
+        self.max_fast_lane = max_fast_lane
+        self.clock = clock
+
+        self.active = 0
+        self.fast_lane_active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._buckets: Dict[str, TokenBucket] = {}
+        # Moving average of how long an admitted request holds its slot
+        self._service_s = 1.0
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for w in self._waiters if not w.done())
+
+    def _check_rate(self, client_id: str) -> None:
+        if self.rate_per_client <= 0:
+            return
+        now = self.clock()
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            if len(self._buckets) >= MAX_TRACKED_CLIENTS:
+                self._prune_buckets(now)
+            bucket = self._buckets[client_id] = TokenBucket(self.rate_per_client, self.burst_per_client, now)
+        wait = bucket.take(now)
+        if wait > 0:
+            get_metrics().inc("admission.rejected.rate_limited")
+            raise AdmissionRejected(429, "rate_limited", wait)
+
+    def _prune_buckets(self, now: float) -> None:
+        """Forget clients whose bucket has refilled; they are indistinguishable from new ones."""
+        for client_id in [c for c, b in self._buckets.items() if b.is_full(now)]:
+            del self._buckets[client_id]
+
+    def _estimated_wait(self) -> float:
+        """Rough time until a newly queued request would start."""
+        return self._service_s * (self.queued + 1) / max(1, self.max_concurrency)
+
+    async def _acquire(self) -> None:
+        if self.active < self.max_concurrency and not self.queued:
+            self.active += 1
+            return
+        if self.queued >= self.max_queue:
+            get_metrics().inc("admission.rejected.queue_full")
+            raise AdmissionRejected(503, "queue_full", self._estimated_wait())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # A released slot is handed over by resolving the future
+            await asyncio.wait_for(waiter, self.queue_timeout_s)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            get_metrics().inc("admission.rejected.queue_timeout")
+            raise AdmissionRejected(503, "queue_timeout", self._estimated_wait())
+        except asyncio.CancelledError:
+            # Client went away; give back a slot that was handed over meanwhile
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # slot passes straight to the next waiter
+                return
+        self.active -= 1
+
+    @asynccontextmanager
+    async def slot(self, client_id: str, fast_lane: bool = False):
+        """
+        Hold a pipeline slot for the duration of the block.
+
+        Raises:
+            AdmissionRejected if the request must be turned away
+        """
+        metrics = get_metrics()
+        self._check_rate(client_id)
+        if fast_lane and self.fast_lane_active < self.max_fast_lane:
+            metrics.inc("admission.fast_lane")
+            self.fast_lane_active += 1
+            try:
+                yield
+            finally:
+                self.fast_lane_active -= 1
+            return
+
+        queued_at = self.clock()
+        await self._acquire()
+        started = self.clock()
+        metrics.observe(QUEUE_WAIT_MS, (started - queued_at) * 1000)
+        metrics.inc("admission.admitted")
+        try:
+            yield
+        finally:
+            self._service_s = 0.9 * self._service_s + 0.1 * (self.clock() - started)
+            self._release()
+
+
+_admission_instance: Optional[AdmissionController] = None
+
+def get_admission_controller() -> AdmissionController:
+    """Get or create the singleton AdmissionController"""
+    global _admission_instance
+    if _admission_instance is None:
+        _admission_instance = AdmissionController()
+        logger.info(
+            f"✓ Admission control: {_admission_instance.max_concurrency} concurrent, "
+            f"queue {_admission_instance.max_queue}, {_admission_instance.rate_per_client}/s per client"
+        )
+    return _admission_instance
@@ -0,0 +1,138 @@
+"""
+Bitmap postings for facet filters (skills, industries, roles, years).
+
+Every key ("skill:kubernetes", "industry:fintech", ...) owns one bitset
+over document ids, stored as a NumPy uint64 array: bit `id` is set when the
+document has that key. Boolean filters are then whole-array AND/OR
+operations that run in C, and counting uses the hardware popcount
+(np.bitwise_count), so a query over 1M documents touches ~122 KB per key
+whatever the selectivity.
+
+All bitsets share the same length; it grows by doubling when a larger id is
+added, so incremental adds are amortized O(1). The reserved key ALL marks
+every indexed document.
+
+The index is not thread-safe; SearchIndex serializes access.
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+ALL = "*"
+
+# Initial capacity in 64-bit words (4096 documents)
+INITIAL_WORDS = 64
+
+
+class BitmapIndex:
+    """Dense uint64 bitsets keyed by facet term, indexed by document id"""
+
+    def __init__(self):
+        self.words = INITIAL_WORDS
+        self.bitmaps: Dict[str, np.ndarray] = {ALL: np.zeros(self.words, dtype=np.uint64)}
+
+    def __len__(self) -> int:
+        return self.count(self.bitmaps[ALL])
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id >> 6 < self.words and bool(self.bitmaps[ALL][doc_id >> 6] >> np.uint64(doc_id & 63) & np.uint64(1))
+
+    def keys(self) -> List[str]:
+        return [key for key in self.bitmaps if key != ALL]
+
+    def _grow(self, doc_id: int) -> None:
+        needed = (doc_id >> 6) + 1
+        if needed <= self.words:
+            return
+        words = max(needed, self.words * 2)
+        for key, bits in self.bitmaps.items():
+            grown = np.zeros(words, dtype=np.uint64)
+            grown[:self.words] = bits
+            self.bitmaps[key] = grown
+        self.words = words
+
+    def add(self, doc_id: int, keys: Iterable[str]) -> None:
+        """Index a document under keys, replacing whatever it had before."""
+        self.remove(doc_id)
+        self._grow(doc_id)
+        word, mask = doc_id >> 6, np.uint64(1) << np.uint64(doc_id & 63)
+        for key in (ALL, *keys):
+            bits = self.bitmaps.get(key)
+            if bits is None:
+                bits = self.bitmaps[key] = np.zeros(self.words, dtype=np.uint64)
+            bits[word] |= mask
+
+    def remove(self, doc_id: int) -> None:
+        """Clear a document from every bitset (O(number of keys))."""
+        if doc_id not in self:
+            return
+        word, keep = doc_id >> 6, ~(np.uint64(1) << np.uint64(doc_id & 63))
+        for bits in self.bitmaps.values():
+            bits[word] &= keep
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        return self.bitmaps.get(key)
+
+    def all_of(self, keys: Iterable[str], within: Optional[np.ndarray] = None) -> np.ndarray:
+        """Documents having every key (intersected with `within`, default all documents)."""
+        result = (self.bitmaps[ALL] if within is None else within).copy()
+        for key in keys:
+            bits = self.bitmaps.get(key)
+            if bits is None:
+                return np.zeros(self.words, dtype=np.uint64)
+            np.bitwise_and(result, bits, out=result)
+        return result
+
+    def any_of(self, keys: Iterable[str]) -> np.ndarray:
+        """Documents having at least one of keys."""
+        result = np.zeros(self.words, dtype=np.uint64)
+        for key in keys:
+            bits = self.bitmaps.get(key)
+            if bits is not None:
+                np.bitwise_or(result, bits, out=result)
+        return result
+
+    @staticmethod
+    def count(bits: np.ndarray) -> int:
+        return int(np.bitwise_count(bits).sum())
+
+    @staticmethod
+    def ids(bits: np.ndarray) -> np.ndarray:
+        """Ascending document ids whose bit is set."""
+        return np.flatnonzero(np.unpackbits(bits.view(np.uint8), bitorder="little"))
+
+    @staticmethod
+    def to_mask(bits: np.ndarray, length: int) -> np.ndarray:
+        """Boolean array of `length` entries, True where the document id's bit is set."""
+        mask = np.unpackbits(bits.view(np.uint8), bitorder="little").view(bool)
+        if len(mask) >= length:
+            return mask[:length]
+        return np.concatenate([mask, np.zeros(length - len(mask), dtype=bool)])
+
+    @staticmethod
+    def test(bits: np.ndarray, doc_ids: np.ndarray) -> np.ndarray:
+        """Boolean mask: which of doc_ids are set in bits (ids past the end are not)."""
+        doc_ids = np.asarray(doc_ids, dtype=np.int64)
+        inside = (doc_ids >> 6) < len(bits)
+        mask = np.zeros(len(doc_ids), dtype=bool)
+        ids = doc_ids[inside]
+        mask[inside] = (bits[ids >> 6] >> (ids & 63).astype(np.uint64)) & np.uint64(1) == 1
+        return mask
+
+    def items(self) -> Iterator[Tuple[str, bytes]]:
+        """(key, bitset bytes) for persisting, ALL included."""
+        for key, bits in self.bitmaps.items():
+            yield key, bits.tobytes()
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[str, bytes]]) -> "BitmapIndex":
+        index = cls()
+        loaded = {key: np.frombuffer(data, dtype=np.uint64) for key, data in items}
+        if ALL not in loaded:
+            return index
+        index.words = max(INITIAL_WORDS, *(len(bits) for bits in loaded.values()))
+        for key, bits in loaded.items():
+            padded = np.zeros(index.words, dtype=np.uint64)
+            padded[:len(bits)] = bits
+            index.bitmaps[key] = padded
+        return index
@@ -0,0 +1,293 @@
+"""
+Candidate Ranker - rank every stored resume against a job description.
+
+Each stored resume (the pipeline's formatted final resume) is a TF-IDF row
+over the job matcher's keyword vocabulary, kept in a CandidateMatrix with
+row index = resume id. Ranking a posting is then:
+
+1. one sparse matrix x dense vector product (scipy's CSR kernel) giving the
+   cosine similarity of every candidate at once,
+2. an optional filter mask from the search index's facet bitsets (role,
+   location and years, which the profile takes from the extracted
+   entities; skills and industries too),
+3. np.argpartition for the top k, so only k scores are sorted.
+
+New and re-saved resumes come from the repository's change feed, which
+numbers every committed save of every process: each ranking first applies
+what was committed since the last one (refresh()), so all workers of a
+pre-forked server rank the same candidates. They go to a small delta matrix that is scored separately and overrides the
+base rows; the delta is merged into the base once it holds more than 1/16
+of it (at least DELTA_MERGE_ROWS rows), so merging costs amortized O(row
+size) per resume. The merged base is built beside the old one and swapped
+in, so queries never wait for a merge.
+
+The matrix is saved next to the database at exit with the feed position it
+covers (unless another worker saved one covering more) and reloaded on
+start, catching up only later saves (all of them if the vocabulary
+changed).
+"""
+import os
+import time
+import atexit
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from app.services.bitmap_index import BitmapIndex
+from app.services.job_matcher import JobMatcher, KeywordVectorizer, get_job_matcher, text_hash
+from app.services.resume_repository import ResumeRepository, get_resume_repository
+from app.services.search_index import SearchIndex, get_search_index
+from app.utils.json_utils import flatten_text
+from app.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+DELTA_MERGE_ROWS = int(os.getenv("RANKER_DELTA_MERGE_ROWS", "4096"))
+CATCH_UP_BATCH = 1000
+
+
+def splice_rows(base: sparse.csr_matrix, ids: np.ndarray, rows: sparse.csr_matrix) -> sparse.csr_matrix:
+    """
+    A copy of base with row ids[i] replaced by rows[i] (growing it as
+    needed), built in linear time: the new row lengths give the new indptr,
+    the delta entries are placed at their rows' offsets, and the kept base
+    entries fill every other slot in their original order.
+    """
+    order = np.argsort(ids)
+    ids, rows = ids[order], rows[order]
+    height = max(base.shape[0], int(ids[-1]) + 1)
+
+    base_lengths = np.diff(base.indptr)
+    lengths = np.zeros(height, dtype=np.int64)
+    lengths[:base.shape[0]] = base_lengths
+    lengths[ids] = np.diff(rows.indptr)
+    indptr = np.zeros(height + 1, dtype=np.int64)
+    np.cumsum(lengths, out=indptr[1:])
+
+    row_lengths = np.diff(rows.indptr)
+    spliced = np.repeat(indptr[ids] - rows.indptr[:-1], row_lengths) + np.arange(rows.nnz)
+    data = np.empty(indptr[-1], dtype=np.float32)
+    indices = np.empty(indptr[-1], dtype=base.indices.dtype)
+    data[spliced] = rows.data
+    indices[spliced] = rows.indices
+
+    kept_rows = np.ones(base.shape[0], dtype=bool)
+    kept_rows[ids[ids < base.shape[0]]] = False
+    kept = np.repeat(kept_rows, base_lengths)
+    free = np.ones(indptr[-1], dtype=bool)
+    free[spliced] = False
+    data[free] = base.data[kept]
+    indices[free] = base.indices[kept]
+    if indptr[-1] < np.iinfo(np.int32).max:
+        indptr = indptr.astype(np.int32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(height, base.shape[1]))
+
+
+class CandidateMatrix:
+    """Candidate TF-IDF rows by resume id: a CSR base plus a delta of recent rows"""
+
+    def __init__(self, columns: int, base: Optional[sparse.csr_matrix] = None,
+                 present: Optional[np.ndarray] = None, merge_rows: int = DELTA_MERGE_ROWS):
+        self.columns = columns
+        self.merge_rows = merge_rows
+        self.base = base if base is not None else sparse.csr_matrix((0, columns), dtype=np.float32)
+        # present[id]: a resume with that id has a row (base or delta)
+        self.present = present if present is not None else np.zeros(self.base.shape[0], dtype=bool)
+        self._delta: Dict[int, sparse.csr_matrix] = {}
+        self._delta_stack: Optional[Tuple[np.ndarray, sparse.csr_matrix]] = None
+        # _lock guards the fields above (held briefly); _write_lock serializes add/compact
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return int(self.present.sum())
+
+    def add(self, rows: Dict[int, sparse.csr_matrix]) -> None:
+        """Set the rows of these resume ids (1 x columns each)."""
+        if not rows:
+            return
+        with self._write_lock:
+            with self._lock:
+                self._delta.update(rows)
+                self._delta_stack = None
+                top = max(rows) + 1
+                if top > len(self.present):
+                    present = np.zeros(max(top, len(self.present) * 2), dtype=bool)
+                    present[:len(self.present)] = self.present
+                    self.present = present
+                self.present[list(rows)] = True
+                full = len(self._delta) > max(self.merge_rows, self.base.shape[0] // 16)
+            if full:
+                self._merge()
+
+    def _stacked_delta(self) -> Optional[Tuple[np.ndarray, sparse.csr_matrix]]:
+        if self._delta and self._delta_stack is None:
+            ids = np.fromiter(self._delta, dtype=np.int64, count=len(self._delta))
+            self._delta_stack = ids, sparse.vstack(list(self._delta.values()), format="csr", dtype=np.float32)
+        return self._delta_stack if self._delta else None
+
+    def _merge(self) -> None:
+        """Fold the delta into the base (caller holds _write_lock, so the delta cannot change)."""
+        with self._lock:
+            base, (ids, rows) = self.base, self._stacked_delta()
+        merged = splice_rows(base, ids, rows)
+        with self._lock:
+            self.base = merged
+            self._delta = {}
+            self._delta_stack = None
+
+    def compact(self) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """Merge the delta; (base, present) for persisting."""
+        with self._write_lock:
+            if self._delta:
+                self._merge()
+            with self._lock:
+                return self.base, self.present.copy()
+
+    def scores(self, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(score per resume id, present mask): every candidate's dot product with query."""
+        with self._lock:
+            base, present, delta = self.base, self.present.copy(), self._stacked_delta()
+        query = query.astype(np.float32, copy=False)
+        scores = np.zeros(len(present), dtype=np.float32)
+        scores[:base.shape[0]] = base @ query
+        if delta is not None:
+            ids, rows = delta
+            scores[ids] = rows @ query
+        return scores, present
+
+    def top_k(self, query: np.ndarray, k: int, mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, int]:
+        """(resume ids, scores) of the k best candidates within mask, best first, and how many were eligible."""
+        scores, eligible = self.scores(query)
+        if mask is not None:
+            # Ids added after the mask was built are not in it
+            eligible[:len(mask)] &= mask[:len(eligible)]
+            eligible[len(mask):] = False
+        candidates = np.flatnonzero(eligible)
+        scores = scores[candidates]
+        k = min(k, len(candidates))
+        if k == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32), len(candidates)
+        top = np.argpartition(scores, len(scores) - k)[-k:]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return candidates[top], scores[top], len(candidates)
+
+
+class CandidateRanker:
+    """CandidateMatrix fed by the resume repository, filtered by the search index"""
+
+    def __init__(self, repository: ResumeRepository, search_index: SearchIndex, matcher: JobMatcher):
+        self.repository = repository
+        self.search_index = search_index
+        self.matcher = matcher
+        self.vectorizer: KeywordVectorizer = matcher.vectorizer
+        self.vocabulary_hash = text_hash(self.vectorizer.terms)
+        self.snapshot_path = Path(f"{repository.path}.candidates.npz")
+
+        # seen_seq: the matrix holds every save up to this feed position
+        self.matrix, self.seen_seq = self._load_snapshot()
+        self._refresh_lock = threading.Lock()
+        caught_up = self.refresh()
+        logger.info(f"✓ Candidate ranker ready ({len(self.matrix)} candidates, {caught_up} vectorized)")
+
+    def vector(self, resume: Dict[str, Any]) -> sparse.csr_matrix:
+        return self.vectorizer.vectorize(flatten_text(resume)).astype(np.float32)
+
+    def refresh(self) -> int:
+        """Vectorize every save committed since the last refresh, by any process. Returns how many."""
+        if self.repository.last_change() <= self.seen_seq:
+            return 0
+        total = 0
+        with self._refresh_lock:
+            while True:
+                changes = self.repository.changes(self.seen_seq, CATCH_UP_BATCH)
+                if not changes:
+                    return total
+                self.matrix.add({resume_id: self.vector(resume) for _, resume_id, resume in changes})
+                self.seen_seq = changes[-1][0]
+                total += len(changes)
+
+    def _saved_seq(self) -> Optional[int]:
+        """Feed position of the saved matrix, None if there is none usable."""
+        try:
+            with np.load(self.snapshot_path) as saved:
+                if str(saved["vocabulary"]) != self.vocabulary_hash:
+                    return None
+                return int(saved["seq"])
+        except FileNotFoundError:
+            return None
+
+    def _load_snapshot(self) -> Tuple[CandidateMatrix, int]:
+        columns = len(self.vectorizer)
+        seq = self._saved_seq()
+        if seq is None:
+            if self.snapshot_path.exists():
+                logger.info("Keyword vocabulary changed; re-vectorizing every candidate")
+            return CandidateMatrix(columns), 0
+        with np.load(self.snapshot_path) as saved:
+            base = sparse.csr_matrix(
+                (saved["data"], saved["indices"], saved["indptr"]), shape=(len(saved["indptr"]) - 1, columns),
+            )
+            return CandidateMatrix(columns, base, saved["present"]), seq
+
+    def snapshot(self) -> None:
+        """Save the matrix so the next start only vectorizes later saves."""
+        self.repository.flush()
+        self.refresh()
+        with self._refresh_lock:
+            seq = self.seen_seq
+            base, present = self.matrix.compact()
+        saved = self._saved_seq()
+        if saved is not None and saved >= seq:
+            # Another worker saved a matrix covering at least as much
+            return
+        temp = self.snapshot_path.with_name(f".{self.snapshot_path.name}.{os.getpid()}.tmp")
+        with open(temp, "wb") as f:
+            np.savez(f, data=base.data, indices=base.indices, indptr=base.indptr, present=present,
+                     seq=np.array(seq), vocabulary=np.array(self.vocabulary_hash))
+        os.replace(temp, self.snapshot_path)
+        logger.info(f"✓ Saved candidate matrix ({len(self.matrix)} candidates, {base.nnz} entries)")
+
+    def rank(self, job_description: str, k: int = 20, skills: Iterable[str] = (), industries: Iterable[str] = (),
+             roles: Iterable[str] = (), locations: Iterable[str] = (), min_years: int = 0,
+             max_years: Optional[int] = None) -> Dict[str, Any]:
+        """
+        The k stored resumes most similar to the job description among those
+        passing the facet filters. Returns {"considered", "hits": [{"id",
+        "input_hash", "score", "resume", "created_at"}]}, best first.
+        """
+        started = time.perf_counter()
+        self.refresh()
+        query = self.matcher.job_vector(job_description)
+        mask = None
+        if any((skills, industries, roles, locations, min_years, max_years is not None)):
+            bits = self.search_index.facet_bits(skills, industries, roles, locations, min_years, max_years)
+            mask = BitmapIndex.to_mask(bits, len(self.matrix.present))
+        ids, scores, considered = self.matrix.top_k(query, k, mask)
+
+        stored = self.repository.resumes(ids.tolist())
+        hits = [{**stored[resume_id], "score": float(score)}
+                for resume_id, score in zip(ids.tolist(), scores) if resume_id in stored]
+
+        metrics = get_metrics()
+        metrics.inc("ranker.queries")
+        metrics.observe("ranker.query_ms", (time.perf_counter() - started) * 1000)
+        return {"considered": considered, "hits": hits}
+
+
+_candidate_ranker_instance: Optional[CandidateRanker] = None
+_candidate_ranker_lock = threading.Lock()
+
+def get_candidate_ranker() -> CandidateRanker:
+    """Get or create the singleton CandidateRanker"""
+    global _candidate_ranker_instance
+    with _candidate_ranker_lock:
+        if _candidate_ranker_instance is None:
+            _candidate_ranker_instance = CandidateRanker(get_resume_repository(), get_search_index(), get_job_matcher())
+            # Runs before the repository closes (atexit is last-in, first-out)
+            atexit.register(_candidate_ranker_instance.snapshot)
+    return _candidate_ranker_instance
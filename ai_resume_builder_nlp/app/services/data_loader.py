@@ -59,6 +59,7 @@ class DataLoader:
         self._cache['action_verbs'] = self._load_json_file('action_verbs.json')
         self._cache['companies'] = self._load_json_file('companies.json')
         self._cache['role_keywords'] = self._load_json_file('role_keywords.json')
+        self._cache['skill_aliases'] = self._load_json_file('skill_aliases.json')
         
         logger.info(f"✓ Loaded {len(self._cache)} data files")
     
@@ -77,6 +78,10 @@ class DataLoader:
     def get_role_keywords(self) -> Dict[str, Any]:
         """Get role-specific keywords"""
         return self._cache.get('role_keywords', {})
+
+    def get_skill_aliases(self) -> Dict[str, Any]:
+        """Get skill aliases (variant spellings -> canonical skill) and words never typo-corrected"""
+        return self._cache.get('skill_aliases', {})
     
     def get_all_data(self) -> Dict[str, Any]:
         """Get all loaded data as a single dictionary"""
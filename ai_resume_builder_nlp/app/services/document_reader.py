@@ -0,0 +1,236 @@
+"""
+Document Reader - text from uploaded PDF, DOCX and plain-text CVs.
+
+An upload is streamed chunk by chunk into a SpooledTemporaryFile that stays
+in memory up to UPLOAD_SPOOL_BYTES and spills to disk beyond that, so an
+upload never holds more than that much RAM whatever its size; bodies over
+MAX_UPLOAD_BYTES are refused while streaming (413), before they are read
+in full.
+
+Text is then pulled out one piece at a time -- a PDF page, a DOCX paragraph
+or table row, a chunk of a text file -- on the shared thread pool, keeping
+the event loop free, and extraction stops as soon as MAX_DOCUMENT_CHARS of
+text are collected: a 500-page PDF costs no more than its first pages, and
+the text handed to the pipeline is bounded like a pasted prompt. The
+compressed parts are bounded too: a DOCX body by its uncompressed size, a
+PDF stream (page content) by its decompressed size, MAX_PDF_STREAM_BYTES,
+where pypdf supports setting it (older releases keep their own fixed
+limits).
+
+pypdf and python-docx are imported on first use; when one is missing that
+format is answered with 501 and the others keep working.
+"""
+import os
+import time
+import codecs
+import asyncio
+import logging
+import zipfile
+import tempfile
+from contextlib import nullcontext
+from typing import Any, AsyncIterable, Dict, IO, Iterator, Optional, Tuple
+
+from app.utils.executors import get_thread_pool
+from app.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_SPOOL_BYTES = int(os.getenv("UPLOAD_SPOOL_BYTES", str(1024 * 1024)))
+MAX_DOCUMENT_CHARS = int(os.getenv("MAX_DOCUMENT_CHARS", "100000"))
+
+# Read size for plain-text uploads
+TEXT_CHUNK_BYTES = 64 * 1024
+# Uncompressed size allowed for word/document.xml (a DOCX is a zip; guards against zip bombs)
+MAX_DOCX_XML_BYTES = 50 * 1024 * 1024
+# Decompressed size allowed for one PDF stream, and for a page's content streams together
+MAX_PDF_STREAM_BYTES = 5 * 1024 * 1024
+# pypdf configuration limits set to MAX_PDF_STREAM_BYTES while reading an upload
+PDF_STREAM_LIMITS = (
+    "zlib_maximum_output_length", "lzw_maximum_output_length", "run_length_maximum_output_length",
+    "array_based_stream_maximum_output_length",
+)
+# Bytes inspected to recognize the format
+SNIFF_BYTES = 1024
+
+EXTRACT_MS = "upload.extract_ms"
+
+
+class DocumentRejected(Exception):
+    """The upload cannot be used; answer with status_code."""
+
+    def __init__(self, status_code: int, reason: str, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.reason = reason
+
+
+async def spool_upload(chunks: AsyncIterable[bytes], max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[IO[bytes], int]:
+    """
+    Copy an async stream of byte chunks (e.g. Request.stream()) into a
+    spooled temp file. Returns (file positioned at 0, size).
+
+    Raises:
+        DocumentRejected(413) as soon as more than max_bytes have arrived
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_BYTES)
+    size = 0
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > max_bytes:
+                raise DocumentRejected(413, "document_too_large", f"upload exceeds {max_bytes} bytes")
+            spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool, size
+
+
+def sniff_format(head: bytes) -> str:
+    """"pdf", "docx" or "txt" from the first bytes of the file."""
+    if b"%PDF-" in head:
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return "docx"
+    if head and b"\x00" not in head:
+        return "txt"
+    raise DocumentRejected(415, "unsupported_document", "expected a PDF, DOCX or plain-text file")
+
+
+def pdf_pages(file: IO[bytes]) -> Iterator[str]:
+    """Text of each page; pages are parsed only as they are requested."""
+    from pypdf import PdfReader
+    try:
+        from pypdf import apply_configuration
+        from pypdf.errors import LimitReachedError
+    except ImportError:
+        limits, LimitReachedError = nullcontext(), ()
+    else:
+        limits = apply_configuration(**{name: MAX_PDF_STREAM_BYTES for name in PDF_STREAM_LIMITS})
+
+    with limits:
+        reader = PdfReader(file)
+        if reader.is_encrypted and not reader.decrypt(""):
+            raise DocumentRejected(422, "encrypted_document", "the PDF is password protected")
+        try:
+            for page in reader.pages:
+                yield (page.extract_text() or "") + "\n"
+        except LimitReachedError:
+            raise DocumentRejected(413, "document_too_large", "a PDF page is too large once decompressed")
+
+
+def docx_blocks(file: IO[bytes]) -> Iterator[str]:
+    """Paragraphs and table rows in document order; merged cells are listed once."""
+    with zipfile.ZipFile(file) as archive:
+        try:
+            body = archive.getinfo("word/document.xml")
+        except KeyError:
+            raise DocumentRejected(415, "unsupported_document", "the zip file is not a DOCX document")
+        if body.file_size > MAX_DOCX_XML_BYTES:
+            raise DocumentRejected(413, "document_too_large", "the DOCX body is too large")
+    file.seek(0)
+
+    import docx
+    from docx.table import Table
+
+    for block in docx.Document(file).iter_inner_content():
+        if isinstance(block, Table):
+            for row in block.rows:
+                cells = []
+                for cell in row.cells:
+                    if cell.text and cell.text not in cells:
+                        cells.append(cell.text)
+                yield " | ".join(cells) + "\n"
+        else:
+            yield block.text + "\n"
+
+
+def text_chunks(file: IO[bytes]) -> Iterator[str]:
+    """UTF-8 text in TEXT_CHUNK_BYTES pieces (undecodable bytes replaced)."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = file.read(TEXT_CHUNK_BYTES)
+        if not chunk:
+            break
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+READERS = {"pdf": pdf_pages, "docx": docx_blocks, "txt": text_chunks}
+
+
+def extract_document_text(file: IO[bytes], fmt: str, max_chars: int = MAX_DOCUMENT_CHARS) -> Dict[str, Any]:
+    """
+    Pull text out of file piece by piece until max_chars are collected.
+
+    Returns:
+        {"text": str, "parts": pieces read (pages for a PDF), "truncated": bool}
+
+    Raises:
+        DocumentRejected: 501 if the format's library is not installed,
+            422 if the file cannot be parsed
+    """
+    parts, size, count, truncated = [], 0, 0, False
+    try:
+        for piece in READERS[fmt](file):
+            count += 1
+            if size + len(piece) > max_chars:
+                parts.append(piece[:max_chars - size])
+                truncated = True
+                break
+            parts.append(piece)
+            size += len(piece)
+    except DocumentRejected:
+        raise
+    except ImportError as e:
+        logger.warning(f"{fmt} upload refused: {e}")
+        raise DocumentRejected(501, "format_unavailable", f"{fmt} documents are not supported on this server")
+    except Exception as e:
+        logger.warning(f"Could not read {fmt} upload: {e}")
+        raise DocumentRejected(422, "unreadable_document", f"could not read the {fmt} document")
+    return {"text": "".join(parts).strip(), "parts": count, "truncated": truncated}
+
+
+async def read_upload(chunks: AsyncIterable[bytes], declared_length: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Spool an uploaded CV and extract its text on the thread pool.
+
+    Args:
+        chunks: the request body as an async stream of bytes
+        declared_length: Content-Length, if sent; a body that declares
+            more than MAX_UPLOAD_BYTES is refused without reading it
+
+    Returns:
+        extract_document_text's dict plus "format" and "bytes"
+
+    Raises:
+        DocumentRejected
+    """
+    metrics = get_metrics()
+    try:
+        if declared_length is not None and declared_length > MAX_UPLOAD_BYTES:
+            raise DocumentRejected(413, "document_too_large", f"upload exceeds {MAX_UPLOAD_BYTES} bytes")
+        spool, size = await spool_upload(chunks)
+        try:
+            fmt = sniff_format(spool.read(SNIFF_BYTES))
+            spool.seek(0)
+            started = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            document = await loop.run_in_executor(get_thread_pool(), extract_document_text, spool, fmt)
+            metrics.observe(EXTRACT_MS, (time.perf_counter() - started) * 1000)
+        finally:
+            spool.close()
+        if not document["text"]:
+            raise DocumentRejected(422, "no_text", "the document has no extractable text (is it a scan?)")
+    except DocumentRejected as e:
+        metrics.inc(f"upload.rejected.{e.reason}")
+        raise
+
+    metrics.inc(f"upload.documents.{fmt}")
+    metrics.observe("upload.bytes", size)
+    if document["truncated"]:
+        metrics.inc("upload.truncated")
+    logger.info(f"✓ Read {fmt} upload: {size} bytes, {document['parts']} parts, {len(document['text'])} chars")
+    return {**document, "format": fmt, "bytes": size}
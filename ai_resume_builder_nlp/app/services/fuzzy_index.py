@@ -0,0 +1,259 @@
+"""
+Typo-tolerant name lookup (companies, institutions).
+
+FuzzyIndex maps normalized names and aliases to their canonical spelling.
+A query is answered in three steps:
+
+1. exact dictionary hit on the normalized form ("Infosys Ltd." -> "infosys"),
+2. per-token matching against the vocabulary of name tokens: exact, or
+   within an edit budget that grows with the token's length. Every
+   vocabulary token is indexed under itself and its one-character deletions;
+   a query token looks up its own deletions (up to its budget), so a single
+   typo -- substitution, insertion, deletion or swap -- always meets its
+   target in a shared variant. Candidates are verified with a bounded
+   Damerau-Levenshtein (optimal string alignment) distance that gives up as
+   soon as the bound is exceeded, so "Goolge" and "Microsfot" are one edit
+   away. Two-edit matches that need two deletions on the indexed side (two
+   substitutions) are not found; indexing deeper would cost ~5x the memory,
+3. names are assembled from the token matches, starting from the query
+   position whose matches occur in the fewest names, and ranked by total
+   edit distance (capped by the budget for the whole name).
+
+Working per token keeps lookups fast on large directories where many names
+share words such as "Technologies": those words never drive candidate
+generation, and the variant table grows with the vocabulary rather than
+the number of names. The index is built once (see KnowledgeBase) and is
+read-only afterwards.
+"""
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Legal-form suffixes that do not distinguish companies
+LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "ltd", "limited", "llc", "llp", "plc", "corp", "corporation",
+    "co", "company", "gmbh", "pvt", "private", "pte", "sa", "ag", "bv", "group",
+})
+
+_NON_WORD = re.compile(r"[^a-z0-9&]+")
+
+# Deletions indexed per vocabulary token; queries delete up to their edit budget
+INDEX_DELETES = 1
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, punctuation to spaces, trailing legal suffixes dropped."""
+    tokens = _NON_WORD.sub(" ", name.lower()).split()
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def max_edits_for(key: str) -> int:
+    """Edit budget by length: short names and tokens must match exactly."""
+    if len(key) < 5:
+        return 0
+    if len(key) < 9:
+        return 1
+    return 2
+
+
+def bounded_distance(a: str, b: str, bound: int) -> Optional[int]:
+    """
+    Optimal string alignment distance between a and b (adjacent
+    transpositions count as one edit), or None if it exceeds bound.
+    """
+    if abs(len(a) - len(b)) > bound:
+        return None
+    if a == b:
+        return 0
+    previous2: Optional[List[int]] = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        ca = a[i - 1]
+        for j in range(1, len(b) + 1):
+            cost = 0 if ca == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and j > 1 and ca == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > bound:
+            return None
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= bound else None
+
+
+def deletes(token: str, depth: int) -> set:
+    """token and every string obtained by deleting up to depth characters from it."""
+    found, frontier = {token}, {token}
+    for _ in range(depth):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        found |= frontier
+    return found
+
+
+class TokenVocabulary:
+    """Distinct name tokens with a deletion-neighbourhood index for fuzzy matching"""
+
+    def __init__(self):
+        self.tokens: List[str] = []
+        self.ids: Dict[str, int] = {}
+        # token or one-deletion variant -> token id, or a list of ids when shared
+        self.variants: Dict[str, object] = {}
+
+    def add(self, token: str) -> int:
+        token_id = self.ids.get(token)
+        if token_id is None:
+            token_id = self.ids[token] = len(self.tokens)
+            self.tokens.append(token)
+            for variant in deletes(token, INDEX_DELETES):
+                held = self.variants.get(variant)
+                if held is None:
+                    self.variants[variant] = token_id
+                elif isinstance(held, list):
+                    held.append(token_id)
+                else:
+                    self.variants[variant] = [held, token_id]
+        return token_id
+
+    def matches(self, token: str, bound: int) -> Dict[int, int]:
+        """{token id: edit distance} for vocabulary tokens within bound of token."""
+        found: Dict[int, int] = {}
+        exact = self.ids.get(token)
+        if exact is not None:
+            found[exact] = 0
+        if bound == 0:
+            return found
+
+        candidates = set()
+        for variant in deletes(token, bound):
+            held = self.variants.get(variant)
+            if held is None:
+                continue
+            if isinstance(held, list):
+                candidates.update(held)
+            else:
+                candidates.add(held)
+        candidates.discard(exact)
+        for candidate in candidates:
+            distance = bounded_distance(token, self.tokens[candidate], bound)
+            if distance is not None:
+                found[candidate] = distance
+        return found
+
+
+class FuzzyIndex:
+    """Token-level fuzzy index over normalized names"""
+
+    def __init__(self, names: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            names: (spelling, canonical) pairs; the spelling is indexed and
+                lookups return the canonical name
+        """
+        self.keys: List[str] = []
+        self.canonical: List[str] = []
+        self.exact: Dict[str, int] = {}
+        self.vocabulary = TokenVocabulary()
+        self.entry_tokens: List[Tuple[int, ...]] = []
+        names_by_token: Dict[int, List[int]] = defaultdict(list)
+
+        for spelling, canonical in names:
+            key = normalize_name(spelling)
+            if not key or key in self.exact:
+                continue
+            entry = len(self.keys)
+            self.keys.append(key)
+            self.canonical.append(canonical)
+            self.exact[key] = entry
+            token_ids = tuple(self.vocabulary.add(token) for token in key.split())
+            self.entry_tokens.append(token_ids)
+            for token_id in set(token_ids):
+                names_by_token[token_id].append(entry)
+
+        # token id -> entries containing it
+        self.names_by_token: Dict[int, Tuple[int, ...]] = {
+            token_id: tuple(entries) for token_id, entries in names_by_token.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def lookup(self, query: str, limit: int = 5, max_edits: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Ranked (canonical name, edit distance) candidates for query, best first.
+        Each token may differ within its own length-based budget; the total is
+        capped by the budget for the whole name (or max_edits). Ties are broken
+        by closer length.
+        """
+        key = normalize_name(query)
+        if not key:
+            return []
+        entry = self.exact.get(key)
+        if entry is not None:
+            return [(self.canonical[entry], 0)]
+
+        budget = max_edits_for(key) if max_edits is None else max_edits
+        if budget == 0:
+            return []
+
+        tokens = key.split()
+        options = []
+        for token in tokens:
+            found = self.vocabulary.matches(token, min(budget, max_edits_for(token)))
+            if not found:
+                return []
+            options.append(found)
+
+        def fan_out(position: int) -> int:
+            return sum(len(self.names_by_token.get(token_id, ())) for token_id in options[position])
+
+        pivot = min(range(len(tokens)), key=fan_out)
+        candidates = {e for token_id in options[pivot] for e in self.names_by_token.get(token_id, ())}
+
+        ranked = []
+        for candidate in candidates:
+            token_ids = self.entry_tokens[candidate]
+            if len(token_ids) != len(tokens):
+                continue
+            total = 0
+            for position, token_id in enumerate(token_ids):
+                distance = options[position].get(token_id)
+                if distance is None:
+                    break
+                total += distance
+            else:
+                if total <= budget:
+                    ranked.append((total, abs(len(self.keys[candidate]) - len(key)), candidate))
+        ranked.sort()
+
+        results, seen = [], set()
+        for distance, _, candidate in ranked:
+            name = self.canonical[candidate]
+            if name not in seen:
+                seen.add(name)
+                results.append((name, distance))
+                if len(results) == limit:
+                    break
+        return results
+
+    def best(self, query: str, max_edits: Optional[int] = None) -> Optional[str]:
+        """Canonical name of the best match, or None."""
+        matches = self.lookup(query, limit=1, max_edits=max_edits)
+        return matches[0][0] if matches else None
+
+
+def company_names(companies_json: Dict[str, list]) -> List[Tuple[str, str]]:
+    """(spelling, canonical) pairs for every name and alias in companies.json."""
+    pairs = []
+    for group in companies_json.values():
+        for company in group:
+            name = company["name"]
+            pairs.append((name, name))
+            for alias in company.get("aliases", []):
+                pairs.append((alias, name))
+    return pairs
@@ -0,0 +1,175 @@
+"""
+Job Matcher - resume vs job description similarity on TF-IDF keyword vectors.
+
+The vocabulary is every skill in skills.json (plus alias targets) and every
+role keyword in role_keywords.json, lowercased. A text is mapped to term
+counts by the skill index (aliases and typos resolve to the canonical
+skill) and one whole-token regex over the role keywords that are not
+skills.
+
+Weights are sublinear tf (1 + ln count) times an idf computed over the
+knowledge base itself: every skills.json category and every role's keyword
+list is one document, so a keyword shared by many roles ("testing") weighs
+less than a specific one ("kubernetes"). Vectors are L2-normalized, so
+cosine similarity is a dot product: resumes are scipy.sparse CSR rows and a
+job description is a dense vector over the (small) vocabulary, so a match
+is one sparse-row x dense-vector product.
+
+Resume and job vectors are cached by content hash, so matching a known
+resume against a new posting only vectorizes the posting.
+"""
+import os
+import json
+import math
+import hashlib
+import logging
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from app.services.data_loader import DataLoader, get_data_loader
+from app.services.knowledge_base import KnowledgeBase, compile_term_regex, get_knowledge_base
+from app.services.result_cache import ResultCache
+from app.utils.json_utils import flatten_text
+
+logger = logging.getLogger(__name__)
+
+MATCH_CACHE_SIZE = int(os.getenv("MATCH_CACHE_SIZE", "4096"))
+# Vectors of unchanged content never go stale; the TTL only bounds memory of idle entries
+MATCH_CACHE_TTL_SECONDS = float(os.getenv("MATCH_CACHE_TTL_SECONDS", "86400"))
+
+
+def skill_groups(skills_json) -> Iterable[List[str]]:
+    """Each leaf list of skills.json (one category)."""
+    if isinstance(skills_json, dict):
+        for value in skills_json.values():
+            yield from skill_groups(value)
+    elif isinstance(skills_json, list):
+        yield [term for term in skills_json if isinstance(term, str)]
+
+
+def text_hash(value: Any) -> str:
+    """SHA-256 of a string, or of the canonical JSON of anything else."""
+    text = value if isinstance(value, str) else json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class KeywordVectorizer:
+    """Sparse TF-IDF vectors over the skill and role keyword vocabulary"""
+
+    def __init__(self, loader: DataLoader, kb: KnowledgeBase):
+        self.kb = kb
+        skills = list(skill_groups(loader.get_skills()))
+        keywords = [data.get("keywords", []) for data in loader.get_role_keywords().values()]
+
+        # lowercase term -> display spelling; skills first, so a keyword that is
+        # also a skill is counted once, by the skill index
+        self.display: Dict[str, str] = {}
+        for group in skills:
+            for term in group:
+                self.display.setdefault(term.lower(), term)
+        for canonical in set(kb.skill_index.phrases.values()):
+            self.display.setdefault(canonical.lower(), canonical)
+        skill_terms = set(self.display)
+        for group in keywords:
+            for keyword in group:
+                self.display.setdefault(keyword.lower(), keyword)
+
+        self.terms: List[str] = sorted(self.display)
+        self.index: Dict[str, int] = {term: i for i, term in enumerate(self.terms)}
+        self.is_skill = np.array([term in skill_terms for term in self.terms])
+        self.keyword_regex = compile_term_regex([term for term in self.terms if term not in skill_terms])
+
+        documents = [{term.lower() for term in group} for group in skills + keywords]
+        df = np.zeros(len(self.terms))
+        for document in documents:
+            df[[self.index[term] for term in document]] += 1
+        self.idf = np.log((1 + len(documents)) / (1 + df)) + 1
+
+        logger.info(f"✓ Compiled keyword vocabulary ({len(self.terms)} terms, {len(documents)} idf documents)")
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def counts(self, text: str) -> Counter:
+        """Occurrences of each vocabulary term in text."""
+        found: Counter = Counter()
+        for skill, count in self.kb.skill_index.count(text).items():
+            found[skill.lower()] += count
+        found.update(self.keyword_regex.findall(text.lower()))
+        return found
+
+    def vectorize(self, text: str) -> sparse.csr_matrix:
+        """L2-normalized 1 x len(vocabulary) TF-IDF row for text."""
+        counts = {self.index[term]: count for term, count in self.counts(text).items() if term in self.index}
+        columns = np.array(sorted(counts), dtype=np.int32)
+        weights = np.array([1 + math.log(counts[column]) for column in columns]) * self.idf[columns]
+        norm = np.linalg.norm(weights)
+        if norm:
+            weights /= norm
+        return sparse.csr_matrix(
+            (weights, columns, np.array([0, len(columns)], dtype=np.int32)), shape=(1, len(self.terms)),
+        )
+
+
+class JobMatcher:
+    """Resume vs job description scoring with content-hash-cached vectors"""
+
+    def __init__(self, vectorizer: KeywordVectorizer, cache_size: int = MATCH_CACHE_SIZE):
+        self.vectorizer = vectorizer
+        self.cache = ResultCache(max_entries=cache_size, ttl_s=MATCH_CACHE_TTL_SECONDS, name="match_vectors")
+
+    def resume_vector(self, resume: Dict[str, Any]) -> sparse.csr_matrix:
+        """Sparse TF-IDF row of a formatted resume."""
+        key = f"resume:{text_hash(resume)}"
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self.vectorizer.vectorize(flatten_text(resume))
+            self.cache.put(key, vector)
+        return vector
+
+    def job_vector(self, job_description: str) -> np.ndarray:
+        """Dense TF-IDF vector of a job description (the query side of every match)."""
+        key = f"job:{text_hash(job_description)}"
+        vector = self.cache.get(key)
+        if vector is None:
+            vector = self.vectorizer.vectorize(job_description).toarray().ravel()
+            self.cache.put(key, vector)
+        return vector
+
+    def match(self, job_description: str, resume: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cosine similarity of the two vectors, the share of the posting's
+        keywords the resume mentions, and the matched / missing keywords and
+        missing skills, most important (highest job weight) first.
+        """
+        job = self.job_vector(job_description)
+        candidate = self.resume_vector(resume)
+        similarity = float((candidate @ job)[0])
+
+        columns = np.flatnonzero(job)
+        columns = columns[np.argsort(-job[columns], kind="stable")]
+        present = np.isin(columns, candidate.indices, assume_unique=True)
+        display = self.vectorizer.display
+        terms = self.vectorizer.terms
+        missing = columns[~present]
+        return {
+            "similarity": similarity,
+            "coverage": float(present.mean()) if len(columns) else 0.0,
+            "job_keywords": len(columns),
+            "matched": [display[terms[column]] for column in columns[present]],
+            "missing": [display[terms[column]] for column in missing],
+            "missing_skills": [display[terms[column]] for column in missing[self.vectorizer.is_skill[missing]]],
+        }
+
+
+_job_matcher_instance: Optional[JobMatcher] = None
+
+def get_job_matcher() -> JobMatcher:
+    """Get or create the singleton JobMatcher"""
+    global _job_matcher_instance
+    if _job_matcher_instance is None:
+        _job_matcher_instance = JobMatcher(KeywordVectorizer(get_data_loader(), get_knowledge_base()))
+    return _job_matcher_instance
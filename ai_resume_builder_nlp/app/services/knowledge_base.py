@@ -0,0 +1,113 @@
+"""
+Knowledge Base Service
+Compiles the JSON data files (loaded by DataLoader) into lookup structures:
+per-role keyword sets and matchers, the action verb set, role aliases,
+the typo-tolerant company and skill indexes, and company industries.
+Everything is built once so request-time scoring never re-walks the raw JSON.
+"""
+
+import re
+import logging
+from typing import Dict, FrozenSet, List, Optional
+
+from app.services.data_loader import DataLoader, get_data_loader
+from app.services.fuzzy_index import FuzzyIndex, company_names
+from app.services.skill_index import SkillIndex, skill_terms
+
+logger = logging.getLogger(__name__)
+
+
+def compile_term_regex(terms: List[str]) -> re.Pattern:
+    """
+    Build one alternation regex that matches any of `terms` as a whole token
+    in lowercased text. Longer terms come first so "data modeling" wins over "data".
+    """
+    escaped = sorted({re.escape(t.lower()) for t in terms if t}, key=len, reverse=True)
+    if not escaped:
+        return re.compile(r"(?!x)x")  # never matches
+    return re.compile(r"(?<![a-z0-9])(?:" + "|".join(escaped) + r")(?![a-z0-9])")
+
+
+class KnowledgeBase:
+    """Precomputed views over skills, action verbs, companies and role keywords"""
+
+    def __init__(self, loader: DataLoader):
+        role_data = loader.get_role_keywords()
+
+        # role -> {lowercase keyword: original spelling}
+        self.role_keywords: Dict[str, Dict[str, str]] = {}
+        # role -> compiled whole-token matcher over its keywords
+        self.role_keyword_regex: Dict[str, re.Pattern] = {}
+        # "software engineer" / "softwareengineer" / "software_engineer" -> "software_engineer"
+        self.role_aliases: Dict[str, str] = {}
+
+        for role, data in role_data.items():
+            keywords = data.get("keywords", [])
+            self.role_keywords[role] = {kw.lower(): kw for kw in keywords}
+            self.role_keyword_regex[role] = compile_term_regex(keywords)
+            self.role_aliases[role] = role
+            self.role_aliases[role.replace("_", " ")] = role
+            self.role_aliases[role.replace("_", "")] = role
+
+        # Single-word verbs are matched against the first word of a bullet,
+        # multi-word ones ("Worked with") against its prefix.
+        verbs = {v.lower() for group in loader.get_action_verbs().values() for v in group}
+        self.action_verbs: FrozenSet[str] = frozenset(v for v in verbs if " " not in v)
+        self.action_verb_phrases: tuple = tuple(sorted(v for v in verbs if " " in v))
+
+        # Typo-tolerant company/institution names and aliases -> canonical name
+        companies = loader.get_companies()
+        self.company_index = FuzzyIndex(company_names(companies))
+        # canonical company name -> lowercase industry terms ("Fintech/Trading" -> fintech, trading)
+        self.company_industries: Dict[str, List[str]] = {
+            company["name"]: [part.strip().lower() for part in company.get("industry", "").split("/") if part.strip()]
+            for group in companies.values() for company in group
+        }
+
+        # Skill aliases and SymSpell deletions -> canonical skills.json spelling
+        self.skill_index = SkillIndex(skill_terms(loader.get_skills()), loader.get_skill_aliases())
+
+        logger.info(
+            f"✓ Compiled knowledge base ({len(self.role_keywords)} roles, {len(self.action_verbs)} verbs, "
+            f"{len(self.company_index)} company names, {len(self.skill_index)} skill spellings)"
+        )
+
+    def resolve_role(self, role: Optional[str]) -> Optional[str]:
+        """Map a free-form role title (e.g. "Software Engineer") to a role_keywords key."""
+        if not role or not isinstance(role, str):
+            return None
+        key = re.sub(r"[\s\-]+", " ", role.strip().lower())
+        return (
+            self.role_aliases.get(key)
+            or self.role_aliases.get(key.replace(" ", "_"))
+            or self.role_aliases.get(key.replace(" ", ""))
+        )
+
+    def industries_of(self, company: Optional[str]) -> List[str]:
+        """Industry terms of a company from companies.json (typos tolerated), or []."""
+        if not company or not isinstance(company, str):
+            return []
+        canonical = self.company_index.best(company)
+        return self.company_industries.get(canonical, []) if canonical else []
+
+    def starts_with_action_verb(self, text: str) -> bool:
+        """True if the text opens with a verb from action_verbs.json."""
+        stripped = text.lstrip(" -•*\t").lower()
+        first = stripped.split(" ", 1)[0].rstrip(",.;:")
+        if first in self.action_verbs:
+            return True
+        return stripped.startswith(self.action_verb_phrases) if self.action_verb_phrases else False
+
+
+# Create a singleton instance
+_knowledge_base_instance = None
+
+def get_knowledge_base() -> KnowledgeBase:
+    """
+    Get the singleton KnowledgeBase instance.
+    Built on first use from the shared DataLoader.
+    """
+    global _knowledge_base_instance
+    if _knowledge_base_instance is None:
+        _knowledge_base_instance = KnowledgeBase(get_data_loader())
+    return _knowledge_base_instance
@@ -0,0 +1,463 @@
+"""
+LLM Client Service
+Async client for the OpenAI-compatible Vercel AI Gateway used by the
+enhancement stage.
+
+- one pooled httpx.AsyncClient (keep-alive connections, no TLS setup per call)
+  per event loop, closed before that loop ends (run_sync(), app shutdown)
+- per-call deadline covering every retry
+- exponential backoff with jitter on timeouts, transport errors, 429 and 5xx
+- a circuit breaker that stops calling a failing or slow gateway for a while
+- a global semaphore capping concurrent gateway calls
+
+Callers catch LLMError and fall back to the rule-based content.
+"""
+
+import os
+import json
+import time
+import random
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from app.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+LLM_API_BASE = os.getenv("OPENAI_API_BASE", "https://ai-gateway.vercel.sh/v1")
+LLM_MODEL = os.getenv("LLM_MODEL", "mistral/devstral-2")
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+LLM_CONNECT_TIMEOUT_SECONDS = float(os.getenv("LLM_CONNECT_TIMEOUT_SECONDS", "5"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+LLM_BACKOFF_BASE_SECONDS = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "0.5"))
+LLM_BACKOFF_MAX_SECONDS = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "8"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "20"))
+LLM_BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5"))
+LLM_BREAKER_SLOW_CALL_SECONDS = float(os.getenv("LLM_BREAKER_SLOW_CALL_SECONDS", "30"))
+LLM_BREAKER_RESET_SECONDS = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    """Base error for gateway calls. Callers fall back to non-LLM content."""
+
+
+class LLMUnavailable(LLMError):
+    """The circuit breaker is open or the client is not configured."""
+
+
+class LLMTimeout(LLMError):
+    """The call's deadline passed (including retries)."""
+
+
+class _RetryableStatus(LLMError):
+    def __init__(self, status_code: int, retry_after: Optional[float]):
+        super().__init__(f"gateway returned {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed    -> calls go through; `failure_threshold` failures in a row opens it
+    open      -> calls are refused until `reset_seconds` have passed
+    half_open -> one probe call is let through; success closes, failure re-opens
+
+    Calls slower than `slow_call_seconds` count as failures, so a gateway that
+    answers but takes too long is treated like one that is down.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = LLM_BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = LLM_BREAKER_RESET_SECONDS,
+        slow_call_seconds: float = LLM_BREAKER_SLOW_CALL_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.slow_call_seconds = slow_call_seconds
+        self.clock = clock
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open" and self.clock() - self.opened_at >= self.reset_seconds:
+            self.state = "half_open"
+            self._probe_in_flight = False
+        if self.state == "half_open" and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self, duration_s: float) -> None:
+        if duration_s > self.slow_call_seconds:
+            self.record_failure()
+            return
+        self.state = "closed"
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Give back a claimed half-open probe without a verdict (cancelled, or a client error)."""
+        if self.state == "half_open":
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning(f"LLM circuit breaker opened after {self.failures} failures")
+            self.state = "open"
+            self.opened_at = self.clock()
+
+
+class LLMClient:
+    """Pooled async chat-completions client with deadlines, retries and a circuit breaker"""
+
+    def __init__(
+        self,
+        api_base: str = LLM_API_BASE,
+        api_key: Optional[str] = None,
+        model: str = LLM_MODEL,
+        timeout_s: float = LLM_TIMEOUT_SECONDS,
+        max_retries: int = LLM_MAX_RETRIES,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        max_connections: int = LLM_MAX_CONNECTIONS,
+        breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.api_base = api_base.rstrip("/")
+        self.api_key = api_key
+        self.model = model
+        self.timeout_s = timeout_s
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self.breaker = breaker or CircuitBreaker()
+        self.transport = transport
+
+        # The pool and semaphore belong to the event loop that created them
+        self._loop = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _bind_to_running_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._http is not None:
+            return
+        self._drop_foreign_pool()
+        self._loop = loop
+        self._http = httpx.AsyncClient(
+            base_url=self.api_base,
+            headers={"Authorization": f"Bearer {self.api_key}"} if self.api_key else {},
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            timeout=httpx.Timeout(self.timeout_s, connect=LLM_CONNECT_TIMEOUT_SECONDS),
+            transport=self.transport,
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def backoff_seconds(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for retry `attempt` (0-based)."""
+        ceiling = min(LLM_BACKOFF_MAX_SECONDS, LLM_BACKOFF_BASE_SECONDS * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def _start_call(self, timeout_s: Optional[float], deadline: Optional[float]) -> float:
+        """Refuse the call if unconfigured or the breaker is open; return its absolute deadline."""
+        if not self.api_key:
+            raise LLMUnavailable("AI_GATEWAY_API_KEY not set")
+        if not self.breaker.allow():
+            get_metrics().inc("llm.breaker_rejected")
+            raise LLMUnavailable("circuit breaker open")
+
+        self._bind_to_running_loop()
+        budget = timeout_s if timeout_s is not None else self.timeout_s
+        call_deadline = time.monotonic() + budget
+        if deadline is not None:
+            call_deadline = min(call_deadline, deadline)
+        return call_deadline
+
+    def _payload(self, messages, temperature, max_tokens, stream=False) -> dict:
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if stream:
+            payload["stream"] = True
+        return payload
+
+    @staticmethod
+    def _check_status(response: httpx.Response) -> None:
+        if response.status_code in RETRYABLE_STATUS:
+            header = response.headers.get("retry-after")
+            raise _RetryableStatus(
+                response.status_code,
+                float(header) if header and header.replace(".", "", 1).isdigit() else None,
+            )
+        if response.status_code >= 400:
+            # Client errors will not get better with retries, and are not the gateway's fault
+            raise LLMError(f"gateway returned {response.status_code}: {response.text[:200]}")
+
+    def _retry_delay(self, error: Exception, attempt: int, call_deadline: float, can_retry: bool = True) -> float:
+        """
+        Record a transient failure and return how long to wait before retrying.
+        Raises LLMTimeout / LLMError when there is no retry left.
+        """
+        self.breaker.record_failure()
+        get_metrics().inc("llm.errors")
+        # allow() may claim the half-open probe; the retry is that probe
+        if not can_retry or attempt >= self.max_retries or not self.breaker.allow():
+            if isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException)):
+                raise LLMTimeout(str(error) or "gateway timed out") from error
+            raise LLMError(str(error) or type(error).__name__) from error
+
+        retry_after = error.retry_after if isinstance(error, _RetryableStatus) else None
+        delay = retry_after if retry_after is not None else self.backoff_seconds(attempt)
+        get_metrics().inc("llm.retries")
+        logger.info(f"Retrying LLM call in {delay:.2f}s (attempt {attempt + 1})")
+        return min(delay, max(0.0, call_deadline - time.monotonic()))
+
+    def _record_success(self, started: float) -> None:
+        elapsed = time.monotonic() - started
+        self.breaker.record_success(elapsed)
+        get_metrics().observe("llm.latency_ms", elapsed * 1000)
+
+    async def complete(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.25,
+        max_tokens: int = 4096,
+        timeout_s: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> str:
+        """
+        Run one chat completion and return the message content.
+
+        Args:
+            messages: OpenAI-style chat messages
+            timeout_s: Budget for this call including retries (defaults to client timeout)
+            deadline: Absolute time.monotonic() deadline; the earlier of the two wins
+
+        Raises:
+            LLMUnavailable, LLMTimeout, LLMError
+        """
+        call_deadline = self._start_call(timeout_s, deadline)
+        payload = self._payload(messages, temperature, max_tokens)
+
+        # allow() just claimed the probe if the breaker is half open
+        probe = self.breaker.state == "half_open"
+        try:
+            async with self._semaphore:
+                attempt = 0
+                while True:
+                    remaining = call_deadline - time.monotonic()
+                    if remaining <= 0:
+                        # Any failed attempt was already recorded with the breaker
+                        raise LLMTimeout(f"deadline exceeded after {attempt} attempts")
+
+                    started = time.monotonic()
+                    get_metrics().inc("llm.requests")
+                    try:
+                        # wait_for bounds the whole exchange; httpx timeouts are per read/connect
+                        response = await asyncio.wait_for(
+                            self._http.post(
+                                "/chat/completions",
+                                json=payload,
+                                timeout=httpx.Timeout(remaining, connect=min(remaining, LLM_CONNECT_TIMEOUT_SECONDS)),
+                            ),
+                            timeout=remaining,
+                        )
+                        self._check_status(response)
+                        content = response.json()["choices"][0]["message"]["content"]
+                        self._record_success(started)
+                        return content or ""
+
+                    except (asyncio.TimeoutError, httpx.TimeoutException, httpx.TransportError, _RetryableStatus) as e:
+                        delay = self._retry_delay(e, attempt, call_deadline)
+                        probe = self.breaker.state == "half_open"
+
+                    except (KeyError, IndexError, ValueError) as e:
+                        self.breaker.record_failure()
+                        raise LLMError(f"malformed gateway response: {e}") from e
+
+                    await asyncio.sleep(delay)
+                    attempt += 1
+        except BaseException:
+            # Cancelled, or failed without a verdict on the gateway: let the next call probe
+            if probe:
+                self.breaker.release()
+            raise
+
+    async def astream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.25,
+        max_tokens: int = 4096,
+        timeout_s: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Streamed chat completion: yields content deltas as they arrive (SSE).
+
+        Same deadline, breaker and semaphore as complete(). Failures before the
+        first delta are retried; once output has been yielded a failure is
+        raised instead, since the caller has already consumed part of it.
+        Closing the iterator early (e.g. with contextlib.aclosing) ends the
+        request and frees its connection.
+        """
+        call_deadline = self._start_call(timeout_s, deadline)
+        payload = self._payload(messages, temperature, max_tokens, stream=True)
+
+        # allow() just claimed the probe if the breaker is half open
+        probe = self.breaker.state == "half_open"
+        try:
+            async with self._semaphore:
+                attempt = 0
+                while True:
+                    remaining = call_deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise LLMTimeout(f"deadline exceeded after {attempt} attempts")
+
+                    started = time.monotonic()
+                    yielded = False
+                    get_metrics().inc("llm.requests")
+                    try:
+                        request = self._http.build_request(
+                            "POST", "/chat/completions", json=payload,
+                            timeout=httpx.Timeout(remaining, connect=min(remaining, LLM_CONNECT_TIMEOUT_SECONDS)),
+                        )
+                        response = await asyncio.wait_for(self._http.send(request, stream=True), timeout=remaining)
+                        try:
+                            if response.status_code >= 400:
+                                await response.aread()
+                            self._check_status(response)
+                            lines = response.aiter_lines()
+                            while True:
+                                remaining = call_deadline - time.monotonic()
+                                if remaining <= 0:
+                                    raise asyncio.TimeoutError("deadline exceeded while streaming")
+                                try:
+                                    line = await asyncio.wait_for(lines.__anext__(), timeout=remaining)
+                                except StopAsyncIteration:
+                                    break
+                                if not line.startswith("data:"):
+                                    continue
+                                data = line[5:].strip()
+                                if data == "[DONE]":
+                                    break
+                                delta = json.loads(data)["choices"][0].get("delta", {}).get("content")
+                                if delta:
+                                    yielded = True
+                                    yield delta
+                        finally:
+                            await response.aclose()
+                        self._record_success(started)
+                        return
+
+                    except GeneratorExit:
+                        # Caller stopped reading early: it got what it needed
+                        self._record_success(started)
+                        raise
+
+                    except (asyncio.TimeoutError, httpx.TimeoutException, httpx.TransportError, _RetryableStatus) as e:
+                        delay = self._retry_delay(e, attempt, call_deadline, can_retry=not yielded)
+                        probe = self.breaker.state == "half_open"
+
+                    except (KeyError, IndexError, ValueError) as e:
+                        self.breaker.record_failure()
+                        raise LLMError(f"malformed gateway response: {e}") from e
+
+                    await asyncio.sleep(delay)
+                    attempt += 1
+        except BaseException:
+            # Cancelled, or failed without a verdict on the gateway: let the next call probe
+            if probe:
+                self.breaker.release()
+            raise
+
+    def _drop_foreign_pool(self) -> None:
+        """
+        Let go of a pool created on another event loop. Its connections can
+        only be closed on that loop: if it is still running (another thread)
+        the close is scheduled there, otherwise they are left to the garbage
+        collector and counted as "llm.pool_abandoned".
+        """
+        http, loop = self._http, self._loop
+        self._http = self._loop = None
+        if http is None:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(http.aclose(), loop)
+            return
+        get_metrics().inc("llm.pool_abandoned")
+        logger.warning("LLM connection pool outlived its event loop; close it with aclose() before the loop ends")
+
+    async def aclose(self) -> None:
+        """Close the connection pool; the next call opens a new one."""
+        if self._http is None:
+            return
+        if self._loop is not asyncio.get_running_loop():
+            self._drop_foreign_pool()
+            return
+        http, self._http, self._loop = self._http, None, None
+        await http.aclose()
+
+
+# Create a singleton instance
+_llm_client_instance = None
+
+def get_llm_client() -> LLMClient:
+    """
+    Get the singleton LLMClient instance.
+    The API key is read on first use so load_dotenv() has already run.
+    """
+    global _llm_client_instance
+    if _llm_client_instance is None:
+        _llm_client_instance = LLMClient(
+            api_base=os.getenv("OPENAI_API_BASE", LLM_API_BASE),
+            api_key=os.getenv("AI_GATEWAY_API_KEY") or os.getenv("OPENAI_API_KEY"),
+        )
+    return _llm_client_instance
+
+
+def set_llm_client(client: Optional[LLMClient]) -> None:
+    """Replace the singleton (tests and benchmarks point it at a mock gateway)."""
+    global _llm_client_instance
+    _llm_client_instance = client
+
+
+async def close_llm_client() -> None:
+    """Close the singleton's connection pool, if it has one."""
+    if _llm_client_instance is not None:
+        await _llm_client_instance.aclose()
+
+
+def run_sync(coro):
+    """
+    asyncio.run(coro) for synchronous callers. The LLM connection pool opened
+    on that loop is closed before the loop ends, while it still can be.
+    """
+    async def main():
+        try:
+            return await coro
+        finally:
+            await close_llm_client()
+
+    return asyncio.run(main())
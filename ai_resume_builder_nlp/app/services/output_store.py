@@ -0,0 +1,282 @@
+"""
+Output Store - content-addressed storage for rendered artifacts.
+
+An artifact is named by the SHA-256 of its bytes, so identical renders are
+stored once and two different renders can never overwrite each other:
+
+    <OUTPUT_STORE_DIR>/ab/cd/abcd...ef.html
+
+The first two byte pairs of the hash shard the directories, keeping each
+one small however many artifacts accumulate.
+
+put() only hashes the bytes and queues them, never touching the disk, so it
+is safe to call on the event loop; a single background thread skips
+artifacts already stored and writes the others to a temp name in their
+shard and renames them into place (os.replace), so a reader never sees a
+partial file. Until it is written an artifact is served from memory. When
+the queue is full put() does not wait either: the artifact is set aside
+(counted as output_store.queue_full) and written by the same thread once it
+gets there. Memory stays bounded by OUTPUT_STORE_MAX_PENDING_BYTES of
+artifacts not yet written; beyond that put() drops the write (counted as
+output_store.dropped). Artifacts are content-addressed, so a later put() of
+the same bytes stores it.
+
+Retention: the writer thread periodically deletes artifacts not written or
+re-put for OUTPUT_STORE_MAX_AGE_DAYS, then the least recently used ones
+while the store is over OUTPUT_STORE_MAX_BYTES (0 disables either limit).
+A re-put of an existing artifact refreshes its mtime, so popular renders
+stay.
+
+export_tar() streams every artifact (or those newer than a timestamp) as
+a tar archive without building it in memory.
+"""
+import os
+import io
+import time
+import queue
+import atexit
+import hashlib
+import logging
+import tarfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+OUTPUT_STORE_DIR = Path(os.getenv("OUTPUT_STORE_DIR", str(PROJECT_ROOT / "output")))
+OUTPUT_STORE_MAX_BYTES = int(os.getenv("OUTPUT_STORE_MAX_BYTES", str(1024 * 1024 * 1024)))
+OUTPUT_STORE_MAX_AGE_DAYS = float(os.getenv("OUTPUT_STORE_MAX_AGE_DAYS", "30"))
+OUTPUT_STORE_SWEEP_SECONDS = float(os.getenv("OUTPUT_STORE_SWEEP_SECONDS", "300"))
+# Bytes of artifacts held in memory until written (queued or set aside); 0: no limit
+OUTPUT_STORE_MAX_PENDING_BYTES = int(os.getenv("OUTPUT_STORE_MAX_PENDING_BYTES", str(64 * 1024 * 1024)))
+# Bearer token for the bulk export endpoint; export is disabled when unset
+OUTPUT_EXPORT_TOKEN = os.getenv("OUTPUT_EXPORT_TOKEN", "")
+
+# Writes waiting for the background thread; beyond this they are set aside
+WRITE_QUEUE_SIZE = 256
+EXPORT_CHUNK_BYTES = 64 * 1024
+TEMP_SUFFIX = ".tmp"
+
+
+def artifact_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands what tarfile writes to a generator."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+class OutputStore:
+    """Sharded content-addressed files written by a background thread"""
+
+    def __init__(self, root: Path = OUTPUT_STORE_DIR, max_bytes: int = OUTPUT_STORE_MAX_BYTES,
+                 max_age_s: float = OUTPUT_STORE_MAX_AGE_DAYS * 86400,
+                 sweep_interval_s: float = OUTPUT_STORE_SWEEP_SECONDS,
+                 max_pending_bytes: int = OUTPUT_STORE_MAX_PENDING_BYTES,
+                 clock: Callable[[], float] = time.time):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.sweep_interval_s = sweep_interval_s
+        self.max_pending_bytes = max_pending_bytes
+        self.clock = clock
+        self._lock = threading.Lock()
+        # "hash + suffix" -> bytes queued but not yet on disk
+        self._pending: Dict[str, bytes] = {}
+        self._pending_bytes = 0
+        self._queue: "queue.Queue[Optional[Tuple[str, Path, bytes]]]" = queue.Queue(WRITE_QUEUE_SIZE)
+        # Writes that found the queue full, for the writer thread to pick up
+        self._overflow: List[Tuple[str, Path, bytes]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._last_sweep = 0.0
+
+    def path_for(self, digest: str, suffix: str = "") -> Path:
+        return self.root / digest[:2] / digest[2:4] / f"{digest}{suffix}"
+
+    def put(self, data: bytes, suffix: str = "") -> Dict[str, str]:
+        """
+        Store data as <hash><suffix> (suffix like ".html"). Returns at once
+        with {"hash", "name", "path"}; the write happens in the background,
+        or not at all if max_pending_bytes are already waiting for it.
+        """
+        digest = artifact_hash(data)
+        path = self.path_for(digest, suffix)
+        key = path.name
+        stored = {"hash": digest, "name": key, "path": str(path)}
+        with self._lock:
+            queued = key in self._pending
+            dropped = not queued and 0 < self.max_pending_bytes < self._pending_bytes + len(data)
+            if not (queued or dropped):
+                self._pending[key] = data
+                self._pending_bytes += len(data)
+        if queued:
+            get_metrics().inc("output_store.deduplicated")
+        elif dropped:
+            get_metrics().inc("output_store.dropped")
+        else:
+            self._submit(key, path, data)
+        return stored
+
+    def read(self, digest: str) -> Optional[Tuple[bytes, str]]:
+        """(bytes, file name) of a stored artifact, or None."""
+        with self._lock:
+            for key, data in self._pending.items():
+                if key.startswith(digest):
+                    return data, key
+        shard = self.path_for(digest).parent
+        try:
+            for path in shard.iterdir():
+                if path.name.startswith(digest) and not path.name.endswith(TEMP_SUFFIX):
+                    return path.read_bytes(), path.name
+        except FileNotFoundError:
+            pass
+        return None
+
+    def _submit(self, key: str, path: Path, data: bytes) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="output-store-writer", daemon=True)
+                self._thread.start()
+            try:
+                self._queue.put_nowait((key, path, data))
+            except queue.Full:
+                # Under the lock: the writer takes overflow only after the
+                # queued items that filled the queue, so none is stranded
+                self._overflow.append((key, path, data))
+                get_metrics().inc("output_store.queue_full")
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+                with self._lock:
+                    overflow, self._overflow = self._overflow, []
+                for set_aside in overflow:
+                    self._write(*set_aside)
+                if self.clock() - self._last_sweep >= self.sweep_interval_s:
+                    self.evict()
+            finally:
+                self._queue.task_done()
+
+    def _write(self, key: str, path: Path, data: bytes) -> None:
+        try:
+            if path.exists():
+                get_metrics().inc("output_store.deduplicated")
+                os.utime(path)  # refresh its mtime for retention
+                return
+            get_metrics().inc("output_store.writes")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp = path.with_name(f".{path.name}.{os.getpid()}{TEMP_SUFFIX}")
+            with open(temp, "wb") as f:
+                f.write(data)
+            os.replace(temp, path)
+        except OSError as e:
+            get_metrics().inc("output_store.write_errors")
+            logger.error(f"Could not store {path.name}: {e}")
+        finally:
+            with self._lock:
+                if self._pending.pop(key, None) is not None:
+                    self._pending_bytes -= len(data)
+
+    def artifacts(self) -> List[Tuple[float, int, Path]]:
+        """(mtime, size, path) of every stored artifact, oldest first."""
+        found = []
+        for path in self.root.glob("??/??/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_mtime, stat.st_size, path))
+        found.sort()
+        return found
+
+    def evict(self) -> int:
+        """Apply the retention policy; returns the number of artifacts deleted."""
+        self._last_sweep = now = self.clock()
+        artifacts = self.artifacts()
+        total = sum(size for _, size, _ in artifacts)
+        deleted = 0
+        for mtime, size, path in artifacts:
+            expired = self.max_age_s > 0 and now - mtime > self.max_age_s
+            over_budget = self.max_bytes > 0 and total > self.max_bytes
+            if not (expired or over_budget):
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            deleted += 1
+        if deleted:
+            get_metrics().inc("output_store.evicted", deleted)
+            logger.info(f"✓ Evicted {deleted} artifacts; {total} bytes stored")
+        return deleted
+
+    def export_tar(self, since: Optional[float] = None, compress: bool = False) -> Iterator[bytes]:
+        """
+        Stream stored artifacts (modified after `since`, if given) as a tar
+        archive, gzipped if compress. Artifacts evicted meanwhile are skipped.
+        """
+        sink = _ChunkSink()
+        with tarfile.open(fileobj=sink, mode="w|gz" if compress else "w|") as archive:
+            for mtime, _, path in self.artifacts():
+                if since is not None and mtime <= since:
+                    continue
+                try:
+                    with open(path, "rb") as f:
+                        info = tarfile.TarInfo(str(path.relative_to(self.root)))
+                        info.size = os.fstat(f.fileno()).st_size
+                        info.mtime = int(mtime)
+                        archive.addfile(info, f)
+                except FileNotFoundError:
+                    continue
+                if sum(len(chunk) for chunk in sink.chunks) >= EXPORT_CHUNK_BYTES:
+                    yield sink.drain()
+        yield sink.drain()
+
+    def flush(self) -> None:
+        """Wait until every queued write is on disk."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Finish queued writes and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+
+_output_store_instance: Optional[OutputStore] = None
+
+def get_output_store() -> OutputStore:
+    """Get or create the singleton OutputStore"""
+    global _output_store_instance
+    if _output_store_instance is None:
+        _output_store_instance = OutputStore(OUTPUT_STORE_DIR)
+        # Queued writes are not lost at interpreter exit
+        atexit.register(_output_store_instance.close)
+    return _output_store_instance
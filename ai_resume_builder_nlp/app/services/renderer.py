@@ -0,0 +1,165 @@
+"""
+Resume Renderer - formatted resume to HTML, and to PDF with WeasyPrint.
+
+Themes are Jinja2 templates in app/templates/resume/themes extending a
+shared base.html. Every theme is compiled once when the renderer is built
+(auto_reload off, so rendering never stats the template files); a render
+is then a single call into the compiled template.
+
+Output is memoized by content hash: the SHA-256 of the theme and the
+canonical JSON of the resume. Re-rendering an unchanged resume (a page
+reload, HTML then PDF of the same draft) costs a hash instead of a render,
+and the hash doubles as an ETag.
+
+PDF conversion is CPU-heavy (layout in pure Python), so it runs on the
+shared process pool; the HTML crosses the boundary and the PDF bytes come
+back. WeasyPrint is optional and imported only in the pool workers.
+"""
+import os
+import json
+import hashlib
+import logging
+import importlib.util
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from app.services.result_cache import ResultCache
+from app.utils.executors import call_in_process, pack_call
+from app.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "resume"
+RENDER_DEFAULT_THEME = os.getenv("RENDER_DEFAULT_THEME", "classic")
+RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE", "128"))
+
+# Sections rendered after the summary, in order, with their headings
+RESUME_SECTIONS = [
+    ("experience", "Experience"),
+    ("education", "Education"),
+    ("skills", "Skills"),
+    ("projects", "Projects"),
+    ("certificates", "Certificates"),
+    ("publications", "Publications"),
+    ("awards", "Awards"),
+    ("languages", "Languages"),
+    ("volunteering", "Volunteering"),
+    ("interests", "Interests"),
+    ("references", "References"),
+]
+# Sections of short strings, rendered as one comma-separated line
+INLINE_SECTIONS = ("skills", "languages", "interests")
+
+
+class UnknownTheme(ValueError):
+    """No template for the requested theme."""
+
+
+def resume_from_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """The formatted resume fields of a pipeline state (see formatting_passthrough)."""
+    keys = ["profile", "summary"] + [key for key, _ in RESUME_SECTIONS]
+    return {key: state[key] for key in keys if key in state}
+
+
+def content_hash(resume: Dict[str, Any], theme: str) -> str:
+    """SHA-256 of the theme and the canonical JSON of the resume."""
+    canonical = json.dumps([theme, resume], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def pdf_available() -> bool:
+    """Whether WeasyPrint is installed (checked without importing it)."""
+    return importlib.util.find_spec("weasyprint") is not None
+
+
+def html_to_pdf(html: str) -> bytes:
+    """Process pool body: lay out html as a PDF."""
+    from weasyprint import HTML
+    return HTML(string=html).write_pdf()
+
+
+class ResumeRenderer:
+    """Compiled theme templates plus a memo of rendered output by content hash"""
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR, cache_size: int = RENDER_CACHE_SIZE):
+        self.env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(("html",)),
+            auto_reload=False,
+            # Missing profile fields come through as None; print nothing for them
+            finalize=lambda value: "" if value is None else value,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        self.templates = {
+            path.stem: self.env.get_template(f"themes/{path.name}")
+            for path in sorted((Path(template_dir) / "themes").glob("*.html"))
+        }
+        # Rendered output never goes stale for a given hash; entries are only evicted
+        self.cache = ResultCache(max_entries=cache_size, ttl_s=float("inf"), name="render_cache")
+        logger.info(f"✓ Compiled {len(self.templates)} resume themes: {', '.join(self.templates)}")
+
+    def resolve_theme(self, theme: Optional[str] = None) -> str:
+        """theme, or RENDER_DEFAULT_THEME if not given. Raises UnknownTheme if it has no template."""
+        theme = theme or RENDER_DEFAULT_THEME
+        if theme not in self.templates:
+            raise UnknownTheme(f"unknown theme {theme!r}; available: {', '.join(self.templates)}")
+        return theme
+
+    def render_html(self, resume: Dict[str, Any], theme: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Render resume with theme (default RENDER_DEFAULT_THEME).
+
+        Returns:
+            (html, content hash)
+
+        Raises:
+            UnknownTheme
+        """
+        theme = self.resolve_theme(theme)
+        template = self.templates[theme]
+
+        digest = content_hash(resume, theme)
+        html = self.cache.get(f"html:{digest}")
+        if html is None:
+            html = template.render(
+                resume=resume,
+                profile=resume.get("profile") if isinstance(resume.get("profile"), dict) else {},
+                summary=resume.get("summary") or "",
+                sections=[(key, heading) for key, heading in RESUME_SECTIONS if key in resume],
+                inline_sections=INLINE_SECTIONS,
+            )
+            self.cache.put(f"html:{digest}", html)
+            get_metrics().inc(f"render.html.{theme}")
+        return html, digest
+
+    async def render_pdf(self, resume: Dict[str, Any], theme: Optional[str] = None) -> Tuple[bytes, str]:
+        """
+        Render resume to PDF on the process pool.
+
+        Returns:
+            (PDF bytes, content hash)
+
+        Raises:
+            UnknownTheme; ImportError or OSError (raised in the worker) if WeasyPrint
+                or its Pango libraries are missing
+        """
+        html, digest = self.render_html(resume, theme)
+        pdf = self.cache.get(f"pdf:{digest}")
+        if pdf is None:
+            pdf = await call_in_process(html_to_pdf, pack_call((html,), {}))
+            self.cache.put(f"pdf:{digest}", pdf)
+            get_metrics().inc("render.pdf")
+        return pdf, digest
+
+
+_renderer_instance: Optional[ResumeRenderer] = None
+
+def get_renderer() -> ResumeRenderer:
+    """Get or create the singleton ResumeRenderer"""
+    global _renderer_instance
+    if _renderer_instance is None:
+        _renderer_instance = ResumeRenderer()
+    return _renderer_instance
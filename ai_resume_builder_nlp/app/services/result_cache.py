@@ -0,0 +1,78 @@
+"""
+Result cache for /api/generate-resume.
+
+Resubmitting the same prompt and answers (page reloads, client retries after
+a 503) is answered from memory instead of re-running the pipeline and the
+LLM calls. Entries are keyed by a hash of the request and expire after
+RESULT_CACHE_TTL_SECONDS; the least recently used are evicted beyond
+RESULT_CACHE_SIZE. Per process.
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from app.utils.metrics import get_metrics
+
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "256"))
+RESULT_CACHE_TTL_SECONDS = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "600"))
+
+
+def request_key(prompt: str, answers: Optional[Dict[str, Any]], test_mode: bool, theme: Optional[str] = None) -> str:
+    """Stable hash of everything that determines the pipeline's output."""
+    parts = [prompt, answers or {}, bool(test_mode)] + ([theme] if theme else [])
+    canonical = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int = RESULT_CACHE_SIZE, ttl_s: float = RESULT_CACHE_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic, name: str = "result_cache"):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.clock = clock
+        # Prefix of the hit/miss counters
+        self.name = name
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < self.clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                get_metrics().inc(f"{self.name}.misses")
+                return None
+            self._entries.move_to_end(key)
+        get_metrics().inc(f"{self.name}.hits")
+        return entry[1]
+
+    def put(self, key: str, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl_s, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_result_cache_instance: Optional[ResultCache] = None
+
+def get_result_cache() -> ResultCache:
+    """Get or create the singleton ResultCache"""
+    global _result_cache_instance
+    if _result_cache_instance is None:
+        _result_cache_instance = ResultCache()
+    return _result_cache_instance
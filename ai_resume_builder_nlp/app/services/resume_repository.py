@@ -0,0 +1,294 @@
+"""
+Resume Repository - generated resumes persisted in SQLite (WAL mode).
+
+Every successful generation is stored under its input hash (request_key:
+prompt, answers, test_mode, theme) with the final normalized resume and
+the full API response, so a repeated request is answered by one indexed
+read instead of a pipeline run, and a resume can be re-fetched, re-scored
+or re-rendered later by id or hash.
+
+Writes never block a request: save() only queues the record. A background
+thread serializes queued records (JSON, the response zlib-compressed) and
+commits them in batches of up to WRITE_BATCH_SIZE, one transaction per
+batch (gathering for at most WRITE_BATCH_WINDOW_MS), so under load the
+commit cost is shared by the whole batch. Records still in the queue are
+served from memory. Saved dicts must not be modified afterwards.
+
+Every committed insert or update also gets the next number in
+resume_changes (kept by triggers, so saves from every process count, in
+commit order: SQLite has one writer at a time). Indexes that live in
+another process, or outside the writer, follow that feed with changes()
+and only need to remember the last number they applied.
+
+WAL mode lets readers run while the writer commits. Reads use one
+connection per thread (they run on the shared thread pool) and
+synchronous=NORMAL, which is durable at every checkpoint and never
+corrupts the database on a crash.
+"""
+import os
+import json
+import time
+import zlib
+import queue
+import atexit
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+RESUME_DB_PATH = Path(os.getenv("RESUME_DB_PATH", str(PROJECT_ROOT / "db" / "resumes.sqlite3")))
+WRITE_BATCH_SIZE = int(os.getenv("RESUME_DB_BATCH_SIZE", "256"))
+WRITE_BATCH_WINDOW_MS = float(os.getenv("RESUME_DB_BATCH_WINDOW_MS", "20"))
+# Stored responses older than this are not reused for repeated requests (0: always reuse)
+RESUME_REUSE_MAX_AGE_DAYS = float(os.getenv("RESUME_REUSE_MAX_AGE_DAYS", "30"))
+# Serve repeated requests from stored responses at all (off: always regenerate, e.g. load tests)
+RESUME_REUSE = os.getenv("RESUME_REUSE", "true").lower() == "true"
+
+# Records waiting for the writer; save() blocks beyond this
+WRITE_QUEUE_SIZE = 4096
+
+# One transaction, so a database from before resume_changes is backfilled
+# before any process's trigger can number a new save
+SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS resumes (
+    id INTEGER PRIMARY KEY,
+    input_hash TEXT NOT NULL UNIQUE,
+    resume TEXT NOT NULL,
+    response BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS resume_changes (
+    resume_id INTEGER PRIMARY KEY,
+    seq INTEGER NOT NULL UNIQUE
+);
+INSERT INTO resume_changes (resume_id, seq)
+    SELECT id, id FROM resumes WHERE NOT EXISTS (SELECT 1 FROM resume_changes);
+CREATE TRIGGER IF NOT EXISTS resume_inserted AFTER INSERT ON resumes BEGIN
+    INSERT INTO resume_changes (resume_id, seq)
+    VALUES (NEW.id, (SELECT coalesce(max(seq), 0) + 1 FROM resume_changes))
+    ON CONFLICT (resume_id) DO UPDATE SET seq = excluded.seq;
+END;
+CREATE TRIGGER IF NOT EXISTS resume_updated AFTER UPDATE ON resumes BEGIN
+    INSERT INTO resume_changes (resume_id, seq)
+    VALUES (NEW.id, (SELECT coalesce(max(seq), 0) + 1 FROM resume_changes))
+    ON CONFLICT (resume_id) DO UPDATE SET seq = excluded.seq;
+END;
+COMMIT;
+"""
+
+UPSERT = """
+INSERT INTO resumes (input_hash, resume, response, created_at, updated_at)
+VALUES (:input_hash, :resume, :response, :created_at, :created_at)
+ON CONFLICT(input_hash) DO UPDATE SET
+    resume = excluded.resume, response = excluded.response, updated_at = excluded.updated_at
+"""
+
+COLUMNS = "id, input_hash, resume, response, created_at, updated_at"
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Connection in WAL mode with the settings shared by readers and the writer."""
+    conn = sqlite3.connect(str(path), timeout=5.0)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class ResumeRepository:
+    """SQLite-backed store of generated resumes with a batching background writer"""
+
+    def __init__(self, path: Path = RESUME_DB_PATH, batch_size: int = WRITE_BATCH_SIZE,
+                 batch_window_ms: float = WRITE_BATCH_WINDOW_MS, clock: Callable[[], float] = time.time):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.batch_window_s = batch_window_ms / 1000
+        self.clock = clock
+        self.reuse_responses = RESUME_REUSE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with connect(self.path) as conn:
+            conn.executescript(SCHEMA)
+        conn.close()
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # input hash -> record queued but not yet committed
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(WRITE_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def save(self, input_hash: str, resume: Dict[str, Any], response: Dict[str, Any]) -> None:
+        """Queue a generated resume and its API response for the next batch."""
+        record = {"input_hash": input_hash, "resume": resume, "response": response, "created_at": self.clock()}
+        with self._lock:
+            self._pending[input_hash] = record
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="resume-db-writer", daemon=True)
+                self._thread.start()
+        self._queue.put(record)
+
+    def _run(self) -> None:
+        conn = connect(self.path)
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                self._queue.task_done()
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.batch_window_s
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+            try:
+                self._write_batch(conn, batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Dict[str, Any]]) -> None:
+        started = time.perf_counter()
+        rows = [
+            {
+                "input_hash": record["input_hash"],
+                "resume": json.dumps(record["resume"], default=str),
+                "response": zlib.compress(json.dumps(record["response"], default=str).encode("utf-8")),
+                "created_at": record["created_at"],
+            }
+            for record in batch
+        ]
+        try:
+            with conn:
+                conn.executemany(UPSERT, rows)
+        except sqlite3.Error as e:
+            get_metrics().inc("resume_db.write_errors")
+            logger.error(f"Could not store {len(batch)} resumes: {e}")
+        else:
+            metrics = get_metrics()
+            metrics.inc("resume_db.writes", len(batch))
+            metrics.observe("resume_db.batch_size", len(batch))
+            metrics.observe("resume_db.commit_ms", (time.perf_counter() - started) * 1000)
+        finally:
+            with self._lock:
+                for record in batch:
+                    # A newer save of the same hash may be queued behind this one
+                    if self._pending.get(record["input_hash"]) is record:
+                        del self._pending[record["input_hash"]]
+
+    def flush(self) -> None:
+        """Wait until every queued record is committed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Commit queued records and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = connect(self.path)
+            conn.execute("PRAGMA query_only=1")
+        return conn
+
+    @staticmethod
+    def _decode(row) -> Dict[str, Any]:
+        resume_id, input_hash, resume, response, created_at, updated_at = row
+        return {
+            "id": resume_id,
+            "input_hash": input_hash,
+            "resume": json.loads(resume),
+            "response": json.loads(zlib.decompress(response)),
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+    def get_by_hash(self, input_hash: str) -> Optional[Dict[str, Any]]:
+        """Stored record for an input hash (id is None until committed), or None."""
+        with self._lock:
+            record = self._pending.get(input_hash)
+        if record is not None:
+            # Its stamp becomes updated_at when committed (and created_at for a new row)
+            return {"id": None, **record, "updated_at": record["created_at"]}
+        row = self._reader().execute(f"SELECT {COLUMNS} FROM resumes WHERE input_hash = ?", (input_hash,)).fetchone()
+        get_metrics().inc("resume_db.hits" if row else "resume_db.misses")
+        return self._decode(row) if row else None
+
+    def reusable_response(self, input_hash: str) -> Optional[Dict[str, Any]]:
+        """The stored API response for an input hash, unless last generated over RESUME_REUSE_MAX_AGE_DAYS ago."""
+        if not self.reuse_responses:
+            return None
+        record = self.get_by_hash(input_hash)
+        if record is None:
+            return None
+        if RESUME_REUSE_MAX_AGE_DAYS and self.clock() - record["updated_at"] > RESUME_REUSE_MAX_AGE_DAYS * 86400:
+            return None
+        return record["response"]
+
+    def get(self, resume_id: int) -> Optional[Dict[str, Any]]:
+        """Stored record by id, or None."""
+        row = self._reader().execute(f"SELECT {COLUMNS} FROM resumes WHERE id = ?", (resume_id,)).fetchone()
+        return self._decode(row) if row else None
+
+    def resumes(self, resume_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """{id: {"id", "input_hash", "resume", "created_at"}} for the stored ids (responses are not read)."""
+        if not resume_ids:
+            return {}
+        placeholders = ",".join("?" * len(resume_ids))
+        rows = self._reader().execute(
+            f"SELECT id, input_hash, resume, created_at FROM resumes WHERE id IN ({placeholders})", list(resume_ids),
+        )
+        return {
+            resume_id: {"id": resume_id, "input_hash": input_hash, "resume": json.loads(resume), "created_at": created_at}
+            for resume_id, input_hash, resume, created_at in rows
+        }
+
+    def last_change(self) -> int:
+        """Number of the latest committed save in the change feed (0 before any)."""
+        return self._reader().execute("SELECT coalesce(max(seq), 0) FROM resume_changes").fetchone()[0]
+
+    def changes(self, after: int, limit: int) -> List[Tuple[int, int, Dict[str, Any]]]:
+        """(seq, id, resume) of up to `limit` resumes saved after change `after`, by any process, in order."""
+        rows = self._reader().execute(
+            "SELECT c.seq, r.id, r.resume FROM resume_changes c JOIN resumes r ON r.id = c.resume_id "
+            "WHERE c.seq > ? ORDER BY c.seq LIMIT ?", (after, limit),
+        )
+        return [(seq, resume_id, json.loads(resume)) for seq, resume_id, resume in rows]
+
+    def count(self) -> int:
+        return self._reader().execute("SELECT COUNT(*) FROM resumes").fetchone()[0]
+
+
+_resume_repository_instance: Optional[ResumeRepository] = None
+
+def get_resume_repository() -> ResumeRepository:
+    """Get or create the singleton ResumeRepository"""
+    global _resume_repository_instance
+    if _resume_repository_instance is None:
+        _resume_repository_instance = ResumeRepository(RESUME_DB_PATH)
+        # Queued records are committed at exit
+        atexit.register(_resume_repository_instance.close)
+    return _resume_repository_instance
@@ -0,0 +1,202 @@
+"""
+Priority scheduler around ResumePipeline.
+
+Jobs belong to a priority class (interactive chat requests, bulk batch
+imports, background re-scoring). Every pipeline stage of a job must hold a
+slot of the matching budget while it runs:
+
+- "llm" for the enhancement stage (gateway calls),
+- "cpu" for every other stage.
+
+Waiting stages are granted slots by weighted fair queuing (self-clocked
+variant): each class advances a virtual finish tag by 1/weight per stage,
+and the waiter with the smallest tag goes next. A large batch therefore
+keeps making progress but cannot starve interactive users, who get
+PRIORITY_WEIGHTS["interactive"] stages for every batch stage.
+
+Each job carries a deadline. A job whose deadline passes while it waits
+for a slot, or between stages, is dropped with JobExpired instead of
+spending budget on a result nobody will read.
+"""
+import os
+import time
+import heapq
+import asyncio
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+from app.utils.metrics import get_metrics
+from app.utils.cancellation import CancellationToken, OperationCancelled
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_WEIGHTS = {"interactive": 8.0, "batch": 2.0, "background": 1.0}
+DEFAULT_DEADLINES_SECONDS = {
+    "interactive": float(os.getenv("SCHEDULER_INTERACTIVE_DEADLINE_SECONDS", "60")),
+    "batch": float(os.getenv("SCHEDULER_BATCH_DEADLINE_SECONDS", "600")),
+    "background": float(os.getenv("SCHEDULER_BACKGROUND_DEADLINE_SECONDS", "3600")),
+}
+
+SCHEDULER_CPU_SLOTS = int(os.getenv("SCHEDULER_CPU_SLOTS", str(os.cpu_count() or 1)))
+SCHEDULER_LLM_SLOTS = int(os.getenv("SCHEDULER_LLM_SLOTS", "4"))
+
+# Stages that wait on the LLM gateway rather than the CPU
+LLM_STAGES = ("enhancement",)
+
+
+class JobExpired(OperationCancelled):
+    """The job's deadline passed before it finished"""
+
+    def __init__(self, detail: str):
+        super().__init__("deadline", detail)
+
+
+class Job:
+    """One pipeline run: its priority class and absolute deadline (monotonic clock)"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, priority: str, deadline: float, clock: Callable[[], float] = time.monotonic):
+        if priority not in PRIORITY_WEIGHTS:
+            raise ValueError(f"unknown priority class {priority!r}; expected one of {list(PRIORITY_WEIGHTS)}")
+        self.id = next(self._ids)
+        self.priority = priority
+        self.deadline = deadline
+        self.clock = clock
+
+    def remaining(self) -> float:
+        return self.deadline - self.clock()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+class FairBudget:
+    """A pool of slots shared by all priority classes, granted in WFQ order"""
+
+    def __init__(self, name: str, slots: int, weights: Dict[str, float] = PRIORITY_WEIGHTS):
+        self.name = name
+        self.slots = slots
+        self.weights = weights
+        self.active = 0
+        self._virtual_time = 0.0
+        self._last_tag = {cls: 0.0 for cls in weights}
+        self._waiters: List[tuple] = []  # heap of (tag, seq, future, job)
+        self._seq = itertools.count()
+
+    def _tag(self, job: Job) -> float:
+        tag = max(self._virtual_time, self._last_tag[job.priority]) + 1.0 / self.weights[job.priority]
+        self._last_tag[job.priority] = tag
+        return tag
+
+    async def acquire(self, job: Job) -> None:
+        tag = self._tag(job)
+        if self.active < self.slots and not self._waiters:
+            self.active += 1
+            self._virtual_time = tag
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (tag, next(self._seq), waiter, job))
+        try:
+            await asyncio.wait_for(waiter, max(0.0, job.remaining()))
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                self.release()
+            raise JobExpired(f"job {job.id} expired waiting for {self.name}")
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        # Cancelled or timed-out entries stay in the heap and are skipped by release()
+
+    def release(self) -> None:
+        while self._waiters:
+            tag, _, waiter, job = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue
+            if job.expired():
+                waiter.set_exception(JobExpired(f"job {job.id} expired waiting for {self.name}"))
+                continue
+            self._virtual_time = tag
+            waiter.set_result(None)  # slot passes straight to the waiter
+            return
+        self.active -= 1
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for entry in self._waiters if not entry[2].done())
+
+
+class JobScheduler:
+    """Runs pipeline jobs under per-stage CPU and LLM budgets"""
+
+    def __init__(self, cpu_slots: int = SCHEDULER_CPU_SLOTS, llm_slots: int = SCHEDULER_LLM_SLOTS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.budgets = {
+            "cpu": FairBudget("cpu", cpu_slots),
+            "llm": FairBudget("llm", llm_slots),
+        }
+
+    def new_job(self, priority: str = "interactive", deadline_s: Optional[float] = None) -> Job:
+        if deadline_s is None:
+            deadline_s = DEFAULT_DEADLINES_SECONDS.get(priority, DEFAULT_DEADLINES_SECONDS["interactive"])
+        return Job(priority, self.clock() + deadline_s, clock=self.clock)
+
+    def budget_for(self, stage_name: str) -> FairBudget:
+        return self.budgets["llm" if stage_name in LLM_STAGES else "cpu"]
+
+    @asynccontextmanager
+    async def stage_slot(self, job: Job, stage_name: str):
+        """Hold the stage's budget slot; raises JobExpired if the deadline passed."""
+        metrics = get_metrics()
+        if job.expired():
+            metrics.inc(f"scheduler.expired.{job.priority}")
+            raise JobExpired(f"job {job.id} expired before {stage_name}")
+        budget = self.budget_for(stage_name)
+        waited_from = self.clock()
+        try:
+            await budget.acquire(job)
+        except JobExpired:
+            metrics.inc(f"scheduler.expired.{job.priority}")
+            raise
+        metrics.observe(f"scheduler.wait_ms.{job.priority}", (self.clock() - waited_from) * 1000)
+        try:
+            yield
+        finally:
+            budget.release()
+
+    async def run(self, pipeline, state: Dict[str, Any], priority: str = "interactive",
+                  deadline_s: Optional[float] = None, token: Optional[CancellationToken] = None) -> Dict[str, Any]:
+        """
+        Run pipeline.run_async(state) as a job of the given class. The job's
+        deadline is applied to `token` (a new one if None), so stages see it too.
+
+        Raises:
+            OperationCancelled (JobExpired if the deadline passes first)
+        """
+        job = self.new_job(priority, deadline_s)
+        token = token or CancellationToken(clock=self.clock)
+        token.limit_deadline(job.deadline)
+        result = await pipeline.run_async(
+            state, gate=lambda stage_name: self.stage_slot(job, stage_name), token=token,
+        )
+        get_metrics().inc(f"scheduler.completed.{priority}")
+        return result
+
+
+_scheduler_instance: Optional[JobScheduler] = None
+
+def get_scheduler() -> JobScheduler:
+    """Get or create the singleton JobScheduler"""
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        _scheduler_instance = JobScheduler()
+        logger.info(
+            f"✓ Scheduler: {_scheduler_instance.budgets['cpu'].slots} CPU slots, "
+            f"{_scheduler_instance.budgets['llm'].slots} LLM slots"
+        )
+    return _scheduler_instance
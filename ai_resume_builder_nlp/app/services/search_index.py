@@ -0,0 +1,399 @@
+"""
+Search Index - full-text and facet search over stored resumes.
+
+Both structures follow the repository's change feed (ResumeRepository.
+changes()), which numbers every committed save from every process; each
+query first applies whatever was committed since the last one (refresh()),
+so a resume is searchable as soon as its batch commits, also in the other
+workers of a pre-forked server:
+
+- resume_fts, an FTS5 table in the resumes database (rowid = resume id)
+  with the columns role, skills, summary, experience, education and other.
+  It is shared, so the feed position it covers (search_meta fts_seq) is
+  kept with it and advanced in the same transaction: whichever process
+  queries first indexes a save, exactly once. Text queries use the FTS5
+  syntax (AND/OR/NOT, "phrases", prefix*) and are ranked by bm25 with role
+  and skills weighted above free text.
+- a BitmapIndex over facet keys derived from the resume:
+      skill:<canonical skill>         industry:<employer industry, companies.json>
+      role:<role_keywords key/title>  location:<each part of the profile location>
+      years>=<n>                      (range-encoded: every n up to the profile's years)
+  so "Kubernetes and 5+ years at a fintech" is an AND of three bitsets over
+  every stored resume.
+
+The bitsets live in memory, one copy per process. snapshot() (run at
+exit) saves them to resume_bitmaps with the feed position they cover,
+unless another process already saved a later one; on start the snapshot is
+loaded and only later saves are re-derived.
+
+Text results are ranked by bm25 and filtered by the facet bitset;
+facet-only results are ranked by years of experience, then most recent,
+which needs only bitset operations per years level.
+"""
+import re
+import time
+import atexit
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from app.services.bitmap_index import BitmapIndex
+from app.services.knowledge_base import KnowledgeBase, get_knowledge_base
+from app.services.resume_repository import ResumeRepository, connect, get_resume_repository
+from app.utils.json_utils import flatten_text
+from app.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# years>=n keys are kept up to this many years; more counts as this many
+SEARCH_MAX_YEARS = 40
+CATCH_UP_BATCH = 1000
+FETCH_BATCH = 4096
+
+FTS_COLUMNS = ("role", "skills", "summary", "experience", "education", "other")
+# bm25 column weights, in FTS_COLUMNS order
+FTS_WEIGHTS = (4.0, 3.0, 1.5, 1.0, 0.5, 0.5)
+
+SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS resume_fts USING fts5(
+    {", ".join(FTS_COLUMNS)}, tokenize = 'porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS resume_bitmaps (
+    key TEXT PRIMARY KEY,
+    bits BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_meta (
+    name TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+FTS_INSERT = (
+    f"INSERT INTO resume_fts (rowid, {', '.join(FTS_COLUMNS)}) "
+    f"VALUES (:id, {', '.join(':' + column for column in FTS_COLUMNS)})"
+)
+FTS_QUERY = (
+    f"SELECT rowid, bm25(resume_fts, {', '.join(map(str, FTS_WEIGHTS))}) AS rank "
+    "FROM resume_fts WHERE resume_fts MATCH ? ORDER BY rank"
+)
+
+OTHER_SECTIONS = ("projects", "certificates", "publications", "awards", "languages", "volunteering", "interests")
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_DIGITS = re.compile(r"\d+")
+
+
+def meta_value(conn: sqlite3.Connection, name: str) -> Optional[float]:
+    row = conn.execute("SELECT value FROM search_meta WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else None
+
+
+def set_meta_value(conn: sqlite3.Connection, name: str, value: float) -> None:
+    conn.execute("INSERT OR REPLACE INTO search_meta (name, value) VALUES (?, ?)", (name, value))
+
+
+class InvalidSearch(ValueError):
+    """The text query is not valid FTS5 syntax."""
+
+
+def profile_years(resume: Dict[str, Any]) -> int:
+    """Years of experience from the profile ("8", 8, "8+ years"), 0 if unknown."""
+    years = (resume.get("profile") or {}).get("years")
+    if isinstance(years, (int, float)):
+        return max(0, int(years))
+    match = _DIGITS.search(str(years or ""))
+    return int(match.group()) if match else 0
+
+
+def experience_entries(resume: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [entry for entry in resume.get("experience") or [] if isinstance(entry, dict)]
+
+
+def fts_row(resume: Dict[str, Any]) -> Dict[str, str]:
+    """FTS5 column values for a formatted resume."""
+    profile = resume.get("profile") or {}
+    roles = [profile.get("role")] + [entry.get("role") for entry in experience_entries(resume)]
+    return {
+        "role": flatten_text([role for role in roles if role]),
+        "skills": flatten_text(resume.get("skills")),
+        "summary": flatten_text(resume.get("summary")),
+        "experience": flatten_text(resume.get("experience")),
+        "education": flatten_text(resume.get("education")),
+        "other": flatten_text([resume.get(section) for section in OTHER_SECTIONS]),
+    }
+
+
+def skill_key(skill: str, kb: KnowledgeBase) -> str:
+    """Facet key of a skill, canonicalized through the skill index ("k8s" -> kubernetes)."""
+    found = kb.skill_index.find(skill)
+    canonical = next(iter(found)) if len(found) == 1 else skill
+    return f"skill:{canonical.strip().lower()}"
+
+
+def role_key(role: str, kb: KnowledgeBase) -> str:
+    """Facet key of a role title: its role_keywords key when known, else the normalized title."""
+    return f"role:{kb.resolve_role(role) or _NON_WORD.sub('_', role.lower()).strip('_')}"
+
+
+def industry_key(industry: str) -> str:
+    return f"industry:{industry.strip().lower()}"
+
+
+def location_keys(location: str) -> List[str]:
+    return [f"location:{part.strip().lower()}" for part in location.split(",") if part.strip()]
+
+
+def years_key(years: int) -> str:
+    return f"years>={min(years, SEARCH_MAX_YEARS)}"
+
+
+def facet_keys(resume: Dict[str, Any], kb: KnowledgeBase) -> Set[str]:
+    """Every facet key a formatted resume is indexed under."""
+    profile = resume.get("profile") or {}
+    keys: Set[str] = set()
+    for skill in resume.get("skills") or []:
+        if isinstance(skill, str) and skill.strip():
+            keys.add(skill_key(skill, kb))
+    for role in [profile.get("role")] + [entry.get("role") for entry in experience_entries(resume)]:
+        if isinstance(role, str) and role.strip():
+            keys.add(role_key(role, kb))
+    for entry in experience_entries(resume):
+        keys.update(industry_key(industry) for industry in kb.industries_of(entry.get("company")))
+    if isinstance(profile.get("location"), str):
+        keys.update(location_keys(profile["location"]))
+    keys.update(years_key(n) for n in range(1, min(profile_years(resume), SEARCH_MAX_YEARS) + 1))
+    return keys
+
+
+class SearchIndex:
+    """FTS5 text index plus in-memory facet bitsets over the resume repository"""
+
+    def __init__(self, repository: ResumeRepository, knowledge_base: Optional[KnowledgeBase] = None):
+        self.repository = repository
+        self.path = repository.path
+        self.kb = knowledge_base or get_knowledge_base()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        conn = connect(self.path)
+        try:
+            conn.executescript(SCHEMA)
+            # seen_seq: the bitsets hold every save up to this feed position
+            self.bitmaps, self.seen_seq = self._load_snapshot(conn)
+        finally:
+            conn.close()
+        # Feed position resume_fts was last seen to cover (another process may have gone further)
+        self._fts_seq = 0
+        self._refresh_lock = threading.Lock()
+        caught_up = self.refresh()
+        logger.info(f"✓ Search index ready ({len(self.bitmaps)} resumes, {caught_up} re-indexed)")
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+    def _load_snapshot(self, conn: sqlite3.Connection):
+        seq = meta_value(conn, "snapshot_seq")
+        if seq is None:
+            return BitmapIndex(), 0
+        return BitmapIndex.from_items(conn.execute("SELECT key, bits FROM resume_bitmaps")), int(seq)
+
+    def refresh(self) -> int:
+        """Index every save committed since the last refresh, by any process. Returns how many."""
+        latest = self.repository.last_change()
+        if latest <= self.seen_seq and latest <= self._fts_seq:
+            return 0
+        with self._refresh_lock:
+            return self._refresh_text() + self._refresh_facets()
+
+    def _refresh_text(self) -> int:
+        """Bring resume_fts up to the feed; also feeds the bitsets while they are level with it."""
+        total = 0
+        conn = connect(self.path)
+        try:
+            while True:
+                with conn:
+                    # The write lock makes reading and advancing fts_seq atomic across processes
+                    conn.execute("BEGIN IMMEDIATE")
+                    fts_seq = int(meta_value(conn, "fts_seq") or 0)
+                    changes = self.repository.changes(fts_seq, CATCH_UP_BATCH)
+                    if changes:
+                        records = [{"id": resume_id, "resume": resume} for _, resume_id, resume in changes]
+                        self._index_text(conn, records)
+                        set_meta_value(conn, "fts_seq", changes[-1][0])
+                self._fts_seq = changes[-1][0] if changes else fts_seq
+                if not changes:
+                    return total
+                if fts_seq == self.seen_seq:
+                    self._index_facets(records, changes[-1][0])
+                total += len(changes)
+        finally:
+            conn.close()
+
+    def _refresh_facets(self) -> int:
+        total = 0
+        while True:
+            changes = self.repository.changes(self.seen_seq, CATCH_UP_BATCH)
+            if not changes:
+                return total
+            self._index_facets([{"id": resume_id, "resume": resume} for _, resume_id, resume in changes],
+                               changes[-1][0])
+            total += len(changes)
+
+    def _index_text(self, conn: sqlite3.Connection, records: List[Dict[str, Any]]) -> None:
+        # The last save of a resume in the batch wins
+        latest = {record["id"]: record for record in records}
+        conn.executemany("DELETE FROM resume_fts WHERE rowid = ?", [(resume_id,) for resume_id in latest])
+        conn.executemany(FTS_INSERT, [{"id": resume_id, **fts_row(record["resume"])}
+                                      for resume_id, record in latest.items()])
+
+    def _index_facets(self, records: List[Dict[str, Any]], seq: int) -> None:
+        keyed = [(record["id"], facet_keys(record["resume"], self.kb)) for record in records]
+        with self._lock:
+            for resume_id, keys in keyed:
+                self.bitmaps.add(resume_id, keys)
+            self.seen_seq = seq
+
+    def snapshot(self) -> None:
+        """Persist the facet bitsets so the next start only re-indexes later saves."""
+        with self._lock:
+            seq = self.seen_seq
+            items = list(self.bitmaps.items())
+        conn = connect(self.path)
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                saved = meta_value(conn, "snapshot_seq")
+                if saved is not None and saved >= seq:
+                    # Another worker saved bitsets covering at least as much
+                    return
+                conn.execute("DELETE FROM resume_bitmaps")
+                conn.executemany("INSERT INTO resume_bitmaps (key, bits) VALUES (?, ?)", items)
+                set_meta_value(conn, "snapshot_seq", seq)
+        finally:
+            conn.close()
+        logger.info(f"✓ Saved search index snapshot ({len(items)} bitsets)")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = connect(self.path)
+            conn.execute("PRAGMA query_only=1")
+        return conn
+
+    def _filter(self, skills: Iterable[str], industries: Iterable[str], roles: Iterable[str],
+                locations: Iterable[str], min_years: int, max_years: Optional[int]) -> np.ndarray:
+        required = [skill_key(skill, self.kb) for skill in skills]
+        if min_years > 0:
+            required.append(years_key(min_years))
+        bits = self.bitmaps.all_of(required)
+        any_groups = [
+            [industry_key(industry) for industry in industries],
+            [role_key(role, self.kb) for role in roles],
+            [key for location in locations for key in location_keys(location)],
+        ]
+        for group in any_groups:
+            if group:
+                np.bitwise_and(bits, self.bitmaps.any_of(group), out=bits)
+        if max_years is not None and max_years < SEARCH_MAX_YEARS:
+            too_senior = self.bitmaps.get(years_key(max_years + 1))
+            if too_senior is not None:
+                np.bitwise_and(bits, ~too_senior, out=bits)
+        return bits
+
+    def facet_bits(self, skills: Iterable[str] = (), industries: Iterable[str] = (), roles: Iterable[str] = (),
+                   locations: Iterable[str] = (), min_years: int = 0, max_years: Optional[int] = None) -> np.ndarray:
+        """Bitset of resumes with every skill, any of the industries/roles/locations, within the years."""
+        self.refresh()
+        with self._lock:
+            return self._filter(skills, industries, roles, locations, min_years, max_years)
+
+    def _rank_by_years(self, bits: np.ndarray, limit: int) -> List[tuple]:
+        """(id, years) of the top `limit` resumes by years, newest first within a level."""
+        ranked: List[tuple] = []
+        above = np.zeros_like(bits)  # resumes already ranked at a higher level
+        for years in range(SEARCH_MAX_YEARS, -1, -1):
+            level = bits if years == 0 else self.bitmaps.get(years_key(years))
+            if level is None:
+                continue
+            level = level & bits
+            tier = level & ~above
+            if BitmapIndex.count(tier):
+                for resume_id in BitmapIndex.ids(tier)[::-1][:limit - len(ranked)]:
+                    ranked.append((int(resume_id), years))
+                if len(ranked) >= limit:
+                    break
+            above = level
+        return ranked
+
+    def _rank_by_text(self, text: str, bits: np.ndarray, limit: int):
+        """(total matches, [(id, score)] best first) for an FTS5 query within bits."""
+        ranked, total = [], 0
+        try:
+            cursor = self._reader().execute(FTS_QUERY, (text,))
+            while True:
+                rows = cursor.fetchmany(FETCH_BATCH)
+                if not rows:
+                    break
+                ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+                keep = np.flatnonzero(BitmapIndex.test(bits, ids))
+                total += len(keep)
+                for position in keep[:max(0, limit - len(ranked))]:
+                    # bm25 is lower-is-better; report higher-is-better
+                    ranked.append((int(ids[position]), -rows[position][1]))
+        except sqlite3.OperationalError as e:
+            raise InvalidSearch(f"invalid search query: {e}") from e
+        return total, ranked
+
+    def search(self, text: Optional[str] = None, skills: Iterable[str] = (), industries: Iterable[str] = (),
+               roles: Iterable[str] = (), locations: Iterable[str] = (), min_years: int = 0,
+               max_years: Optional[int] = None, limit: int = 20) -> Dict[str, Any]:
+        """
+        Resumes matching the text query (FTS5 syntax) and the facets: every
+        skill, any of the industries, roles and locations, min_years to
+        max_years. Returns {"total", "hits": [{"id", "input_hash", "score",
+        "resume", "created_at"}]}, best first.
+        """
+        started = time.perf_counter()
+        self.refresh()
+        with self._lock:
+            bits = self._filter(skills, industries, roles, locations, min_years, max_years)
+            if not text:
+                ranked = self._rank_by_years(bits, limit)
+                total = BitmapIndex.count(bits)
+        if text:
+            total, ranked = self._rank_by_text(text, bits, limit)
+
+        stored = self.repository.resumes([resume_id for resume_id, _ in ranked])
+        hits = [{**stored[resume_id], "score": score} for resume_id, score in ranked if resume_id in stored]
+
+        metrics = get_metrics()
+        metrics.inc("search.queries")
+        metrics.observe("search.query_ms", (time.perf_counter() - started) * 1000)
+        return {"total": total, "hits": hits}
+
+    def facets(self, prefix: str = "") -> Dict[str, int]:
+        """Resume count per facet key starting with prefix (e.g. "industry:")."""
+        self.refresh()
+        with self._lock:
+            return {key: BitmapIndex.count(self.bitmaps.get(key))
+                    for key in self.bitmaps.keys() if key.startswith(prefix)}
+
+
+_search_index_instance: Optional[SearchIndex] = None
+_search_index_lock = threading.Lock()
+
+def get_search_index() -> SearchIndex:
+    """Get or create the singleton SearchIndex"""
+    global _search_index_instance
+    with _search_index_lock:
+        if _search_index_instance is None:
+            _search_index_instance = SearchIndex(get_resume_repository())
+            # Runs before the repository closes (atexit is last-in, first-out)
+            atexit.register(_search_index_instance.snapshot)
+    return _search_index_instance
@@ -0,0 +1,199 @@
+"""
+Skill spelling correction and alias canonicalization.
+
+SkillIndex resolves what users actually type to the canonical skills.json
+spelling:
+
+- aliases from skill_aliases.json and the canonical names themselves, looked
+  up exactly on 1..N-word phrases ("k8s" -> Kubernetes, "ReactJS" -> React,
+  "node js" -> Node.js),
+- typos in single-word skills by symmetric deletion (SymSpell): every
+  one-word skill and alias is stored under all its deletions up to its edit
+  budget when the knowledge base is compiled, and a query word only
+  generates its own deletions and probes the table, so a lookup costs a
+  fixed number of dictionary gets for a given word length, independent of
+  the number of skills ("Pyhton" -> Python). Candidates are verified with
+  the bounded distance from fuzzy_index.
+
+Words shorter than 6 characters are never corrected (too many English words
+are one edit from "React" or "Scala"), and not_typos in skill_aliases.json
+lists longer words that must not be corrected either ("iconic" is not Ionic,
+"scalar" is not Scala). Aliases listed in needs_context are ordinary words
+too ("graph node", "rails trips"): they only count when capitalized ("Node",
+"Rails") or on a skills line ("Skills: node, docker").
+
+find_unambiguous() keeps only canonical names of at least three characters
+written as is -- no aliases, typos, "Go" in "ready to go" or "R" in "R&D" --
+for callers that act on a mere mention.
+"""
+import re
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.services.fuzzy_index import bounded_distance, deletes
+
+# Corrections are memoized per word; the memo is reset when it reaches this size
+CORRECTION_MEMO_SIZE = 50000
+# Shortest canonical skill name find_unambiguous() accepts as written
+MIN_UNAMBIGUOUS_CHARS = 3
+
+# A line listing skills: "Skills: ...", "Tech stack (backend): ...", "• Tools: ..."
+_SKILLS_LINE = re.compile(
+    r"^[ \t*•-]*(?:technical skills|skills|technologies|tech stack|tools)\b[^:\n]{0,30}:(.*)$", re.I | re.M,
+)
+# Skill words: letters/digits plus the punctuation used in names like C++, C#, Node.js
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#./-]*")
+_JOINER = re.compile(r"[/-]")
+
+
+def skill_max_edits(word: str) -> int:
+    """Edit budget for correcting a single word."""
+    if len(word) < 6:
+        return 0
+    if len(word) < 10:
+        return 1
+    return 2
+
+
+def skill_terms(skills_json) -> List[str]:
+    """Every skill name in skills.json, whatever the nesting."""
+    if isinstance(skills_json, dict):
+        return [term for value in skills_json.values() for term in skill_terms(value)]
+    if isinstance(skills_json, list):
+        return [term for term in skills_json if isinstance(term, str)]
+    return []
+
+
+def skill_words(text: str) -> List[str]:
+    """Lowercased words of text, trailing sentence punctuation removed."""
+    return [word.rstrip(".-/") for word in _WORD.findall(text.lower())]
+
+
+class SkillIndex:
+    """Exact phrase table plus a SymSpell deletion table over one-word skills"""
+
+    def __init__(self, terms: Iterable[str], aliases: Optional[Dict[str, object]] = None):
+        """
+        Args:
+            terms: canonical skill names (skills.json)
+            aliases: parsed skill_aliases.json: {"aliases": {canonical: [variant, ...]},
+                "not_typos": [word, ...]}
+        """
+        aliases = aliases or {}
+        # normalized phrase -> canonical skill
+        self.phrases: Dict[str, str] = {}
+        for term in terms:
+            self.phrases.setdefault(" ".join(skill_words(term)), term)
+        for canonical, variants in aliases.get("aliases", {}).items():
+            for variant in variants:
+                self.phrases.setdefault(" ".join(skill_words(variant)), canonical)
+        self.phrases.pop("", None)
+        self.max_phrase_words = max((phrase.count(" ") + 1 for phrase in self.phrases), default=1)
+        # First words of multi-word phrases; other words never start a phrase lookup
+        self.phrase_starts: Set[str] = {phrase.split(" ", 1)[0] for phrase in self.phrases if " " in phrase}
+        self.not_typos: Set[str] = {word.lower() for word in aliases.get("not_typos", [])}
+        # needs_context phrase -> its whole-word pattern in the original text
+        self.context_patterns: Dict[str, re.Pattern] = {}
+        for variant in aliases.get("needs_context", []):
+            phrase = " ".join(skill_words(variant))
+            words = r"[\s/-]+".join(re.escape(word) for word in phrase.split(" "))
+            self.context_patterns[phrase] = re.compile(r"(?<![\w.])" + words + r"(?![\w])", re.I)
+
+        # deletion variant -> one-word phrases it was derived from
+        self.deletions: Dict[str, Set[str]] = {}
+        for phrase in self.phrases:
+            if " " in phrase:
+                continue
+            for variant in deletes(phrase, skill_max_edits(phrase)):
+                self.deletions.setdefault(variant, set()).add(phrase)
+        self._corrections: Dict[str, Optional[Tuple[str, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def correct(self, word: str) -> Optional[Tuple[str, int]]:
+        """(canonical skill, edit distance) for a single lowercased word, or None."""
+        exact = self.phrases.get(word)
+        if exact is not None:
+            return exact, 0
+        bound = skill_max_edits(word)
+        if bound == 0 or word in self.not_typos:
+            return None
+
+        best: Optional[Tuple[int, str]] = None
+        for variant in deletes(word, bound):
+            for phrase in self.deletions.get(variant, ()):
+                distance = bounded_distance(word, phrase, bound)
+                if distance is not None and (best is None or (distance, phrase) < best):
+                    best = (distance, phrase)
+        return (self.phrases[best[1]], best[0]) if best else None
+
+    def _correct_memoized(self, word: str) -> Optional[Tuple[str, int]]:
+        try:
+            return self._corrections[word]
+        except KeyError:
+            pass
+        if len(self._corrections) >= CORRECTION_MEMO_SIZE:
+            self._corrections = {}
+        result = self._corrections[word] = self.correct(word)
+        return result
+
+    def words(self, text: str) -> List[str]:
+        """skill_words, with "Python/Django" and "Django-based" split unless the whole is a skill."""
+        words = []
+        for word in skill_words(text):
+            if ("/" in word or "-" in word) and word not in self.phrases and word not in self.phrase_starts:
+                words.extend(part for part in _JOINER.split(word) if part)
+            else:
+                words.append(word)
+        return words
+
+    def in_context(self, text: str, phrase: str) -> bool:
+        """Whether a needs_context phrase appears capitalized, or on a skills line, in text."""
+        pattern = self.context_patterns[phrase]
+        if any(found.group()[0].isupper() for found in pattern.finditer(text)):
+            return True
+        return any(pattern.search(line.group(1)) for line in _SKILLS_LINE.finditer(text))
+
+    def matches(self, text: str) -> Iterator[Tuple[str, str, int]]:
+        """(canonical skill, phrase as written, edit distance) for every mention in text."""
+        words = self.words(text)
+        # needs_context phrase -> whether text gives it that context
+        context: Dict[str, bool] = {}
+        for start, word in enumerate(words):
+            candidates = []
+            if word in self.phrase_starts:
+                for n in range(2, min(self.max_phrase_words, len(words) - start) + 1):
+                    phrase = " ".join(words[start:start + n])
+                    skill = self.phrases.get(phrase)
+                    if skill is not None:
+                        candidates.append((skill, phrase, 0))
+            match = self._correct_memoized(word)
+            if match is not None:
+                candidates.append((match[0], word, match[1]))
+            for skill, phrase, distance in candidates:
+                if phrase in self.context_patterns:
+                    if phrase not in context:
+                        context[phrase] = self.in_context(text, phrase)
+                    if not context[phrase]:
+                        continue
+                yield skill, phrase, distance
+
+    def count(self, text: str) -> Counter:
+        """Mentions of each canonical skill in text (by alias, canonical spelling or a typo)."""
+        return Counter(skill for skill, _, _ in self.matches(text))
+
+    def find(self, text: str) -> Set[str]:
+        """Canonical skills mentioned in text by alias, canonical spelling or a typo."""
+        return set(self.count(text))
+
+    def find_unambiguous(self, text: str) -> Set[str]:
+        """
+        Canonical skill names of at least MIN_UNAMBIGUOUS_CHARS written as is.
+        Aliases, typos and shorter names are left out: any of them can be a
+        plain word ("node", "reacts", "go").
+        """
+        return {
+            skill for skill, phrase, distance in self.matches(text)
+            if not distance and len(phrase) >= MIN_UNAMBIGUOUS_CHARS and phrase == " ".join(skill_words(skill))
+        }
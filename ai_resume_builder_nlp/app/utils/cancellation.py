@@ -0,0 +1,138 @@
+"""
+Request deadlines and cancellation.
+
+A CancellationToken carries a request's absolute deadline and a cancelled
+flag (set when the client disconnects). ResumePipeline.run_async makes the
+token current in a context variable, so every stage function can reach it
+without a new parameter:
+
+    token = current_token()
+    if token:
+        token.raise_if_cancelled()           # between steps
+        deadline = token.limit(my_deadline)  # never wait past the request's deadline
+
+Code that starts background work (e.g. concurrent LLM calls) registers a
+callback with on_cancel() so the work is cancelled with the request.
+
+Skipped stages and cancelled LLM calls are counted under "cancellation.*"
+so /metrics can report how much work cancellation saved.
+"""
+import time
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STAGES_SKIPPED = "cancellation.stages_skipped"
+LLM_SECTIONS_CANCELLED = "cancellation.llm_sections_cancelled"
+STAGE_MS = "pipeline.stage_ms"
+
+
+class OperationCancelled(Exception):
+    """The request was cancelled or ran out of time; reason says which."""
+
+    def __init__(self, reason: str, detail: Optional[str] = None):
+        super().__init__(detail or f"operation cancelled: {reason}")
+        self.reason = reason
+
+
+class CancellationToken:
+    """Deadline plus explicit cancellation for one request"""
+
+    def __init__(self, deadline: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.deadline = deadline  # absolute, on clock(); None means no deadline
+        self.clock = clock
+        self.reason: Optional[str] = None
+        self._callbacks: List[Callable[[], None]] = []
+
+    @classmethod
+    def after(cls, seconds: Optional[float], clock: Callable[[], float] = time.monotonic) -> "CancellationToken":
+        return cls(None if seconds is None else clock() + seconds, clock)
+
+    @property
+    def cancelled(self) -> bool:
+        if self.reason is None and self.deadline is not None and self.clock() >= self.deadline:
+            self.reason = "deadline"
+        return self.reason is not None
+
+    def remaining(self) -> Optional[float]:
+        return None if self.deadline is None else self.deadline - self.clock()
+
+    def limit(self, deadline: float) -> float:
+        """The earlier of `deadline` and this token's deadline."""
+        return deadline if self.deadline is None else min(deadline, self.deadline)
+
+    def limit_deadline(self, deadline: Optional[float]) -> None:
+        """Tighten this token's own deadline."""
+        if deadline is not None:
+            self.deadline = self.limit(deadline)
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if self.reason is not None:
+            return
+        self.reason = reason
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Cancellation callback failed: {e}")
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call `callback` on cancel(). Returns a function that unregisters it."""
+        if self.reason is not None:
+            callback()
+            return lambda: None
+        self._callbacks.append(callback)
+
+        def remove() -> None:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+        return remove
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise OperationCancelled(self.reason)
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar("cancellation_token", default=None)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """The token of the request being served, if any."""
+    return _current_token.get()
+
+
+@contextmanager
+def use_token(token: Optional[CancellationToken]):
+    """Make `token` current for the duration of the block (and tasks started in it)."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def reclaimed_work(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Summarize cancellation savings from a metrics snapshot: skipped stages
+    priced at their mean observed duration, plus cancelled LLM calls.
+    """
+    counters = snapshot.get("counters", {})
+    observations = snapshot.get("observations", {})
+    skipped = {
+        name[len(STAGES_SKIPPED) + 1:]: count
+        for name, count in counters.items() if name.startswith(STAGES_SKIPPED + ".")
+    }
+    reclaimed_ms = sum(
+        count * observations.get(f"{STAGE_MS}.{stage}", {}).get("mean", 0.0)
+        for stage, count in skipped.items()
+    )
+    return {
+        "requestsCancelled": sum(v for k, v in counters.items() if k.startswith("cancellation.requests.")),
+        "stagesSkipped": skipped,
+        "estimatedStageMsReclaimed": round(reclaimed_ms, 1),
+        "llmSectionsCancelled": counters.get(LLM_SECTIONS_CANCELLED, 0),
+    }
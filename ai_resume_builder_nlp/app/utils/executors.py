@@ -0,0 +1,88 @@
+"""
+Shared executors for work that runs off the calling thread.
+
+A single pool per process is reused by every request so threads are not
+spawned per call. Pool sizes can be tuned with environment variables.
+
+The process pool is for CPU-bound pure-Python stages (regex extraction,
+schema normalization) that hold the GIL: running them in another process
+keeps the event loop serving other requests. Arguments and results cross
+the process boundary as marshal bytes, which is smaller and faster than
+pickle for the plain dict/list/str data the stages exchange.
+"""
+import os
+import marshal
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
+THREAD_POOL_WORKERS = int(os.getenv("THREAD_POOL_WORKERS", str(min(8, os.cpu_count() or 1))))
+PROCESS_POOL_WORKERS = int(os.getenv("PROCESS_POOL_WORKERS", str(os.cpu_count() or 1)))
+
+# Imported once in the fork server so pool workers start with the stage code
+# and the JSON-derived matchers already loaded
+PROCESS_POOL_PRELOAD = ["app.pipeline_runner"]
+
+_thread_pool = None
+_process_pool = None
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """
+    Get the shared ThreadPoolExecutor.
+    Created on first use so importing this module stays cheap.
+    """
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(
+            max_workers=THREAD_POOL_WORKERS,
+            thread_name_prefix="resume-worker",
+        )
+    return _thread_pool
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared ProcessPoolExecutor.
+    Created on first use. Workers come from a fork server where available
+    (never forked from the threaded server process itself), else spawned.
+    """
+    global _process_pool
+    if _process_pool is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload(PROCESS_POOL_PRELOAD)
+        else:
+            context = multiprocessing.get_context("spawn")
+        _process_pool = ProcessPoolExecutor(max_workers=PROCESS_POOL_WORKERS, mp_context=context)
+    return _process_pool
+
+
+def pack_call(args: tuple, kwargs: dict) -> Optional[bytes]:
+    """Marshal call arguments; None if they hold types marshal cannot encode."""
+    try:
+        return marshal.dumps((args, kwargs))
+    except ValueError:
+        return None
+
+
+def _marshal_call(func: Callable, payload: bytes, omit_keys: Iterable[str]) -> bytes:
+    """Process pool body: unpack the arguments, call, marshal the result back."""
+    args, kwargs = marshal.loads(payload)
+    result = func(*args, **kwargs)
+    if isinstance(result, dict):
+        for key in omit_keys:
+            result.pop(key, None)
+    return marshal.dumps(result)
+
+
+async def call_in_process(func: Callable, payload: bytes, omit_keys: Iterable[str] = ()) -> Any:
+    """
+    Run func on the process pool with arguments packed by pack_call.
+
+    func must be a module-level function. Keys in omit_keys are dropped
+    from a dict result before it is sent back (e.g. input echoed unchanged).
+    """
+    loop = asyncio.get_running_loop()
+    reply = await loop.run_in_executor(get_process_pool(), _marshal_call, func, payload, tuple(omit_keys))
+    return marshal.loads(reply)
@@ -1,8 +1,243 @@
-
 import json
+from typing import Any, List, Optional, Tuple
 
 def safe_json(data: any) -> str:
     try:
         return json.dumps(data, indent=2)
     except Exception:
         return str(data)
+
+
+def flatten_text(value: Any) -> str:
+    """All strings inside value (dicts, lists, scalars) joined by spaces."""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return " ".join(flatten_text(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return " ".join(flatten_text(v) for v in value)
+    return str(value)
+
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class IncrementalJSONParser:
+    """
+    Tolerant, incremental extractor for the first JSON object in LLM output.
+
+    Text before the object (prose, code fences) and after it is ignored.
+    feed() can be called with streamed chunks; it returns the object's
+    top-level members ("key", value) as soon as the object closes, so a
+    caller can stop reading without waiting for trailing text. Members are
+    only returned once the whole object has parsed: until then a "{" in
+    prose can look like the start of one.
+
+    If the output is truncated, partial() rebuilds the object up to the last
+    complete value (closing any open arrays/objects), so finished sections of
+    a cut-off response are not lost.
+
+    Scanning is linear while the candidate object stays valid. A candidate
+    that turns out not to be JSON (e.g. "{braces}" in prose) is dropped and
+    scanning restarts just after its opening brace, so text is rescanned
+    once per abandoned candidate: O(n^2) in the worst case (many nested
+    braces that never form an object), which the max_tokens bound on LLM
+    output keeps small. A stray "{" that never closes only shows at the end
+    of the input: finish() then looks for a complete object at each later "{".
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.result: Optional[dict] = None
+        self._reset_candidate(0)
+
+    def _reset_candidate(self, pos: int) -> None:
+        self._pos = pos              # next buffer index to scan
+        self._start = -1             # index of the candidate's opening "{"
+        self._stack: List[str] = []  # open brackets
+        self._in_string = False
+        self._escape = False
+        self._string_is_value = False
+        self._expect_value = False
+        self._member_start = -1      # start of the current top-level member
+        self._members: List[Tuple[str, Any]] = []
+        # (cut index, open brackets at that index) of the last complete value
+        self._safe_cut: Optional[Tuple[int, str]] = None
+
+    @property
+    def done(self) -> bool:
+        return self.result is not None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add streamed text.
+
+        Returns:
+            The object's top-level members, in order, if it closed within
+            this chunk; [] otherwise
+        """
+        if self.done:
+            return []
+        self.buffer += chunk
+        completed = []
+        while not self._scan(completed):
+            # Not JSON after all: rescan from just after the candidate's opening brace
+            self._reset_candidate(self._start + 1)
+        return completed
+
+    def _scan(self, completed: list) -> bool:
+        """Scan new text; False if the current candidate object is invalid."""
+        buf = self.buffer
+        i = self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if self._start < 0:
+                if ch == "{":
+                    self._start = i
+                    self._stack = ["{"]
+                    self._member_start = i + 1
+                    self._safe_cut = (i + 1, "{")
+                i += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._string_is_value:
+                        self._safe_cut = (i + 1, "".join(self._stack))
+                i += 1
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_is_value = self._expect_value or self._stack[-1] == "["
+                self._expect_value = False
+            elif ch == ":":
+                self._expect_value = True
+            elif ch in "{[":
+                self._expect_value = False
+                self._stack.append(ch)
+                self._safe_cut = (i + 1, "".join(self._stack))
+            elif ch in "}]":
+                if _CLOSERS[self._stack[-1]] != ch:
+                    return False
+                if len(self._stack) == 1:
+                    if self._close_member(i) is False:
+                        return False
+                    try:
+                        result = json.loads(buf[self._start:i + 1])
+                    except ValueError:
+                        return False
+                    self.result = result
+                    completed.extend(result.items())
+                    self._pos = i + 1
+                    return True
+                self._stack.pop()
+                self._safe_cut = (i + 1, "".join(self._stack))
+            elif ch == ",":
+                self._expect_value = False
+                self._safe_cut = (i, "".join(self._stack))
+                if len(self._stack) == 1:
+                    if not self._close_member(i):
+                        return False
+                    self._member_start = i + 1
+            i += 1
+
+        self._pos = i
+        return True
+
+    def _close_member(self, end: int):
+        """Parse buffer[member_start:end] as one "key": value member; False if invalid."""
+        text = self.buffer[self._member_start:end]
+        if not text.strip():
+            return None
+        try:
+            parsed = json.loads("{" + text + "}")
+        except ValueError:
+            return False
+        if len(parsed) != 1:
+            return False
+        member = next(iter(parsed.items()))
+        self._members.append(member)
+        return member
+
+    def finish(self) -> List[Tuple[str, Any]]:
+        """
+        Mark the end of the input. If the candidate object never closed and
+        is not a valid truncated object either, its "{" was prose: the first
+        complete object starting at a later "{" becomes the result.
+
+        Returns:
+            That object's members; [] if there is none
+        """
+        if self.done or self._start < 0 or self._truncated() is not None:
+            return []
+        decoder = json.JSONDecoder()
+        pos = self.buffer.find("{", self._start + 1)
+        while pos >= 0:
+            try:
+                value, end = decoder.raw_decode(self.buffer, pos)
+            except ValueError:
+                value = None
+            if isinstance(value, dict):
+                self._reset_candidate(end)
+                self.result = value
+                self._members = list(value.items())
+                return list(self._members)
+            pos = self.buffer.find("{", pos + 1)
+        return []
+
+    def _truncated(self) -> Optional[dict]:
+        """The open candidate cut after its last complete value, or None if that is not JSON."""
+        if self._start < 0 or self._safe_cut is None:
+            return None
+        cut, stack = self._safe_cut
+        text = self.buffer[self._start:cut].rstrip().rstrip(",")
+        closing = "".join(_CLOSERS[b] for b in reversed(stack))
+        try:
+            value = json.loads(text + closing)
+        except ValueError:
+            return None
+        return value if isinstance(value, dict) else None
+
+    def partial(self) -> Optional[dict]:
+        """
+        Best-effort object from a truncated buffer: everything up to the last
+        complete value, with open brackets closed. None if nothing usable.
+        """
+        if self.done:
+            return self.result
+        value = self._truncated()
+        if value is None and self._members:
+            # Fall back to the members that closed cleanly
+            value = dict(self._members)
+        return value
+
+
+def extract_first_json_object(text: str) -> Optional[dict]:
+    """The first complete JSON object in `text`, or None."""
+    parser = IncrementalJSONParser()
+    parser.feed(text)
+    parser.finish()
+    return parser.result
+
+
+def parse_llm_json(text: str, allow_partial: bool = True) -> dict:
+    """
+    Parse a JSON object out of LLM output, tolerating code fences and stray
+    prose. Truncated output yields the complete part if allow_partial.
+
+    Raises:
+        ValueError if no object can be recovered
+    """
+    parser = IncrementalJSONParser()
+    parser.feed(text)
+    parser.finish()
+    result = parser.result if parser.done else (parser.partial() if allow_partial else None)
+    if result is None:
+        raise ValueError("no JSON object found in LLM output")
+    return result
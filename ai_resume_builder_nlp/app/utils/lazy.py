@@ -0,0 +1,40 @@
+"""
+Lazy module attributes (PEP 562).
+
+The ADK agent wrappers pull in google-adk, google-genai and litellm, which
+take seconds to import, while ResumePipeline only calls the plain tool
+functions. Agent modules therefore build their ADK objects on first
+attribute access instead of at import time:
+
+    def _build_qa_agent():
+        from google.adk.agents import Agent
+        return Agent(...)
+
+    __getattr__ = lazy_attributes(globals(), qa_agent=_build_qa_agent)
+
+`from app.agents.qa_agent.agent import qa_agent` still works; it triggers
+the build once and the result is cached in the module namespace.
+"""
+import threading
+from typing import Any, Callable, Dict
+
+
+def lazy_attributes(module_globals: Dict[str, Any], **factories: Callable[[], Any]) -> Callable[[str], Any]:
+    """
+    Return a module-level __getattr__ that builds each named attribute on
+    first access with its zero-argument factory.
+    """
+    lock = threading.RLock()
+    module_name = module_globals.get("__name__", "module")
+
+    def __getattr__(name: str) -> Any:
+        factory = factories.get(name)
+        if factory is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        with lock:
+            # Another thread may have built it while we waited
+            if name not in module_globals:
+                module_globals[name] = factory()
+        return module_globals[name]
+
+    return __getattr__
@@ -0,0 +1,62 @@
+"""
+In-process metrics registry.
+
+Counters (monotonic totals) and observations (count/sum/min/max of a value,
+e.g. latency in ms) keyed by dotted names such as "llm.requests". The
+snapshot is served by GET /metrics. Values are per process; with several
+workers each reports its own.
+"""
+import threading
+from typing import Any, Dict
+
+
+class MetricsRegistry:
+    """Thread-safe counters and observations"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._observations: Dict[str, Dict[str, float]] = {}
+
+    def inc(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        with self._lock:
+            obs = self._observations.get(name)
+            if obs is None:
+                self._observations[name] = {"count": 1, "sum": value, "min": value, "max": value}
+                return
+            obs["count"] += 1
+            obs["sum"] += value
+            obs["min"] = min(obs["min"], value)
+            obs["max"] = max(obs["max"], value)
+
+    def counter(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            observations = {
+                name: {**obs, "mean": obs["sum"] / obs["count"]}
+                for name, obs in self._observations.items()
+            }
+            return {"counters": dict(self._counters), "observations": observations}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._observations.clear()
+
+
+# Create a singleton instance
+_metrics_instance = None
+
+def get_metrics() -> MetricsRegistry:
+    """Get the process-wide MetricsRegistry."""
+    global _metrics_instance
+    if _metrics_instance is None:
+        _metrics_instance = MetricsRegistry()
+    return _metrics_instance
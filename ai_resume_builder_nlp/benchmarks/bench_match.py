@@ -0,0 +1,65 @@
+"""
+Job matching latency: vectorizing a resume vs matching with cached vectors.
+
+Matches the sample CV's formatted resume against a job description N
+times: once with a cold vector cache (both texts vectorized on every call)
+and once warm, where every match is two cache hits and one sparse-row x
+dense-vector product.
+
+Usage:
+    python benchmarks/bench_match.py [--matches 2000]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.pipeline_runner import pipeline
+from app.services.job_matcher import JobMatcher, get_job_matcher
+from app.services.renderer import resume_from_state
+from benchmarks.fixtures import CLARIFICATION_ANSWERS, SAMPLE_RESUME_TEXT
+from benchmarks.harness import use_scratch_storage
+
+JOB_DESCRIPTION = (
+    "We are hiring a Senior Software Engineer to build microservices and APIs in Python and Go. "
+    "You will run services on Kubernetes and AWS, own CI/CD pipelines, and work with PostgreSQL "
+    "and Redis. Experience with React, TypeScript and system design is a plus. Strong "
+    "communication and code review habits expected."
+)
+
+
+def per_second(count: int, seconds: float) -> str:
+    return f"{count / seconds:>10,.0f}/s  ({seconds / count * 1e6:7.1f} us each)"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--matches", type=int, default=2000)
+    args = parser.parse_args()
+
+    use_scratch_storage()
+    state = pipeline.run({"raw_text": SAMPLE_RESUME_TEXT, "test_mode": True, "answers": CLARIFICATION_ANSWERS})
+    resume = resume_from_state(state)
+    vectorizer = get_job_matcher().vectorizer
+
+    cold = JobMatcher(vectorizer, cache_size=0)
+    start = time.perf_counter()
+    for _ in range(args.matches):
+        cold.match(JOB_DESCRIPTION, resume)
+    cold_s = time.perf_counter() - start
+
+    warm = JobMatcher(vectorizer)
+    warm.match(JOB_DESCRIPTION, resume)
+    start = time.perf_counter()
+    for _ in range(args.matches):
+        warm.match(JOB_DESCRIPTION, resume)
+    warm_s = time.perf_counter() - start
+
+    print("=" * 62)
+    print(f"JOB MATCHING ({len(vectorizer)} keyword vocabulary, {args.matches} matches)")
+    print("=" * 62)
+    print(f"{'vectorize both texts':<24} {per_second(args.matches, cold_s)}")
+    print(f"{'cached vectors':<24} {per_second(args.matches, warm_s)}")
@@ -0,0 +1,86 @@
+"""
+Event-loop stall benchmark: understanding a large CV inline vs on the process pool.
+
+While one large document goes through the understanding stage, a ticker
+coroutine measures how late the event loop wakes it up. Inline, the regex
+extractors hold the GIL and the loop stalls for the whole stage; offloaded,
+other requests keep being served and only the marshal round trip is paid.
+
+Usage:
+    python benchmarks/bench_offload.py [--sizes-kb 20 50 100] [--repeats 5]
+"""
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import pipeline_runner
+from app.pipeline_runner import pipeline
+from app.agents.understanding_agent.agent import understand_text
+from app.utils.executors import get_process_pool
+from benchmarks.corpus import get_corpus_generator
+
+TICK_S = 0.001
+
+
+async def stage_with_ticker(text: str):
+    """Return (stage ms, worst event-loop lag ms) for one understanding call."""
+    lags = []
+    stop = asyncio.Event()
+
+    async def ticker():
+        while not stop.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_S)
+            lags.append((time.perf_counter() - start - TICK_S) * 1000)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await pipeline._call_stage("understanding", understand_text, (text,), {"parallel": False})
+    elapsed = (time.perf_counter() - start) * 1000
+    # One more tick so a stall at the end of the stage is counted
+    await asyncio.sleep(TICK_S * 2)
+    stop.set()
+    await task
+    return elapsed, max(lags, default=0.0)
+
+
+def measure(text: str, offload: bool, repeats: int):
+    pipeline_runner.PROCESS_OFFLOAD = offload
+    pipeline_runner.PROCESS_OFFLOAD_MIN_BYTES = 0
+    samples = [asyncio.run(stage_with_ticker(text)) for _ in range(repeats)]
+    return statistics.median(s[0] for s in samples), statistics.median(s[1] for s in samples)
+
+
+def run(sizes_kb, repeats, seed=0):
+    corpus = get_corpus_generator(seed)
+    # Start the pool workers outside the measurements
+    get_process_pool().submit(len, "").result()
+
+    print("=" * 70)
+    print("UNDERSTANDING STAGE: INLINE VS PROCESS POOL (median ms)")
+    print("=" * 70)
+    print(f"{'size':>8} {'inline':>9} {'loop lag':>9} {'offload':>9} {'loop lag':>9}")
+    for size_kb in sizes_kb:
+        text = corpus.text_of_size(size_kb * 1024)
+        inline, inline_lag = measure(text, offload=False, repeats=repeats)
+        offloaded, offloaded_lag = measure(text, offload=True, repeats=repeats)
+        print(f"{size_kb:>6}KB {inline:>9.1f} {inline_lag:>9.1f} {offloaded:>9.1f} {offloaded_lag:>9.1f}")
+
+    print("\nloop lag = worst delay of a 1 ms timer while the stage runs, i.e. how long")
+    print("every other request on the same worker waited.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[5, 20, 50, 100])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes_kb, args.repeats, args.seed)
@@ -0,0 +1,46 @@
+"""
+Throughput benchmark: qa_passthrough (one resume at a time) vs qa_batch.
+
+Usage:
+    python benchmarks/bench_qa_batch.py [--sizes 100 1000 10000] [--seed 0]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.agents.qa_agent.agent import qa_passthrough
+from app.agents.qa_agent.batch_qa import qa_batch
+from benchmarks.corpus import get_corpus_generator
+
+def run(sizes, seed=0):
+    corpus = get_corpus_generator(seed)
+    print("=" * 70)
+    print("QA THROUGHPUT (resumes/sec)")
+    print("=" * 70)
+    print(f"{'batch':>10} {'qa_passthrough':>18} {'qa_batch':>14} {'speedup':>10}")
+
+    for n in sizes:
+        batch = corpus.batch(n)
+
+        start = time.perf_counter()
+        for resume in batch:
+            qa_passthrough({"final_resume": resume})
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        qa_batch(batch)
+        batched = time.perf_counter() - start
+
+        print(f"{n:>10} {n / single:>18,.0f} {n / batched:>14,.0f} {single / batched:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.seed)
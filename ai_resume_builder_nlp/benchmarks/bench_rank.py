@@ -0,0 +1,109 @@
+"""
+Candidate ranking latency: one sparse mat-vec plus top-k over N resumes.
+
+Builds an N-row CandidateMatrix of synthetic resume vectors directly
+(random keyword columns with the vectorizer's idf weights, L2-normalized,
+like real rows), so 1M candidates load in seconds instead of vectorizing
+1M texts. Then times, per query:
+
+- the scores alone (scipy CSR x dense vector),
+- top-k with np.argpartition (what CandidateMatrix.top_k does) vs a full
+  argsort,
+- top-k within a facet mask covering ~10% of candidates,
+- scoring with a pending delta of recent rows, and one delta merge.
+
+Usage:
+    python benchmarks/bench_rank.py [--resumes 10000 100000 1000000] [--k 20] [--repeat 20]
+"""
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.bitmap_index import BitmapIndex
+from app.services.candidate_ranker import DELTA_MERGE_ROWS, CandidateMatrix
+from app.services.job_matcher import get_job_matcher
+
+JOB_DESCRIPTION = (
+    "We are hiring a Senior Software Engineer to build microservices and APIs in Python and Go. "
+    "You will run services on Kubernetes and AWS, own CI/CD pipelines, and work with PostgreSQL "
+    "and Redis. Experience with React, TypeScript and system design is a plus."
+)
+# Distinct keywords per synthetic resume
+TERMS_PER_RESUME = 30
+
+
+def synthetic_rows(count: int, idf: np.ndarray, rng: np.random.Generator) -> sparse.csr_matrix:
+    """count x len(idf) L2-normalized TF-IDF rows with TERMS_PER_RESUME random columns each."""
+    columns = np.sort(rng.integers(0, len(idf), size=(count, TERMS_PER_RESUME)), axis=1)
+    weights = (1 + np.log(rng.integers(1, 4, size=columns.shape))) * idf[columns]
+    weights /= np.linalg.norm(weights, axis=1, keepdims=True)
+    indptr = np.arange(0, count * TERMS_PER_RESUME + 1, TERMS_PER_RESUME)
+    # Repeated columns are summed by the CSR kernels; fine for timing
+    return sparse.csr_matrix((weights.ravel().astype(np.float32), columns.ravel(), indptr), shape=(count, len(idf)))
+
+
+def median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def bench(count: int, k: int, repeat: int, rng: np.random.Generator):
+    matcher = get_job_matcher()
+    idf = matcher.vectorizer.idf
+    query = matcher.job_vector(JOB_DESCRIPTION).astype(np.float32)
+
+    base = synthetic_rows(count, idf, rng)
+    matrix = CandidateMatrix(len(idf), base, np.ones(count, dtype=bool))
+
+    facets = BitmapIndex()
+    for doc_id in rng.choice(count, size=count // 10, replace=False).tolist():
+        facets.add(doc_id, ["location:berlin"])
+    mask = BitmapIndex.to_mask(facets.get("location:berlin"), count)
+
+    def full_sort():
+        scores, _ = matrix.scores(query)
+        return np.argsort(-scores)[:k]
+
+    rows = {
+        "scores (mat-vec)": median_ms(lambda: matrix.scores(query), repeat),
+        f"top {k}, argpartition": median_ms(lambda: matrix.top_k(query, k), repeat),
+        f"top {k}, full argsort": median_ms(full_sort, repeat),
+        f"top {k}, 10% facet mask": median_ms(lambda: matrix.top_k(query, k, mask), repeat),
+    }
+
+    delta = synthetic_rows(DELTA_MERGE_ROWS, idf, rng)
+    recent = rng.choice(count, size=DELTA_MERGE_ROWS, replace=False)
+    matrix.merge_rows = count  # keep the rows pending
+    matrix.add({int(doc_id): delta[i] for i, doc_id in enumerate(recent)})
+    rows[f"top {k}, {DELTA_MERGE_ROWS} delta rows"] = median_ms(lambda: matrix.top_k(query, k), repeat)
+    rows["merge delta into base"] = median_ms(matrix.compact, 1)
+    return base.nnz, rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    for count in args.resumes:
+        nnz, rows = bench(count, args.k, args.repeat, rng)
+        print("=" * 62)
+        print(f"CANDIDATE RANKING ({count:,} resumes, {nnz:,} nonzeros, median of {args.repeat})")
+        print("=" * 62)
+        for label, ms in rows.items():
+            print(f"{label:<36} {ms:>10.2f} ms")
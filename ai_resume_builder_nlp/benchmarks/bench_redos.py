@@ -0,0 +1,119 @@
+"""
+Worst-case benchmark: extractor patterns on adversarial inputs.
+
+Each case builds an input designed to make the pre-scanner patterns backtrack
+(long runs of separators, digits or words that almost match) and times the
+old pattern against the current scanner / bounded pattern at growing sizes.
+Linear code grows ~4x per row; the old patterns grow ~16x (quadratic) and are
+skipped once a single call exceeds --legacy-limit seconds.
+
+Usage:
+    python benchmarks/bench_redos.py [--sizes 1000 4000 16000 64000] [--legacy-limit 2]
+"""
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.nlp.extractors import contact_scanner, section_extractor, pattern_matcher, entity_extractor
+
+# Patterns as they were before contact_scanner and the bounded spans, for comparison
+LEGACY = {
+    "phone": re.compile(r"(?:\+\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,5}[-.\s]?\d{3,5}[-.\s]?\d{0,5}"),
+    "email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"),
+    "years": re.compile(r"\b(\d+)\s*\+?\s*(years?|yrs?)\b", re.IGNORECASE),
+    "metrics": re.compile(r"(\d+%|\d+\s+(?:bugs?|features?|issues?|clients?|users?))", re.IGNORECASE),
+    "location": re.compile(r"(?:based in|located in|from|living in|residing in)\s+([A-Za-z][A-Za-z\s,]+?)(?:\.|,|\n|$)", re.IGNORECASE),
+    "company_span": re.compile(
+        r"(?:\b(?:at|with|for|joined)\s+|@\s*|^\s*|[|,–—-]\s*)([A-Z][\w&.'-]*(?:[ \t]+[A-Z&][\w&.'-]*){0,3})",
+        re.MULTILINE,
+    ),
+    "institution": re.compile(r"([A-Z][A-Za-z\s&]+(?:University|College|Institute|School|Academy))"),
+    "degree": re.compile(
+        r"((?:Bachelor'?s?|Master'?s?|Ph\.?D\.?|Doctor(?:ate)?|Associate'?s?|MBA|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|B\.?Tech\.?|M\.?Tech\.?)(?:\s+degree)?(?:\s+in\s+[A-Za-z\s&]+?)?)(?:\s+(?:from|at)\s+|\s+[A-Z][a-z]+\s+(?:University|College|Institute)|$)",
+        re.IGNORECASE,
+    ),
+    "role_at_company": re.compile(r"^([A-Za-z\s]+?)\s+at\s+([A-Za-z0-9\s&.,]+?)(?:\s*\(|\s*,|\s*-|\s*$)", re.IGNORECASE),
+    "role_title": re.compile(
+        r"\b([A-Za-z\s]*(?:Engineer|Developer|Manager|Lead|Analyst|Designer|Architect|Director|Specialist|Consultant|Coordinator|Intern|Associate))\b",
+        re.IGNORECASE,
+    ),
+    "list_items": re.compile(r"\n\s*[-•*]\s*|\n\s*\d+[.)]\s*"),
+}
+
+# name -> (adversarial input of about n characters, current implementation)
+CASES = {
+    "phone": (lambda n: "12-" * (n // 3) + "x", contact_scanner.scan_phone),
+    "email": (lambda n: "a." * (n // 2), contact_scanner.scan_email),
+    "years": (lambda n: "1" + " " * n + "x", contact_scanner.scan_years_of_experience),
+    "metrics": (lambda n: "1" * n, pattern_matcher.METRIC_REGEX.findall),
+    "location": (lambda n: "from a " * (n // 7) + "1", entity_extractor.Location_Patterns[0].search),
+    "company_span": (lambda n: "-A" * (n // 2), entity_extractor.Company_Span_Regex.findall),
+    "institution": (lambda n: "Aa " * (n // 3), section_extractor.INSTITUTION_PATTERNS[1].search),
+    "degree": (lambda n: "ba in x " * (n // 8) + "1", section_extractor.FULL_DEGREE_REGEX.search),
+    "role_at_company": (lambda n: "x at y " * (n // 7) + "'", section_extractor.ROLE_AT_COMPANY_REGEX.search),
+    "role_title": (lambda n: "a " * (n // 2), section_extractor.extract_role_title),
+    "list_items": (lambda n: "\n" * n + "x", section_extractor.LIST_ITEM_SPLIT_REGEX.split),
+}
+
+
+def legacy_call(name):
+    pattern = LEGACY[name]
+    if name in ("metrics", "company_span"):
+        return pattern.findall
+    if name == "list_items":
+        return pattern.split
+    return pattern.search
+
+
+def timed_ms(func, text, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def run(sizes, legacy_limit_s=2.0):
+    print("=" * 78)
+    print("EXTRACTOR WORST CASE (adversarial inputs, best of 3, ms)")
+    print("=" * 78)
+    print(f"{'case':<16} {'size':>8} {'old ms':>12} {'new ms':>10} {'old/new':>9}")
+
+    growth = {}
+    for name, (make_input, current) in CASES.items():
+        legacy = legacy_call(name)
+        legacy_alive = True
+        new_times = []
+        for size in sizes:
+            text = make_input(size)
+            new_ms = timed_ms(current, text)
+            new_times.append(new_ms)
+            old_cell, ratio_cell = "skipped", ""
+            if legacy_alive:
+                old_ms = timed_ms(legacy, text, repeats=1)
+                old_cell = f"{old_ms:.2f}"
+                ratio_cell = f"{old_ms / new_ms:.0f}x" if new_ms else ""
+                legacy_alive = old_ms / 1000 < legacy_limit_s / 4
+            print(f"{name:<16} {len(text):>8,} {old_cell:>12} {new_ms:>10.3f} {ratio_cell:>9}")
+        growth[name] = new_times[-1] / new_times[-2] if len(new_times) > 1 and new_times[-2] else None
+
+    ratio = sizes[-1] / sizes[-2] if len(sizes) > 1 else 1
+    print(f"\nGrowth of the new code over the last {ratio:.0f}x size step (linear ~{ratio:.0f}x):")
+    for name, factor in growth.items():
+        if factor is not None:
+            print(f"  {name:<16} {factor:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 4000, 16000, 64000])
+    parser.add_argument("--legacy-limit", type=float, default=2.0,
+                        help="stop timing an old pattern once a call would exceed this many seconds")
+    args = parser.parse_args()
+    run(args.sizes, args.legacy_limit)
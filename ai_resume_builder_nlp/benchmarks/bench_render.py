@@ -0,0 +1,124 @@
+"""
+Rendering throughput: compiled-template HTML, memoized repeats, PDF on the process pool.
+
+HTML rows compare recompiling the theme for every render (an Environment
+without a template cache) against the renderer's precompiled templates,
+and a repeat of an unchanged resume answered from the content-hash memo.
+PDF rows compare converting N resumes one after another in this process
+with converting them concurrently on the shared process pool; they are
+skipped when WeasyPrint (or its Pango libraries) is not installed.
+
+Usage:
+    python benchmarks/bench_render.py [--resumes 200] [--pdfs 8] [--theme classic]
+"""
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from app.pipeline_runner import pipeline
+from app.services.renderer import (
+    INLINE_SECTIONS, RESUME_SECTIONS, TEMPLATE_DIR, ResumeRenderer, html_to_pdf, resume_from_state,
+)
+from app.utils.executors import PROCESS_POOL_WORKERS, get_process_pool
+from benchmarks.fixtures import CLARIFICATION_ANSWERS, SAMPLE_RESUME_TEXT
+from benchmarks.harness import use_scratch_storage
+
+
+def make_resumes(count: int):
+    """count distinct formatted resumes derived from the sample CV."""
+    state = pipeline.run({"raw_text": SAMPLE_RESUME_TEXT, "test_mode": True, "answers": CLARIFICATION_ANSWERS})
+    base = resume_from_state(state)
+    resumes = []
+    for n in range(count):
+        resume = dict(base)
+        resume["profile"] = {**(base.get("profile") or {}), "name": f"Candidate {n}"}
+        resume["summary"] = f"{base.get('summary', '')} ({n})"
+        resumes.append(resume)
+    return resumes
+
+
+def rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>10,.0f}/s" if seconds else "inf"
+
+
+def bench_html(resumes, theme: str):
+    # Baseline: parse and compile the theme on every render
+    uncached = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)), autoescape=select_autoescape(("html",)),
+        cache_size=0, trim_blocks=True, lstrip_blocks=True,
+    )
+    start = time.perf_counter()
+    for resume in resumes:
+        uncached.get_template(f"themes/{theme}.html").render(
+            resume=resume, profile=resume.get("profile") or {}, summary=resume.get("summary") or "",
+            sections=[s for s in RESUME_SECTIONS if s[0] in resume], inline_sections=INLINE_SECTIONS,
+        )
+    recompile_s = time.perf_counter() - start
+
+    renderer = ResumeRenderer(cache_size=len(resumes) + 1)
+    start = time.perf_counter()
+    for resume in resumes:
+        renderer.render_html(resume, theme)
+    compiled_s = time.perf_counter() - start
+
+    # Same resumes again: every one is a memo hit
+    start = time.perf_counter()
+    for resume in resumes:
+        renderer.render_html(resume, theme)
+    memo_s = time.perf_counter() - start
+
+    print(f"{'HTML, recompile per render':<34} {rate(len(resumes), recompile_s)}")
+    print(f"{'HTML, precompiled template':<34} {rate(len(resumes), compiled_s)}")
+    print(f"{'HTML, memo hit (content hash)':<34} {rate(len(resumes), memo_s)}")
+    return renderer
+
+
+async def pdfs_on_pool(pages):
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    return await asyncio.gather(*(loop.run_in_executor(pool, html_to_pdf, html) for html in pages))
+
+
+def bench_pdf(renderer, resumes, theme: str):
+    pages = [renderer.render_html(resume, theme)[0] for resume in resumes]
+    try:
+        html_to_pdf(pages[0])
+    except (ImportError, OSError) as e:
+        print(f"{'PDF':<34} skipped: WeasyPrint unavailable ({type(e).__name__})")
+        return
+
+    start = time.perf_counter()
+    for html in pages:
+        html_to_pdf(html)
+    inline_s = time.perf_counter() - start
+
+    asyncio.run(pdfs_on_pool(pages[:PROCESS_POOL_WORKERS]))  # start the workers
+    start = time.perf_counter()
+    asyncio.run(pdfs_on_pool(pages))
+    pool_s = time.perf_counter() - start
+
+    print(f"{'PDF, inline (one at a time)':<34} {rate(len(pages), inline_s)}")
+    print(f"{f'PDF, process pool ({PROCESS_POOL_WORKERS} workers)':<34} {rate(len(pages), pool_s)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--pdfs", type=int, default=8)
+    parser.add_argument("--theme", default="classic")
+    args = parser.parse_args()
+
+    use_scratch_storage()
+    resumes = make_resumes(max(args.resumes, args.pdfs))
+    print("=" * 50)
+    print(f"RENDER THROUGHPUT ({args.resumes} resumes, theme {args.theme})")
+    print("=" * 50)
+    renderer = bench_html(resumes[:args.resumes], args.theme)
+    bench_pdf(renderer, resumes[:args.pdfs], args.theme)
@@ -0,0 +1,85 @@
+"""
+Resume repository throughput: per-record commits vs batched commits, and lookup latency.
+
+Saves N generated resumes (the sample CV's formatted resume and response)
+through ResumeRepository with batch size 1 (one transaction per resume)
+and with the default batch size, reporting end-to-end throughput and the
+time save() takes on the calling (request) thread, then times lookups by
+input hash against the committed table.
+
+Usage:
+    python benchmarks/bench_repository.py [--records 5000] [--lookups 2000]
+"""
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.pipeline_runner import pipeline
+from app.services.renderer import resume_from_state
+from app.services.resume_repository import WRITE_BATCH_SIZE, ResumeRepository
+from benchmarks.fixtures import CLARIFICATION_ANSWERS, SAMPLE_RESUME_TEXT
+from benchmarks.harness import use_scratch_storage
+
+
+def sample_record():
+    state = pipeline.run({"raw_text": SAMPLE_RESUME_TEXT, "test_mode": True, "answers": CLARIFICATION_ANSWERS})
+    return resume_from_state(state), {"success": True, "status": "success", "data": state, "error": None}
+
+
+def bench_writes(records: int, batch_size: int, resume, response):
+    """(records committed per second, mean microseconds per save() call)"""
+    with tempfile.TemporaryDirectory() as root:
+        repo = ResumeRepository(Path(root) / "resumes.sqlite3", batch_size=batch_size)
+        in_save = 0.0
+        start = time.perf_counter()
+        for n in range(records):
+            call = time.perf_counter()
+            repo.save(f"hash-{n}", resume, response)
+            in_save += time.perf_counter() - call
+        repo.flush()
+        elapsed = time.perf_counter() - start
+        repo.close()
+    return records / elapsed, in_save / records * 1e6
+
+
+def bench_lookups(records: int, lookups: int, resume, response):
+    with tempfile.TemporaryDirectory() as root:
+        repo = ResumeRepository(Path(root) / "resumes.sqlite3")
+        for n in range(records):
+            repo.save(f"hash-{n}", resume, response)
+        repo.flush()
+        rng = random.Random(0)
+        samples = []
+        for _ in range(lookups):
+            key = f"hash-{rng.randrange(records)}"
+            start = time.perf_counter()
+            repo.get_by_hash(key)
+            samples.append((time.perf_counter() - start) * 1000)
+        repo.close()
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    use_scratch_storage()
+    resume, response = sample_record()
+    print("=" * 56)
+    print(f"RESUME REPOSITORY ({args.records} records)")
+    print("=" * 56)
+    for label, batch_size in [("writes, one commit per resume", 1), (f"writes, batches of {WRITE_BATCH_SIZE}", WRITE_BATCH_SIZE)]:
+        rate, save_us = bench_writes(args.records, batch_size, resume, response)
+        print(f"{label:<36} {rate:>8,.0f}/s  (save() {save_us:.1f} us)")
+    p50, p99 = bench_lookups(args.records, args.lookups, resume, response)
+    print(f"{'lookup by input hash':<36} p50 {p50:.3f} ms, p99 {p99:.3f} ms")
@@ -0,0 +1,105 @@
+"""
+Resume search latency: facet bitsets and FTS5 text queries over N stored resumes.
+
+Generates N synthetic formatted resumes (skills from skills.json, employers
+from companies.json, roles from role_keywords.json, 0-20 years), saves them
+through ResumeRepository, lets the SearchIndex catch up on the change feed
+(the same path it takes after any worker's commits), then times
+representative queries and the snapshot/reload cycle.
+
+Usage:
+    python benchmarks/bench_search.py [--resumes 100000] [--repeat 20]
+"""
+import sys
+import time
+import random
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.data_loader import get_data_loader
+from app.services.resume_repository import ResumeRepository
+from app.services.search_index import SearchIndex
+from app.services.skill_index import skill_terms
+
+LOCATIONS = ["Pune, India", "Bangalore, India", "Nashik, India", "London, UK", "San Francisco, USA", "Berlin, Germany"]
+WORDS = ["payments", "platform", "latency", "migration", "analytics", "mobile", "compliance", "search", "billing"]
+
+QUERIES = [
+    ("Kubernetes + fintech + 5y (facets)", {"skills": ["Kubernetes"], "industries": ["fintech"], "min_years": 5}),
+    ("Python (one common facet)", {"skills": ["Python"]}),
+    ("role + location + 10y (facets)", {"roles": ["data scientist"], "locations": ["india"], "min_years": 10}),
+    ("text: kubernetes AND payments", {"text": "kubernetes AND payments"}),
+    ("text: latency + fintech facet", {"text": "latency", "industries": ["fintech"]}),
+]
+
+
+def synthetic_resumes(count: int, seed: int = 0):
+    loader = get_data_loader()
+    rng = random.Random(seed)
+    skills = skill_terms(loader.get_skills())
+    roles = [role.replace("_", " ").title() for role in loader.get_role_keywords()]
+    companies = [company["name"] for group in loader.get_companies().values() for company in group]
+    for n in range(count):
+        role = rng.choice(roles)
+        yield {
+            "profile": {"name": f"Candidate {n}", "role": role, "years": rng.randint(0, 20),
+                        "location": rng.choice(LOCATIONS)},
+            "summary": f"{role} working on {' and '.join(rng.sample(WORDS, 2))}.",
+            "skills": rng.sample(skills, rng.randint(5, 12)),
+            "experience": [
+                {"role": rng.choice(roles), "company": rng.choice(companies),
+                 "description": f"Led {rng.choice(WORDS)} work"}
+                for _ in range(rng.randint(1, 3))
+            ],
+        }
+
+
+def timed(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return result, statistics.median(samples), samples[-1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        path = Path(root) / "resumes.sqlite3"
+        repo = ResumeRepository(path, batch_size=1024)
+        index = SearchIndex(repo)
+        start = time.perf_counter()
+        for n, resume in enumerate(synthetic_resumes(args.resumes)):
+            repo.save(f"hash-{n}", resume, {"status": "success"})
+        repo.flush()
+        ingest_s = time.perf_counter() - start
+        start = time.perf_counter()
+        index.refresh()
+        index_s = time.perf_counter() - start
+
+        print("=" * 72)
+        print(f"RESUME SEARCH ({args.resumes:,} resumes, {len(index.facets()):,} facet keys)")
+        print("=" * 72)
+        print(f"{'ingest (repository)':<40} {args.resumes / ingest_s:>10,.0f}/s")
+        print(f"{'index from the feed (FTS5 + bitsets)':<40} {args.resumes / index_s:>10,.0f}/s")
+        for label, query in QUERIES:
+            found, p50, worst = timed(lambda: index.search(**query), args.repeat)
+            print(f"{label:<40} p50 {p50:7.2f} ms  max {worst:7.2f} ms  ({found['total']:,} matches)")
+
+        _, snapshot_ms, _ = timed(index.snapshot, 1)
+        repo.close()
+        repo = ResumeRepository(path)
+        _, reopen_ms, _ = timed(lambda: SearchIndex(repo), 1)
+        repo.close()
+        print(f"{'snapshot / reopen from snapshot':<40} {snapshot_ms:7.0f} ms / {reopen_ms:.0f} ms")
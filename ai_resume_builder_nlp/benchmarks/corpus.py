@@ -0,0 +1,247 @@
+"""
+Synthetic resume corpus generator for scaling tests.
+
+Builds resumes from the knowledge base files (skills.json, companies.json,
+role_keywords.json, action_verbs.json). Output is fully determined by the
+seed: resume `i` of a corpus is generated from its own RNG seeded with
+(seed, i), so it does not depend on how many resumes are requested.
+
+Two shapes are produced:
+- text:    free-form resume text as a user would paste it (for extractors / pipeline)
+- resume:  normalized final_resume dict (for QA, scoring, ranking)
+"""
+import random
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.services.data_loader import get_data_loader
+
+FIRST_NAMES = [
+    "John", "Priya", "Wei", "Maria", "Ahmed", "Olivia", "Rahul", "Sofia",
+    "Kenji", "Amara", "Lucas", "Fatima", "Ethan", "Ananya", "Noah", "Chen",
+]
+LAST_NAMES = [
+    "Smith", "Patel", "Zhang", "Garcia", "Khan", "Johnson", "Sharma", "Rossi",
+    "Tanaka", "Okafor", "Silva", "Haddad", "Brown", "Iyer", "Miller", "Li",
+]
+LOCATIONS = [
+    "San Francisco, CA", "Bangalore", "Pune", "Nashik", "London", "Berlin",
+    "Toronto", "Singapore", "New York, NY", "Hyderabad",
+]
+DEGREES = [
+    "BS Computer Science", "B.Tech Information Technology", "MS Software Engineering",
+    "Bachelor's degree in Electronics", "Master's degree in Data Science", "MBA",
+]
+INSTITUTIONS = [
+    "MIT", "Stanford University", "IIT Bombay", "University of Pune",
+    "Carnegie Mellon University", "University of Toronto",
+]
+OBJECTS = [
+    "the checkout service", "internal dashboards", "the data platform",
+    "customer onboarding flows", "the billing system", "release tooling",
+    "the search backend", "mobile clients",
+]
+METRIC_TEMPLATES = [
+    "improving throughput by {n}%", "reducing latency by {n}%", "serving {n} users",
+    "closing {n} issues", "cutting costs by {n}%", "shipping {n} features",
+]
+OPTIONAL_SECTIONS = [
+    "projects", "certificates", "languages", "interests",
+    "volunteering", "awards", "publications", "references",
+]
+SPOKEN_LANGUAGES = ["English", "Hindi", "Marathi", "German", "Spanish", "Mandarin"]
+
+
+class ResumeCorpusGenerator:
+    """Deterministic, seedable generator of synthetic resumes"""
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+        loader = get_data_loader()
+
+        skills = []
+        for section in loader.get_skills().values():
+            if isinstance(section, dict):
+                for items in section.values():
+                    skills.extend(items)
+            elif isinstance(section, list):
+                skills.extend(section)
+        # Stable order so the same seed always picks the same skills
+        self.skills: List[str] = sorted(set(skills))
+        self.certifications: List[str] = list(loader.get_skills().get("certifications", []))
+
+        self.companies: List[str] = [
+            company["name"]
+            for group in loader.get_companies().values()
+            for company in group
+        ]
+        self.role_keywords: Dict[str, List[str]] = {
+            role: data.get("keywords", []) for role, data in loader.get_role_keywords().items()
+        }
+        self.roles: List[str] = sorted(self.role_keywords)
+        self.verbs: List[str] = sorted({
+            verb for verbs in loader.get_action_verbs().values() for verb in verbs if " " not in verb
+        })
+
+    def rng_for(self, index: int) -> random.Random:
+        """RNG for resume `index`; independent of every other index."""
+        return random.Random(f"{self.seed}:{index}")
+
+    # ------------------------------------------------------------------
+    # Building blocks
+    # ------------------------------------------------------------------
+    def bullet(self, rng: random.Random, role: str, with_metric: bool) -> str:
+        keyword = rng.choice(self.role_keywords[role] or ["software"])
+        text = f"{rng.choice(self.verbs)} {keyword} for {rng.choice(OBJECTS)}"
+        if with_metric:
+            text += ", " + rng.choice(METRIC_TEMPLATES).format(n=rng.randint(2, 95))
+        return text
+
+    def experience_entry(self, rng: random.Random, role: str, bullets: int, end_year: int) -> Dict[str, Any]:
+        start_year = end_year - rng.randint(1, 4)
+        achievements = [self.bullet(rng, role, with_metric=rng.random() < 0.6) for _ in range(bullets)]
+        return {
+            "role": role.replace("_", " ").title(),
+            "company": rng.choice(self.companies),
+            "start_date": str(start_year),
+            "end_date": str(end_year),
+            "description": "\n".join(f"- {a}" for a in achievements),
+            "achievements": achievements,
+        }
+
+    def optional_section(self, rng: random.Random, name: str, role: str) -> List[str]:
+        if name == "projects":
+            return [f"{self.bullet(rng, role, False)} using {rng.choice(self.skills)}" for _ in range(rng.randint(1, 3))]
+        if name == "certificates":
+            return rng.sample(self.certifications, k=min(2, len(self.certifications))) if self.certifications else []
+        if name == "languages":
+            return rng.sample(SPOKEN_LANGUAGES, k=rng.randint(1, 3))
+        if name == "interests":
+            return rng.sample(["Hiking", "Chess", "Photography", "Open source", "Running"], k=2)
+        if name == "volunteering":
+            return ["Code mentor at local bootcamp"]
+        if name == "awards":
+            return [f"Engineering excellence award {rng.randint(2015, 2024)}"]
+        if name == "publications":
+            return [f"Notes on {rng.choice(self.role_keywords[role] or ['systems'])}, {rng.randint(2015, 2024)}"]
+        return ["Available on request"]
+
+    # ------------------------------------------------------------------
+    # Resumes
+    # ------------------------------------------------------------------
+    def resume(
+        self,
+        index: int = 0,
+        experience_entries: int = 3,
+        bullets_per_entry: int = 3,
+        skills: int = 8,
+        extra_sections: int = 2,
+        summary_sentences: int = 2,
+    ) -> Dict[str, Any]:
+        """Normalized final_resume dict for resume `index`."""
+        rng = self.rng_for(index)
+        role = rng.choice(self.roles)
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+        end_year = 2025
+        experience = []
+        for _ in range(experience_entries):
+            entry = self.experience_entry(rng, role, bullets_per_entry, end_year)
+            experience.append(entry)
+            end_year = int(entry["start_date"])
+
+        keywords = self.role_keywords[role] or ["software"]
+        summary = " ".join(
+            f"{role.replace('_', ' ').title()} experienced in {rng.choice(keywords)} and {rng.choice(keywords)}."
+            for _ in range(summary_sentences)
+        )
+
+        resume = {
+            "profile": {
+                "name": name,
+                "role": role.replace("_", " ").title(),
+                "email": f"{name.lower().replace(' ', '.')}{index}@example.com",
+                "phone": f"+1-555-{rng.randint(1000, 9999)}",
+                "location": rng.choice(LOCATIONS),
+                "years": 2025 - end_year,
+            },
+            "summary": summary,
+            "experience": experience,
+            "education": [{
+                "degree": rng.choice(DEGREES),
+                "institution": rng.choice(INSTITUTIONS),
+                "year": str(end_year - rng.randint(0, 2)),
+            }],
+            "skills": rng.sample(self.skills, k=min(skills, len(self.skills))),
+        }
+        for section in rng.sample(OPTIONAL_SECTIONS, k=min(extra_sections, len(OPTIONAL_SECTIONS))):
+            resume[section] = self.optional_section(rng, section, role)
+        return resume
+
+    def to_text(self, resume: Dict[str, Any]) -> str:
+        """Render a generated resume as pasted free-form text with section headers."""
+        profile = resume["profile"]
+        lines = [
+            profile["name"],
+            profile["role"],
+            f"Email: {profile['email']}",
+            f"Phone: {profile['phone']}",
+            f"Location: {profile['location']}",
+            "",
+            "Summary:",
+            resume["summary"],
+            "",
+            "Experience:",
+        ]
+        for exp in resume["experience"]:
+            lines.append(f"{exp['role']} at {exp['company']} ({exp['start_date']}-{exp['end_date']})")
+            lines.extend(f"- {a}" for a in exp["achievements"])
+            lines.append("")
+
+        lines.append("Education:")
+        for edu in resume["education"]:
+            lines.append(f"{edu['degree']}, {edu['institution']}, {edu['year']}")
+        lines += ["", "Skills:", ", ".join(resume["skills"])]
+
+        for section in OPTIONAL_SECTIONS:
+            items = resume.get(section)
+            if items:
+                lines += ["", f"{section.title()}:"]
+                lines.extend(items if section != "languages" else [", ".join(items)])
+        return "\n".join(lines) + "\n"
+
+    def text(self, index: int = 0, **params) -> str:
+        """Free-form resume text for resume `index` (same params as resume())."""
+        return self.to_text(self.resume(index, **params))
+
+    def text_of_size(self, size_bytes: int, index: int = 0, bullets_per_entry: int = 4) -> str:
+        """
+        Resume text of roughly `size_bytes` (UTF-8), grown by adding experience
+        entries. Used for the 1-100 KB extractor scaling curves.
+        """
+        probe = self.text(index, experience_entries=1, bullets_per_entry=bullets_per_entry)
+        per_entry = max(1, len(self.text(index, experience_entries=2, bullets_per_entry=bullets_per_entry)) - len(probe))
+        entries = max(1, 1 + (size_bytes - len(probe)) // per_entry)
+        text = self.text(index, experience_entries=entries, bullets_per_entry=bullets_per_entry)
+        # Entry lengths vary, so top up once from the measured shortfall
+        if len(text) < size_bytes:
+            entries += -(-(size_bytes - len(text)) // per_entry)
+            text = self.text(index, experience_entries=entries, bullets_per_entry=bullets_per_entry)
+        return text
+
+    def batch(self, n: int, start: int = 0, **params) -> List[Dict[str, Any]]:
+        """Resumes start..start+n-1 as normalized dicts."""
+        return [self.resume(i, **params) for i in range(start, start + n)]
+
+    def iter_texts(self, n: int, start: int = 0, **params) -> Iterator[str]:
+        for i in range(start, start + n):
+            yield self.text(i, **params)
+
+
+_generators: Dict[int, ResumeCorpusGenerator] = {}
+
+def get_corpus_generator(seed: Optional[int] = 0) -> ResumeCorpusGenerator:
+    """Cached generator per seed (building one flattens the JSON data files)."""
+    seed = seed or 0
+    if seed not in _generators:
+        _generators[seed] = ResumeCorpusGenerator(seed)
+    return _generators[seed]
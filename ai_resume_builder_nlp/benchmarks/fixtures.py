@@ -0,0 +1,81 @@
+"""
+Shared benchmark inputs.
+"""
+
+SAMPLE_RESUME_TEXT = """
+John Smith
+Senior Software Engineer
+Email: john.smith@example.com
+Phone: +1-555-0123
+Location: San Francisco, CA
+
+Summary:
+Experienced software engineer with 8+ years of expertise in full-stack development.
+
+Experience:
+Software Engineer at Google (2020-2024)
+- Led development of cloud infrastructure tools
+- Improved system performance by 40%
+- Managed team of 5 engineers
+
+Junior Developer at Microsoft (2018-2020)
+- Developed web applications using React and Node.js
+- Reduced load times by 30%
+
+Education:
+BS Computer Science, MIT, 2018
+MS Software Engineering, Stanford, 2020
+
+Skills:
+Python, JavaScript, React, Node.js, Docker, Kubernetes, AWS, TypeScript
+
+Projects:
+Open Source Contribution to Kubernetes
+Personal blog engine built with Next.js
+"""
+
+# Answers for the sections the sample does not cover, so a non-test-mode run
+# gets past clarification and QA and reaches every stage.
+CLARIFICATION_ANSWERS = {
+    "summary": "Backend-leaning full-stack engineer building cloud infrastructure tools.",
+    "certificates": ["AWS Certified Solutions Architect"],
+    "publications": ["Scaling build systems, 2022"],
+    "interests": ["Hiking", "Chess"],
+    "volunteering": ["Code mentor at local bootcamp"],
+    "references": ["Available on request"],
+}
+
+HEADER = """John Smith
+Senior Software Engineer
+Email: john.smith@example.com
+Phone: +1-555-0123
+Location: San Francisco, CA
+
+Summary:
+Experienced software engineer with 8+ years of expertise in full-stack development.
+
+Experience:
+"""
+
+EXPERIENCE_BLOCK = """Software Engineer at Google (2020-2024)
+- Led development of cloud infrastructure tools
+- Improved system performance by 40%
+- Managed team of 5 engineers
+Junior Developer at Microsoft (2018-2020)
+- Developed web applications using React and Node.js
+- Reduced load times by 30%
+"""
+
+FOOTER = """
+Education:
+BS Computer Science, MIT, 2018
+
+Skills:
+Python, JavaScript, React, Node.js, Docker, Kubernetes, AWS, TypeScript
+"""
+
+
+def make_text(size_kb: int) -> str:
+    """A resume padded with repeated experience entries to roughly size_kb kilobytes."""
+    repeats = max(1, (size_kb * 1024 - len(HEADER) - len(FOOTER)) // len(EXPERIENCE_BLOCK))
+    return HEADER + EXPERIENCE_BLOCK * repeats + FOOTER
@@ -0,0 +1,227 @@
+"""
+Benchmark harness - timing, latency histograms and JSON reports.
+
+Every suite returns a list of BenchResult. Reports are plain JSON so two runs
+(e.g. before/after a commit) can be diffed with `run_all.py --compare`.
+"""
+import gc
+import os
+import json
+import math
+import time
+import atexit
+import shutil
+import tempfile
+import platform
+import statistics
+import subprocess
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+HISTOGRAM_BOUNDS_MS = [0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+
+@dataclass
+class BenchResult:
+    """Latency samples (ms) for one named benchmark"""
+    name: str
+    group: str
+    samples_ms: List[float]
+    # Work items per sample (e.g. resumes in a batch) for throughput figures
+    items_per_sample: int = 1
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, Any]:
+        samples = sorted(self.samples_ms)
+        total_s = sum(samples) / 1000
+        return {
+            "name": self.name,
+            "group": self.group,
+            "n": len(samples),
+            "mean_ms": round(statistics.fmean(samples), 4),
+            "min_ms": round(samples[0], 4),
+            "p50_ms": round(percentile(samples, 50), 4),
+            "p90_ms": round(percentile(samples, 90), 4),
+            "p99_ms": round(percentile(samples, 99), 4),
+            "max_ms": round(samples[-1], 4),
+            "items_per_sec": round(len(samples) * self.items_per_sample / total_s, 2) if total_s else None,
+            "histogram": histogram(samples),
+            **self.extra,
+        }
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, math.ceil(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+
+def histogram(samples: List[float]) -> Dict[str, int]:
+    """Count samples per latency bucket. Keys are upper bounds, e.g. "<=5ms"."""
+    counts = {f"<={b}ms": 0 for b in HISTOGRAM_BOUNDS_MS}
+    counts[f">{HISTOGRAM_BOUNDS_MS[-1]}ms"] = 0
+    for s in samples:
+        for bound in HISTOGRAM_BOUNDS_MS:
+            if s <= bound:
+                counts[f"<={bound}ms"] += 1
+                break
+        else:
+            counts[f">{HISTOGRAM_BOUNDS_MS[-1]}ms"] += 1
+    return {k: v for k, v in counts.items() if v}
+
+
+def format_histogram(hist: Dict[str, int], width: int = 40) -> str:
+    """Render a histogram dict as ASCII bars."""
+    if not hist:
+        return ""
+    peak = max(hist.values())
+    lines = []
+    for bucket, count in hist.items():
+        bar = "#" * max(1, round(count / peak * width))
+        lines.append(f"    {bucket:>10} | {bar} {count}")
+    return "\n".join(lines)
+
+
+def measure(
+    name: str,
+    group: str,
+    func: Callable[[], Any],
+    repeats: int = 50,
+    warmup: int = 3,
+    items_per_sample: int = 1,
+) -> BenchResult:
+    """Call func() `repeats` times (after `warmup` untimed calls) and record latencies."""
+    for _ in range(warmup):
+        func()
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return BenchResult(name=name, group=group, samples_ms=samples, items_per_sample=items_per_sample)
+
+
+@contextmanager
+def stub_llm(delay_s: float = 0.0):
+    """
+    Point the shared LLMClient at the in-process mock gateway, which echoes the
+    resume back after `delay_s` seconds, so benchmarks never hit the real
+    gateway but still go through the client's pool, semaphore and retries.
+    """
+    import httpx
+    from app.services import llm_client
+    from tests.mock_llm_server import create_mock_llm_app
+
+    original = llm_client._llm_client_instance
+    llm_client.set_llm_client(llm_client.LLMClient(
+        api_base="http://mock-gateway",
+        api_key="benchmark",
+        transport=httpx.ASGITransport(app=create_mock_llm_app(delay_s=delay_s)),
+    ))
+    try:
+        yield
+    finally:
+        llm_client.set_llm_client(original)
+
+
+def use_scratch_storage() -> Path:
+    """
+    Point the resume database and the output store at a temporary
+    directory, removed at exit, so benchmarks do not write into the
+    project's db/ and output/. Call it before the first
+    get_resume_repository() / get_output_store(). Also exported to the
+    environment, for server subprocesses.
+    """
+    from app.services import output_store, resume_repository
+
+    root = Path(tempfile.mkdtemp(prefix="resume-bench-"))
+    # Registered first, so it runs after the singletons' own atexit hooks
+    atexit.register(shutil.rmtree, root, ignore_errors=True)
+    resume_repository.RESUME_DB_PATH = root / "resumes.sqlite3"
+    os.environ["RESUME_DB_PATH"] = str(resume_repository.RESUME_DB_PATH)
+    output_store.OUTPUT_STORE_DIR = root / "output"
+    os.environ["OUTPUT_STORE_DIR"] = str(output_store.OUTPUT_STORE_DIR)
+    return root
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def build_report(results: List[BenchResult]) -> Dict[str, Any]:
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "results": {r.name: r.summary() for r in results},
+    }
+
+
+def write_report(results: List[BenchResult], path: Path) -> Dict[str, Any]:
+    report = build_report(results)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return report
+
+
+def print_results(results: List[BenchResult], show_histograms: bool = False) -> None:
+    print(f"{'benchmark':<40} {'n':>6} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'items/s':>12}")
+    print("-" * 92)
+    for result in results:
+        s = result.summary()
+        per_sec = s.get("throughput_rps") or s["items_per_sec"]
+        rate = f"{per_sec:,.0f}" if per_sec else "-"
+        print(f"{s['name']:<40} {s['n']:>6} {s['p50_ms']:>10.3f} {s['p90_ms']:>10.3f} {s['p99_ms']:>10.3f} {rate:>12}")
+        if show_histograms:
+            print(format_histogram(s["histogram"]))
+
+
+def compare_reports(old: Dict[str, Any], new: Dict[str, Any], metric: str = "p50_ms") -> List[Dict[str, Any]]:
+    """Per-benchmark change of `metric` between two reports (positive % = slower)."""
+    rows = []
+    old_results, new_results = old.get("results", {}), new.get("results", {})
+    for name in sorted(set(old_results) | set(new_results)):
+        before = old_results.get(name, {}).get(metric)
+        after = new_results.get(name, {}).get(metric)
+        change = None
+        if before and after is not None:
+            change = round((after - before) / before * 100, 1)
+        rows.append({"name": name, "before": before, "after": after, "change_pct": change})
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]], metric: str = "p50_ms") -> None:
+    print(f"{'benchmark':<40} {'before':>12} {'after':>12} {'change':>9}   ({metric})")
+    print("-" * 80)
+    for row in rows:
+        before = f"{row['before']:.3f}" if row["before"] is not None else "-"
+        after = f"{row['after']:.3f}" if row["after"] is not None else "-"
+        change = f"{row['change_pct']:+.1f}%" if row["change_pct"] is not None else "new" if row["before"] is None else "gone"
+        print(f"{row['name']:<40} {before:>12} {after:>12} {change:>9}")
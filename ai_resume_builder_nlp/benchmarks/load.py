@@ -0,0 +1,81 @@
+"""
+In-process load generator for /api/generate-resume.
+
+Requests go through httpx's ASGI transport straight into the FastAPI app, so
+no server or network is involved and the LLM stage is stubbed. Each
+concurrency level runs `total` requests with `concurrency` workers.
+"""
+import time
+import asyncio
+from collections import Counter
+from typing import List
+
+import httpx
+
+from benchmarks.fixtures import SAMPLE_RESUME_TEXT, CLARIFICATION_ANSWERS
+from benchmarks.harness import BenchResult, stub_llm, use_scratch_storage
+
+ENDPOINT = "/api/generate-resume"
+
+
+async def drive(app, payload: dict, concurrency: int, total: int, base_url: str = None, name: str = None) -> BenchResult:
+    """
+    Fire `total` requests from `concurrency` concurrent workers, in-process at
+    `app`, or over the network at `base_url` when given (app may then be None).
+    """
+    samples: List[float] = []
+    statuses: Counter = Counter()
+    remaining = iter(range(total))
+
+    if base_url:
+        client_kwargs = {"base_url": base_url, "limits": httpx.Limits(max_connections=concurrency)}
+    else:
+        client_kwargs = {"base_url": "http://bench", "transport": httpx.ASGITransport(app=app)}
+    async with httpx.AsyncClient(timeout=None, **client_kwargs) as client:
+
+        async def worker():
+            for _ in remaining:
+                start = time.perf_counter()
+                response = await client.post(ENDPOINT, json=payload)
+                samples.append((time.perf_counter() - start) * 1000)
+                body = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+                statuses[f"{response.status_code}:{body.get('status', '-')}"] += 1
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall_s = time.perf_counter() - wall_start
+
+    return BenchResult(
+        name=name or f"load.generate_resume[c={concurrency}]",
+        group="load",
+        samples_ms=samples,
+        extra={
+            "concurrency": concurrency,
+            "requests": total,
+            "wall_s": round(wall_s, 3),
+            "throughput_rps": round(total / wall_s, 2),
+            "status_counts": dict(statuses),
+        },
+    )
+
+
+def run(concurrency_levels=(1, 8, 32), total: int = 200, llm_delay_s: float = 0.05, test_mode: bool = False) -> List[BenchResult]:
+    from app.main import app
+    from app.services.admission import get_admission_controller
+    from app.services.result_cache import get_result_cache
+    from app.services.resume_repository import get_resume_repository
+
+    # Every request comes from one client with the same payload: measure the
+    # pipeline, not the per-client rate limit or the stored responses
+    use_scratch_storage()
+    get_admission_controller().rate_per_client = 0
+    get_result_cache().max_entries = 0
+    get_resume_repository().reuse_responses = False
+
+    payload = {"prompt": SAMPLE_RESUME_TEXT, "answers": CLARIFICATION_ANSWERS, "test_mode": test_mode}
+
+    results = []
+    with stub_llm(llm_delay_s):
+        for concurrency in concurrency_levels:
+            results.append(asyncio.run(drive(app, payload, concurrency, total)))
+    return results
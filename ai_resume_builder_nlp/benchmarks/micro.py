@@ -0,0 +1,60 @@
+"""
+Micro-benchmarks for each extractor and enhancer.
+"""
+from typing import List
+
+from app.nlp.extractors.entity_extractor import (
+    extract_entities, extract_email, extract_phone, extract_name,
+    extract_location, extract_role, extract_company,
+)
+from app.nlp.extractors.section_extractor import extract_sections
+from app.nlp.extractors.skill_matcher import extract_skills
+from app.nlp.extractors.pattern_matcher import extract_metrics
+from app.nlp.enhancers.text_enhancer import enhance_text, enhance_resume_content
+from app.nlp.enhancers.action_verb_adder import add_action_verb
+from app.utils.schema_normalizer import normalize_resume_schema
+from app.agents.generation_agent.agent import generate_resume
+from app.agents.understanding_agent.agent import understand_text
+
+from benchmarks.fixtures import SAMPLE_RESUME_TEXT, make_text
+from benchmarks.harness import BenchResult, measure
+
+WEAK_BULLET = "worked on the billing service and helped the team with handled incidents"
+
+
+def run(repeats: int = 200, large_kb: int = 20) -> List[BenchResult]:
+    text = SAMPLE_RESUME_TEXT
+    large = make_text(large_kb)
+    resume = generate_resume(understand_text(text))["final_resume"]
+
+    cases = [
+        ("extract_entities", lambda: extract_entities(text)),
+        ("extract_email", lambda: extract_email(text)),
+        ("extract_phone", lambda: extract_phone(text)),
+        ("extract_name", lambda: extract_name(text)),
+        ("extract_location", lambda: extract_location(text)),
+        ("extract_role", lambda: extract_role(text)),
+        ("extract_company", lambda: extract_company(text)),
+        ("extract_sections", lambda: extract_sections(text)),
+        ("extract_skills", lambda: extract_skills(text)),
+        ("extract_metrics", lambda: extract_metrics(text)),
+        ("normalize_resume_schema", lambda: normalize_resume_schema(resume)),
+        ("enhance_text", lambda: enhance_text(WEAK_BULLET)),
+        ("add_action_verb", lambda: add_action_verb(WEAK_BULLET)),
+        ("enhance_resume_content", lambda: enhance_resume_content(resume)),
+    ]
+    results = [measure(f"micro.{name}", "micro", func, repeats=repeats) for name, func in cases]
+
+    # Whole-text extractors again on a large pasted CV
+    large_cases = [
+        ("extract_entities", lambda: extract_entities(large)),
+        ("extract_sections", lambda: extract_sections(large)),
+        ("extract_skills", lambda: extract_skills(large)),
+        ("extract_metrics", lambda: extract_metrics(large)),
+    ]
+    large_repeats = max(5, repeats // 20)
+    results += [
+        measure(f"micro.{name}@{large_kb}KB", "micro", func, repeats=large_repeats, warmup=1)
+        for name, func in large_cases
+    ]
+    return results
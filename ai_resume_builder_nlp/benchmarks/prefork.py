@@ -0,0 +1,144 @@
+"""
+Pre-fork worker benchmark: memory per worker and throughput vs worker count.
+
+For each worker count the launcher (app.prefork) is started on a free port,
+driven over real HTTP with test_mode requests, and every worker's memory is
+read from /proc/<pid>/smaps_rollup after the load:
+
+- rss_mb:  resident set, counting shared pages in full
+- pss_mb:  proportional set, shared pages divided between the processes sharing them
+- uss_mb:  private pages only (what one more worker really costs)
+
+Runs with and without --no-preload so the copy-on-write saving is visible.
+Linux only (fork + /proc).
+
+Usage:
+    python benchmarks/prefork.py [--workers 1 2 4] [--requests 400] [--concurrency 16]
+"""
+import os
+import sys
+import time
+import socket
+import asyncio
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+# Add project root to sys.path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.fixtures import SAMPLE_RESUME_TEXT, CLARIFICATION_ANSWERS
+from benchmarks.harness import BenchResult, print_results, use_scratch_storage
+from benchmarks.load import drive
+
+WORKER_COUNTS = (1, 2, 4)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def worker_pids(parent_pid: int) -> List[int]:
+    with open(f"/proc/{parent_pid}/task/{parent_pid}/children") as f:
+        return [int(pid) for pid in f.read().split()]
+
+
+def memory_mb(pid: int) -> Dict[str, float]:
+    """Rss / Pss / Uss of a process in MB, from smaps_rollup."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                fields[parts[0][:-1]] = int(parts[1])
+    uss = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    return {
+        "rss_mb": round(fields.get("Rss", 0) / 1024, 2),
+        "pss_mb": round(fields.get("Pss", 0) / 1024, 2),
+        "uss_mb": round(uss / 1024, 2),
+    }
+
+
+def wait_healthy(base_url: str, timeout_s: float = 30) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not become healthy")
+
+
+def run_one(workers: int, preload: bool, total: int, concurrency: int) -> BenchResult:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    cmd = [sys.executable, "-m", "app.prefork", "--workers", str(workers), "--port", str(port)]
+    if not preload:
+        cmd.append("--no-preload")
+    # Identical requests from one client: keep the result cache and stored responses out of the measurement
+    env = dict(os.environ, LITELLM_LOCAL_MODEL_COST_MAP="True", RESULT_CACHE_SIZE="0", RESUME_REUSE="false")
+    server = subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_healthy(base_url)
+        payload = {"prompt": SAMPLE_RESUME_TEXT, "answers": CLARIFICATION_ANSWERS, "test_mode": True}
+        mode = "preload" if preload else "no-preload"
+        result = asyncio.run(drive(
+            None, payload, concurrency, total, base_url=base_url,
+            name=f"prefork.generate_resume[{mode},w={workers}]",
+        ))
+
+        per_worker = [memory_mb(pid) for pid in worker_pids(server.pid)]
+        parent = memory_mb(server.pid)
+        mean = lambda key: round(sum(m[key] for m in per_worker) / len(per_worker), 2)
+        result.group = "prefork"
+        result.extra.update({
+            "workers": workers,
+            "preload": preload,
+            "rss_mb_per_worker": mean("rss_mb"),
+            "pss_mb_per_worker": mean("pss_mb"),
+            "uss_mb_per_worker": mean("uss_mb"),
+            "total_pss_mb": round(parent["pss_mb"] + sum(m["pss_mb"] for m in per_worker), 2),
+        })
+        return result
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def run(worker_counts=WORKER_COUNTS, total: int = 400, concurrency: int = 16) -> List[BenchResult]:
+    # The servers inherit the scratch database through the environment
+    use_scratch_storage()
+    results = []
+    for preload in (True, False):
+        for workers in worker_counts:
+            results.append(run_one(workers, preload, total, concurrency))
+    return results
+
+
+def print_memory(results: List[BenchResult]) -> None:
+    print(f"\n{'mode':<12} {'workers':>7} {'rps':>9} {'RSS/wkr MB':>11} {'PSS/wkr MB':>11} {'USS/wkr MB':>11} {'total PSS MB':>13}")
+    for r in results:
+        e = r.extra
+        print(f"{'preload' if e['preload'] else 'no-preload':<12} {e['workers']:>7} {e['throughput_rps']:>9.1f} "
+              f"{e['rss_mb_per_worker']:>11.1f} {e['pss_mb_per_worker']:>11.1f} {e['uss_mb_per_worker']:>11.1f} "
+              f"{e['total_pss_mb']:>13.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=list(WORKER_COUNTS))
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    results = run(args.workers, args.requests, args.concurrency)
+    print_results(results)
+    print_memory(results)
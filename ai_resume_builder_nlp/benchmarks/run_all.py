@@ -0,0 +1,76 @@
+"""
+Run the benchmark suite and write a JSON report.
+
+Usage:
+    python benchmarks/run_all.py                              # micro, stages, load and startup
+    python benchmarks/run_all.py --suites micro stages
+    python benchmarks/run_all.py --suites scaling --seed 42   # 1-100 KB inputs, 10k batches
+    python benchmarks/run_all.py --suites prefork             # RSS per worker, 1/2/4 workers (Linux)
+    python benchmarks/run_all.py --concurrency 1 16 64 --requests 500 --llm-delay 0.2
+    python benchmarks/run_all.py --output reports/new.json --compare reports/old.json
+
+Reports from two commits can be diffed with --compare (p50 by default).
+"""
+import sys
+import json
+import logging
+import argparse
+from pathlib import Path
+
+# Add project root to sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.harness import write_report, print_results, compare_reports, print_comparison
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / "reports" / "latest.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume pipeline benchmark suite")
+    parser.add_argument("--suites", nargs="+", default=["micro", "stages", "load", "startup"],
+                        choices=["micro", "stages", "load", "scaling", "startup", "prefork"])
+    parser.add_argument("--repeats", type=int, default=200, help="samples per micro benchmark")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=200, help="requests per concurrency level")
+    parser.add_argument("--llm-delay", type=float, default=0.05, help="stubbed LLM latency in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic corpus seed (scaling suite)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--compare", type=Path, help="earlier report to diff against")
+    parser.add_argument("--metric", default="p50_ms", help="metric used by --compare")
+    parser.add_argument("--histograms", action="store_true", help="print latency histograms")
+    args = parser.parse_args()
+
+    results = []
+    if "micro" in args.suites:
+        from benchmarks import micro
+        results += micro.run(repeats=args.repeats)
+    if "stages" in args.suites:
+        from benchmarks import stages
+        results += stages.run(repeats=max(10, args.repeats // 2), llm_delay_s=args.llm_delay)
+    if "load" in args.suites:
+        from benchmarks import load
+        results += load.run(args.concurrency, total=args.requests, llm_delay_s=args.llm_delay)
+        # app.main configures INFO logging on import; keep the report readable
+        logging.getLogger().setLevel(logging.WARNING)
+    if "startup" in args.suites:
+        from benchmarks import startup
+        results += startup.run(repeats=max(3, args.repeats // 40))
+    if "scaling" in args.suites:
+        from benchmarks import scaling
+        results += scaling.run(repeats=max(3, args.repeats // 40), seed=args.seed)
+    if "prefork" in args.suites:
+        from benchmarks import prefork
+        results += prefork.run()
+
+    print_results(results, show_histograms=args.histograms)
+    report = write_report(results, args.output)
+    print(f"\nReport written to {args.output}")
+
+    if args.compare:
+        old = json.loads(args.compare.read_text(encoding="utf-8"))
+        print()
+        print_comparison(compare_reports(old, report, args.metric), args.metric)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Scaling curves over the synthetic corpus: extractor and pipeline latency vs
+input size (up to 100 KB) and batch QA/scoring throughput vs batch size (up to 10k).
+"""
+from typing import List
+
+from app.agents.understanding_agent.agent import understand_text, EXTRACTORS
+from app.agents.qa_agent.batch_qa import qa_batch
+from app.nlp.validators.resume_scorer import score_resume
+from app.pipeline_runner import pipeline
+
+from benchmarks.corpus import get_corpus_generator
+from benchmarks.harness import BenchResult, measure, use_scratch_storage
+
+SIZES_KB = (1, 5, 20, 50, 100)
+BATCH_SIZES = (100, 1000, 10000)
+
+
+def run(repeats: int = 5, sizes_kb=SIZES_KB, batch_sizes=BATCH_SIZES, seed: int = 0) -> List[BenchResult]:
+    corpus = get_corpus_generator(seed)
+    use_scratch_storage()
+    results = []
+
+    for size_kb in sizes_kb:
+        text = corpus.text_of_size(size_kb * 1024)
+        for name, func in EXTRACTORS:
+            results.append(measure(
+                f"scaling.{name}@{size_kb}KB", "scaling",
+                lambda f=func, t=text: f(t), repeats=repeats, warmup=1,
+            ))
+        results.append(measure(
+            f"scaling.understand_text@{size_kb}KB", "scaling",
+            lambda t=text: understand_text(t, parallel=False), repeats=repeats, warmup=1,
+        ))
+        results.append(measure(
+            f"scaling.pipeline.run@{size_kb}KB", "scaling",
+            lambda t=text: pipeline.run({"raw_text": t, "test_mode": True}), repeats=repeats, warmup=1,
+        ))
+
+    for n in batch_sizes:
+        batch = corpus.batch(n)
+        results.append(measure(
+            f"scaling.qa_batch[n={n}]", "scaling",
+            lambda b=batch: qa_batch(b), repeats=repeats, warmup=1, items_per_sample=n,
+        ))
+        results.append(measure(
+            f"scaling.score_resume[n={n}]", "scaling",
+            lambda b=batch: [score_resume(r) for r in b], repeats=max(1, repeats // 2), warmup=0, items_per_sample=n,
+        ))
+    return results
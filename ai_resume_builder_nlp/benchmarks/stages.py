@@ -0,0 +1,58 @@
+"""
+Stage benchmarks for ResumePipeline: each stage function on the state it would
+receive in a real run, plus end-to-end runs.
+"""
+import asyncio
+import inspect
+from typing import List
+
+from app.pipeline_runner import pipeline
+
+from benchmarks.fixtures import SAMPLE_RESUME_TEXT, CLARIFICATION_ANSWERS
+from benchmarks.harness import BenchResult, measure, stub_llm, use_scratch_storage
+
+
+def call_stage(stage_name: str, stage_func, state: dict):
+    """Call a stage the way the pipeline does, driving coroutine stages to completion."""
+    if stage_name == "understanding":
+        result = stage_func(state.get("raw_text", ""))
+    else:
+        result = stage_func(state)
+    if inspect.isawaitable(result):
+        result = asyncio.run(result)
+    return result
+
+
+def stage_inputs(initial_state: dict) -> list:
+    """Replay the pipeline once, capturing the state each stage receives."""
+    state = dict(initial_state)
+    captured = []
+    for stage_name, stage_func in pipeline.stages:
+        captured.append((stage_name, stage_func, dict(state)))
+        result = call_stage(stage_name, stage_func, state)
+        if isinstance(result, dict):
+            state.update(result)
+    return captured
+
+
+def run(repeats: int = 100, llm_delay_s: float = 0.0) -> List[BenchResult]:
+    test_state = {"raw_text": SAMPLE_RESUME_TEXT, "test_mode": True}
+    live_state = {"raw_text": SAMPLE_RESUME_TEXT, "answers": CLARIFICATION_ANSWERS}
+    use_scratch_storage()
+
+    results = []
+    for stage_name, stage_func, state in stage_inputs(test_state):
+        func = lambda n=stage_name, f=stage_func, s=state: call_stage(n, f, s)
+        results.append(measure(f"stage.{stage_name}", "stages", func, repeats=repeats))
+
+    results.append(measure(
+        "pipeline.run[test_mode]", "stages",
+        lambda: pipeline.run(test_state), repeats=repeats,
+    ))
+
+    with stub_llm(llm_delay_s):
+        results.append(measure(
+            "pipeline.run[stub_llm]", "stages",
+            lambda: pipeline.run(live_state), repeats=max(5, repeats // 5),
+        ))
+    return results
@@ -0,0 +1,101 @@
+"""
+Cold-start benchmark: import time of the API and pipeline in fresh interpreters.
+
+Each sample runs `python -X importtime -c "import <module>"` in a subprocess
+and records the module's cumulative import time as reported by importtime
+(interpreter startup excluded). The report also lists the slowest imports
+and whether any of the heavy SDKs (google-adk, litellm) were loaded, so a
+regression in the import graph shows up in `run_all.py --compare`.
+
+Usage:
+    python benchmarks/startup.py [--modules app.main app.pipeline_runner] [--repeats 5] [--top 10]
+"""
+import os
+import sys
+import time
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add project root to sys.path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.harness import BenchResult, print_results
+
+TARGET_MODULES = ("app.main", "app.pipeline_runner")
+HEAVY_MODULES = ("google.adk", "google.genai", "litellm")
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse `-X importtime` output into {module: (self_us, cumulative_us)}.
+    A module imported more than once keeps its first (real) entry.
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            modules.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return modules
+
+
+def import_profile(module: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Import `module` in a fresh interpreter; return (wall ms, importtime table)."""
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT), LITELLM_LOCAL_MODEL_COST_MAP="True")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return wall_ms, parse_importtime(proc.stderr)
+
+
+def run(repeats: int = 5, modules=TARGET_MODULES, top: int = 10) -> List[BenchResult]:
+    results = []
+    for module in modules:
+        samples, walls, table = [], [], {}
+        for _ in range(repeats):
+            wall_ms, table = import_profile(module)
+            samples.append(table.get(module, (0, 0))[1] / 1000)
+            walls.append(wall_ms)
+
+        slowest = sorted(table.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        results.append(BenchResult(
+            name=f"startup.import[{module}]",
+            group="startup",
+            samples_ms=samples,
+            extra={
+                "process_wall_ms_p50": round(sorted(walls)[len(walls) // 2], 1),
+                "modules_imported": len(table),
+                "heavy_modules_loaded": sorted(
+                    m for m in HEAVY_MODULES if any(name == m or name.startswith(m + ".") for name in table)
+                ),
+                "slowest_imports_self_ms": {name: round(self_us / 1000, 2) for name, (self_us, _) in slowest},
+            },
+        ))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", nargs="+", default=list(TARGET_MODULES))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    results = run(args.repeats, args.modules, args.top)
+    print_results(results)
+    for result in results:
+        print(f"\n{result.name}: {result.extra['modules_imported']} modules, "
+              f"heavy SDKs loaded: {result.extra['heavy_modules_loaded'] or 'none'}")
+        for name, ms in result.extra["slowest_imports_self_ms"].items():
+            print(f"    {ms:>8.2f} ms  {name}")
@@ -119,6 +119,7 @@ async def generate_resume(request: ResumeRequest):
         from app.nlp.extractors.skill_matcher import SkillMatcher
         from app.nlp.enhancers.text_enhancer import enhance_bullet
         from app.nlp.generators.content_generator import generate_resume_structure
+        from app.nlp.validators.resume_scorer import score_resume
 
         extractor = EntityExtractor()
         matcher = SkillMatcher()
@@ -188,10 +189,16 @@ async def generate_resume(request: ResumeRequest):
             "certificates": structure.get("certificates", []),
         }
 
+        # 7. Scoring
+        validation = score_resume(
+            {**structure, **resume_data, "skills": extracted.get("skills", [])},
+            role=extracted.get("role"),
+        )
+
         return ResumeResponse(
             success=True,
             resumeData=resume_data,
-            validation={"atsScore": 85, "completenessScore": 100},
+            validation=validation,
         )
 
     except Exception as e:
@@ -0,0 +1,10 @@
+# Keep test runs out of the project's db/ and output/: every test process gets a scratch resume database and output store
+import os
+import atexit
+import shutil
+import tempfile
+
+_scratch = tempfile.mkdtemp(prefix="resume-tests-")
+atexit.register(shutil.rmtree, _scratch, ignore_errors=True)
+os.environ["RESUME_DB_PATH"] = os.path.join(_scratch, "resumes.sqlite3")
+os.environ["OUTPUT_STORE_DIR"] = os.path.join(_scratch, "output")
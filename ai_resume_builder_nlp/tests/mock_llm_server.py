@@ -0,0 +1,109 @@
+"""
+Mock OpenAI-compatible LLM gateway for tests and benchmarks.
+
+POST /chat/completions echoes back the first JSON object found in the last
+message (i.e. the resume the enhancer sent), after an optional delay. The
+first `failures` calls answer 503 to exercise retries and the circuit breaker.
+
+In-process (no sockets):
+    transport = httpx.ASGITransport(app=create_mock_llm_app(delay_s=0.05))
+    client = LLMClient(api_base="http://mock-gateway", api_key="test", transport=transport)
+
+As a real server (exercises the connection pool):
+    python tests/mock_llm_server.py --port 9100 --delay 0.2
+    OPENAI_API_BASE=http://127.0.0.1:9100 AI_GATEWAY_API_KEY=test python main.py
+"""
+import json
+import asyncio
+import argparse
+from typing import Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+def first_json_object(text: str) -> Optional[dict]:
+    decoder = json.JSONDecoder()
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = decoder.raw_decode(text, start)
+            return obj
+        except ValueError:
+            start = text.find("{", start + 1)
+    return None
+
+
+def create_mock_llm_app(
+    delay_s: float = 0.0,
+    failures: int = 0,
+    content: Optional[str] = None,
+    delays: Optional[Dict[str, float]] = None,
+    truncate_at: Optional[int] = None,
+    chunk_size: int = 16,
+) -> FastAPI:
+    """
+    Args:
+        delay_s: Seconds to wait before answering each call
+        failures: Number of initial calls answered with 503
+        content: Fixed completion text (default: echo the prompt's JSON)
+        delays: Extra delay for prompts containing a given substring
+        truncate_at: Cut every reply to this many characters (like hitting max_tokens)
+        chunk_size: Characters per SSE delta when the request asks for stream=true
+    """
+    app = FastAPI()
+    app.state.calls = 0
+    app.state.in_flight = 0
+    app.state.max_in_flight = 0
+
+    @app.post("/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        prompt = body["messages"][-1]["content"]
+        app.state.calls += 1
+        if app.state.calls <= failures:
+            return JSONResponse({"error": "unavailable"}, status_code=503)
+
+        app.state.in_flight += 1
+        app.state.max_in_flight = max(app.state.max_in_flight, app.state.in_flight)
+        try:
+            delay = delay_s + sum(d for marker, d in (delays or {}).items() if marker in prompt)
+            if delay:
+                await asyncio.sleep(delay)
+        finally:
+            app.state.in_flight -= 1
+
+        if content is not None:
+            reply = content
+        else:
+            reply = "```json\n" + json.dumps(first_json_object(prompt) or {}) + "\n```"
+        if truncate_at is not None:
+            reply = reply[:truncate_at]
+
+        if body.get("stream"):
+            async def events():
+                for i in range(0, len(reply), chunk_size):
+                    delta = {"choices": [{"index": 0, "delta": {"content": reply[i:i + chunk_size]}}]}
+                    yield f"data: {json.dumps(delta)}\n\n"
+                yield "data: [DONE]\n\n"
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        return {
+            "id": f"mock-{app.state.calls}",
+            "object": "chat.completion",
+            "model": body.get("model"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop"}],
+        }
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--failures", type=int, default=0)
+    args = parser.parse_args()
+    uvicorn.run(create_mock_llm_app(args.delay, args.failures), host="127.0.0.1", port=args.port)
@@ -0,0 +1,146 @@
+# Admission control: token bucket, bounded FIFO queue, 429/503 with Retry-After
+import sys
+import asyncio
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services import admission, result_cache
+from app.services.admission import AdmissionController, AdmissionRejected, TokenBucket
+from app.services.result_cache import ResultCache
+
+
+def test_token_bucket_refills():
+    bucket = TokenBucket(rate=2, burst=2, now=0)
+    assert bucket.take(0) == 0
+    assert bucket.take(0) == 0
+    assert bucket.take(0) == 0.5      # next token in half a second
+    assert bucket.take(0.5) == 0
+    assert not bucket.is_full(0.5)
+    assert bucket.is_full(10)
+
+
+def test_rate_limit_is_per_client():
+    controller = AdmissionController(rate_per_client=1, burst_per_client=1, clock=lambda: 0.0)
+
+    async def admit(client):
+        async with controller.slot(client):
+            pass
+
+    asyncio.run(admit("a"))
+    asyncio.run(admit("b"))
+    try:
+        asyncio.run(admit("a"))
+        assert False, "expected AdmissionRejected"
+    except AdmissionRejected as e:
+        assert e.status_code == 429
+        assert e.retry_after_header == "1"
+
+
+def test_queue_is_bounded_fifo():
+    controller = AdmissionController(max_concurrency=1, max_queue=2, queue_timeout_s=1, rate_per_client=0)
+    order, outcomes = [], []
+
+    async def request(name, hold_s):
+        try:
+            async with controller.slot(name):
+                order.append(name)
+                await asyncio.sleep(hold_s)
+        except AdmissionRejected as e:
+            outcomes.append((name, e.status_code, e.reason))
+
+    async def burst():
+        tasks = []
+        for name in ("first", "second", "third", "fourth"):
+            tasks.append(asyncio.create_task(request(name, 0.02)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+    asyncio.run(burst())
+    assert order == ["first", "second", "third"]
+    assert outcomes == [("fourth", 503, "queue_full")]
+    assert controller.active == 0
+
+
+def test_queue_timeout():
+    controller = AdmissionController(max_concurrency=1, queue_timeout_s=0.01, rate_per_client=0)
+
+    async def scenario():
+        async with controller.slot("a"):
+            try:
+                async with controller.slot("b"):
+                    assert False, "should not be admitted"
+            except AdmissionRejected as e:
+                return e.reason
+
+    assert asyncio.run(scenario()) == "queue_timeout"
+    assert controller.active == 0 and controller.queued == 0
+
+
+def test_fast_lane_is_rate_limited_and_capped():
+    controller = AdmissionController(
+        max_concurrency=1, max_fast_lane=1, rate_per_client=1, burst_per_client=1, clock=lambda: 0.0,
+    )
+
+    async def scenario():
+        async with controller.slot("a", fast_lane=True):
+            assert controller.fast_lane_active == 1 and controller.active == 0
+            # Fast lane full: the next one takes a pipeline slot instead
+            async with controller.slot("b", fast_lane=True):
+                assert controller.fast_lane_active == 1 and controller.active == 1
+        # test_mode does not bypass the client's token bucket
+        try:
+            async with controller.slot("a", fast_lane=True):
+                pass
+        except AdmissionRejected as e:
+            return e.reason
+
+    assert asyncio.run(scenario()) == "rate_limited"
+    assert controller.fast_lane_active == 0 and controller.active == 0
+
+
+def test_endpoint_rate_limits_and_serves_cached_repeats():
+    from app.main import app
+
+    saved = admission._admission_instance, result_cache._result_cache_instance
+    admission._admission_instance = AdmissionController(rate_per_client=0.001, burst_per_client=1)
+    result_cache._result_cache_instance = ResultCache()
+
+    async def post_all():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # Too little information: the pipeline stops at clarification
+            first = await client.post("/api/generate-resume", json={"prompt": "John Smith"})
+            repeat = await client.post("/api/generate-resume", json={"prompt": "John Smith"})
+            other = await client.post("/api/generate-resume", json={"prompt": "Jane Doe"})
+            cheap = await client.post("/api/generate-resume", json={"prompt": "Jane Doe", "test_mode": True})
+            return first, repeat, other, cheap
+
+    try:
+        first, repeat, other, cheap = asyncio.run(post_all())
+    finally:
+        admission._admission_instance, result_cache._result_cache_instance = saved
+
+    assert first.status_code == 200 and first.json()["status"] == "needs_clarification"
+    # Same request again comes from the cache, past the exhausted bucket
+    assert repeat.status_code == 200 and repeat.json() == first.json()
+    assert other.status_code == 429
+    assert other.json()["status"] == "rate_limited"
+    assert int(other.headers["Retry-After"]) >= 1
+    # test_mode does not get past the rate limit
+    assert cheap.status_code == 429
+
+
+if __name__ == "__main__":
+    test_token_bucket_refills()
+    test_rate_limit_is_per_client()
+    test_queue_is_bounded_fifo()
+    test_queue_timeout()
+    test_fast_lane_is_rate_limited_and_capped()
+    test_endpoint_rate_limits_and_serves_cached_repeats()
+    print("All admission tests passed")
@@ -0,0 +1,68 @@
+# Verify batch QA gives the same verdicts as qa_passthrough, resume by resume
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.agents.qa_agent.agent import qa_passthrough
+from app.agents.qa_agent.batch_qa import qa_batch, CHECKS
+
+GOOD_RESUME = {
+    "profile": {"name": "John Smith", "email": "john@example.com"},
+    "summary": "Backend engineer.",
+    "experience": [
+        {"role": "Software Engineer", "company": "Google", "achievements": ["Cut latency by 40%"]},
+    ],
+    "education": [{"degree": "BS", "institution": "MIT", "year": "2018"}],
+    "skills": ["Python", "Docker", "AWS"],
+}
+
+RESUMES = [
+    GOOD_RESUME,
+    {},
+    None,
+    {**GOOD_RESUME, "summary": ""},
+    {**GOOD_RESUME, "skills": ["Python"]},
+    {**GOOD_RESUME, "skills": "Python, Docker, AWS"},
+    {**GOOD_RESUME, "experience": [{"role": "Engineer", "company": "", "achievements": ["Shipped 3 features"]}]},
+    {**GOOD_RESUME, "experience": [{"role": "Engineer", "company": "Acme", "achievements": ["Shipped features"]}]},
+    {**GOOD_RESUME, "experience": [{"role": "Engineer", "company": "Acme", "achievements": "Shipped 3 features"}]},
+    {**GOOD_RESUME, "experience": [{"role": "Engineer", "company": "Acme", "achievements": []}], "metrics": ["40%"]},
+    {**GOOD_RESUME, "experience": ["Engineer at Acme", {"role": "Engineer", "company": "Acme", "achievements": [7, "x2"]}]},
+    {**GOOD_RESUME, "experience": "Engineer at Acme, improved things by 20%"},
+    {"profile": {}, "summary": "", "experience": [], "education": [], "skills": []},
+]
+
+
+def test_batch_matches_single():
+    result = qa_batch(RESUMES)
+
+    assert result["matrix"].shape == (len(RESUMES), len(CHECKS))
+    for row, resume in enumerate(RESUMES):
+        expected = qa_passthrough({"final_resume": resume})
+        assert result["issues"][row] == expected["issues"], (row, resume)
+        assert bool(result["qa_passed"][row]) == expected["qa_passed"]
+
+
+def test_scores_are_fraction_of_checks_passed():
+    result = qa_batch([GOOD_RESUME, None])
+
+    assert result["scores"][0] == 1.0
+    assert result["scores"][1] == 0.0
+
+
+def test_empty_batch():
+    result = qa_batch([])
+
+    assert result["matrix"].shape == (0, len(CHECKS))
+    assert result["issues"] == []
+
+
+if __name__ == "__main__":
+    test_batch_matches_single()
+    test_scores_are_fraction_of_checks_passed()
+    test_empty_batch()
+    print("✅ PASSED: batch QA matches qa_passthrough")
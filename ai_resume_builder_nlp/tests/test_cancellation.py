@@ -0,0 +1,118 @@
+# Deadlines and cancellation propagate through the pipeline and LLM calls
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+import app.main as main
+from app.pipeline_runner import pipeline
+from app.services import llm_client
+from app.services.llm_client import LLMClient
+from app.utils.cancellation import (
+    CancellationToken, OperationCancelled, use_token, reclaimed_work, LLM_SECTIONS_CANCELLED,
+)
+from app.utils.metrics import get_metrics
+from tests.mock_llm_server import create_mock_llm_app
+
+RESUME = {
+    "summary": "Did stuff.",
+    "experience": [{"role": "Engineer", "company": "Acme", "achievements": ["Worked on things"]}],
+}
+
+
+def test_token_deadline_and_callbacks():
+    now = [0.0]
+    token = CancellationToken.after(5, clock=lambda: now[0])
+    calls = []
+    unregister = token.on_cancel(lambda: calls.append("a"))
+    token.on_cancel(lambda: calls.append("b"))
+    unregister()
+    assert token.limit(10) == 5 and token.limit(2) == 2
+    assert not token.cancelled
+    now[0] = 6
+    assert token.cancelled and token.reason == "deadline"
+
+    token = CancellationToken()
+    token.on_cancel(lambda: calls.append("c"))
+    token.cancel("client_disconnected")
+    token.cancel("again")
+    assert calls == ["c"]
+    try:
+        token.raise_if_cancelled()
+        assert False, "expected OperationCancelled"
+    except OperationCancelled as e:
+        assert e.reason == "client_disconnected"
+
+
+def test_cancelled_pipeline_skips_remaining_stages():
+    token = CancellationToken()
+    token.cancel("client_disconnected")
+    before = get_metrics().snapshot()["counters"]
+    try:
+        asyncio.run(pipeline.run_async({"raw_text": "John Smith", "test_mode": True}, token=token))
+        assert False, "expected OperationCancelled"
+    except OperationCancelled:
+        pass
+    after = get_metrics().snapshot()
+    for stage_name, _ in pipeline.stages:
+        key = f"cancellation.stages_skipped.{stage_name}"
+        assert after["counters"][key] == before.get(key, 0) + 1
+    assert reclaimed_work(after)["stagesSkipped"]["formatting"] >= 1
+
+
+def test_cancel_stops_in_flight_llm_calls():
+    from app.agents.enhancer_agent.agent import enhance_with_devstral_async
+
+    original = llm_client._llm_client_instance
+    llm_client.set_llm_client(LLMClient(
+        api_base="http://mock-gateway", api_key="test",
+        transport=httpx.ASGITransport(app=create_mock_llm_app(delay_s=5.0)),
+    ))
+    before = get_metrics().counter(LLM_SECTIONS_CANCELLED)
+
+    async def scenario():
+        token = CancellationToken()
+        asyncio.get_running_loop().call_later(0.05, token.cancel, "client_disconnected")
+        with use_token(token):
+            return await enhance_with_devstral_async({"final_resume": RESUME})
+
+    start = time.perf_counter()
+    try:
+        asyncio.run(scenario())
+        assert False, "expected OperationCancelled"
+    except OperationCancelled as e:
+        assert e.reason == "client_disconnected"
+    finally:
+        llm_client.set_llm_client(original)
+    assert time.perf_counter() - start < 2
+    assert get_metrics().counter(LLM_SECTIONS_CANCELLED) > before
+
+
+def test_disconnect_cancels_work():
+    class DisconnectedRequest:
+        async def is_disconnected(self):
+            return True
+
+    main.DISCONNECT_POLL_SECONDS, saved = 0.01, main.DISCONNECT_POLL_SECONDS
+    token = CancellationToken()
+    try:
+        response = asyncio.run(main.run_until_disconnected(DisconnectedRequest(), token, asyncio.sleep(10)))
+    finally:
+        main.DISCONNECT_POLL_SECONDS = saved
+    assert response["status"] == "cancelled"
+    assert token.reason == "client_disconnected"
+
+
+if __name__ == "__main__":
+    test_token_deadline_and_callbacks()
+    test_cancelled_pipeline_skips_remaining_stages()
+    test_cancel_stops_in_flight_llm_calls()
+    test_disconnect_cancels_work()
+    print("All cancellation tests passed")
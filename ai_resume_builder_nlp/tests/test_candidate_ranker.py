@@ -0,0 +1,199 @@
+# Candidate ranker: CSR + delta matrix, top-k with facet filters, re-saves, snapshot catch-up, workers, rank endpoint
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+import httpx
+import numpy as np
+from scipy import sparse
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services import candidate_ranker, resume_repository, search_index
+from app.services.candidate_ranker import CandidateMatrix, CandidateRanker
+from app.services.job_matcher import get_job_matcher
+from app.services.resume_repository import ResumeRepository
+from app.services.search_index import SearchIndex
+
+JOB = "Backend engineer: Go, Python, Kubernetes and PostgreSQL microservices for a payments platform."
+PLATFORM = {
+    "profile": {"name": "Asha", "role": "DevOps Engineer", "years": 7, "location": "Pune, India"},
+    "summary": "Runs Kubernetes clusters for a payments platform.",
+    "skills": ["Kubernetes", "Go", "Terraform"],
+    "experience": [{"role": "DevOps Engineer", "company": "Razorpay", "description": "Payments infrastructure"}],
+}
+SCIENTIST = {
+    "profile": {"name": "Ben", "role": "Data Scientist", "years": 3, "location": "London"},
+    "summary": "Forecasting models for retail demand.",
+    "skills": ["Python", "Pandas"],
+    "experience": [{"role": "Data Scientist", "company": "Tesco", "description": "Demand forecasting"}],
+}
+BACKEND = {
+    "profile": {"name": "Chen", "role": "Software Engineer", "years": 10, "location": "Bangalore, India"},
+    "summary": "Backend microservices in Go and Python.",
+    "skills": ["Python", "Go", "Kubernetes", "PostgreSQL"],
+    "experience": [{"role": "Backend Engineer", "company": "Paytm", "description": "Wallet backend"}],
+}
+
+
+def open_ranker(root: str):
+    repo = ResumeRepository(Path(root) / "resumes.sqlite3")
+    return repo, CandidateRanker(repo, SearchIndex(repo), get_job_matcher())
+
+
+def save_all(repo: ResumeRepository) -> None:
+    for key, resume in [("a", PLATFORM), ("b", SCIENTIST), ("c", BACKEND)]:
+        repo.save(key, resume, {"status": "success"})
+    repo.flush()
+
+
+def names(ranked):
+    return [hit["resume"]["profile"]["name"] for hit in ranked["hits"]]
+
+
+def row(*weights):
+    return sparse.csr_matrix(np.array([weights], dtype=np.float32))
+
+
+def test_matrix_delta_overrides_and_merges():
+    matrix = CandidateMatrix(3, merge_rows=2)
+    matrix.add({1: row(1, 0, 0), 4: row(0, 1, 0)})
+    assert matrix.base.shape[0] == 0 and len(matrix) == 2  # still in the delta
+
+    matrix.add({6: row(0.6, 0.8, 0)})  # third delta row: merged into the base
+    assert matrix.base.shape == (7, 3) and not matrix._delta
+
+    matrix.add({1: row(0, 0, 1)})  # re-saved: the delta row replaces the base row
+    ids, scores, considered = matrix.top_k(np.array([1, 0, 0]), 2)
+    assert ids[0] == 6 and len(ids) == 2 and considered == 3 and scores[0] > 0.59
+    assert list(matrix.top_k(np.array([0, 0, 1]), 1)[0]) == [1]
+
+    mask = np.zeros(5, dtype=bool)
+    mask[4] = True  # shorter than the matrix: id 6 is outside it
+    assert matrix.top_k(np.array([0, 1, 0]), 5, mask)[0].tolist() == [4]
+
+    base, present = matrix.compact()
+    assert base.shape == (7, 3) and present.sum() == 3
+    assert base[1].toarray().tolist() == [[0, 0, 1]]
+
+
+def test_rank_by_similarity_within_filters():
+    with tempfile.TemporaryDirectory() as root:
+        repo, ranker = open_ranker(root)
+        save_all(repo)
+
+        ranked = ranker.rank(JOB, k=2)
+        assert ranked["considered"] == 3 and names(ranked) == ["Chen", "Asha"]
+        assert ranked["hits"][0]["score"] > ranked["hits"][1]["score"] > 0
+        assert abs(ranked["hits"][0]["score"] - get_job_matcher().match(JOB, BACKEND)["similarity"]) < 1e-5
+
+        # Role, location and years come from the extracted profile
+        assert names(ranker.rank(JOB, locations=["india"], max_years=8)) == ["Asha"]
+        assert names(ranker.rank(JOB, roles=["data scientist"])) == ["Ben"]
+        assert names(ranker.rank(JOB, skills=["python"], min_years=5)) == ["Chen"]
+        assert ranker.rank(JOB, skills=["Cobol"]) == {"considered": 0, "hits": []}
+        repo.close()
+
+
+def test_resaving_a_resume_replaces_its_vector():
+    with tempfile.TemporaryDirectory() as root:
+        repo, ranker = open_ranker(root)
+        save_all(repo)
+        repo.save("c", {**BACKEND, "skills": ["Excel"], "summary": "Accountant.", "experience": []}, {})
+        repo.flush()
+
+        ranked = ranker.rank(JOB)
+        assert ranked["considered"] == 3 and names(ranked)[0] == "Asha"
+        assert ranked["hits"][-1]["score"] == 0
+        repo.close()
+
+
+def test_snapshot_and_catch_up():
+    with tempfile.TemporaryDirectory() as root:
+        repo, ranker = open_ranker(root)
+        repo.save("a", PLATFORM, {"status": "success"})
+        ranker.snapshot()
+        repo.close()
+
+        # Saved by a process that never opened the ranker
+        repo = ResumeRepository(Path(root) / "resumes.sqlite3")
+        repo.save("c", BACKEND, {"status": "success"})
+        repo.close()
+
+        repo, ranker = open_ranker(root)
+        assert len(ranker.matrix) == 2 and ranker.matrix.base.shape[0] == 2  # id 1 from the snapshot
+        assert names(ranker.rank(JOB)) == ["Chen", "Asha"]
+        repo.save("b", SCIENTIST, {"status": "success"})
+        repo.flush()
+        assert ranker.rank(JOB)["considered"] == 3
+        repo.close()
+
+
+def test_workers_rank_each_others_saves():
+    with tempfile.TemporaryDirectory() as root:
+        repo, ranker = open_ranker(root)
+        other_repo, other = open_ranker(root)  # a second worker on the same database
+        repo.save("a", PLATFORM, {"status": "success"})
+        repo.flush()
+        other_repo.save("c", BACKEND, {"status": "success"})
+        other_repo.flush()
+
+        assert names(ranker.rank(JOB)) == ["Chen", "Asha"]
+        assert names(other.rank(JOB)) == ["Chen", "Asha"]
+
+        other.snapshot()
+        repo.save("b", SCIENTIST, {"status": "success"})
+        ranker.snapshot()
+        other.snapshot()  # behind the saved matrix: left alone
+        with np.load(ranker.snapshot_path) as saved:
+            assert int(saved["seq"]) == 3
+        repo.close()
+        other_repo.close()
+
+
+def test_rank_endpoint():
+    from app import main
+
+    async def call(payload):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/rank-candidates", json=payload)
+
+    with tempfile.TemporaryDirectory() as root:
+        saved = (resume_repository._resume_repository_instance, search_index._search_index_instance,
+                 candidate_ranker._candidate_ranker_instance)
+        repo = ResumeRepository(Path(root) / "resumes.sqlite3")
+        index = SearchIndex(repo)
+        resume_repository._resume_repository_instance, search_index._search_index_instance = repo, index
+        candidate_ranker._candidate_ranker_instance = CandidateRanker(repo, index, get_job_matcher())
+        try:
+            save_all(repo)
+            ranked = asyncio.run(call({"job_description": JOB, "k": 2}))
+            filtered = asyncio.run(call({"job_description": JOB, "locations": ["london"]}))
+            invalid = asyncio.run(call({"job_description": JOB, "k": 0}))
+            repo.close()
+        finally:
+            (resume_repository._resume_repository_instance, search_index._search_index_instance,
+             candidate_ranker._candidate_ranker_instance) = saved
+
+    data = ranked.json()["data"]
+    assert data["considered"] == 3 and [result["name"] for result in data["results"]] == ["Chen", "Asha"]
+    best = data["results"][0]
+    assert best["inputHash"] == "c" and best["years"] == 10 and best["missingSkills"] == []
+    assert data["results"][1]["missingSkills"] and 0 < data["results"][1]["coverage"] < 1
+    assert [result["name"] for result in filtered.json()["data"]["results"]] == ["Ben"]
+    assert invalid.status_code == 422
+
+
+if __name__ == "__main__":
+    test_matrix_delta_overrides_and_merges()
+    test_rank_by_similarity_within_filters()
+    test_resaving_a_resume_replaces_its_vector()
+    test_snapshot_and_catch_up()
+    test_workers_rank_each_others_saves()
+    test_rank_endpoint()
+    print("All candidate ranker tests passed")
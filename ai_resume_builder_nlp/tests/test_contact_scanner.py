@@ -0,0 +1,104 @@
+# Linear-time contact scanners vs the regexes they replace
+import re
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.nlp.extractors.contact_scanner import scan_email, scan_phone, scan_profile_urls, scan_years_of_experience
+from app.nlp.extractors.entity_extractor import extract_entities
+from app.nlp.extractors.section_extractor import extract_role_title
+
+OLD_EMAIL = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+OLD_PHONE = re.compile(r"(?:\+\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)?\d{3,5}[-.\s]?\d{3,5}[-.\s]?\d{0,5}")
+OLD_YEARS = re.compile(r"\b(\d+)\s*\+?\s*(years?|yrs?)\b", re.IGNORECASE)
+OLD_ROLE = re.compile(
+    r"\b([A-Za-z\s]{0,80}(?:Engineer|Developer|Manager|Lead|Analyst|Designer|Architect|Director|Specialist|Consultant|Coordinator|Intern|Associate))\b",
+    re.IGNORECASE,
+)
+
+
+def _random_text(rng, parts, max_parts=12):
+    return "".join(rng.choice(parts) for _ in range(rng.randint(0, max_parts)))
+
+
+def test_email_matches_old_regex():
+    rng = random.Random(7)
+    parts = ["a", "b.", "@", ".com", ".c", "-", "_", "%", "+", " ", "1", "x.io", "é", "@@", ".."]
+    for _ in range(20000):
+        text = _random_text(rng, parts)
+        match = OLD_EMAIL.search(text)
+        assert scan_email(text) == (match.group(0) if match else None), repr(text)
+
+
+def test_years_matches_old_regex():
+    rng = random.Random(11)
+    parts = ["5", "12", " ", "+", "years", "Yrs", "yr", "year", "s", "a", "_", "\n", "+ "]
+    for _ in range(20000):
+        text = _random_text(rng, parts)
+        match = OLD_YEARS.search(text)
+        assert scan_years_of_experience(text) == (int(match.group(1)) if match else None), repr(text)
+
+
+def test_role_title_matches_old_regex():
+    rng = random.Random(3)
+    parts = ["Lead", " ", "engineer", "Intern", "al", "x", "_", "1", ",", "Senior ", "a" * 30, "\n"]
+    for _ in range(20000):
+        text = _random_text(rng, parts)
+        match = OLD_ROLE.search(text)
+        assert extract_role_title(text) == (match.group(1) if match else ""), repr(text)
+
+
+def test_phone_numbers():
+    assert scan_phone("Call +1 (555) 123-4567 today") == "+1 (555) 123-4567"
+    assert scan_phone("555.123.4567") == "555.123.4567"
+    assert scan_phone("Mobile: +91 98765 43210") == "+91 98765 43210"
+    # A number followed by years is cut back to the last group that fits, as the old regex did
+    for text in [
+        "Mobile: 9876543210 2018 2020",
+        "Call +1 (555) 123-4567 2019 2020 2021",
+        "Phone 555 123 4567 890 123 456",
+    ]:
+        assert scan_phone(text) == OLD_PHONE.search(text).group(0), text
+    assert scan_phone("Mobile: 9876543210 2018 2020") == "9876543210 2018"
+    for text in ["Graduated 2019", "2019 - 2023", "12345", "1" * 20, "1--2--3--4--5--6--7"]:
+        assert scan_phone(text) is None, text
+
+
+def test_profile_urls():
+    text = "Links: https://www.linkedin.com/in/jane-doe, github.com/janedoe."
+    assert scan_profile_urls(text) == {
+        "linkedin": "https://www.linkedin.com/in/jane-doe",
+        "github": "github.com/janedoe",
+    }
+    assert scan_profile_urls("mygithub.com/x and github.com/") == {}
+    entities = extract_entities("Jane Doe, jane@example.com, linkedin.com/in/jane")
+    assert entities["email"] == "jane@example.com"
+    assert entities["linkedin"] == "linkedin.com/in/jane"
+
+
+def test_adversarial_inputs_are_fast():
+    inputs = ["12-" * 20000, "a." * 30000, "1" + " " * 60000 + "x", "a " * 30000]
+    for text in inputs:
+        start = time.perf_counter()
+        scan_phone(text)
+        scan_email(text)
+        scan_years_of_experience(text)
+        scan_profile_urls(text)
+        extract_role_title(text)
+        assert time.perf_counter() - start < 2.0
+
+
+if __name__ == "__main__":
+    test_email_matches_old_regex()
+    test_years_matches_old_regex()
+    test_role_title_matches_old_regex()
+    test_phone_numbers()
+    test_profile_urls()
+    test_adversarial_inputs_are_fast()
+    print("All contact scanner tests passed")
@@ -0,0 +1,144 @@
+# Upload ingestion: spooling with a size cap, PDF/DOCX/text extraction, decompression caps, the endpoint
+import io
+import sys
+import zlib
+import asyncio
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services import document_reader
+from app.services.document_reader import DocumentRejected, extract_document_text, read_upload, spool_upload
+
+
+def make_pdf(pages, padding=0):
+    """Minimal PDF with one line of Helvetica text per page (content padded with spaces and compressed if padding)."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = b"BT /F1 12 Tf 72 720 Td (" + text.encode() + b") Tj ET"
+        if padding:
+            stream = zlib.compress(stream + b" " * padding)
+            objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        else:
+            objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d >>" % len(pages)
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def make_docx():
+    import docx
+
+    document = docx.Document()
+    document.add_paragraph("Jane Doe")
+    table = document.add_table(rows=1, cols=2)
+    table.rows[0].cells[0].text = "Python"
+    table.rows[0].cells[1].text = "Kubernetes"
+    document.add_paragraph("jane@example.com")
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+async def stream(data, chunk=1000):
+    for start in range(0, len(data), chunk):
+        yield data[start:start + chunk]
+
+
+def test_pdf_pages_and_truncation():
+    pdf = make_pdf([f"Page {n} of the CV" for n in range(20)])
+    document = extract_document_text(io.BytesIO(pdf), "pdf")
+    assert document["parts"] == 20 and not document["truncated"]
+    assert "Page 0 of the CV" in document["text"] and "Page 19 of the CV" in document["text"]
+
+    # Stops reading once the cap is reached
+    document = extract_document_text(io.BytesIO(pdf), "pdf", max_chars=40)
+    assert document["truncated"] and document["parts"] < 5
+    assert len(document["text"]) <= 40
+
+
+def test_pdf_page_decompression_is_capped():
+    document = extract_document_text(io.BytesIO(make_pdf(["Jane Doe"], padding=1000)), "pdf")
+    assert document["text"] == "Jane Doe"
+
+    bomb = make_pdf(["Jane Doe"], padding=document_reader.MAX_PDF_STREAM_BYTES)
+    assert len(bomb) < 50_000
+    try:
+        extract_document_text(io.BytesIO(bomb), "pdf")
+        assert False, "expected DocumentRejected"
+    except DocumentRejected as e:
+        assert e.status_code == 413 and e.reason == "document_too_large"
+
+
+def test_docx_paragraphs_and_tables_in_order():
+    document = extract_document_text(io.BytesIO(make_docx()), "docx")
+    assert document["text"].split("\n") == ["Jane Doe", "Python | Kubernetes", "jane@example.com"]
+
+
+def test_upload_is_capped_while_streaming():
+    spool, size = asyncio.run(spool_upload(stream(b"x" * 5000), max_bytes=10000))
+    assert size == 5000 and spool.read() == b"x" * 5000
+    try:
+        asyncio.run(spool_upload(stream(b"x" * 20000), max_bytes=10000))
+        assert False, "expected DocumentRejected"
+    except DocumentRejected as e:
+        assert e.status_code == 413
+
+    for data, status in [(b"\x89PNG\r\n\x00\x00", 415), (b"%PDF-1.4 garbage", 422), (b"PK\x03\x04junk", 422)]:
+        try:
+            asyncio.run(read_upload(stream(data)))
+            assert False, "expected DocumentRejected"
+        except DocumentRejected as e:
+            assert e.status_code == status, (data, e.status_code)
+
+    document = asyncio.run(read_upload(stream("Jane Doe – résumé".encode() * 100, chunk=7)))
+    assert document["format"] == "txt" and document["text"].startswith("Jane Doe – résumé")
+
+
+def test_upload_endpoint():
+    from app.main import app
+
+    async def post_all():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            pdf = await client.post("/api/upload-resume", content=make_pdf(["Jane Doe jane@example.com"]))
+            large = await client.post(
+                "/api/upload-resume", content=b"x" * 100, headers={"Content-Length": str(10 ** 9)},
+            )
+            return pdf, large
+
+    pdf, large = asyncio.run(post_all())
+    assert pdf.status_code == 200
+    body = pdf.json()
+    assert body["document"]["format"] == "pdf" and "jane@example.com" in body["document"]["text"]
+    assert body["status"] == "needs_clarification"
+    assert large.status_code == 413 and large.json()["status"] == "document_too_large"
+
+
+if __name__ == "__main__":
+    test_pdf_pages_and_truncation()
+    test_pdf_page_decompression_is_capped()
+    test_docx_paragraphs_and_tables_in_order()
+    test_upload_is_capped_while_streaming()
+    test_upload_endpoint()
+    print("All document reader tests passed")
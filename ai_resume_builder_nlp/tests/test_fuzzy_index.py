@@ -0,0 +1,61 @@
+# Typo-tolerant company lookup: normalization, edit budgets, extractor fallback
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services.fuzzy_index import FuzzyIndex, bounded_distance, normalize_name
+from app.nlp.extractors.entity_extractor import extract_company
+
+NAMES = [
+    ("Google", "Google"), ("Alphabet", "Google"), ("Microsoft", "Microsoft"),
+    ("Infosys", "Infosys"), ("Goldman Sachs", "Goldman Sachs"), ("Uber", "Uber"),
+    ("Meta", "Meta"), ("Tata Consultancy Services", "TCS"),
+]
+
+
+def test_normalize_drops_legal_suffixes():
+    assert normalize_name("Infosys Ltd.") == "infosys"
+    assert normalize_name("Acme Pvt. Ltd") == "acme"
+    assert normalize_name("Group") == "group"   # never strips a name to nothing
+
+
+def test_bounded_distance():
+    assert bounded_distance("google", "goolge", 1) == 1       # transposition is one edit
+    assert bounded_distance("microsoft", "microsfot", 2) == 1
+    assert bounded_distance("google", "amazon", 2) is None
+
+
+def test_lookup_typos_and_aliases():
+    index = FuzzyIndex(NAMES)
+    assert index.lookup("Google Inc") == [("Google", 0)]
+    assert index.best("Goolge") == "Google"
+    assert index.best("Alphabett") == "Google"
+    assert index.best("Goldmn Sachs") == "Goldman Sachs"
+    assert index.best("Tata Consultancy Servics") == "TCS"
+
+
+def test_short_names_must_match_exactly():
+    index = FuzzyIndex(NAMES)
+    assert index.best("Meta") == "Meta"
+    assert index.best("Mata") is None
+    assert index.best("Ubr") is None
+    assert index.best("Goolge", max_edits=0) is None
+
+
+def test_extract_company_falls_back_to_index():
+    assert extract_company("Software Engineer at Goolge") == "Google"
+    assert extract_company("Microsfot | Senior Developer") == "Microsoft"
+    assert extract_company("Built APIs with Python and Django") is None
+
+
+if __name__ == "__main__":
+    test_normalize_drops_legal_suffixes()
+    test_bounded_distance()
+    test_lookup_typos_and_aliases()
+    test_short_names_must_match_exactly()
+    test_extract_company_falls_back_to_index()
+    print("All fuzzy index tests passed")
@@ -0,0 +1,100 @@
+# Job matcher: TF-IDF keyword vectors, coverage and missing skills, vector cache, match endpoint
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services import resume_repository
+from app.services.job_matcher import JobMatcher, get_job_matcher
+from app.services.resume_repository import ResumeRepository
+from app.utils.metrics import get_metrics
+
+JOB = (
+    "Senior Backend Engineer. You will build microservices in Python and Golang on Kubernetes "
+    "and AWS, with PostgreSQL. CI/CD experience required; Python is our main language."
+)
+RESUME = {
+    "profile": {"name": "Asha", "role": "Backend Engineer"},
+    "summary": "Backend developer.",
+    "skills": ["Python", "Docker", "AWS"],
+    "experience": [{"role": "Engineer", "description": "Moved our microservices to k8s"}],
+}
+
+
+def test_vectors_are_normalized_tf_idf():
+    vectorizer = get_job_matcher().vectorizer
+    vector = vectorizer.vectorize(JOB)
+    assert vector.shape == (1, len(vectorizer))
+    assert abs(np.linalg.norm(vector.data) - 1) < 1e-9
+
+    terms = {vectorizer.terms[column]: weight for column, weight in zip(vector.indices, vector.data)}
+    # Aliases resolve to the canonical skill ("Golang" is Go); a repeated skill weighs more
+    assert {"python", "go", "kubernetes", "aws", "postgresql", "ci/cd", "microservices", "backend"} <= set(terms)
+    assert terms["python"] > terms["go"]
+    assert vectorizer.vectorize("nothing relevant here").nnz == 0
+
+
+def test_match_reports_coverage_and_missing_skills():
+    match = get_job_matcher().match(JOB, RESUME)
+
+    assert 0.5 < match["similarity"] < 1
+    assert {"Python", "AWS", "Kubernetes", "Microservices", "backend"} <= set(match["matched"])
+    assert set(match["missing_skills"]) == {"Go", "PostgreSQL", "CI/CD"}
+    assert match["coverage"] == len(match["matched"]) / match["job_keywords"]
+    assert get_job_matcher().match(JOB, {"skills": []})["similarity"] == 0.0
+
+
+def test_vectors_are_cached_by_content():
+    matcher = JobMatcher(get_job_matcher().vectorizer)
+    matcher.match(JOB, RESUME)
+    before = get_metrics().snapshot()["counters"]
+    matcher.match(JOB, dict(RESUME))  # equal content, different object
+    after = get_metrics().snapshot()["counters"]
+    assert after["match_vectors.hits"] - before.get("match_vectors.hits", 0) == 2
+    assert after.get("match_vectors.misses", 0) == before.get("match_vectors.misses", 0)
+
+
+def test_match_endpoint():
+    from app import main
+
+    async def call(payload):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/match-job", json=payload)
+
+    with tempfile.TemporaryDirectory() as root:
+        saved = resume_repository._resume_repository_instance
+        repo = resume_repository._resume_repository_instance = ResumeRepository(Path(root) / "resumes.sqlite3")
+        try:
+            repo.save("h1", RESUME, {"status": "success"})
+            repo.flush()
+            inline = asyncio.run(call({"job_description": JOB, "resume": RESUME}))
+            stored = asyncio.run(call({"job_description": JOB, "resume_id": 1}))
+            unknown = asyncio.run(call({"job_description": JOB, "resume_id": 99}))
+            no_resume = asyncio.run(call({"job_description": JOB}))
+            repo.close()
+        finally:
+            resume_repository._resume_repository_instance = saved
+
+    data = inline.json()["data"]
+    assert inline.status_code == 200 and data["missingSkills"][0] in ("Go", "PostgreSQL", "CI/CD")
+    assert set(data) == {"similarity", "coverage", "jobKeywords", "matchedKeywords", "missingKeywords", "missingSkills"}
+    assert stored.json()["data"] == data
+    assert unknown.status_code == 404
+    assert no_resume.status_code == 422 and no_resume.json()["status"] == "missing_resume"
+
+
+if __name__ == "__main__":
+    test_vectors_are_normalized_tf_idf()
+    test_match_reports_coverage_and_missing_skills()
+    test_vectors_are_cached_by_content()
+    test_match_endpoint()
+    print("All job matcher tests passed")
@@ -0,0 +1,73 @@
+# Tolerant / incremental JSON extraction from LLM output
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.json_utils import IncrementalJSONParser, extract_first_json_object, parse_llm_json
+
+RESUME_JSON = '{"summary": "Led {core} team, shipped \\"v2\\"", "experience": [{"role": "Eng", "achievements": ["a", "b"]}], "skills": ["Python"]}'
+
+
+def test_first_object_with_fences_and_prose():
+    text = "Sure! Here is the {improved} JSON:\n```json\n" + RESUME_JSON + "\n```\nLet me know {if} needed."
+    result = extract_first_json_object(text)
+    assert result["summary"] == 'Led {core} team, shipped "v2"'
+    assert result["skills"] == ["Python"]
+
+
+def test_no_object():
+    assert extract_first_json_object("no json here {at all") is None
+    try:
+        parse_llm_json("nothing")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_truncated_output_keeps_complete_values():
+    cut = RESUME_JSON.index('"b"') + 2
+    partial = parse_llm_json(RESUME_JSON[:cut])
+    assert partial["summary"].startswith("Led")
+    assert partial["experience"] == [{"role": "Eng", "achievements": ["a"]}]
+    assert "skills" not in partial
+    assert parse_llm_json('{"summary": "done", "skills": [') == {"summary": "done", "skills": []}
+
+
+def test_stray_brace_before_the_object():
+    assert parse_llm_json('Note: a { may appear. Here: {"summary": "x"}') == {"summary": "x"}
+    assert extract_first_json_object('Use { as needed.\n```json\n' + RESUME_JSON + '\n```')["skills"] == ["Python"]
+
+    # What looks like a member of the abandoned candidate is never returned
+    parser = IncrementalJSONParser()
+    assert parser.feed('Use { "skills": 1, then {"summary": "x"}') == []
+    assert parser.finish() == [("summary", "x")] and parser.result == {"summary": "x"}
+    assert parse_llm_json('Use { "skills": 1, then {"summary": "x"}') == {"summary": "x"}
+
+
+def test_streamed_members_wait_for_the_object():
+    parser = IncrementalJSONParser()
+    seen = []
+    for ch in "```json\n" + RESUME_JSON + "\n```":
+        for key, _ in parser.feed(ch):
+            seen.append((key, parser.done))
+    # All members arrive together, once the object has closed and parsed
+    assert seen == [("summary", True), ("experience", True), ("skills", True)]
+    assert parser.feed("more text") == []
+
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"summary": "x", "skills": ["Go"') == []
+    assert parser.partial() == {"summary": "x", "skills": ["Go"]}
+    assert parser.feed("]}") == [("summary", "x"), ("skills", ["Go"])]
+
+
+if __name__ == "__main__":
+    test_first_object_with_fences_and_prose()
+    test_no_object()
+    test_truncated_output_keeps_complete_values()
+    test_stray_brace_before_the_object()
+    test_streamed_members_wait_for_the_object()
+    print("All JSON utils tests passed")
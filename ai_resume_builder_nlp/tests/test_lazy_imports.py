@@ -0,0 +1,51 @@
+# The deterministic pipeline must import without google-adk / litellm
+import sys
+import subprocess
+from pathlib import Path
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.utils.lazy import lazy_attributes
+
+HEAVY_CHECK = (
+    "import sys, {module}; "
+    "heavy = [m for m in sys.modules if m.startswith(('google.adk', 'litellm'))]; "
+    "print(len(heavy))"
+)
+
+
+def loaded_heavy_modules(module: str) -> int:
+    proc = subprocess.run(
+        [sys.executable, "-c", HEAVY_CHECK.format(module=module)],
+        cwd=project_root, capture_output=True, text=True, check=True,
+    )
+    return int(proc.stdout.strip().splitlines()[-1])
+
+
+def test_pipeline_and_api_skip_adk():
+    assert loaded_heavy_modules("app.pipeline_runner") == 0
+    assert loaded_heavy_modules("app.main") == 0
+
+
+def test_lazy_attributes_build_once():
+    calls = []
+    namespace = {"__name__": "fake_module"}
+    getattr_ = lazy_attributes(namespace, agent=lambda: calls.append(1) or object())
+    first = getattr_("agent")
+    assert getattr_("agent") is first
+    assert namespace["agent"] is first
+    assert calls == [1]
+    try:
+        getattr_("missing")
+        assert False, "expected AttributeError"
+    except AttributeError:
+        pass
+
+
+if __name__ == "__main__":
+    test_pipeline_and_api_skip_adk()
+    test_lazy_attributes_build_once()
+    print("All lazy import tests passed")
@@ -0,0 +1,194 @@
+# Exercise LLMClient against the in-process mock gateway
+import sys
+import json
+import asyncio
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services import llm_client
+from app.services.llm_client import LLMClient, CircuitBreaker, LLMError, LLMTimeout, LLMUnavailable
+from app.utils.metrics import get_metrics
+from tests.mock_llm_server import create_mock_llm_app
+
+RESUME = {"summary": "Backend engineer.", "skills": ["Python", "Docker", "AWS"]}
+
+
+def make_client(app, **kwargs):
+    return LLMClient(
+        api_base="http://mock-gateway",
+        api_key="test",
+        transport=httpx.ASGITransport(app=app),
+        **kwargs,
+    )
+
+
+def ask(client, **kwargs):
+    messages = [{"role": "user", "content": f"Here is the resume:\n{json.dumps(RESUME)}"}]
+    return asyncio.run(client.complete(messages, **kwargs))
+
+
+def test_complete_echoes_resume():
+    reply = ask(make_client(create_mock_llm_app()))
+    assert RESUME == json.loads(reply.strip("`").removeprefix("json"))
+
+
+def test_stream_yields_deltas():
+    client = make_client(create_mock_llm_app(chunk_size=5))
+    messages = [{"role": "user", "content": json.dumps(RESUME)}]
+
+    async def collect():
+        return [delta async for delta in client.astream(messages)]
+
+    deltas = asyncio.run(collect())
+    assert len(deltas) > 1
+    assert RESUME == json.loads("".join(deltas).strip("`").removeprefix("json"))
+
+
+def test_retries_transient_failures():
+    app = create_mock_llm_app(failures=2)
+    llm_client.LLM_BACKOFF_BASE_SECONDS, saved = 0.001, llm_client.LLM_BACKOFF_BASE_SECONDS
+    try:
+        ask(make_client(app, max_retries=2))
+    finally:
+        llm_client.LLM_BACKOFF_BASE_SECONDS = saved
+    assert app.state.calls == 3
+
+
+def test_deadline_raises_timeout():
+    client = make_client(create_mock_llm_app(delay_s=1.0), max_retries=0)
+    try:
+        ask(client, timeout_s=0.05)
+        assert False, "expected LLMTimeout"
+    except LLMTimeout:
+        pass
+
+
+def test_breaker_opens_and_short_circuits():
+    app = create_mock_llm_app(failures=100)
+    client = make_client(app, max_retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_seconds=60))
+    for _ in range(2):
+        try:
+            ask(client)
+        except LLMError:
+            pass
+    assert client.breaker.state == "open"
+    try:
+        ask(client)
+        assert False, "expected LLMUnavailable"
+    except LLMUnavailable:
+        pass
+    # The open breaker never reached the gateway
+    assert app.state.calls == 2
+
+
+def test_breaker_half_open_probe_closes():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, slow_call_seconds=5, clock=lambda: now[0])
+    breaker.record_failure()
+    assert not breaker.allow()
+    now[0] = 11
+    assert breaker.allow()        # the probe
+    assert not breaker.allow()    # only one probe at a time
+    breaker.record_success(0.1)
+    assert breaker.state == "closed"
+    # Slow successes count as failures
+    breaker.record_success(6.0)
+    assert breaker.state == "open"
+
+
+def test_cancelled_probe_releases_half_open_breaker():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=lambda: now[0])
+    client = make_client(create_mock_llm_app(delay_s=5.0), breaker=breaker)
+    messages = [{"role": "user", "content": "{}"}]
+    breaker.record_failure()
+    now[0] = 11
+
+    async def cancel_probe():
+        probe = asyncio.ensure_future(client.complete(messages))
+        await asyncio.sleep(0.05)
+        probe.cancel()
+        try:
+            await probe
+            assert False, "expected CancelledError"
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(cancel_probe())
+    # No verdict on the gateway: still half open, and the next call may probe
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+
+
+def test_semaphore_caps_concurrency():
+    app = create_mock_llm_app(delay_s=0.02)
+    client = make_client(app, max_concurrency=3)
+    messages = [{"role": "user", "content": "{}"}]
+
+    async def burst():
+        await asyncio.gather(*(client.complete(messages) for _ in range(12)))
+
+    asyncio.run(burst())
+    assert app.state.max_in_flight == 3
+
+
+def test_enhancer_falls_back_when_gateway_down():
+    from app.agents.enhancer_agent.agent import enhance_with_devstral_async
+
+    original = llm_client._llm_client_instance
+    llm_client.set_llm_client(make_client(create_mock_llm_app(failures=100), max_retries=0))
+    try:
+        state = {"final_resume": RESUME}
+        assert asyncio.run(enhance_with_devstral_async(state)) is state
+    finally:
+        llm_client.set_llm_client(original)
+
+
+class ClosingTransport(httpx.ASGITransport):
+    closed = 0
+
+    async def aclose(self) -> None:
+        self.closed += 1
+        await super().aclose()
+
+
+def test_pool_is_closed_before_its_loop_ends():
+    transport = ClosingTransport(app=create_mock_llm_app())
+    client = LLMClient(api_base="http://mock-gateway", api_key="test", transport=transport)
+    messages = [{"role": "user", "content": "{}"}]
+    abandoned = get_metrics().counter("llm.pool_abandoned")
+
+    original = llm_client._llm_client_instance
+    llm_client.set_llm_client(client)
+    try:
+        llm_client.run_sync(client.complete(messages))
+        llm_client.run_sync(client.complete(messages))
+    finally:
+        llm_client.set_llm_client(original)
+    assert transport.closed == 2 and client._http is None
+    assert get_metrics().counter("llm.pool_abandoned") == abandoned
+
+    # A bare asyncio.run leaves the pool behind; the next loop lets go of it
+    asyncio.run(client.complete(messages))
+    asyncio.run(client.complete(messages))
+    assert get_metrics().counter("llm.pool_abandoned") == abandoned + 1
+
+
+if __name__ == "__main__":
+    test_complete_echoes_resume()
+    test_stream_yields_deltas()
+    test_retries_transient_failures()
+    test_deadline_raises_timeout()
+    test_breaker_opens_and_short_circuits()
+    test_breaker_half_open_probe_closes()
+    test_cancelled_probe_releases_half_open_breaker()
+    test_semaphore_caps_concurrency()
+    test_enhancer_falls_back_when_gateway_down()
+    test_pool_is_closed_before_its_loop_ends()
+    print("All LLM client tests passed")
@@ -0,0 +1,167 @@
+# Content-addressed output store: dedup, sharding, atomic background writes, full queue, retention, tar export
+import io
+import os
+import sys
+import asyncio
+import tarfile
+import tempfile
+import threading
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services import output_store
+from app.services.output_store import OutputStore, artifact_hash
+from app.utils.file_writer import write_to_file
+from app.utils.metrics import get_metrics
+
+
+def test_identical_content_is_stored_once_in_its_shard():
+    with tempfile.TemporaryDirectory() as root:
+        store = OutputStore(root)
+        first = store.put(b"<p>one</p>", ".html")
+        again = store.put(b"<p>one</p>", ".html")
+        other = store.put(b"<p>two</p>", ".html")
+        # Readable before the background write lands
+        assert store.read(first["hash"]) == (b"<p>one</p>", first["name"])
+        store.flush()
+
+        digest = artifact_hash(b"<p>one</p>")
+        assert first == again and first["hash"] == digest
+        assert first["path"] == str(Path(root) / digest[:2] / digest[2:4] / f"{digest}.html")
+        assert Path(first["path"]).read_bytes() == b"<p>one</p>" and other["path"] != first["path"]
+        files = sorted(p.name for p in Path(root).rglob("*") if p.is_file())
+        assert files == sorted([first["name"], other["name"]])  # no temp files left behind
+        assert store.read(other["hash"]) == (b"<p>two</p>", other["name"])
+        assert store.read("0" * 64) is None
+        store.close()
+
+
+def test_full_queue_does_not_block_put():
+    with tempfile.TemporaryDirectory() as root:
+        saved_size = output_store.WRITE_QUEUE_SIZE
+        output_store.WRITE_QUEUE_SIZE = 1
+        try:
+            store = OutputStore(root)
+        finally:
+            output_store.WRITE_QUEUE_SIZE = saved_size
+        before = get_metrics().counter("output_store.queue_full")
+        store._thread = threading.current_thread()  # writer not running: the queue stays full
+        stored = [store.put(f"<p>{n}</p>".encode(), ".html") for n in range(3)]
+        assert get_metrics().counter("output_store.queue_full") - before == 2
+        assert store.read(stored[2]["hash"]) == (b"<p>2</p>", stored[2]["name"])
+
+        store._thread = None
+        stored.append(store.put(b"<p>3</p>", ".html"))  # starts the writer, which also takes the set-aside ones
+        store.flush()
+        assert all(Path(item["path"]).exists() for item in stored)
+        store.close()
+
+
+def test_pending_bytes_are_capped():
+    with tempfile.TemporaryDirectory() as root:
+        saved_size = output_store.WRITE_QUEUE_SIZE
+        output_store.WRITE_QUEUE_SIZE = 1
+        try:
+            store = OutputStore(root, max_pending_bytes=25)
+        finally:
+            output_store.WRITE_QUEUE_SIZE = saved_size
+        before = get_metrics().counter("output_store.dropped")
+        disk = threading.Event()
+        write = store._write
+        store._write = lambda *item: (disk.wait(), write(*item))  # a stalled disk
+        stored = [store.put(bytes([n]) * 10, ".bin") for n in range(5)]
+        # Two held (being written, queued or set aside), the rest dropped: at most 25 bytes
+        assert store._pending_bytes == 20 and sum(len(data) for data in store._pending.values()) == 20
+        assert get_metrics().counter("output_store.dropped") - before == 3
+        assert store.read(stored[4]["hash"]) is None
+
+        disk.set()
+        store.flush()
+        store.put(bytes([4]) * 10, ".bin")  # put again once there is room
+        store.flush()
+        assert [Path(item["path"]).exists() for item in stored] == [True, True, False, False, True]
+        assert store._pending_bytes == 0
+        store.close()
+
+
+def test_retention_by_age_then_size():
+    with tempfile.TemporaryDirectory() as root:
+        now = 1_000_000.0
+        store = OutputStore(root, max_bytes=25, max_age_s=100, sweep_interval_s=float("inf"), clock=lambda: now)
+        stored = [store.put(bytes([n]) * 10, ".bin") for n in range(4)]
+        store.flush()
+        for age, item in zip([500, 50, 40, 30], stored):
+            os.utime(item["path"], (now - age, now - age))
+
+        # The first has expired; of the 30 bytes left the oldest goes to fit 25
+        assert store.evict() == 2
+        assert [Path(item["path"]).exists() for item in stored] == [False, False, True, True]
+        store.close()
+
+
+def test_export_streams_a_tar():
+    with tempfile.TemporaryDirectory() as root:
+        store = OutputStore(root)
+        items = [store.put(f"artifact {n}".encode() * 5000, ".txt") for n in range(3)]
+        store.flush()
+        os.utime(items[0]["path"], (1000, 1000))
+
+        for compress in (False, True):
+            chunks = list(store.export_tar(compress=compress))
+            with tarfile.open(fileobj=io.BytesIO(b"".join(chunks)), mode="r|*") as archive:
+                names = {m.name: archive.extractfile(m).read() for m in archive}
+            assert len(names) == 3
+            assert names[str(Path(items[1]["path"]).relative_to(root))] == b"artifact 1" * 5000
+
+        recent = b"".join(store.export_tar(since=2000))
+        with tarfile.open(fileobj=io.BytesIO(recent), mode="r|") as archive:
+            assert len([m for m in archive]) == 2
+        store.close()
+
+
+def test_write_to_file_and_endpoints():
+    from app import main
+
+    with tempfile.TemporaryDirectory() as root:
+        saved = output_store._output_store_instance, main.OUTPUT_EXPORT_TOKEN
+        output_store._output_store_instance = OutputStore(root)
+        main.OUTPUT_EXPORT_TOKEN = "secret"
+        try:
+            written = write_to_file("<h1>Hi</h1>")
+            assert written["status"] == "success" and written["file"].endswith(f"{written['hash']}.html")
+
+            async def get_all():
+                transport = httpx.ASGITransport(app=main.app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    artifact = await client.get(f"/api/artifacts/{written['hash']}")
+                    missing = await client.get(f"/api/artifacts/{'0' * 64}")
+                    denied = await client.get("/api/artifacts/export")
+                    export = await client.get("/api/artifacts/export", headers={"Authorization": "Bearer secret"})
+                    return artifact, missing, denied, export
+
+            artifact, missing, denied, export = asyncio.run(get_all())
+            output_store._output_store_instance.close()
+        finally:
+            output_store._output_store_instance, main.OUTPUT_EXPORT_TOKEN = saved
+
+    assert artifact.status_code == 200 and artifact.text == "<h1>Hi</h1>"
+    assert artifact.headers["content-type"].startswith("text/html")
+    assert missing.status_code == 404 and denied.status_code == 401
+    with tarfile.open(fileobj=io.BytesIO(export.content), mode="r|") as archive:
+        assert [m.name.endswith(".html") for m in archive] == [True]
+
+
+if __name__ == "__main__":
+    test_identical_content_is_stored_once_in_its_shard()
+    test_full_queue_does_not_block_put()
+    test_pending_bytes_are_capped()
+    test_retention_by_age_then_size()
+    test_export_streams_a_tar()
+    test_write_to_file_and_endpoints()
+    print("All output store tests passed")
@@ -0,0 +1,66 @@
+# Offloaded understanding/generation must match the inline result
+import sys
+import asyncio
+from pathlib import Path
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app import pipeline_runner
+from app.pipeline_runner import pipeline
+from app.agents.understanding_agent.agent import understand_text
+from app.agents.generation_agent.agent import generate_resume
+from app.utils.executors import pack_call
+from app.utils.metrics import get_metrics
+from benchmarks.corpus import get_corpus_generator
+
+TEXT = get_corpus_generator(0).text_of_size(30 * 1024)
+
+
+def call_stage(name, func, args, kwargs=None):
+    return asyncio.run(pipeline._call_stage(name, func, args, kwargs or {}))
+
+
+def test_pack_call_rejects_unmarshallable():
+    assert pack_call(("text",), {"parallel": None}) is not None
+    assert pack_call((object(),), {}) is None
+
+
+def test_offloaded_stages_match_inline():
+    saved = pipeline_runner.PROCESS_OFFLOAD, pipeline_runner.PROCESS_OFFLOAD_MIN_BYTES
+    pipeline_runner.PROCESS_OFFLOAD, pipeline_runner.PROCESS_OFFLOAD_MIN_BYTES = True, 1000
+    before = get_metrics().counter("pipeline.offloaded_stages")
+    try:
+        understood = call_stage("understanding", understand_text, (TEXT,), {"parallel": False})
+        state = {"raw_text": TEXT, **understood}
+        generated = call_stage("generation", generate_resume, (state,))
+    finally:
+        pipeline_runner.PROCESS_OFFLOAD, pipeline_runner.PROCESS_OFFLOAD_MIN_BYTES = saved
+
+    assert get_metrics().counter("pipeline.offloaded_stages") == before + 2
+    # raw_text is not shipped back; everything else is identical
+    expected = understand_text(TEXT, parallel=False)
+    assert "raw_text" not in understood
+    assert understood == {k: v for k, v in expected.items() if k != "raw_text"}
+    assert generated == generate_resume({"raw_text": TEXT, **expected})
+
+
+def test_small_payload_runs_inline():
+    saved = pipeline_runner.PROCESS_OFFLOAD
+    pipeline_runner.PROCESS_OFFLOAD = True
+    before = get_metrics().counter("pipeline.offloaded_stages")
+    try:
+        result = call_stage("understanding", understand_text, ("John Smith, Python developer",))
+    finally:
+        pipeline_runner.PROCESS_OFFLOAD = saved
+    assert result["raw_text"] == "John Smith, Python developer"
+    assert get_metrics().counter("pipeline.offloaded_stages") == before
+
+
+if __name__ == "__main__":
+    test_pack_call_rejects_unmarshallable()
+    test_offloaded_stages_match_inline()
+    test_small_payload_runs_inline()
+    print("All process offload tests passed")
@@ -0,0 +1,86 @@
+# Quality gate: strong content skips the LLM, weak content is sent
+import sys
+import asyncio
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.agents.enhancer_agent.agent import enhance_with_devstral_async
+from app.nlp.enhancers import quality_scorer
+from app.nlp.enhancers.quality_scorer import score_bullet, score_summary, needs_llm, llm_savings
+from app.services import llm_client
+from app.services.llm_client import LLMClient
+from app.utils.metrics import get_metrics
+from tests.mock_llm_server import create_mock_llm_app
+
+STRONG_SUMMARY = (
+    "Backend engineer with eight years of experience designing distributed payment "
+    "systems, leading small teams and improving reliability for high traffic products."
+)
+STRONG_ENTRY = {
+    "role": "Engineer", "company": "Google",
+    "achievements": ["Reduced checkout latency by 40% across all regional services"],
+}
+WEAK_ENTRY = {"role": "Developer", "company": "Acme", "achievements": ["Tasks for the team"]}
+
+
+def test_bullet_signals():
+    assert score_bullet("Reduced checkout latency by 40% across all regional services") == 1.0
+    assert score_bullet("Reduced checkout latency across all regional services") == 0.65
+    assert score_bullet("Tasks for the team") == 0.0
+
+
+def test_summary_signals():
+    assert score_summary(STRONG_SUMMARY) == 1.0
+    assert score_summary("Backend engineer.") == 0.5
+    assert score_summary(STRONG_SUMMARY + " I worked on many things.") == 0.5
+
+
+def test_section_routing():
+    assert not needs_llm("summary", STRONG_SUMMARY)
+    assert not needs_llm("experience", STRONG_ENTRY)
+    assert needs_llm("experience", WEAK_ENTRY)
+    # One weak bullet sends the whole entry
+    assert needs_llm("experience", {**STRONG_ENTRY, "achievements": STRONG_ENTRY["achievements"] + ["Misc"]})
+    # No prose to polish
+    assert not needs_llm("education", [{"degree": "BS", "institution": "MIT", "year": "2018"}])
+
+
+def test_only_weak_sections_reach_the_gateway():
+    app = create_mock_llm_app()
+    original = llm_client._llm_client_instance
+    llm_client.set_llm_client(LLMClient(
+        api_base="http://mock-gateway", api_key="test", transport=httpx.ASGITransport(app=app),
+    ))
+    metrics = get_metrics()
+    before = dict(metrics.snapshot()["counters"])
+    try:
+        resume = {"summary": STRONG_SUMMARY, "experience": [STRONG_ENTRY, WEAK_ENTRY], "skills": ["Python"]}
+        result = asyncio.run(enhance_with_devstral_async({"final_resume": resume}))
+    finally:
+        llm_client.set_llm_client(original)
+
+    assert app.state.calls == 1
+    assert result["enhancement_sections"]["llm"] == ["experience[1]"]
+    assert result["enhancement_sections"]["skipped"] == ["summary", "experience[0]"]
+
+    after = metrics.snapshot()["counters"]
+    delta = {k: after.get(k, 0) - before.get(k, 0) for k in after}
+    assert delta[quality_scorer.SECTIONS_SENT] == 1
+    assert delta[quality_scorer.SECTIONS_SKIPPED] == 2
+    savings = llm_savings(delta)
+    assert savings["callsAvoidedRatio"] == round(2 / 3, 3)
+    assert 0 < savings["tokensAvoidedRatio"] < 1
+
+
+if __name__ == "__main__":
+    test_bullet_signals()
+    test_summary_signals()
+    test_section_routing()
+    test_only_weak_sections_reach_the_gateway()
+    print("All quality scorer tests passed")
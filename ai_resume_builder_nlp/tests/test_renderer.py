@@ -0,0 +1,92 @@
+# Themed HTML rendering: compiled templates, content-hash memo, rendering stage and endpoint
+import sys
+import asyncio
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services.renderer import ResumeRenderer, UnknownTheme, pdf_available
+from app.utils.metrics import get_metrics
+
+RESUME = {
+    "profile": {"name": "Jane <Doe>", "role": "Data Engineer", "email": "jane@example.com", "phone": None},
+    "summary": "Builds pipelines.",
+    "experience": [{"role": "Data Engineer", "company": "Acme", "description": "ETL", "achievements": ["40%"]}],
+    "education": ["BSc Computer Science, 2018"],
+    "skills": ["Python", "SQL"],
+}
+
+
+def test_render_escapes_and_skips_missing_fields():
+    html, _ = ResumeRenderer().render_html(RESUME, "classic")
+    assert "Jane &lt;Doe&gt;" in html and "<Doe>" not in html
+    assert "None" not in html
+    assert "Python, SQL" in html and "Acme" in html and "BSc Computer Science, 2018" in html
+
+
+def test_memoized_by_content_hash():
+    renderer = ResumeRenderer()
+    hits = get_metrics().snapshot()["counters"].get("render_cache.hits", 0)
+    first, digest = renderer.render_html(RESUME, "classic")
+    again, same = renderer.render_html(dict(RESUME), "classic")
+    assert again is first and same == digest
+    assert get_metrics().snapshot()["counters"]["render_cache.hits"] == hits + 1
+
+    modern, other = renderer.render_html(RESUME, "modern")
+    assert other != digest and modern != first
+    try:
+        renderer.render_html(RESUME, "missing")
+        assert False, "expected UnknownTheme"
+    except UnknownTheme:
+        pass
+
+
+def test_pipeline_renders_after_formatting():
+    from app.pipeline_runner import pipeline
+    from benchmarks.fixtures import CLARIFICATION_ANSWERS, SAMPLE_RESUME_TEXT
+
+    state = pipeline.run({
+        "raw_text": SAMPLE_RESUME_TEXT, "test_mode": True, "answers": CLARIFICATION_ANSWERS, "theme": "modern",
+    })
+    rendered = state["rendered_resume"]
+    assert rendered["theme"] == "modern"
+    assert "john.smith@example.com" in rendered["html"] and "Kubernetes" in rendered["html"]
+
+
+def test_render_endpoint():
+    from app.main import app
+
+    async def post_all():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            html = await client.post("/api/render-resume", json={"resume": RESUME, "theme": "modern"})
+            unknown = await client.post("/api/render-resume", json={"resume": RESUME, "theme": "missing"})
+            pdf = await client.post("/api/render-resume", json={"resume": RESUME, "format": "pdf"})
+            # Generation rejects the theme the same way, before running the pipeline
+            generate = await client.post("/api/generate-resume", json={"prompt": "Jane", "theme": "missing"})
+            upload = await client.post("/api/upload-resume?theme=missing", content=b"Jane Doe")
+            return html, unknown, pdf, generate, upload
+
+    html, unknown, pdf, generate, upload = asyncio.run(post_all())
+    assert html.status_code == 200 and html.headers["content-type"].startswith("text/html")
+    assert "Jane &lt;Doe&gt;" in html.text and html.headers["ETag"]
+    assert unknown.status_code == 422 and unknown.json()["status"] == "unknown_theme"
+    assert generate.status_code == 422 and generate.json() == unknown.json()
+    assert upload.status_code == 422 and upload.json() == unknown.json()
+    if pdf_available():
+        assert pdf.status_code in (200, 501)
+    else:
+        assert pdf.status_code == 501 and pdf.json()["status"] == "pdf_unavailable"
+
+
+if __name__ == "__main__":
+    test_render_escapes_and_skips_missing_fields()
+    test_memoized_by_content_hash()
+    test_pipeline_renders_after_formatting()
+    test_render_endpoint()
+    print("All renderer tests passed")
@@ -0,0 +1,130 @@
+# Resume repository: batched WAL writes, read-your-writes, reuse of stored responses, lookup endpoints
+import sys
+import asyncio
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services import resume_repository, result_cache
+from app.services.resume_repository import ResumeRepository
+from app.services.result_cache import ResultCache
+from app.utils.metrics import get_metrics
+
+RESUME = {"profile": {"name": "Jane Doe"}, "skills": ["Python"]}
+
+
+def test_save_is_readable_before_and_after_commit():
+    with tempfile.TemporaryDirectory() as root:
+        repo = ResumeRepository(Path(root) / "resumes.sqlite3")
+        repo.save("h1", RESUME, {"status": "success", "data": RESUME})
+        pending = repo.get_by_hash("h1")
+        assert pending["id"] is None and pending["resume"] == RESUME
+        repo.flush()
+
+        stored = repo.get_by_hash("h1")
+        assert stored["id"] == 1 and stored["response"]["data"] == RESUME
+        assert repo.get(1)["input_hash"] == "h1" and repo.get(2) is None
+
+        # Same input hash again updates the row in place
+        repo.save("h1", {**RESUME, "skills": ["Go"]}, {"status": "success"})
+        repo.flush()
+        assert repo.count() == 1 and repo.get(1)["resume"]["skills"] == ["Go"]
+        assert sqlite3.connect(repo.path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        repo.close()
+
+
+def test_writes_are_batched():
+    with tempfile.TemporaryDirectory() as root:
+        repo = ResumeRepository(Path(root) / "resumes.sqlite3", batch_size=100, batch_window_ms=50)
+        before = get_metrics().snapshot()
+        for n in range(500):
+            repo.save(f"h{n}", RESUME, {"status": "success"})
+        repo.flush()
+        after = get_metrics().snapshot()
+
+        assert repo.count() == 500
+        commits = after["observations"]["resume_db.batch_size"]["count"] - \
+            before["observations"].get("resume_db.batch_size", {}).get("count", 0)
+        assert commits < 50
+        assert after["observations"]["resume_db.batch_size"]["max"] > 1
+        repo.close()
+
+
+def test_expired_response_is_reused_again_once_regenerated():
+    now = [1_000_000.0]
+    with tempfile.TemporaryDirectory() as root:
+        repo = ResumeRepository(Path(root) / "resumes.sqlite3", clock=lambda: now[0])
+        repo.save("h1", RESUME, {"status": "success", "version": 1})
+        repo.flush()
+        assert repo.reusable_response("h1")["version"] == 1
+
+        now[0] += (resume_repository.RESUME_REUSE_MAX_AGE_DAYS + 1) * 86400
+        assert repo.reusable_response("h1") is None
+
+        # Regenerated: fresh again, though the row was created long ago
+        repo.save("h1", RESUME, {"status": "success", "version": 2})
+        assert repo.reusable_response("h1")["version"] == 2
+        repo.flush()
+        stored = repo.get_by_hash("h1")
+        assert stored["updated_at"] == now[0] > stored["created_at"]
+        assert repo.reusable_response("h1")["version"] == 2
+        repo.close()
+
+
+def test_repeated_request_is_served_from_the_repository():
+    from app import main
+    from benchmarks.fixtures import CLARIFICATION_ANSWERS, SAMPLE_RESUME_TEXT
+
+    payload = {"prompt": SAMPLE_RESUME_TEXT, "answers": CLARIFICATION_ANSWERS}
+
+    with tempfile.TemporaryDirectory() as root:
+        saved = resume_repository._resume_repository_instance, result_cache._result_cache_instance, main.run_generation
+        resume_repository._resume_repository_instance = ResumeRepository(Path(root) / "resumes.sqlite3")
+        result_cache._result_cache_instance = ResultCache()
+
+        async def generated(request, *args, **kwargs):
+            return {"success": True, "status": "success", "data": {"profile": {"name": "Jane"}}, "error": None}
+
+        async def not_rerun(request, *args, **kwargs):
+            raise AssertionError("pipeline ran for a stored request")
+
+        async def call(path, method="get", **kwargs):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await getattr(client, method)(path, **kwargs)
+
+        try:
+            main.run_generation = generated
+            first = asyncio.run(call("/api/generate-resume", "post", json=payload)).json()
+            resume_repository._resume_repository_instance.flush()
+
+            # A fresh process: nothing in the result cache, only the database
+            result_cache._result_cache_instance = ResultCache()
+            main.run_generation = not_rerun
+            repeat = asyncio.run(call("/api/generate-resume", "post", json=payload)).json()
+            by_hash = asyncio.run(call(f"/api/resumes/by-hash/{first['resumeHash']}"))
+            by_id = asyncio.run(call(f"/api/resumes/{by_hash.json()['data']['id']}"))
+            missing = asyncio.run(call("/api/resumes/999"))
+            resume_repository._resume_repository_instance.close()
+        finally:
+            resume_repository._resume_repository_instance, result_cache._result_cache_instance, main.run_generation = saved
+
+    assert first["status"] == "success" and repeat == first
+    assert by_hash.status_code == 200 and by_hash.json()["data"]["resume"] == {"profile": {"name": "Jane"}}
+    assert by_id.json() == by_hash.json()
+    assert missing.status_code == 404
+
+
+if __name__ == "__main__":
+    test_save_is_readable_before_and_after_commit()
+    test_writes_are_batched()
+    test_expired_response_is_reused_again_once_regenerated()
+    test_repeated_request_is_served_from_the_repository()
+    print("All resume repository tests passed")
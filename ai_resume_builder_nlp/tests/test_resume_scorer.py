@@ -0,0 +1,63 @@
+# Verify the ATS / completeness scorer signals
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.nlp.validators.resume_scorer import score_resume
+
+RESUME = {
+    "profile": {"name": "John Smith", "email": "john@example.com", "phone": "+1-555-0123"},
+    "summary": "Backend engineer focused on microservices and APIs.",
+    "experience": [
+        {
+            "role": "Software Engineer",
+            "company": "Google",
+            "description": "Developed microservices for billing\n- Improved CI/CD pipeline speed by 40%",
+            "achievements": ["40%"],
+        },
+        {
+            "role": "Developer",
+            "company": "Microsoft",
+            "description": "Worked on debugging and testing tools",
+            "achievements": [],
+        },
+    ],
+    "education": [{"degree": "BS", "institution": "MIT", "year": "2018"}],
+    "skills": ["Python", "Docker", "AWS"],
+}
+
+
+def test_signals():
+    result = score_resume(RESUME, role="Software Engineer")
+
+    assert result["role"] == "software_engineer"
+    assert set(result["matchedKeywords"]) == {"backend", "microservices", "APIs", "CI/CD", "debugging", "testing"}
+    # 3 bullets: "Developed ...", "Improved ... 40%", "Worked on ..."
+    assert result["actionVerbDensity"] == round(2 / 3, 3)
+    assert result["metricDensity"] == round(1 / 3, 3)
+    assert result["completenessScore"] == 100
+    assert 0 <= result["atsScore"] <= 100
+
+
+def test_role_detected_when_unknown():
+    result = score_resume(RESUME, role=None)
+
+    assert result["role"] == "software_engineer"
+
+
+def test_empty_resume():
+    result = score_resume({})
+
+    assert result["completenessScore"] == 0
+    assert "Missing email address" in result["issues"]
+
+
+if __name__ == "__main__":
+    test_signals()
+    test_role_detected_when_unknown()
+    test_empty_resume()
+    print("✅ PASSED: resume scorer")
@@ -0,0 +1,123 @@
+# Weighted fair scheduling between priority classes, budgets and deadlines
+import sys
+import asyncio
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services import admission, result_cache, scheduler
+from app.services.admission import AdmissionController
+from app.services.result_cache import ResultCache
+from app.services.scheduler import FairBudget, JobScheduler, JobExpired
+
+
+def test_interactive_overtakes_queued_batch():
+    sched = JobScheduler(cpu_slots=1)
+    order = []
+
+    async def stage(job, name):
+        async with sched.stage_slot(job, "understanding"):
+            order.append(name)
+            await asyncio.sleep(0.001)
+
+    async def scenario():
+        tasks = [asyncio.create_task(stage(sched.new_job("interactive"), "holder"))]
+        await asyncio.sleep(0)
+        for i in range(4):
+            tasks.append(asyncio.create_task(stage(sched.new_job("batch"), f"batch{i}")))
+        await asyncio.sleep(0)
+        for i in range(2):
+            tasks.append(asyncio.create_task(stage(sched.new_job("interactive"), f"chat{i}")))
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+    assert order == ["holder", "chat0", "chat1", "batch0", "batch1", "batch2", "batch3"]
+    assert sched.budgets["cpu"].active == 0
+
+
+def test_batch_still_progresses():
+    budget = FairBudget("cpu", 1)
+    sched = JobScheduler()
+    tags = [budget._tag(sched.new_job("interactive")) for _ in range(8)]
+    batch_tag = budget._tag(sched.new_job("batch"))
+    # One batch stage is worth four interactive stages, not starved behind all of them
+    assert batch_tag < tags[-1]
+
+
+def test_job_expires_while_queued():
+    sched = JobScheduler(cpu_slots=1)
+
+    async def scenario():
+        async def hold():
+            async with sched.stage_slot(sched.new_job("interactive"), "understanding"):
+                await asyncio.sleep(0.05)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        try:
+            async with sched.stage_slot(sched.new_job("batch", deadline_s=0.01), "understanding"):
+                return "ran"
+        except JobExpired:
+            return "expired"
+        finally:
+            await holder
+
+    assert asyncio.run(scenario()) == "expired"
+    assert sched.budgets["cpu"].active == 0
+
+
+def test_stages_use_their_budget():
+    sched = JobScheduler(cpu_slots=2, llm_slots=1)
+    seen = {}
+
+    class FakePipeline:
+        async def run_async(self, state, gate=None, token=None):
+            for stage_name in ("understanding", "enhancement"):
+                async with gate(stage_name):
+                    seen[stage_name] = {name: b.active for name, b in sched.budgets.items()}
+            return state
+
+    assert asyncio.run(sched.run(FakePipeline(), {"x": 1}, "background")) == {"x": 1}
+    assert seen == {"understanding": {"cpu": 1, "llm": 0}, "enhancement": {"cpu": 0, "llm": 1}}
+
+
+def test_batch_endpoint():
+    from app.main import app
+
+    saved = (admission._admission_instance, result_cache._result_cache_instance, scheduler._scheduler_instance)
+    admission._admission_instance = AdmissionController(rate_per_client=0)
+    result_cache._result_cache_instance = ResultCache()
+    scheduler._scheduler_instance = JobScheduler()
+
+    async def post(payload):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/generate-resume/batch", json=payload)
+
+    try:
+        items = [{"prompt": "John Smith", "test_mode": True}, {"prompt": "Jane Doe", "test_mode": True}]
+        done = asyncio.run(post({"items": items}))
+        result_cache._result_cache_instance = ResultCache()
+        expired = asyncio.run(post({"items": items, "priority": "background", "deadline_seconds": 1e-9}))
+        invalid = asyncio.run(post({"items": items, "priority": "interactive"}))
+    finally:
+        admission._admission_instance, result_cache._result_cache_instance, scheduler._scheduler_instance = saved
+
+    assert done.status_code == 200
+    assert done.json()["data"]["summary"] == {"qa_failed": 2}  # test_mode skips clarification
+    assert expired.json()["data"]["summary"] == {"expired": 2}
+    assert invalid.status_code == 422
+
+
+if __name__ == "__main__":
+    test_interactive_overtakes_queued_batch()
+    test_batch_still_progresses()
+    test_job_expires_while_queued()
+    test_stages_use_their_budget()
+    test_batch_endpoint()
+    print("All scheduler tests passed")
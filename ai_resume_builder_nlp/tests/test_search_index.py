@@ -0,0 +1,209 @@
+# Search index: facet bitsets, FTS5 text ranking, incremental updates, snapshot catch-up, search endpoint
+import sys
+import asyncio
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services import resume_repository, search_index
+from app.services.bitmap_index import BitmapIndex
+from app.services.resume_repository import ResumeRepository
+from app.services.search_index import InvalidSearch, SearchIndex
+
+PLATFORM = {
+    "profile": {"name": "Asha", "role": "DevOps Engineer", "years": 7, "location": "Pune, India"},
+    "summary": "Runs Kubernetes clusters for a payments platform.",
+    "skills": ["Kubernetes", "Go", "Terraform"],
+    "experience": [{"role": "DevOps Engineer", "company": "Razorpay", "description": "Payments infrastructure"}],
+}
+SCIENTIST = {
+    "profile": {"name": "Ben", "role": "Data Scientist", "years": "3+ years", "location": "London"},
+    "summary": "Forecasting models for retail demand.",
+    "skills": ["Python", "k8s"],
+    "experience": [{"role": "Data Scientist", "company": "Googel", "description": "Demand forecasting"}],
+}
+BACKEND = {
+    "profile": {"name": "Chen", "role": "Software Engineer", "years": 10, "location": "Bangalore, India"},
+    "summary": "Backend services in Go and Python.",
+    "skills": ["Python", "Go", "Kubernetes"],
+    "experience": [{"role": "Software Engineer", "company": "Paytm", "description": "Wallet backend"}],
+}
+
+
+def open_index(root: str):
+    repo = ResumeRepository(Path(root) / "resumes.sqlite3")
+    return repo, SearchIndex(repo)
+
+
+def names(found):
+    return [hit["resume"]["profile"]["name"] for hit in found["hits"]]
+
+
+def test_bitmap_index_grows_and_round_trips():
+    index = BitmapIndex()
+    index.add(3, ["skill:go"])
+    index.add(70000, ["skill:go", "skill:python"])
+    assert len(index) == 2 and 70000 in index and 4 not in index
+    assert list(index.ids(index.all_of(["skill:go", "skill:python"]))) == [70000]
+    assert list(index.test(index.get("skill:go"), np.array([3, 4, 70000, 10 ** 7]))) == [True, False, True, False]
+
+    index.add(70000, ["skill:rust"])  # re-adding replaces the old keys
+    assert index.count(index.get("skill:python")) == 0
+
+    restored = BitmapIndex.from_items(index.items())
+    assert list(restored.ids(restored.any_of(["skill:go", "skill:rust"]))) == [3, 70000]
+
+
+def test_facet_filters_and_ranking():
+    with tempfile.TemporaryDirectory() as root:
+        repo, index = open_index(root)
+        for key, resume in [("a", PLATFORM), ("b", SCIENTIST), ("c", BACKEND)]:
+            repo.save(key, resume, {"status": "success"})
+        repo.flush()
+
+        # "Kubernetes and 5+ years at a fintech" (k8s is an alias of Kubernetes)
+        assert names(index.search(skills=["Kubernetes"], industries=["fintech"], min_years=5)) == ["Chen", "Asha"]
+        assert index.search(skills=["kubernetes"])["total"] == 3
+        assert names(index.search(industries=["technology"])) == ["Ben"]  # "Googel" is Google
+        assert names(index.search(roles=["data scientist", "devops engineer"])) == ["Asha", "Ben"]
+        assert names(index.search(locations=["india"], limit=1)) == ["Chen"]
+        assert index.search(skills=["Cobol"]) == {"total": 0, "hits": []}
+        assert index.facets("industry:") == {"industry:fintech": 2, "industry:technology": 1}
+        repo.close()
+
+
+def test_text_search_is_ranked_and_filtered():
+    with tempfile.TemporaryDirectory() as root:
+        repo, index = open_index(root)
+        for key, resume in [("a", PLATFORM), ("b", SCIENTIST), ("c", BACKEND)]:
+            repo.save(key, resume, {"status": "success"})
+        repo.flush()
+
+        assert names(index.search("payments")) == ["Asha"]
+        assert names(index.search("forecasting OR wallet")) in (["Ben", "Chen"], ["Chen", "Ben"])
+        assert names(index.search("forecasting OR wallet", min_years=5)) == ["Chen"]
+        found = index.search("python NOT forecasting")
+        assert found["total"] == 1 and found["hits"][0]["input_hash"] == "c"
+        try:
+            index.search('"unterminated')
+        except InvalidSearch:
+            pass
+        else:
+            raise AssertionError("invalid FTS5 syntax was accepted")
+        repo.close()
+
+
+def test_resaving_a_resume_replaces_its_entries():
+    with tempfile.TemporaryDirectory() as root:
+        repo, index = open_index(root)
+        repo.save("a", PLATFORM, {"status": "success"})
+        repo.flush()
+        repo.save("a", {**PLATFORM, "skills": ["Rust"], "summary": "Embedded firmware."}, {"status": "success"})
+        repo.flush()
+
+        assert index.search(skills=["Kubernetes"])["total"] == 0
+        assert index.search("clusters")["total"] == 0
+        assert names(index.search("firmware", skills=["rust"])) == ["Asha"]
+        repo.close()
+
+
+def test_snapshot_and_catch_up():
+    with tempfile.TemporaryDirectory() as root:
+        repo, index = open_index(root)
+        repo.save("a", PLATFORM, {"status": "success"})
+        index.snapshot()
+        repo.close()
+
+        # Saved by a process that never opened the search index
+        repo = ResumeRepository(Path(root) / "resumes.sqlite3")
+        repo.save("b", SCIENTIST, {"status": "success"})
+        repo.close()
+
+        repo, index = open_index(root)
+        assert index.search(skills=["kubernetes"])["total"] == 2
+        assert names(index.search("forecasting")) == ["Ben"]
+        repo.save("c", BACKEND, {"status": "success"})
+        repo.flush()
+        assert index.search(industries=["fintech"])["total"] == 2
+        repo.close()
+
+
+def test_workers_share_saves_and_snapshots():
+    with tempfile.TemporaryDirectory() as root:
+        repo, index = open_index(root)
+        lagging_repo, lagging = open_index(root)
+        # Another worker's repository, which never opened the search index
+        writer = ResumeRepository(Path(root) / "resumes.sqlite3")
+        writer.save("a", PLATFORM, {"status": "success"})
+        writer.save("c", BACKEND, {"status": "success"})
+        writer.flush()
+
+        assert names(index.search("clusters")) == ["Asha"]
+        assert index.search(skills=["kubernetes"])["total"] == 2
+        # The text was indexed once, by the first worker that queried
+        assert names(lagging.search("wallet")) == ["Chen"]
+        assert sqlite3.connect(repo.path).execute("SELECT count(*) FROM resume_fts").fetchone()[0] == 2
+
+        writer.save("b", SCIENTIST, {"status": "success"})
+        writer.flush()
+        index.facets()
+        index.snapshot()
+        # Covers less than the saved snapshot: not written over it
+        lagging.snapshot()
+        saved = sqlite3.connect(repo.path).execute("SELECT value FROM search_meta WHERE name = 'snapshot_seq'")
+        assert saved.fetchone()[0] == 3
+        for r in (repo, lagging_repo, writer):
+            r.close()
+
+        repo, index = open_index(root)
+        assert index.search()["total"] == 3
+        repo.close()
+
+
+def test_search_endpoint():
+    from app import main
+
+    async def call(payload):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/resumes/search", json=payload)
+
+    with tempfile.TemporaryDirectory() as root:
+        saved = resume_repository._resume_repository_instance, search_index._search_index_instance
+        repo = ResumeRepository(Path(root) / "resumes.sqlite3")
+        resume_repository._resume_repository_instance = repo
+        search_index._search_index_instance = SearchIndex(repo)
+        try:
+            repo.save("a", PLATFORM, {"status": "success"})
+            repo.save("c", BACKEND, {"status": "success"})
+            repo.flush()
+            found = asyncio.run(call({"skills": ["Go"], "industries": ["fintech"], "min_years": 8}))
+            invalid = asyncio.run(call({"query": "AND"}))
+            repo.close()
+        finally:
+            resume_repository._resume_repository_instance, search_index._search_index_instance = saved
+
+    data = found.json()["data"]
+    assert data["total"] == 1
+    assert data["results"][0]["name"] == "Chen" and data["results"][0]["inputHash"] == "c"
+    assert data["results"][0]["years"] == 10 and data["results"][0]["skills"] == BACKEND["skills"]
+    assert invalid.status_code == 422 and invalid.json()["status"] == "invalid_query"
+
+
+if __name__ == "__main__":
+    test_bitmap_index_grows_and_round_trips()
+    test_facet_filters_and_ranking()
+    test_text_search_is_ranked_and_filtered()
+    test_resaving_a_resume_replaces_its_entries()
+    test_snapshot_and_catch_up()
+    test_workers_share_saves_and_snapshots()
+    test_search_endpoint()
+    print("All search index tests passed")
@@ -0,0 +1,120 @@
+# Section-level enhancement: split/merge and per-section timeouts against the mock gateway
+import sys
+import copy
+import time
+import asyncio
+from pathlib import Path
+
+import httpx
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.agents.enhancer_agent import agent as enhancer
+from app.nlp.enhancers.section_splitter import split_resume_sections, merge_section
+from app.services import llm_client
+from app.services.llm_client import LLMClient
+from tests.mock_llm_server import create_mock_llm_app
+
+RESUME = {
+    "profile": {"name": "John Smith", "email": "john@example.com"},
+    "summary": "worked on backend systems.",
+    "experience": [
+        {"role": "Engineer", "company": "Google", "achievements": ["Cut latency by 40%"]},
+        {"role": "Developer", "company": "SlowCorp", "achievements": ["helped ship 3 features"]},
+    ],
+    "education": [{"degree": "BS", "institution": "MIT", "year": "2018"}],
+    "skills": ["Python", "Docker", "AWS"],
+}
+
+
+def test_split_resume_sections():
+    ids = [sid for sid, _ in split_resume_sections(RESUME)]
+    assert ids == ["summary", "experience[0]", "experience[1]", "education"]
+
+
+def test_merge_rejects_shape_changes():
+    merged = copy.deepcopy(RESUME)
+    applied = [sid for sid, content in {
+        "summary": "Built backend systems.",
+        "experience[0]": {"role": "Engineer", "company": "Google", "achievements": []},
+        "education": [{"degree": "BS", "institution": "MIT", "year": "2018"}],
+    }.items() if merge_section(merged, sid, content)]
+    assert applied == ["summary", "education"]
+    assert merged["summary"] == "Built backend systems."
+    assert merged["experience"][0] == RESUME["experience"][0]
+    assert RESUME["summary"] == "worked on backend systems."
+
+
+def test_slow_section_keeps_rule_based_version():
+    app = create_mock_llm_app(delays={"SlowCorp": 2.0})
+    original_client = llm_client._llm_client_instance
+    original_timeout = enhancer.SECTION_TIMEOUT_SECONDS
+    llm_client.set_llm_client(LLMClient(
+        api_base="http://mock-gateway", api_key="test", max_retries=0,
+        transport=httpx.ASGITransport(app=app),
+    ))
+    enhancer.SECTION_TIMEOUT_SECONDS = 0.3
+    try:
+        start = time.perf_counter()
+        result = asyncio.run(enhancer.enhance_with_devstral_async({"final_resume": RESUME}))
+        elapsed = time.perf_counter() - start
+    finally:
+        llm_client.set_llm_client(original_client)
+        enhancer.SECTION_TIMEOUT_SECONDS = original_timeout
+
+    # Bounded by the shared deadline, not the slow section
+    assert elapsed < 1.0
+    assert result["devstral_enhanced"]
+    # Education has no prose, so the quality gate never sends it
+    assert result["enhancement_sections"] == {
+        "llm": ["summary", "experience[0]"],
+        "rule_based": ["experience[1]"],
+        "skipped": ["education"],
+    }
+    # Fallback section is the rule-based rewrite
+    assert result["final_resume"]["experience"][1]["achievements"] == ["Assisted ship 3 features"]
+    assert result["final_resume"]["summary"] == "Developed backend systems."
+    assert result["final_resume"]["skills"] == RESUME["skills"]
+
+
+def test_truncated_section_keeps_complete_part():
+    entry = {"role": "Engineer", "company": "Google", "achievements": ["Tasks one", "Tasks two", "Tasks three"]}
+    prompt_json = '{"experience": {"role": "Engineer", "company": "Google", "achievements": ["Tasks one", "Tasks two"'
+    # Reply is cut inside the second achievement
+    app = create_mock_llm_app(truncate_at=len("```json\n" + prompt_json) - 3, chunk_size=7)
+    original_client = llm_client._llm_client_instance
+    llm_client.set_llm_client(LLMClient(
+        api_base="http://mock-gateway", api_key="test", transport=httpx.ASGITransport(app=app),
+    ))
+    try:
+        value = asyncio.run(enhancer.enhance_section("experience[0]", entry, time.monotonic() + 5))
+    finally:
+        llm_client.set_llm_client(original_client)
+    assert value == entry
+
+
+def test_member_of_prose_brace_is_not_taken():
+    # The first "{" is prose; what follows it looks like a finished summary member
+    reply = 'Changed { "summary": "draft", see below.\n{"summary": "Built backend systems."}'
+    app = create_mock_llm_app(content=reply, chunk_size=5)
+    original_client = llm_client._llm_client_instance
+    llm_client.set_llm_client(LLMClient(
+        api_base="http://mock-gateway", api_key="test", transport=httpx.ASGITransport(app=app),
+    ))
+    try:
+        value = asyncio.run(enhancer.enhance_section("summary", RESUME["summary"], time.monotonic() + 5))
+    finally:
+        llm_client.set_llm_client(original_client)
+    assert value == "Built backend systems."
+
+
+if __name__ == "__main__":
+    test_split_resume_sections()
+    test_merge_rejects_shape_changes()
+    test_slow_section_keeps_rule_based_version()
+    test_truncated_section_keeps_complete_part()
+    test_member_of_prose_brace_is_not_taken()
+    print("All section enhancement tests passed")
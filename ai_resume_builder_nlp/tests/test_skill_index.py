@@ -0,0 +1,84 @@
+# Skill aliases and SymSpell spelling correction
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.services.skill_index import SkillIndex
+from app.nlp.extractors.skill_matcher import extract_skills
+from app.agents.clarification_agent.clarification_agent import clarification_questions
+
+TERMS = ["Python", "Kubernetes", "React", "Node.js", "CI/CD", "TestNG", "Machine Learning"]
+ALIASES = {
+    "aliases": {"Kubernetes": ["k8s"], "React": ["reactjs"], "Node.js": ["node", "node js"]},
+    "not_typos": ["testing"],
+}
+
+
+def test_aliases_and_typos():
+    index = SkillIndex(TERMS, ALIASES)
+    assert index.find("Pyhton, k8s, ReactJS and node") == {"Python", "Kubernetes", "React", "Node.js"}
+    assert index.find("Built with Node JS") == {"Node.js"}
+    assert index.correct("kuberntes") == ("Kubernetes", 1)
+
+
+def test_exact_whole_words_and_phrases():
+    index = SkillIndex(TERMS, ALIASES)
+    assert index.find("CI/CD for Python/React, machine learning") == {"CI/CD", "Python", "React", "Machine Learning"}
+    assert index.find("Python-based services") == {"Python"}
+
+
+def test_short_words_and_not_typos_are_not_corrected():
+    index = SkillIndex(TERMS, ALIASES)
+    assert index.correct("reach") is None      # one edit from React, but too short
+    assert index.correct("testing") is None    # one edit from TestNG, listed in not_typos
+    assert index.find("integration testing") == set()
+
+
+def test_common_words_in_prose_are_not_skills():
+    index = SkillIndex(TERMS + ["Scala", "Flask"], {
+        "aliases": {"Node.js": ["node"]}, "not_typos": ["reacts", "scalar", "flasks"], "needs_context": ["node"],
+    })
+    assert index.find("The UI reacts to a scalar value; flasks of coffee") == set()
+    assert index.find("Each graph node holds an edge list") == set()
+    # Capitalized, or on a skills line, the alias is meant
+    assert index.find("Built APIs on Node") == {"Node.js"}
+    assert index.find("Summary\nSkills: python, node") == {"Python", "Node.js"}
+
+
+def test_extract_skills_ignores_prose():
+    assert extract_skills("Each graph node holds rails trips data; I wrote shell scripts") == []
+    assert extract_skills("The UI reacts to a scalar value; flasks of coffee") == []
+    assert extract_skills("JavaScript") == ["JavaScript"]  # not Java, nor R
+    assert {"Node.js", "Ruby on Rails"} <= set(extract_skills("Skills: node, rails"))
+
+
+def test_extract_skills_uses_knowledge_base_index():
+    skills = extract_skills("Skills: Pyhton, k8s, ReactJS and node")
+    assert {"Python", "Kubernetes", "React", "Node.js"} <= set(skills)
+
+
+def test_clarification_does_not_ask_for_listed_skills():
+    def asks_for_skills(text):
+        return "skills" in [q["field"] for q in clarification_questions({"raw_text": text})["questions"]]
+
+    assert not asks_for_skills("I know Python, Kubernetes and React")
+    assert asks_for_skills("I like cooking")
+    # Short names, aliases and typos can be ordinary words: still ask
+    assert asks_for_skills("Ready to go, I led R&D")
+    assert asks_for_skills("The team reacts fast; every graph node and rails trip was logged")
+    assert asks_for_skills("I know Pyhton and k8s")
+
+
+if __name__ == "__main__":
+    test_aliases_and_typos()
+    test_exact_whole_words_and_phrases()
+    test_short_words_and_not_typos_are_not_corrected()
+    test_common_words_in_prose_are_not_skills()
+    test_extract_skills_ignores_prose()
+    test_extract_skills_uses_knowledge_base_index()
+    test_clarification_does_not_ask_for_listed_skills()
+    print("All skill index tests passed")
@@ -0,0 +1,31 @@
+# Parallel extraction: same result as sequential, and no deadlock when called from the shared thread pool
+import sys
+from pathlib import Path
+
+# Add project root to sys.path
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+sys.path.append(str(project_root))
+
+from app.agents.understanding_agent.agent import understand_text
+from app.utils.executors import THREAD_POOL_WORKERS, get_thread_pool
+from benchmarks.corpus import get_corpus_generator
+
+TEXT = get_corpus_generator(0).text_of_size(30 * 1024)
+
+
+def test_parallel_matches_sequential():
+    assert understand_text(TEXT, parallel=True) == understand_text(TEXT, parallel=False)
+
+
+def test_parallel_from_every_shared_pool_thread():
+    expected = understand_text(TEXT, parallel=False)
+    # Every shared worker waits on its extractors at once
+    futures = [get_thread_pool().submit(understand_text, TEXT, True) for _ in range(THREAD_POOL_WORKERS)]
+    assert all(future.result(timeout=60) == expected for future in futures)
+
+
+if __name__ == "__main__":
+    test_parallel_matches_sequential()
+    test_parallel_from_every_shared_pool_thread()
+    print("All understanding tests passed")